@@ -25,6 +25,5 @@ class GeneralDeps(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
     # Allow Any-typed arbitrary objects for forward extension (e.g. a
-    # future club-archive cache); mirrors StatsDeps.meeting_pool_cache
-    # convention.
+    # future club-archive cache).
     extras: dict[str, Any] = {}
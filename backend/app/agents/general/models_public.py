@@ -1,7 +1,5 @@
 """AgentPublic runtime deps."""
 
-from typing import Any, Optional
-
 from pydantic import BaseModel
 
 from app.agents.runtime.skill_registry import SkillRegistry
@@ -14,7 +12,5 @@ class GeneralPublicDeps(BaseModel):
     current_user_message: str = ""
     today: str = ""
     skill_registry: SkillRegistry
-    meeting_pool_cache: Optional[list[dict]] = None
-    meeting_pool_lock: Any = None
 
     model_config = {"arbitrary_types_allowed": True}
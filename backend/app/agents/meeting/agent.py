@@ -380,8 +380,8 @@ async def lookup_meeting(
                            '最近 3 个月' → date_from = today - 90d, no date_to
                          If the user provides a specific date, pass it as
                          both date_from and date_to (single-day range).
-      `limit`          — max cards returned (default 5; max 200, the
-                         candidate pool size). Pick a limit appropriate
+      `limit`          — max cards returned (default 5; max 200).
+                         Pick a limit appropriate
                          to the user's intent:
                            '上次' / '最近一次' / 'last' / 'most recent'   → 1
                            '最近三次' / 'recent 3'                          → 3
@@ -402,16 +402,19 @@ async def lookup_meeting(
     **Result envelope.** The tool returns:
         {
           "cards": [...up to `limit` cards, most recent first...],
-          "total_matches": <int>,    # total in the candidate pool
-          "pool_size": <int>,        # candidate pool size (200 for
-                                     # descriptor scans, 1 for exact-no)
+          "total_matches": <int>,    # every meeting that matches
           "limit_clamped": <bool>,   # True iff total_matches > len(cards)
+          "manager_matched": <str>,  # only when `name_substring` matched no
+                                     # manager as typed and was respelled
         }
     When `limit_clamped` is true, **disclose this in your reply**: tell
     the user how many you're showing vs. how many match in total
     ("showing 5 of 7 Custom meetings" / "为您列出最近 5 期, 共匹配到 7 期").
     If the user says "show me all" / "全部", call again with a higher
     `limit` rather than asking. Do NOT silently truncate without saying.
+    When `manager_matched` is present, the cards are for that member
+    (e.g. '郑锐' → 'Rui Zheng'); name them in your reply so the user can
+    correct a wrong match.
 
     Examples (user → call, assuming today=2026-04-27):
       'show me #451'                       → lookup_meeting(no=451)
@@ -1,8 +1,9 @@
-from typing import Any, Optional
+from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 from app.models.meeting import Attendee
+from app.services.member_directory import MemberIndex
 
 
 class Meta(BaseModel):
@@ -102,22 +103,14 @@ class AgendaDeps(BaseModel):
     current_user_message: str = ""
     image_data: Optional[bytes] = None
     image_content_type: Optional[str] = None
-    # Per-turn pool cache for the meeting-lookup service. Deps is built fresh
-    # each turn so the cache invalidates naturally at turn boundaries.
-    # `meeting_pool_lock` is lazily set to an asyncio.Lock on first lookup
-    # call (must bind to the current event loop, not the one that built
-    # deps). Multiple parallel `lookup_meeting` tool calls within one turn
-    # — e.g. cross-language theme + intro fan-out — share a single DB
-    # fetch instead of each hitting Supabase.
-    meeting_pool_cache: Optional[list[dict]] = None
-    meeting_pool_lock: Any = None
-    # Live members directory, eager-fetched at turn boundary by the route.
-    # Each row carries the DB shape `{"id": <uuid>, "username": <str>,
-    # "full_name": <str>}`. `set_role` / `add_segment` consult it to resolve
+    # Members directory snapshot, taken at turn boundary by the route from
+    # the process-wide cache (`member_directory`). Rows carry the DB shape
+    # `{"id": <uuid>, "username": <str>, "full_name": <str>}`, indexed by
+    # lowercased full name and first name. `set_role` / `add_segment` consult it to resolve
     # a bare-name LLM arg ("Joyce Feng") to a structured `Attendee` with the
     # real `member_id`. Without this, the chat addendum would briefly render
     # such a role taker as `(guest)` until the frontend re-resolved on the
     # next snapshot — see Phase B closing fix.
-    members_directory: list[dict] = Field(default_factory=list)
+    members_directory: MemberIndex = Field(default_factory=MemberIndex)
 
     model_config = {"arbitrary_types_allowed": True}
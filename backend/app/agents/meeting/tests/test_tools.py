@@ -34,6 +34,9 @@ from app.agents.meeting.tools import (
 )
 from app.agents.runtime.contracts import AgentKind, RouteKind
 from app.agents.runtime.store import AgentTurnRecord, InMemoryUnifiedAgentTurnStore
+from app.db.meeting_cache import meeting_cache
+from app.services.member_directory import MemberIndex
+from app.services.tests.test_meeting_lookup import indexed
 
 
 @dataclass
@@ -490,7 +493,7 @@ async def test_apply_preview_meeting_unknown_no_raises_modelretry():
 
 
 def test_db_get_meeting_by_no_uses_two_targeted_queries():
-    """Regression: the lookup must NOT scan the bulk `_db_meetings_recent` page.
+    """Regression: the lookup must NOT scan a bulk hydrated meetings page.
     That path builds a `.in_(500 meeting_ids)` URL (~18 KB) which under
     concurrent calls (e.g. 3 parallel preview_meeting on the same turn)
     overflows PostgREST / cloudflare URL-length limits and returns 400
@@ -516,66 +519,44 @@ def test_db_get_meeting_by_no_uses_two_targeted_queries():
     with (
         patch("app.services.meeting_lookup.get_meeting_id_by_no", return_value="uuid-425") as mock_id,
         patch("app.services.meeting_lookup.get_meeting_by_id", return_value=full_complete) as mock_full,
-        patch("app.services.meeting_lookup.db_meetings_recent") as mock_bulk,
+        patch("app.services.meeting_lookup.db_search_meetings") as mock_bulk,
     ):
         result = fetch_meeting_full(425)
 
     mock_id.assert_called_once_with(425)
     mock_full.assert_called_once_with("uuid-425", user_id=None)
-    # The bulk-recent path must NOT be touched anymore.
+    # The descriptor search path must NOT be touched.
     mock_bulk.assert_not_called()
     assert len(result["segments"]) == 4
     assert result["segments"][-1]["type"] == "Closing Remarks"
 
 
-def test_db_get_meeting_by_no_serializes_concurrent_callers():
-    """supabase-py wraps a SYNC httpx client which is NOT thread-safe.
-    When several tool calls in one turn (e.g. parallel `preview_meeting`)
-    drive concurrent worker-thread DB queries, the shared httpx state
-    corrupts and the upstream returns `RemoteProtocolError: Server
-    disconnected`. The agent-side helper must hold a module-level lock
-    so concurrent callers fall through one at a time."""
+def test_db_get_meeting_by_no_runs_concurrent_callers_in_parallel():
+    """Parallel tool calls in one turn (e.g. several `preview_meeting`) each
+    query through their worker thread's own Supabase client, so their DB
+    round-trips overlap instead of queueing behind one another."""
     import threading
     from concurrent.futures import ThreadPoolExecutor
 
     from app.services.meeting_lookup import fetch_meeting_full
 
-    in_flight = 0
-    max_in_flight = 0
-    barrier = threading.Lock()
-
-    def _slow_id(no, user_id=None):
-        nonlocal in_flight, max_in_flight
-        with barrier:
-            in_flight += 1
-            max_in_flight = max(max_in_flight, in_flight)
-        # Simulate the real query taking measurable time so any racing
-        # threads have a chance to overlap if the lock is missing.
-        threading.Event().wait(0.05)
-        with barrier:
-            in_flight -= 1
+    # Every caller must be inside the id lookup at once for the barrier to open.
+    all_in_flight = threading.Barrier(4, timeout=5)
+
+    def _slow_id(no):
+        all_in_flight.wait()
         return f"uuid-{no}"
 
-    def _slow_full(meeting_id, user_id=None):
-        nonlocal in_flight, max_in_flight
-        with barrier:
-            in_flight += 1
-            max_in_flight = max(max_in_flight, in_flight)
-        threading.Event().wait(0.05)
-        with barrier:
-            in_flight -= 1
+    def _full(meeting_id, user_id=None):
         return {"id": meeting_id, "no": int(meeting_id.split("-")[1]), "segments": []}
 
     with (
         patch("app.services.meeting_lookup.get_meeting_id_by_no", side_effect=_slow_id),
-        patch("app.services.meeting_lookup.get_meeting_by_id", side_effect=_slow_full),
+        patch("app.services.meeting_lookup.get_meeting_by_id", side_effect=_full),
     ):
         with ThreadPoolExecutor(max_workers=4) as pool:
             results = list(pool.map(fetch_meeting_full, [446, 425, 413, 387]))
 
-    # Lock guarantees at most one DB-helper invocation runs at a time.
-    assert max_in_flight == 1, f"expected serialized DB access, observed {max_in_flight} concurrent"
-    # All four calls returned correct results.
     assert [r["no"] for r in results] == [446, 425, 413, 387]
 
 
@@ -826,25 +807,24 @@ async def test_apply_create_from_text_propagates_value_error_as_modelretry():
 
 
 @pytest.mark.asyncio
-async def test_lookup_by_no_takes_exact_no_path():
-    """LLM-supplied `no=` takes the exact-no fast path → fetch_meeting_full
-    targeted query. Bypasses the recent-pool scan to avoid the PostgREST
-    URL-length / row-cap issues that bit the bulk path in production."""
+async def test_lookup_by_no_is_a_card_query():
+    """LLM-supplied `no=` is a card query on the search index; the full
+    meeting is only hydrated by preview / clone."""
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    fake_388 = next(m for m in _fake_db_meetings() if m["no"] == 388)
-    with patch("app.services.meeting_lookup.fetch_meeting_full", return_value=fake_388):
+    with indexed(_fake_db_meetings()), patch("app.services.meeting_lookup.fetch_meeting_full") as mock_full:
         result = await apply_lookup_meeting(ctx, no=388)
     assert len(result["cards"]) == 1
     assert result["cards"][0]["no"] == 388
     assert result["cards"][0]["type"] == "Workshop"
+    mock_full.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_lookup_by_type_filter_returns_only_that_type():
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_fake_db_meetings()):
+    with indexed(_fake_db_meetings()):
         result = await apply_lookup_meeting(ctx, type_filter="Workshop", limit=1)
     assert len(result["cards"]) == 1
     assert result["cards"][0]["no"] == 388
@@ -858,7 +838,7 @@ async def test_lookup_by_name_substring_matches_manager_only():
     disclose which group surfaced each meeting."""
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_fake_db_meetings()):
+    with indexed(_fake_db_meetings()):
         result = await apply_lookup_meeting(ctx, name_substring="Joyce")
     assert len(result["cards"]) == 1
     assert result["cards"][0]["manager_name"] == "Joyce Feng"
@@ -870,7 +850,7 @@ async def test_lookup_by_theme_substring_matches_theme_field():
     require any other axis to be set."""
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_fake_db_meetings()):
+    with indexed(_fake_db_meetings()):
         result = await apply_lookup_meeting(ctx, theme_substring="T2")
     assert len(result["cards"]) == 1
     assert result["cards"][0]["no"] == 388
@@ -878,7 +858,7 @@ async def test_lookup_by_theme_substring_matches_theme_field():
 
 @pytest.mark.asyncio
 async def test_lookup_by_introduction_substring_matches_intro_field():
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 500,
@@ -892,29 +872,20 @@ async def test_lookup_by_introduction_substring_matches_intro_field():
     ]
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = await apply_lookup_meeting(ctx, introduction_substring="leadership")
     assert len(result["cards"]) == 1
     assert result["cards"][0]["no"] == 500
 
 
 @pytest.mark.asyncio
-async def test_lookup_pool_fetched_once_across_parallel_calls():
+async def test_parallel_lookups_each_run_one_index_query():
     """Cross-language theme + intro fan-out can produce 4 parallel
-    lookup_meeting calls within one turn. They MUST share a single
-    Supabase fetch via the per-turn cache on AgendaDeps — otherwise
-    DB_LOCK serializes them and the whole turn pays N times the latency.
-
-    Pinned because the cache is the only thing keeping the latency
-    of a fan-out turn acceptable. Regression here means a 4-call turn
-    silently grows from ~1 fetch to ~4 fetches."""
-    pool = _fake_db_meetings()
+    lookup_meeting calls within one turn. Each is a single card query
+    against the search index — no hydrated meetings are fetched."""
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch(
-        "app.services.meeting_lookup.db_meetings_recent",
-        return_value=pool,
-    ) as mock_pool:
+    with indexed(_fake_db_meetings()) as index:
         # Four parallel lookups — what a cross-language theme+intro
         # fan-out generates for a Chinese topic keyword.
         results = await asyncio.gather(
@@ -923,19 +894,17 @@ async def test_lookup_pool_fetched_once_across_parallel_calls():
             apply_lookup_meeting(ctx, introduction_substring="anything"),
             apply_lookup_meeting(ctx, name_substring="Joyce"),
         )
-    # Only one Supabase fetch despite four resolver calls.
-    assert mock_pool.call_count == 1
+    assert len(index.calls) == 4
     # All four resolves succeeded (envelope shape preserved).
     for r in results:
         assert "cards" in r and "total_matches" in r
 
 
 @pytest.mark.asyncio
-async def test_lookup_pool_cache_isolated_per_deps_instance():
-    """Each turn builds a fresh AgendaDeps; the cache must NOT persist
-    across deps boundaries (would surface stale data after meeting
-    creation/edit between turns)."""
-    pool_v1 = [
+async def test_lookup_results_are_shared_across_turns_until_a_meeting_write():
+    """Lookups are cached process-wide, so a later turn (fresh deps) reuses
+    them; a meeting saved in between drops them so the next lookup sees it."""
+    v1 = [
         {
             "id": "u1",
             "no": 500,
@@ -946,16 +915,8 @@ async def test_lookup_pool_cache_isolated_per_deps_instance():
             "segments": [],
         },
     ]
-    pool_v2 = [
-        {
-            "id": "u1",
-            "no": 500,
-            "type": "Regular",
-            "theme": "Old",
-            "date": "2026-04-01",
-            "manager": {"name": "M"},
-            "segments": [],
-        },
+    v2 = [
+        *v1,
         {
             "id": "u2",
             "no": 501,
@@ -966,17 +927,16 @@ async def test_lookup_pool_cache_isolated_per_deps_instance():
             "segments": [],
         },
     ]
-    # First turn (deps_a) sees only #500.
-    deps_a = make_deps()
-    ctx_a = FakeCtx(deps=deps_a)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool_v1):
-        r1 = await apply_lookup_meeting(ctx_a, theme_substring="Old")
+    with indexed(v1) as index:
+        r1 = await apply_lookup_meeting(FakeCtx(deps=make_deps()), theme_substring="Old")
+        assert (await apply_lookup_meeting(FakeCtx(deps=make_deps()), theme_substring="Old")) == r1
+        assert (await apply_lookup_meeting(FakeCtx(deps=make_deps()), theme_substring="New"))["cards"] == []
     assert [c["no"] for c in r1["cards"]] == [500]
-    # Second turn — fresh deps — should see updated pool, not cached v1.
-    deps_b = make_deps()
-    ctx_b = FakeCtx(deps=deps_b)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool_v2):
-        r2 = await apply_lookup_meeting(ctx_b, theme_substring="New")
+    assert len(index.calls) == 2
+
+    meeting_cache.invalidate("u2")
+    with indexed(v2):
+        r2 = await apply_lookup_meeting(FakeCtx(deps=make_deps()), theme_substring="New")
     assert [c["no"] for c in r2["cards"]] == [501]
 
 
@@ -984,7 +944,7 @@ async def test_lookup_pool_cache_isolated_per_deps_instance():
 async def test_lookup_unknown_no_returns_empty_envelope():
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.fetch_meeting_full", return_value=None):
+    with indexed(_fake_db_meetings()):
         result = await apply_lookup_meeting(ctx, no=9999)
     assert result["cards"] == []
     assert result["total_matches"] == 0
@@ -1000,7 +960,7 @@ async def test_lookup_envelope_carries_total_matches_and_clamp_flag():
     ctx = FakeCtx(deps=deps)
     # _fake_db_meetings has two Regular meetings; with limit=1 we expect a
     # clamp signal.
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_fake_db_meetings()):
+    with indexed(_fake_db_meetings()):
         result = await apply_lookup_meeting(ctx, type_filter="Regular", limit=1)
     assert len(result["cards"]) == 1
     assert result["total_matches"] == 2
@@ -1008,7 +968,7 @@ async def test_lookup_envelope_carries_total_matches_and_clamp_flag():
 
 
 @pytest.mark.asyncio
-async def test_lookup_rejects_limit_above_pool_size():
+async def test_lookup_rejects_limit_above_max():
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
     with pytest.raises(ModelRetry, match="limit must be <="):
@@ -1056,7 +1016,7 @@ async def test_lookup_with_only_date_filter_is_a_valid_call():
     """A bare date-range filter (no name / no / type) is still a meaningful
     intent — '10月份的会议' / 'meetings this week'. Don't trip the
     'no filter axes' refusal."""
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 500,
@@ -1069,7 +1029,7 @@ async def test_lookup_with_only_date_filter_is_a_valid_call():
     ]
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = await apply_lookup_meeting(ctx, date_from="2025-10-01", date_to="2025-10-31")
     assert len(result["cards"]) == 1
     assert result["cards"][0]["no"] == 500
@@ -1129,7 +1089,7 @@ async def test_lookup_chinese_theme_keyword_substring():
     ]
     deps = make_deps()
     ctx = FakeCtx(deps=deps)
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=chinese_themed):
+    with indexed(chinese_themed):
         result = await apply_lookup_meeting(ctx, theme_substring="教育")
     assert len(result["cards"]) == 1
     assert result["cards"][0]["no"] == 442
@@ -1382,10 +1342,12 @@ def test_set_role_resolves_member_id_from_directory():
     for the next render until the frontend re-resolved on the snapshot
     after — the in-flight glitch from the initial Phase B implementation."""
     deps = make_deps()
-    deps.members_directory = [
-        {"id": "uuid-joyce", "username": "joyce", "full_name": "Joyce Feng"},
-        {"id": "uuid-rui", "username": "rui", "full_name": "Rui Zheng"},
-    ]
+    deps.members_directory = MemberIndex(
+        [
+            {"id": "uuid-joyce", "username": "joyce", "full_name": "Joyce Feng"},
+            {"id": "uuid-rui", "username": "rui", "full_name": "Rui Zheng"},
+        ]
+    )
     ctx = FakeCtx(deps=deps)
 
     apply_set_role(ctx, segment_id="s2", role_taker="Joyce Feng")
@@ -1402,9 +1364,11 @@ def test_set_role_unknown_name_falls_back_to_guest():
     (`adoptRoleTaker` → `resolveAttendee`) gets a chance to fix it before
     the form renders."""
     deps = make_deps()
-    deps.members_directory = [
-        {"id": "uuid-joyce", "username": "joyce", "full_name": "Joyce Feng"},
-    ]
+    deps.members_directory = MemberIndex(
+        [
+            {"id": "uuid-joyce", "username": "joyce", "full_name": "Joyce Feng"},
+        ]
+    )
     ctx = FakeCtx(deps=deps)
 
     apply_set_role(ctx, segment_id="s2", role_taker="Some Guest")
@@ -1423,10 +1387,12 @@ def test_set_role_resolves_unique_first_name_to_full_name():
     surfaced. The stored Attendee carries the directory's full_name so
     subsequent turns and persisted state use the canonical form."""
     deps = make_deps()
-    deps.members_directory = [
-        {"id": "uuid-libra", "username": "libra", "full_name": "Libra Lee"},
-        {"id": "uuid-rui", "username": "rui", "full_name": "Rui Zheng"},
-    ]
+    deps.members_directory = MemberIndex(
+        [
+            {"id": "uuid-libra", "username": "libra", "full_name": "Libra Lee"},
+            {"id": "uuid-rui", "username": "rui", "full_name": "Rui Zheng"},
+        ]
+    )
     ctx = FakeCtx(deps=deps)
 
     apply_set_role(ctx, segment_id="s2", role_taker="Libra")
@@ -1443,10 +1409,12 @@ def test_set_role_first_name_collision_falls_back_to_guest():
     'multiple first-name matches → ASK before calling' rule is the model's
     job; the backend just doesn't make things worse by guessing wrong."""
     deps = make_deps()
-    deps.members_directory = [
-        {"id": "uuid-jenny-li", "username": "jenny", "full_name": "Jenny Li"},
-        {"id": "uuid-jenny-lin", "username": "jennyl", "full_name": "Jenny Lin"},
-    ]
+    deps.members_directory = MemberIndex(
+        [
+            {"id": "uuid-jenny-li", "username": "jenny", "full_name": "Jenny Li"},
+            {"id": "uuid-jenny-lin", "username": "jennyl", "full_name": "Jenny Lin"},
+        ]
+    )
     ctx = FakeCtx(deps=deps)
 
     apply_set_role(ctx, segment_id="s2", role_taker="Jenny")
@@ -1456,6 +1424,27 @@ def test_set_role_first_name_collision_falls_back_to_guest():
     assert rt.member_id == ""  # guest fallback
 
 
+def test_set_role_resolves_respelled_names_but_not_near_misses():
+    """'Zheng Rui' (family name first) resolves to the one member it
+    spells; a name a letter or two off a member ('Libro Lee', 'Amy Wang')
+    stays a guest rather than being credited to that member."""
+    deps = make_deps_3()
+    deps.members_directory = MemberIndex(
+        [
+            {"id": "uuid-libra", "username": "libra", "full_name": "Libra Lee"},
+            {"id": "uuid-rui", "username": "rui", "full_name": "Rui Zheng"},
+            {"id": "uuid-amy", "username": "amy", "full_name": "Amy Fang"},
+        ]
+    )
+    ctx = FakeCtx(deps=deps)
+
+    apply_set_role(ctx, segment_id="s1", role_taker="Zheng Rui")
+    apply_set_role(ctx, segment_id="s2", role_taker="Libro Lee")
+    apply_set_role(ctx, segment_id="s3", role_taker="Amy Wang")
+    takers = [(seg.role_taker.name, seg.role_taker.member_id) for seg in deps.agenda.segments[:3]]
+    assert takers == [("Rui Zheng", "uuid-rui"), ("Libro Lee", ""), ("Amy Wang", "")]
+
+
 def test_set_role_prefers_in_agenda_attendee_over_directory():
     """If the same person is already on another segment with a real
     member_id, the in-agenda Attendee wins — preserves the id field even
@@ -1466,10 +1455,12 @@ def test_set_role_prefers_in_agenda_attendee_over_directory():
     deps = make_deps()
     # Pre-populate s1 with Joyce carrying a specific in-agenda id.
     deps.agenda.segments[0].role_taker = Attendee(id="att-existing", name="Joyce Feng", member_id="uuid-joyce")
-    deps.members_directory = [
-        # Directory has a different `id` field — agenda lookup should win.
-        {"id": "uuid-joyce", "username": "joyce", "full_name": "Joyce Feng"},
-    ]
+    deps.members_directory = MemberIndex(
+        [
+            # Directory has a different `id` field — agenda lookup should win.
+            {"id": "uuid-joyce", "username": "joyce", "full_name": "Joyce Feng"},
+        ]
+    )
     ctx = FakeCtx(deps=deps)
 
     apply_set_role(ctx, segment_id="s2", role_taker="Joyce Feng")
@@ -27,12 +27,13 @@ from app.db.core import (
 from app.models.meeting import Attendee, Meeting
 from app.models.meeting import Segment as MeetingSegment
 from app.services import meeting_lookup
+from app.services.member_directory import MemberIndex
 from app.utils.meeting import parse_meeting_agenda_image, plan_meeting_from_text
 
 
 def _resolve_role_taker(
     agenda: Agenda,
-    members_directory: list[dict],
+    members_directory: MemberIndex,
     role_name: str,
 ) -> Attendee | None:
     """Resolve a bare-name role_taker arg into a structured Attendee.
@@ -47,9 +48,9 @@ def _resolve_role_taker(
          (case-insensitive) → reuse that Attendee, inheriting the DB-resolved
          `member_id` from the frontend snapshot. Common case: "Joyce 也来做
          Timer 吧" when Joyce is already TOM in this agenda.
-      3. Full-name match in `members_directory` (the live members list eager-
-         fetched by the route at turn boundary) → Attendee carrying the real
-         DB `member_id`.
+      3. Full-name match in `members_directory` (the cached members
+         directory snapshot the route hands over at turn boundary) →
+         Attendee carrying the real DB `member_id`.
       4. **Unique first-name match in `members_directory`** ("Libra" →
          "Libra Lee" when only one club member has that first name). Mirrors
          the frontend's `resolveAttendee` heuristic so the chat addendum
@@ -59,7 +60,12 @@ def _resolve_role_taker(
          `(guest)` here while the form renders `(member)`. The Attendee
          stores the directory's full name, not the model's first-name input
          — so subsequent turns see the canonical name.
-      5. No match anywhere → guest Attendee with empty member_id. The
+      5. Unique spelling match ignoring word order, spacing and Chinese
+         script (`MemberIndex.with_spelling`): "郑锐" or "Zheng Rui" → "Rui
+         Zheng". Saves the retry turn where the model re-asks who the user
+         meant. Typos are not corrected: "Amy Wang" one letter off "Amy
+         Fang" is as likely a guest, so it stays a guest.
+      6. No match anywhere → guest Attendee with empty member_id. The
          frontend's `applyAgendaSnapshot` still runs `resolveAttendee` as a
          final defense.
     """
@@ -71,18 +77,16 @@ def _resolve_role_taker(
         rt = seg.role_taker
         if rt is not None and rt.name.lower() == lower:
             return rt.model_copy()
-    for member in members_directory or ():
+    member = next(iter(members_directory.with_full_name(name)), None)
+    if member is None:
+        for lookup in (members_directory.with_first_name, members_directory.with_spelling):
+            matches = lookup(name)
+            if matches:
+                member = matches[0] if len(matches) == 1 else None
+                break
+    if member is not None:
+        uid = member.get("id") or ""
         full_name = (member.get("full_name") or "").strip()
-        if full_name.lower() == lower:
-            uid = member.get("id") or ""
-            return Attendee(id=uid or None, name=full_name, member_id=uid)
-    first_name_matches = [
-        m for m in (members_directory or ()) if (m.get("full_name") or "").strip().split(" ", 1)[0].lower() == lower
-    ]
-    if len(first_name_matches) == 1:
-        m = first_name_matches[0]
-        uid = m.get("id") or ""
-        full_name = (m.get("full_name") or "").strip()
         return Attendee(id=uid or None, name=full_name, member_id=uid)
     return Attendee(id=None, name=name, member_id="")
 
@@ -755,7 +759,7 @@ _REGULAR_2PS_SEGMENTS: tuple[tuple[str, str, int, str], ...] = (
 )
 
 
-def _build_template_regular_2ps(members_directory: list[dict]) -> Agenda:
+def _build_template_regular_2ps(members_directory: MemberIndex) -> Agenda:
     """Hardcoded Regular meeting with 2 prepared speeches.
 
     Segments are back-to-back from 19:15 (warmup) to 21:15 (closing).
@@ -770,8 +774,8 @@ def _build_template_regular_2ps(members_directory: list[dict]) -> Agenda:
     is 21:15, but typical SoarHigh slots end at 21:30 — let the user
     decide rather than picking one for them).
 
-    `members_directory` is the live members list eager-fetched at turn
-    boundary by the route. Static defaults like "Alice Song" (the current
+    `members_directory` is the members directory snapshot handed over at
+    turn boundary by the route. Static defaults like "Alice Song" (the current
     president) are resolved through `_resolve_role_taker` so they carry a
     real DB `member_id` — without this, the chat addendum would render
     those default-presider rows as `(guest)` until the frontend re-resolved
@@ -799,7 +803,7 @@ def _build_template_regular_2ps(members_directory: list[dict]) -> Agenda:
     return Agenda(meta=meta, segments=segments)
 
 
-def _build_template_custom(members_directory: list[dict]) -> Agenda:
+def _build_template_custom(members_directory: MemberIndex) -> Agenda:
     """Minimal single-segment Custom meeting starter.
 
     Custom meetings have no fixed structural convention — no required
@@ -896,8 +900,8 @@ async def apply_show_current_agenda(ctx) -> dict:
 # imports (`from app.agents.meeting.tools import apply_lookup_meeting`)
 # keep working without churning callers. The actual logic lives in
 # `app.services.meeting_lookup` so the statistics agent (and any future
-# specialist) shares one validation path, one envelope shape, one
-# pool-cache definition. See feedback_mirror_existing_patterns.md.
+# specialist) shares one validation path and one envelope shape. See
+# feedback_mirror_existing_patterns.md.
 apply_lookup_meeting = meeting_lookup.apply_lookup_meeting
 apply_preview_meeting = meeting_lookup.apply_preview_meeting
 
@@ -1178,7 +1182,7 @@ async def apply_save_draft(ctx, *, confirmed: bool = False) -> dict:
     if no is not None:
         meeting_id = await asyncio.to_thread(get_meeting_id_by_no, no, ctx.deps.user_id)
         if meeting_id:
-            db_meeting = await asyncio.to_thread(get_meeting_by_id, meeting_id, ctx.deps.user_id)
+            db_meeting = await asyncio.to_thread(get_meeting_by_id, meeting_id, ctx.deps.user_id, use_cache=False)
 
     classification = classify_save(agenda, db_meeting, now_shanghai())
 
@@ -227,7 +227,7 @@ async def member_award_matrix(
 #
 # Both agents thin-wrap the same `apply_*` helpers in
 # `app.services.meeting_lookup`. One definition of arg validation, one
-# envelope shape, one pool-cache helper — both agents stay in sync.
+# envelope shape — both agents stay in sync.
 
 
 @agent.tool
@@ -245,7 +245,7 @@ async def lookup_meeting(
     """READ-ONLY. Find historical meetings by structured filter.
 
     Filter axes (AND across distinct axes; fire parallel calls for OR):
-    - `no`: exact display number; bypasses pool scan.
+    - `no`: exact display number.
     - `name_substring`: case-insensitive substring on **meeting manager
       name ONLY**. Use for queries about who **organized / managed**
       a meeting as Meeting Manager (会议经理). Chinese phrasing:
@@ -255,6 +255,9 @@ async def lookup_meeting(
       Do NOT use this for "X 主持" — that means in-meeting hosting
       roles (TOM, TTM, MoT, etc.), not Meeting Manager. Use
       `member_role_matrix(member=X, role_group="hosting")` for those.
+      A name that matches no manager as typed is retried as the member
+      it resolves to (pinyin, word order); the envelope then carries
+      `manager_matched` — name that member in your reply.
     - `theme_substring`: substring on `theme` ("Emojis 那次", "主题
       关于教育的").
     - `introduction_substring`: substring on `introduction` body
@@ -306,7 +309,7 @@ async def list_members(ctx: RunContext[StatsDeps]) -> dict:
     "现在有哪些会员?", "Frank 是会员吗?"), or to provide a roster as
     context for follow-up role/award lookups.
     """
-    from app.db.core import get_members
+    from app.services.member_directory import member_directory
 
-    rows = await asyncio.to_thread(get_members) or []
+    rows = await asyncio.to_thread(member_directory.members)
     return {"members": rows, "count": len(rows)}
@@ -11,6 +11,7 @@ from pydantic_ai import ModelRetry
 
 from app.agents.statistics import tools as stats_tools
 from app.agents.statistics.models import StatsDeps
+from app.services.tests.test_meeting_lookup import indexed
 
 
 @dataclass
@@ -185,7 +186,7 @@ async def test_member_role_matrix_groups_dashboard_rows_by_member():
     ]
 
     with patch(
-        "app.agents.statistics.tools.get_member_meeting_stats",
+        "app.services.analytics_snapshot.member_meeting_rows",
         return_value=role_rows,
     ):
         out = await stats_tools.apply_member_role_matrix(
@@ -255,7 +256,7 @@ async def test_member_role_matrix_member_filter_uses_canonical_resolver():
 
     with (
         patch(
-            "app.agents.statistics.tools.get_member_meeting_stats",
+            "app.services.analytics_snapshot.member_meeting_rows",
             return_value=role_rows,
         ),
         patch(
@@ -349,7 +350,7 @@ async def test_member_role_matrix_role_group_expands_to_stable_role_keys():
 
     with (
         patch(
-            "app.agents.statistics.tools.get_member_meeting_stats",
+            "app.services.analytics_snapshot.member_meeting_rows",
             return_value=role_rows,
         ),
         patch(
@@ -449,7 +450,7 @@ async def test_member_role_matrix_hosting_and_facilitator_group_memberships():
 
     with (
         patch(
-            "app.agents.statistics.tools.get_member_meeting_stats",
+            "app.services.analytics_snapshot.member_meeting_rows",
             return_value=role_rows,
         ),
         patch(
@@ -549,7 +550,7 @@ async def test_member_award_matrix_groups_resolved_and_unresolved_winners():
         },
     ]
 
-    with patch("app.agents.statistics.tools.get_member_award_stats", return_value=award_rows):
+    with patch("app.services.analytics_snapshot.member_award_rows", return_value=award_rows):
         out = await stats_tools.apply_member_award_matrix(
             ctx,
             date_from="2026-01-01",
@@ -637,7 +638,7 @@ async def test_member_award_matrix_category_filters_accept_standard_keys_and_raw
         },
     ]
 
-    with patch("app.agents.statistics.tools.get_member_award_stats", return_value=award_rows):
+    with patch("app.services.analytics_snapshot.member_award_rows", return_value=award_rows):
         out = await stats_tools.apply_member_award_matrix(
             ctx,
             category_filters=["BestPS", "Best Joke"],
@@ -700,7 +701,7 @@ async def test_member_award_matrix_member_filter_uses_canonical_resolver():
     ]
 
     with (
-        patch("app.agents.statistics.tools.get_member_award_stats", return_value=award_rows),
+        patch("app.services.analytics_snapshot.member_award_rows", return_value=award_rows),
         patch(
             "app.services.meeting_stats.resolve_member",
             return_value=type(
@@ -741,7 +742,7 @@ async def test_member_award_matrix_retries_for_unknown_custom_category():
         }
     ]
 
-    with patch("app.agents.statistics.tools.get_member_award_stats", return_value=award_rows):
+    with patch("app.services.analytics_snapshot.member_award_rows", return_value=award_rows):
         with pytest.raises(ModelRetry, match="Best Joke"):
             await stats_tools.apply_member_award_matrix(
                 ctx,
@@ -749,11 +750,23 @@ async def test_member_award_matrix_retries_for_unknown_custom_category():
             )
 
 
+@pytest.mark.asyncio
+async def test_member_filter_near_miss_is_suggested_not_resolved():
+    """'Amy Wang' is one letter off member Amy Fang but may be a guest, so
+    the tool asks the user to confirm instead of reporting Amy Fang's roles."""
+    ctx = FakeCtx(deps=_deps())
+    members = [{"id": "mem-amy", "username": "amy", "full_name": "Amy Fang"}]
+
+    with patch("app.db.core.get_members", lambda: members):
+        with pytest.raises(ModelRetry, match=r"closest member names are Amy Fang \(@amy\)"):
+            await stats_tools.apply_member_role_matrix(ctx, member="Amy Wang")
+
+
 @pytest.mark.asyncio
 async def test_member_award_matrix_standard_category_with_no_rows_returns_zero():
     ctx = FakeCtx(deps=_deps())
 
-    with patch("app.agents.statistics.tools.get_member_award_stats", return_value=[]):
+    with patch("app.services.analytics_snapshot.member_award_rows", return_value=[]):
         out = await stats_tools.apply_member_award_matrix(
             ctx,
             category_filters=["BestPS"],
@@ -812,7 +825,7 @@ async def test_member_award_matrix_meeting_no_filter_scopes_to_one_meeting():
         },
     ]
 
-    with patch("app.agents.statistics.tools.get_member_award_stats", return_value=award_rows):
+    with patch("app.services.analytics_snapshot.member_award_rows", return_value=award_rows):
         out = await stats_tools.apply_member_award_matrix(
             ctx,
             meeting_no=408,
@@ -839,23 +852,64 @@ async def test_member_award_matrix_retries_when_relative_date_scope_missing():
 
 
 @pytest.mark.asyncio
-async def test_stats_deps_pool_cache_field_default_is_none():
-    """Stats deps owns the same per-turn lookup cache as the meeting
-    agent, so parallel lookup fan-out shares one recent-meetings fetch."""
-    deps = _deps()
-    assert deps.meeting_pool_cache is None
-    assert deps.meeting_pool_lock is None
+async def test_matrix_tools_in_one_turn_share_one_snapshot_load(monkeypatch):
+    from app.services import analytics_snapshot
+
+    calls: list[str | None] = []
+
+    def fake_changes(since, _meeting_ids):
+        calls.append(since)
+        return {
+            "as_of": "2026-04-28T00:00:00+00:00",
+            "counts": {"members": 1, "attendees": 1, "meetings": 1, "segments": 1, "awards": 1, "checkins": 0},
+            "members": [{"id": "mem-joyce", "username": "joyce", "full_name": "Joyce Feng"}],
+            "attendees": [{"id": "att-joyce", "name": "Joyce", "wxid": None, "member_id": "mem-joyce"}],
+            "meetings": [
+                {
+                    "id": "m1",
+                    "no": 451,
+                    "type": "Regular",
+                    "theme": "A",
+                    "date": "2026-01-07",
+                    "manager_id": "att-joyce",
+                    "status": "published",
+                }
+            ],
+            "segments": [
+                {
+                    "id": "s1",
+                    "meeting_id": "m1",
+                    "attendee_id": "att-joyce",
+                    "type": "General Evaluation",
+                    "start_time": "20:30:00",
+                }
+            ],
+            "awards": [{"id": "a1", "meeting_id": "m1", "category": "Best Evaluator", "winner": "Joyce Feng"}],
+            "checkins": [],
+        }
+
+    monkeypatch.setattr(analytics_snapshot.analytics_snapshot, "_fetch_changes", fake_changes)
+    ctx = FakeCtx(deps=_deps())
+
+    roles, managers, awards = await asyncio.gather(
+        stats_tools.apply_member_role_matrix(ctx, group_by="role", include_meetings=False),
+        stats_tools.apply_meeting_manager_matrix(ctx),
+        stats_tools.apply_member_award_matrix(ctx, group_by="winner", include_meetings=False),
+    )
+
+    assert calls == [None]
+    assert roles["value"]["groups"][0]["role_key"] == "GE"
+    assert managers["value"]["groups"][0]["member_id"] == "mem-joyce"
+    assert awards["value"]["groups"][0]["winner_key"] == "member:mem-joyce"
 
 
 @pytest.mark.asyncio
-async def test_stats_agent_lookup_meeting_shares_pool_across_parallel_calls():
-    """Cross-language theme + intro fan-out can produce multiple
-    `lookup_meeting` calls within one turn. They share the deps cache
-    so only one Supabase fetch happens."""
+async def test_stats_agent_lookup_meeting_queries_the_search_index():
+    """The stats agent's `lookup_meeting` is the shared wrapper: one
+    search-index query per call, cards in the shared envelope."""
     from app.agents.statistics.agent import lookup_meeting as agent_tool
-    from app.services import meeting_lookup as ml
 
-    fake_pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 451,
@@ -866,22 +920,15 @@ async def test_stats_agent_lookup_meeting_shares_pool_across_parallel_calls():
             "segments": [],
         },
     ]
-    deps = _deps()
-    ctx = FakeCtx(deps=deps)
-    with patch(
-        "app.services.meeting_lookup.db_meetings_recent",
-        return_value=fake_pool,
-    ) as mock_pool:
+    ctx = FakeCtx(deps=_deps())
+    with indexed(meetings) as index:
         results = await asyncio.gather(
             agent_tool(ctx, theme_substring="T"),
-            agent_tool(ctx, theme_substring="t"),
-            agent_tool(ctx, introduction_substring="x"),
             agent_tool(ctx, name_substring="Joyce"),
         )
 
-    assert mock_pool.call_count == 1
-    assert all("cards" in r for r in results)
-    assert ml.MeetingFilters is not None
+    assert len(index.calls) == 2
+    assert [r["cards"][0]["no"] for r in results] == [451, 451]
 
 
 @pytest.mark.asyncio
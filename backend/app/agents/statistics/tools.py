@@ -15,8 +15,8 @@ from zoneinfo import ZoneInfo
 
 from pydantic_ai import ModelRetry
 
-from app.db.stats import get_meeting_attendance_stats, get_member_award_stats, get_member_meeting_stats
-from app.services import meeting_lookup, meeting_stats
+from app.db.stats import get_meeting_attendance_stats
+from app.services import analytics_snapshot, meeting_lookup, meeting_stats
 
 MeetingType = Literal["Regular", "Workshop", "Custom"]
 AttendanceSortBy = Literal["date", "member_count", "guest_count", "total_count"]
@@ -301,6 +301,13 @@ def _resolve_award_category_filters(
 def _resolve_member_or_retry(name: str) -> meeting_stats.Member:
     result = meeting_stats.resolve_member(name)
     if result is None:
+        suggestions = meeting_stats.suggest_members(name)
+        if suggestions:
+            names = ", ".join(f"{c.full_name} (@{c.username})" for c in suggestions)
+            raise ModelRetry(
+                f"No member matched {name!r}; the closest member names are {names}. "
+                "Ask the user whether they meant one of them — they may be a guest."
+            )
         raise ModelRetry(f"No member matched {name!r}. Ask the user to provide a more specific name.")
     if isinstance(result, meeting_stats.AmbiguousMember):
         candidates = ", ".join(f"{c.full_name} (@{c.username})" for c in result.candidates)
@@ -452,8 +459,11 @@ def _rows_for_member_role_matrix(
     role_filter: str | None,
     role_group: str | None,
 ) -> tuple[list[dict], list[str]]:
-    raw_rows = get_member_meeting_stats(date_from, date_to)
     canonical_member = _resolve_member_or_retry(member) if member else None
+    # A member filter reads that member's rows off the per-member index.
+    raw_rows = analytics_snapshot.member_meeting_rows(
+        date_from, date_to, member_id=canonical_member.id if canonical_member else None
+    )
     allowed_role_keys: set[str] | None = None
     if role_filter:
         allowed_role_keys = {role_filter}
@@ -680,7 +690,8 @@ async def apply_meeting_manager_matrix(
 ) -> dict:
     """Per-member counts of meetings managed (Meeting Manager role).
 
-    Backed by `meeting_stats.group_meetings_by_manager`, which counts
+    Backed by the analytics snapshot's `group_meetings_by_manager` (same
+    rows as `meeting_stats.group_meetings_by_manager`), which counts
     meetings.manager_id grouped by resolved member_id. Always
     server-side aggregated — never have the LLM count cards.
     """
@@ -694,7 +705,7 @@ async def apply_meeting_manager_matrix(
         raise ModelRetry("sort_order must be 'asc' or 'desc'.")
 
     rows = await asyncio.to_thread(
-        meeting_stats.group_meetings_by_manager,
+        analytics_snapshot.group_meetings_by_manager,
         date_from=date_from,
         date_to=date_to,
         type_filter=type_filter,  # type: ignore[arg-type]
@@ -805,7 +816,7 @@ def _rows_for_member_award_matrix(
     category_filters: list[str] | None,
     meeting_no: int | None,
 ) -> tuple[list[dict], list[str], set[str] | None]:
-    raw_rows = get_member_award_stats(date_from, date_to)
+    raw_rows = analytics_snapshot.member_award_rows(date_from, date_to)
     observed_categories = _observed_award_categories(raw_rows)
     resolved_category_filters = _resolve_award_category_filters(category_filters, observed_categories)
     canonical_member = _resolve_member_or_retry(member) if member else None
@@ -0,0 +1,52 @@
+"""ETag / 304 handling for public read endpoints (see app/db/response_cache.py)."""
+
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from ..db.response_cache import CachedResponse, make_etag, response_cache
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """`If-None-Match` check; weak comparison, as RFC 9110 requires for it."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+async def cached_json(
+    request: Request,
+    scope: str,
+    build: Callable[[], Awaitable[BaseModel]],
+    *,
+    shared: bool,
+) -> Response:
+    """Serve `build()`'s model as JSON with an ETag, or 304 when the client has it.
+
+    Args:
+        scope: Response-cache scope whose writes make this body stale.
+        build: Produces the response model; HTTPExceptions pass through.
+        shared: Whether the body is the same for every caller that gets it
+            (anonymous reads). Only shared bodies are cached and marked
+            `public`; the rest still get an ETag.
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    cached = response_cache.get(key) if shared else None
+    if cached is None:
+        generation = response_cache.generation(scope)
+        body = (await build()).model_dump_json(by_alias=True).encode()
+        cached = response_cache.put(key, scope, body, generation) if shared else CachedResponse(body, make_etag(body))
+
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": "public, no-cache" if shared else "private, no-cache",
+        "Vary": "Authorization",
+    }
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(cached.body, media_type="application/json", headers=headers)
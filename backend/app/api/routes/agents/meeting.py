@@ -369,13 +369,14 @@ async def agent_turn(
                 current_agent=AgentKind.MEETING,
                 system_prompt=MEETING_SYSTEM_PROMPT,
             )
-            # Eager-fetch the live members directory once per turn. The agent
-            # tools (`set_role`, `add_segment`) consult this to resolve a
-            # bare-name LLM arg ("Joyce Feng") to a structured `Attendee`
-            # carrying the real DB `member_id`. ~20 rows; one cheap query.
-            from app.db.core import get_members
-
-            members_directory = await asyncio.to_thread(get_members) or []
+            # Snapshot the members directory once per turn. The agent tools
+            # (`set_role`, `add_segment`) consult it to resolve a bare-name
+            # LLM arg ("Joyce Feng") to a structured `Attendee` carrying the
+            # real DB `member_id`. Served from the process-wide cache; the
+            # thread only matters on the turn that reloads it.
+            from app.services.member_directory import member_directory
+
+            members_directory = await asyncio.to_thread(member_directory.current)
             deps = AgendaDeps(
                 agenda=copy.deepcopy(req.agenda_snapshot),
                 session_id=req.session_id,
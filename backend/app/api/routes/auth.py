@@ -8,8 +8,10 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import ExpiredSignatureError, JWTError, jwt
 
 from ...config import SUPABASE_JWT_SECRET, SUPABASE_URL, WECHAT_JWT_SECRET
-from ...db.core import get_attendee_id_by_wxid, get_members, get_user_by_wxid
-from ...db.supabase import supabase
+from ...db.core import get_attendee_id_by_wxid, get_user_by_wxid
+from ...db.identity import Identity, identity_cache
+from ...db.supabase import run_sync
+from ...db.supabase import thread_supabase as supabase
 from ...models.users import User
 from ...models.wechat_user import (
     TokenRefreshResponse,
@@ -17,6 +19,7 @@ from ...models.wechat_user import (
     WeChatLoginResponse,
     WeChatUser,
 )
+from ...services.member_directory import member_directory
 from ...utils.wechat import exchange_wx_code_for_openid
 
 http_scheme = HTTPBearer()
@@ -226,15 +229,9 @@ def get_current_extended_user(
                 # Return WeChatUser from embedded data
                 return WeChatUser(wxid=wxid, attendee_id=user_data.get("attendee_id"))
         else:
-            # Fallback to DB queries for legacy tokens
-            user_data = get_user_by_wxid(wxid)
-            if user_data:
-                # Return User object for bound members
-                return User(**user_data)
-            else:
-                # Return WeChatUser for unbound users
-                attendee_id = get_attendee_id_by_wxid(wxid)
-                return WeChatUser(wxid=wxid, attendee_id=attendee_id)
+            # Fallback to DB queries for legacy tokens: User for bound
+            # members, WeChatUser for unbound users (cached by wxid)
+            return identity_cache.wechat_user(wxid)
     else:
         # Supabase token
         return User(
@@ -259,6 +256,25 @@ def get_optional_extended_user(
         return None
 
 
+def get_identity(user: Union[User, WeChatUser] = Depends(get_current_extended_user)) -> Identity:
+    """The caller as an `Identity`: the user plus their wxid, attendee_id and
+    admin flag, which the checkin, feedback and timer routes check
+    permissions against.
+
+    FastAPI resolves a dependency once per request however many parameters
+    use it, and `identity_cache` reuses member lookups across requests for
+    `IDENTITY_CACHE_TTL_SECONDS`, so routes take this instead of querying
+    the binding themselves."""
+    return identity_cache.resolve(user)
+
+
+def get_optional_identity(
+    user: Optional[Union[User, WeChatUser]] = Depends(get_optional_extended_user),
+) -> Identity:
+    """Like get_identity, but anonymous requests get an empty Identity instead of a 401."""
+    return identity_cache.resolve(user)
+
+
 @r.get("/whoami")
 async def whoami(user: User = Depends(get_current_user)) -> User:
     return user
@@ -280,7 +296,7 @@ async def is_admin(user: User = Depends(get_current_user)) -> bool:
 
 @r.get("/members")
 async def members(user: User = Depends(get_current_user)) -> List[User]:
-    members = get_members()
+    members = await run_sync(member_directory.members)
     return [User(uid=member["id"], username=member["username"], full_name=member["full_name"]) for member in members]
 
 
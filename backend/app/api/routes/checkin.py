@@ -2,16 +2,17 @@ from typing import Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Path
 
+from ...db.aio import get_checkin_by_segment, get_checkins_by_meeting, get_meeting_by_id
 from ...db.core import (
+    MeetingNotFoundError,
+    SegmentNotInMeetingError,
+    TimerRoleTakenError,
     create_checkins,
-    get_checkin_by_segment,
-    get_checkins_by_meeting,
     get_extended_user_wxid,
-    get_meeting_by_id,
-    get_user_by_wxid,
     reset_segment_checkin,
-    validate_segments_belong_to_meeting,
 )
+from ...db.identity import Identity
+from ...db.supabase import run_sync
 from ...models.checkin import (
     Checkin,
     CheckinCreate,
@@ -22,7 +23,7 @@ from ...models.checkin import (
 )
 from ...models.users import User
 from ...models.wechat_user import WeChatUser
-from .auth import get_current_extended_user, get_optional_extended_user
+from .auth import get_current_extended_user, get_identity, get_optional_extended_user
 
 checkin_router = r = APIRouter()
 
@@ -32,6 +33,7 @@ async def create_meeting_checkins(
     checkin_data: CheckinCreate,
     meeting_id: str = Path(..., description="The ID of the meeting to create checkins for"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Create checkins for meeting segments - allows users to register their participation.
@@ -50,9 +52,11 @@ async def create_meeting_checkins(
     - Members without wxid binding will receive a 403 error
     - WeChat users inherently have wxid from their authentication
 
-    Validation performed:
+    Validation performed (all inside the one `checkin` RPC call):
     - Meeting existence verification
     - Segment ownership validation (only when specific segments are provided)
+    - Timer exclusivity (only one person can hold the Timer segment)
+    - Membership inference from the wxid's member binding
     - Duplicate checkin prevention (handled by database unique constraints)
 
     Args:
@@ -66,56 +70,38 @@ async def create_meeting_checkins(
     Raises:
         HTTPException 403: If user lacks wxid binding
         HTTPException 404: If meeting not found
+        HTTPException 409: If the Timer role is already taken
         HTTPException 422: If segment IDs don't belong to meeting
         HTTPException 500: If checkin creation fails
     """
     # For create operations, members must have wxid binding
-    wxid = get_extended_user_wxid(current_user)
+    wxid = identity.wxid
     if not wxid:
         raise HTTPException(status_code=403, detail="User wxid not bound to attendee record")
 
-    # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-
-    # Validate segments belong to meeting (skip validation for None and empty list)
-    if checkin_data.segment_ids and not validate_segments_belong_to_meeting(meeting_id, checkin_data.segment_ids):
-        raise HTTPException(status_code=422, detail="One or more segment IDs do not belong to this meeting")
-
-    # Check if Timer segment is being requested and already taken by someone else
-    if checkin_data.segment_ids and meeting.get("segments"):
-        # Find the Timer segment in the meeting
-        timer_segment = next(
-            (s for s in meeting["segments"] if s.get("type", "").lower() == "timer"),
-            None,
-        )
-        if timer_segment and timer_segment["id"] in checkin_data.segment_ids:
-            # Check if Timer is already taken
-            existing_timer_checkin = get_checkin_by_segment(meeting_id, timer_segment["id"])
-            if existing_timer_checkin and existing_timer_checkin.get("wxid") != wxid:
-                raise HTTPException(status_code=409, detail="Timer role is already taken")
-
-    # Infer membership status from wxid binding
-    is_member = get_user_by_wxid(wxid) is not None
-
-    # Create checkins
     try:
-        checkins = create_checkins(
+        checkins = await run_sync(
+            create_checkins,
             meeting_id=meeting_id,
             wxid=wxid,
             segment_ids=checkin_data.segment_ids,
             name=checkin_data.name,
             referral_source=checkin_data.referral_source,
-            is_member=is_member,
+            is_member=identity.is_member,
+            published_only=not identity.is_member,
         )
-
-        checkin_models = [Checkin(**checkin) for checkin in checkins]
-        return CheckinResponse(success=True, checkins=checkin_models)
-
+    except MeetingNotFoundError:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    except SegmentNotInMeetingError:
+        raise HTTPException(status_code=422, detail="One or more segment IDs do not belong to this meeting")
+    except TimerRoleTakenError:
+        raise HTTPException(status_code=409, detail="Timer role is already taken")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create checkins: {e!s}")
 
+    checkin_models = [Checkin(**checkin) for checkin in checkins]
+    return CheckinResponse(success=True, checkins=checkin_models)
+
 
 @r.get("/meetings/{meeting_id}/checkins", response_model=CheckinListResponse)
 async def get_meeting_checkins(
@@ -151,7 +137,7 @@ async def get_meeting_checkins(
         return CheckinListResponse(checkins=[])
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -159,17 +145,17 @@ async def get_meeting_checkins(
     is_member = isinstance(current_user, User)
 
     if is_member:
-        checkins = get_checkins_by_meeting(meeting_id, wxid=None)
+        checkins = await get_checkins_by_meeting(meeting_id, wxid=None)
     else:
-        wxid = get_extended_user_wxid(current_user)
-        checkins = get_checkins_by_meeting(meeting_id, wxid=wxid)
+        wxid = await run_sync(get_extended_user_wxid, current_user)
+        checkins = await get_checkins_by_meeting(meeting_id, wxid=wxid)
 
     # Get Timer wxid for miniapp Timer disable feature
     timer_wxid = None
     if meeting.get("segments"):
         timer_segment = next((s for s in meeting["segments"] if s.get("type", "").lower() == "timer"), None)
         if timer_segment:
-            timer_checkin = get_checkin_by_segment(meeting_id, timer_segment["id"])
+            timer_checkin = await get_checkin_by_segment(meeting_id, timer_segment["id"])
             if timer_checkin:
                 timer_wxid = timer_checkin.get("wxid")
 
@@ -210,12 +196,12 @@ async def reset_meeting_checkin(
         raise HTTPException(status_code=403, detail="Only members can reset checkins")
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Reset the checkin
-    result = reset_segment_checkin(meeting_id, reset_data.segment_id)
+    result = await run_sync(reset_segment_checkin, meeting_id, reset_data.segment_id)
     if not result:
         raise HTTPException(status_code=404, detail="No checkin found for this segment")
 
@@ -0,0 +1,79 @@
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request
+from fastapi.responses import StreamingResponse
+
+from ...config import MEETING_EVENTS_KEEPALIVE_SECONDS
+from ...db import meeting_events as events
+from ...db.aio import get_meeting_by_id
+from ...models.users import User
+from ...models.wechat_user import WeChatUser
+from .agents._shared import _sse
+from .auth import get_optional_extended_user
+
+events_router = r = APIRouter()
+
+_KEEPALIVE = b": keepalive\n\n"
+
+
+def _visible_event(
+    event: events.MeetingEvent, current_user: Optional[Union[User, WeChatUser]]
+) -> Optional[Dict[str, Any]]:
+    """
+    The part of `event` this viewer may see, or None to skip it.
+
+    Mirrors the REST reads: members see every checkin and the vote counts,
+    WeChat users only their own checkins, anonymous viewers neither.
+    """
+    if event.event == events.CHECKINS:
+        if isinstance(current_user, User):
+            return event.data
+        if isinstance(current_user, WeChatUser) and event.data.get("wxid") == current_user.wxid:
+            return event.data
+        return None
+    if event.event == events.VOTES:
+        return event.data if isinstance(current_user, User) else None
+    return event.data
+
+
+@r.get("/meetings/{meeting_id}/events")
+async def stream_meeting_events(
+    request: Request,
+    meeting_id: str = Path(..., description="The ID of the meeting to follow"),
+    current_user: Optional[Union[User, WeChatUser]] = Depends(get_optional_extended_user),
+):
+    """
+    Stream live updates for a meeting as server-sent events.
+
+    Replaces polling `/timings`, `/checkins` and `/votes` during a meeting.
+    Events:
+    - ready: sent once subscribed; fetch the current state over REST now
+    - timings: {"timings": [...]} the meeting's full timing list after a timing write
+    - checkins: {"wxid", "checkins": [...]} the complete checkins of one wxid
+    - votes: {"votes": [...]} the vote rows a ballot just incremented (members only)
+    - votes_status: the meeting's new votes status row
+    - resync: updates were dropped; refetch over REST
+
+    A comment line is sent every MEETING_EVENTS_KEEPALIVE_SECONDS while idle.
+
+    Raises:
+        HTTPException 404: If meeting not found
+    """
+    user_id = current_user.uid if isinstance(current_user, User) else None
+    meeting = await get_meeting_by_id(meeting_id, user_id)
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        with events.meeting_events.subscribe(meeting_id) as subscription:
+            yield _sse("ready", {"meeting_id": meeting_id})
+            while not await request.is_disconnected():
+                event = await subscription.get(MEETING_EVENTS_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield _KEEPALIVE
+                    continue
+                data = _visible_event(event, current_user)
+                if data is not None:
+                    yield _sse(event.event, data)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
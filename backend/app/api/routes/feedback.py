@@ -2,20 +2,19 @@ from typing import Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
 
+from ...db.aio import get_meeting_by_id
 from ...db.core import (
     create_experiences,
     create_feedback,
     delete_feedback,
-    get_extended_user_attendee_id,
-    get_extended_user_wxid,
     get_feedback_by_id,
     get_feedbacks_by_meeting,
-    get_meeting_by_id,
-    is_extended_user_admin,
     update_feedback,
     validate_attendee_id_exists,
     validate_segments_belong_to_meeting,
 )
+from ...db.identity import Identity
+from ...db.supabase import run_sync
 from ...models.feedback import (
     Feedback,
     FeedbackCreate,
@@ -25,7 +24,7 @@ from ...models.feedback import (
 )
 from ...models.users import User
 from ...models.wechat_user import WeChatUser
-from .auth import get_current_extended_user, get_optional_extended_user
+from .auth import get_current_extended_user, get_identity, get_optional_extended_user, get_optional_identity
 
 feedback_router = r = APIRouter()
 
@@ -35,6 +34,7 @@ async def create_meeting_feedback(
     feedback_data: FeedbackCreate,
     meeting_id: str = Path(..., description="The ID of the meeting to create feedback for"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Create feedback for a meeting - supports experience curves and targeted feedback.
@@ -74,28 +74,29 @@ async def create_meeting_feedback(
         HTTPException 422: If segment/attendee IDs are invalid
         HTTPException 500: If feedback creation fails
     """
-    wxid = get_extended_user_wxid(current_user)
+    wxid = identity.wxid
     if not wxid:
         raise HTTPException(status_code=403, detail="User wxid not available")
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Validate segment_id belongs to meeting if provided
     if feedback_data.segment_id:
-        if not validate_segments_belong_to_meeting(meeting_id, [feedback_data.segment_id]):
+        if not await run_sync(validate_segments_belong_to_meeting, meeting_id, [feedback_data.segment_id]):
             raise HTTPException(status_code=422, detail="Segment ID does not belong to this meeting")
 
     # Validate to_attendee_id exists if provided
     if feedback_data.to_attendee_id:
-        if not validate_attendee_id_exists(feedback_data.to_attendee_id):
+        if not await run_sync(validate_attendee_id_exists, feedback_data.to_attendee_id):
             raise HTTPException(status_code=422, detail="Invalid to_attendee_id")
 
     # Create feedback
     try:
-        feedback_dict = create_feedback(
+        feedback_dict = await run_sync(
+            create_feedback,
             meeting_id=meeting_id,
             wxid=wxid,
             feedback_type=feedback_data.type.value,
@@ -119,6 +120,7 @@ async def get_meeting_feedbacks(
     feedback_type: Optional[str] = Query(None, description="Filter by feedback type"),
     segment_id: Optional[str] = Query(None, description="Filter by segment ID"),
     current_user: Optional[Union[User, WeChatUser]] = Depends(get_optional_extended_user),
+    identity: Identity = Depends(get_optional_identity),
 ):
     """
     Retrieve feedbacks for a meeting with sophisticated access control and filtering.
@@ -156,12 +158,12 @@ async def get_meeting_feedbacks(
     if not current_user:
         return FeedbackListResponse(feedbacks=[])
 
-    wxid = get_extended_user_wxid(current_user)
-    user_attendee_id = get_extended_user_attendee_id(current_user)
-    is_admin = is_extended_user_admin(current_user)
+    wxid = identity.wxid
+    user_attendee_id = identity.attendee_id
+    is_admin = identity.is_admin
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -170,7 +172,8 @@ async def get_meeting_feedbacks(
         return FeedbackListResponse(feedbacks=[])
 
     # Get feedbacks with access control
-    feedback_dicts = get_feedbacks_by_meeting(
+    feedback_dicts = await run_sync(
+        get_feedbacks_by_meeting,
         meeting_id=meeting_id,
         wxid=wxid,
         user_attendee_id=user_attendee_id,
@@ -189,6 +192,7 @@ async def update_meeting_feedback(
     meeting_id: str = Path(..., description="The ID of the meeting"),
     feedback_id: str = Path(..., description="The ID of the feedback to update"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Update an existing feedback record with ownership validation.
@@ -229,18 +233,18 @@ async def update_meeting_feedback(
         HTTPException 422: If feedback doesn't belong to specified meeting
         HTTPException 500: If feedback update fails
     """
-    wxid = get_extended_user_wxid(current_user)
-    is_admin = is_extended_user_admin(current_user)
+    wxid = identity.wxid
+    is_admin = identity.is_admin
     if not wxid and not is_admin:
         raise HTTPException(status_code=403, detail="User wxid not available")
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Get existing feedback
-    feedback = get_feedback_by_id(feedback_id)
+    feedback = await run_sync(get_feedback_by_id, feedback_id)
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
@@ -265,7 +269,7 @@ async def update_meeting_feedback(
 
     # Update feedback
     try:
-        updated_feedback_dict = update_feedback(feedback_id, updates)
+        updated_feedback_dict = await run_sync(update_feedback, feedback_id, updates)
         updated_feedback = Feedback(**updated_feedback_dict)
         return FeedbackResponse(success=True, feedback=updated_feedback)
 
@@ -280,6 +284,7 @@ async def delete_meeting_feedback(
     meeting_id: str = Path(..., description="The ID of the meeting"),
     feedback_id: str = Path(..., description="The ID of the feedback to delete"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Delete an existing feedback record with strict ownership validation.
@@ -322,18 +327,18 @@ async def delete_meeting_feedback(
         HTTPException 422: If feedback doesn't belong to specified meeting
         HTTPException 500: If feedback deletion fails
     """
-    wxid = get_extended_user_wxid(current_user)
-    is_admin = is_extended_user_admin(current_user)
+    wxid = identity.wxid
+    is_admin = identity.is_admin
     if not wxid and not is_admin:
         raise HTTPException(status_code=403, detail="User wxid not available")
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Get existing feedback
-    feedback = get_feedback_by_id(feedback_id)
+    feedback = await run_sync(get_feedback_by_id, feedback_id)
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
@@ -346,7 +351,7 @@ async def delete_meeting_feedback(
         raise HTTPException(status_code=403, detail="Can only delete your own feedback")
 
     # Delete feedback
-    success = delete_feedback(feedback_id)
+    success = await run_sync(delete_feedback, feedback_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete feedback")
 
@@ -358,6 +363,7 @@ async def create_meeting_experiences(
     experience_data: dict,
     meeting_id: str = Path(..., description="The ID of the meeting to create experience feedbacks for"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Create experience curve feedbacks for a meeting - batch operation for 4 experience types.
@@ -394,12 +400,12 @@ async def create_meeting_experiences(
         HTTPException 404: If meeting not found
         HTTPException 500: If experience feedback creation fails
     """
-    wxid = get_extended_user_wxid(current_user)
+    wxid = identity.wxid
     if not wxid:
         raise HTTPException(status_code=403, detail="User wxid required for experience feedback")
 
     # Validate meeting exists
-    meeting = get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
+    meeting = await get_meeting_by_id(meeting_id, current_user.uid if isinstance(current_user, User) else None)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -411,7 +417,8 @@ async def create_meeting_experiences(
 
     # Create experience feedbacks
     try:
-        feedback_dicts = create_experiences(
+        feedback_dicts = await run_sync(
+            create_experiences,
             meeting_id=meeting_id,
             wxid=wxid,
             opening=opening,
@@ -1,41 +1,44 @@
-import mimetypes
 import secrets
-from datetime import datetime, timezone
 from typing import Dict, List, Optional, Union
-from urllib.parse import quote
 
 import oss2  # type: ignore
-from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, Request, Response, UploadFile
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 
 from ...config import (
-    ALICLOUD_ACCESS_KEY_ID,
-    ALICLOUD_ACCESS_KEY_SECRET,
     ALICLOUD_OSS_BUCKET,
     ALICLOUD_OSS_ENDPOINT,
     ALICLOUD_OSS_MEETING_MEDIA_PREFIX,
     WXPOST_SERVICE_TOKEN,
 )
+from ...db.aio import (
+    get_meeting_by_id,
+    get_meeting_options,
+    get_meeting_options_by_cursor,
+    get_meeting_options_by_ids,
+    get_votes_by_meeting,
+    get_votes_status,
+)
 from ...db.core import (
     cast_votes,
     create_meeting,
     delete_meeting,
     get_awards_by_meeting,
-    get_meeting_by_id,
-    get_meeting_options,
-    get_meeting_options_by_ids,
     get_meetings,
-    get_votes_by_meeting,
-    get_votes_status,
+    get_meetings_by_cursor,
     save_meeting_awards,
     save_vote_form,
     update_meeting,
     update_meeting_status,
     update_votes_status,
 )
+from ...db.response_cache import MEETINGS
+from ...db.supabase import run_sync
 from ...models.meeting import (
     Award,
+    CursorPaginatedMeetingOptions,
+    CursorPaginatedMeetings,
     Meeting,
     MeetingOptionsByIdsRequest,
     MeetingOptionsByIdsResponse,
@@ -45,7 +48,15 @@ from ...models.meeting import (
     VotesStatus,
 )
 from ...models.users import User
+from ...services.meeting_media import (
+    MEDIA_UPLOAD_URL_EXPIRES_SECONDS,
+    get_bucket,
+    media_page,
+    media_prefix,
+    meeting_media_index,
+)
 from ...utils.meeting import parse_meeting_agenda_image, plan_meeting_from_text
+from ..http_cache import cached_json
 from .auth import get_current_user, get_optional_user, verify_access_token
 
 http_scheme = HTTPBearer()
@@ -104,6 +115,8 @@ class MediaFile(BaseModel):
 
 class MediaFileList(BaseModel):
     items: List[MediaFile]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
 
 
 class MediaUploadUrlRequestItem(BaseModel):
@@ -195,7 +208,7 @@ async def r_create_meeting(meeting_data: Meeting, user: User = Depends(get_curre
         meeting_dict = meeting_data.dict(exclude={"id"})  # Exclude id for creation
 
         # Create the meeting in the database
-        meeting_db = create_meeting(meeting_dict)
+        meeting_db = await run_sync(create_meeting, meeting_dict)
 
         return Meeting(**meeting_db)
     except ValueError as e:
@@ -204,43 +217,88 @@ async def r_create_meeting(meeting_data: Meeting, user: User = Depends(get_curre
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e!s}")
 
 
-@r.get("/meetings", response_model=PaginatedMeetings)
+@r.get("/meetings", response_model=Union[PaginatedMeetings, CursorPaginatedMeetings])
 async def r_list_meetings(
+    request: Request,
     user: Optional[User] = Depends(get_optional_user),
     status: Optional[str] = Query(None, description="Filter by status (draft or published)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
-) -> PaginatedMeetings:
+    cursor: Optional[str] = Query(
+        None, description="Keyset pagination: pass an empty cursor for the first page, then `next_cursor`"
+    ),
+    include_total: bool = Query(False, description="Keyset pagination only: include an estimated total"),
+) -> Response:
     """
     List meetings with pagination.
 
     This endpoint returns all published meetings for anonymous users,
     and both draft and published meetings for authenticated users.
     Results can be filtered by status and are paginated.
+
+    Offset pages (`page`) are the default. Passing `cursor` switches to keyset
+    pages ordered by (date, id), which skip the per-page count query and
+    stay stable for infinite scroll.
+
+    Responses carry an ETag; anonymous pages are cached until a meeting write.
     """
-    try:
-        meetings_db = get_meetings(user_id=user.uid if user else None, status=status, page=page, page_size=page_size)
+    user_id = user.uid if user else None
+
+    async def build() -> Union[PaginatedMeetings, CursorPaginatedMeetings]:
+        if cursor is not None:
+            meetings_page = await run_sync(
+                get_meetings_by_cursor,
+                user_id=user_id,
+                status=status,
+                cursor=cursor,
+                page_size=page_size,
+                include_total=include_total,
+            )
+            return CursorPaginatedMeetings(**meetings_page)
+
+        meetings_db = await run_sync(get_meetings, user_id=user_id, status=status, page=page, page_size=page_size)
         return PaginatedMeetings(**meetings_db)
+
+    try:
+        return await cached_json(request, MEETINGS, build, shared=user_id is None)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@r.get("/meetings/options", response_model=PaginatedMeetingOptions)
+@r.get("/meetings/options", response_model=Union[PaginatedMeetingOptions, CursorPaginatedMeetingOptions])
 async def r_list_meeting_options(
     user_id: Optional[str] = Depends(get_meeting_reader_user_id),
     status: Optional[str] = Query(None, description="Filter by status (draft or published)"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-) -> PaginatedMeetingOptions:
+    cursor: Optional[str] = Query(
+        None, description="Keyset pagination: pass an empty cursor for the first page, then `next_cursor`"
+    ),
+    include_total: bool = Query(False, description="Keyset pagination only: include an estimated total"),
+) -> Union[PaginatedMeetingOptions, CursorPaginatedMeetingOptions]:
     """List lightweight meeting options with the same visibility rules as `/meetings`."""
     try:
-        options = get_meeting_options(
+        if cursor is not None:
+            options_page = await get_meeting_options_by_cursor(
+                user_id=user_id,
+                status=status,
+                cursor=cursor,
+                page_size=page_size,
+                include_total=include_total,
+            )
+            return CursorPaginatedMeetingOptions(**options_page)
+
+        options = await get_meeting_options(
             user_id=user_id,
             status=status,
             page=page,
             page_size=page_size,
         )
         return PaginatedMeetingOptions(**options)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -252,7 +310,7 @@ async def r_list_meeting_options_by_ids(
 ) -> MeetingOptionsByIdsResponse:
     """Resolve compact meeting records in one request for workspace lists."""
     try:
-        options = get_meeting_options_by_ids(
+        options = await get_meeting_options_by_ids(
             request.ids,
             user_id=user_id,
         )
@@ -263,23 +321,26 @@ async def r_list_meeting_options_by_ids(
 
 @r.get("/meetings/{meeting_id}", response_model=Meeting)
 async def r_get_meeting(
+    request: Request,
     meeting_id: str = Path(..., description="The ID of the meeting to retrieve"),
     user_id: Optional[str] = Depends(get_meeting_reader_user_id),
-) -> Meeting:
+) -> Response:
     """
     Get a specific meeting by ID.
 
     For authenticated users, returns any meeting.
     For unauthenticated users, returns only published meetings.
+    Responses carry an ETag; anonymous reads are cached until a meeting write.
     """
-    try:
-        # Get meeting from database
-        meeting_db = get_meeting_by_id(meeting_id, user_id)
 
+    async def build() -> Meeting:
+        meeting_db = await get_meeting_by_id(meeting_id, user_id)
         if not meeting_db:
             raise HTTPException(status_code=404, detail="Meeting not found")
-
         return Meeting(**meeting_db)
+
+    try:
+        return await cached_json(request, MEETINGS, build, shared=user_id is None)
     except HTTPException:
         raise
     except Exception as e:
@@ -303,7 +364,7 @@ async def r_update_meeting(
         meeting_dict = meeting_data.dict(exclude={"id"})
 
         # Update the meeting in the database
-        meeting_db = update_meeting(meeting_id, meeting_dict, user.uid)
+        meeting_db = await run_sync(update_meeting, meeting_id, meeting_dict, user.uid)
 
         if not meeting_db:
             raise HTTPException(status_code=404, detail="Meeting not found")
@@ -338,7 +399,7 @@ async def r_update_meeting_status(
             raise HTTPException(status_code=400, detail="Invalid status. Must be 'draft' or 'published'")
 
         # Update the meeting status in the database
-        meeting_db = update_meeting_status(meeting_id, status, user.uid)
+        meeting_db = await run_sync(update_meeting_status, meeting_id, status, user.uid)
 
         if not meeting_db:
             raise HTTPException(status_code=404, detail="Meeting not found")
@@ -370,22 +431,21 @@ async def r_delete_meeting(
         payload = verify_access_token(user_token)
 
         # First delete the meeting from the database
-        success = delete_meeting(meeting_id, payload["sub"], user_token)
+        success = await run_sync(delete_meeting, meeting_id, payload["sub"], user_token)
 
         if not success:
             raise HTTPException(status_code=404, detail="Meeting not found or you don't have permission to delete it")
 
         # After successful database deletion, clean up media files in OSS
         try:
-            auth = oss2.Auth(ALICLOUD_ACCESS_KEY_ID, ALICLOUD_ACCESS_KEY_SECRET)
-            bucket = oss2.Bucket(auth, ALICLOUD_OSS_ENDPOINT, ALICLOUD_OSS_BUCKET)
+            bucket = get_bucket()
 
             # List all objects with the meeting prefix
-            media_prefix = f"{ALICLOUD_OSS_MEETING_MEDIA_PREFIX}/{meeting_id}/"
+            meeting_prefix = f"{ALICLOUD_OSS_MEETING_MEDIA_PREFIX}/{meeting_id}/"
             objects_to_delete = []
 
             # List and collect all objects with this prefix (this includes the "folder" itself)
-            for obj in oss2.ObjectIterator(bucket, prefix=media_prefix):
+            for obj in oss2.ObjectIterator(bucket, prefix=meeting_prefix):
                 objects_to_delete.append(obj.key)
 
             # Delete all objects in batches (AliCloud supports max 1000 objects per batch)
@@ -393,6 +453,7 @@ async def r_delete_meeting(
                 for i in range(0, len(objects_to_delete), 1000):
                     batch = objects_to_delete[i : i + 1000]
                     bucket.batch_delete_objects(batch)
+            meeting_media_index.invalidate(meeting_id)
         except oss2.exceptions.OssError as e:
             # Don't fail the request since the database deletion succeeded
             # Just add a note in the response that media deletion failed
@@ -424,12 +485,12 @@ async def r_get_meeting_awards(
     """
     try:
         # First check if the meeting exists and is accessible
-        meeting = get_meeting_by_id(meeting_id, user.uid if user else None)
+        meeting = await get_meeting_by_id(meeting_id, user.uid if user else None)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
         # Get all awards for the meeting
-        awards = get_awards_by_meeting(meeting_id)
+        awards = await run_sync(get_awards_by_meeting, meeting_id)
         return [Award(**award) for award in awards]
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -457,7 +518,7 @@ async def r_save_meeting_awards(
         awards = [award.dict(exclude={"id"}) for award in awards_data.awards]
 
         # Save the awards
-        saved_awards = save_meeting_awards(meeting_id, awards, user.uid)
+        saved_awards = await run_sync(save_meeting_awards, meeting_id, awards, user.uid)
 
         # Return the saved awards
         return [Award(**award) for award in saved_awards]
@@ -483,7 +544,7 @@ async def r_get_meeting_votes(
     - Non-authenticated users: Only category and candidate information (no counts)
     """
     try:
-        votes = get_votes_by_meeting(meeting_id)
+        votes = await get_votes_by_meeting(meeting_id)
 
         # Group votes by category and extract candidates
         categories_dict: Dict[str, List[Candidate]] = {}
@@ -520,7 +581,7 @@ async def r_get_votes_status(
     Anyone can access this endpoint.
     """
     try:
-        status = get_votes_status(meeting_id)
+        status = await get_votes_status(meeting_id)
         if not status:
             # Return a default status object if none exists
             return VotesStatus(id=None, meeting_id=meeting_id, open=False)
@@ -549,11 +610,11 @@ async def r_update_votes_status(
 
         # If trying to open voting, check if meeting has vote form data
         if status_update["open"]:
-            votes = get_votes_by_meeting(meeting_id)
+            votes = await get_votes_by_meeting(meeting_id)
             if not votes:
                 raise ValueError("Cannot open voting: No vote options defined. Please set up the vote form first.")
 
-        status = update_votes_status(meeting_id, status_update["open"], user.uid)
+        status = await run_sync(update_votes_status, meeting_id, status_update["open"], user.uid)
         if not status:
             raise HTTPException(status_code=404, detail="Meeting not found or not accessible")
         return VotesStatus(**status)
@@ -582,7 +643,7 @@ async def r_save_vote_form(
             for category in vote_form.dict()["votes"]
         ]
 
-        votes = save_vote_form(meeting_id, votes_list, user.uid)
+        votes = await run_sync(save_vote_form, meeting_id, votes_list, user.uid)
         return [CategoryCandidatesList(**vote) for vote in votes]
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -605,7 +666,7 @@ async def r_cast_vote(
         # Convert the Pydantic model to a list of dictionaries
         votes_list = [{"category": v.category, "name": v.name} for v in vote_data.votes]
 
-        results = cast_votes(meeting_id, votes_list)
+        results = await cast_votes(meeting_id, votes_list)
         if not results:
             raise ValueError("Voting is closed or none of the vote records exist")
         return [Vote(**vote) for vote in results]
@@ -619,51 +680,32 @@ async def r_cast_vote(
 async def r_get_meeting_media(
     meeting_id: str = Path(..., description="The ID of the meeting"),
     user_id: Optional[str] = Depends(get_meeting_reader_user_id),
+    page_size: Optional[int] = Query(None, ge=1, le=200, description="Items per page; omit to list every file"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the previous page"),
 ) -> MediaFileList:
     """
-    List all media files for a meeting directly from the storage bucket.
+    List a meeting's media files, oldest upload first.
+
+    The storage bucket listing is cached per meeting (see
+    app/services/meeting_media.py). Pass `page_size`, then each
+    `next_cursor`, to page through large galleries.
     """
     try:
-        meeting = get_meeting_by_id(meeting_id, user_id)
+        meeting = await get_meeting_by_id(meeting_id, user_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        # Set up OSS client
-        auth = oss2.Auth(ALICLOUD_ACCESS_KEY_ID, ALICLOUD_ACCESS_KEY_SECRET)
-        bucket = oss2.Bucket(auth, ALICLOUD_OSS_ENDPOINT, ALICLOUD_OSS_BUCKET)
-
-        # List objects with the meeting prefix
-        prefix = f"{ALICLOUD_OSS_MEETING_MEDIA_PREFIX}/{meeting_id}/media/"
-        object_list = []
-
-        for obj in oss2.ObjectIterator(bucket, prefix=prefix):
-            if obj.key != prefix:  # Skip the directory itself
-                filename = obj.key.split("/")[-1]
-                public_url = f"https://{ALICLOUD_OSS_BUCKET}.{ALICLOUD_OSS_ENDPOINT}/{quote(obj.key, safe='/')}"
-
-                modified_time = datetime.fromtimestamp(
-                    obj.last_modified,
-                    tz=timezone.utc,
-                )
-                formatted_time = modified_time.strftime("%Y-%m-%dT%H:%M:%SZ")
-                mime_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
-
-                object_list.append(
-                    MediaFile(
-                        filename=filename,
-                        url=public_url,
-                        fileKey=obj.key,
-                        uploadedAt=formatted_time,
-                        mimeType=mime_type,
-                        sizeBytes=obj.size,
-                    )
-                )
-
-        object_list.sort(key=lambda x: datetime.fromisoformat(x.uploadedAt.replace("Z", "+00:00")), reverse=False)
-
-        return MediaFileList(items=object_list)
+        items = await run_sync(meeting_media_index.get, meeting_id)
+        page = media_page(items, cursor, page_size)
+        return MediaFileList(
+            items=[MediaFile(**item) for item in page["items"]],
+            next_cursor=page["next_cursor"],
+            total=page["total"],
+        )
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except oss2.exceptions.OssError as e:
         raise HTTPException(status_code=500, detail=f"AliCloud OSS error: {e!s}")
     except Exception as e:
@@ -680,27 +722,28 @@ async def r_get_meeting_media_upload_url(
     Generate pre-signed URLs for uploading multiple media files directly to AliCloud OSS.
     """
     try:
-        meeting = get_meeting_by_id(meeting_id, user.uid if user else None)
+        meeting = await get_meeting_by_id(meeting_id, user.uid if user else None)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        auth = oss2.Auth(ALICLOUD_ACCESS_KEY_ID, ALICLOUD_ACCESS_KEY_SECRET)
-        bucket = oss2.Bucket(auth, ALICLOUD_OSS_ENDPOINT, ALICLOUD_OSS_BUCKET)
-
+        bucket = get_bucket()
         response_items = []
 
         for item in request.items:
             # Sanitize filename to prevent path traversal and ensure safe characters
             safe_filename = "".join(c for c in item.filename if c.isalnum() or c in "._- ")
-            file_key = f"{ALICLOUD_OSS_MEETING_MEDIA_PREFIX}/{meeting_id}/media/{safe_filename}"
+            file_key = f"{media_prefix(meeting_id)}{safe_filename}"
 
-            upload_url = bucket.sign_url("PUT", file_key, 3600, headers={"Content-Type": item.contentType})
+            upload_url = bucket.sign_url(
+                "PUT", file_key, MEDIA_UPLOAD_URL_EXPIRES_SECONDS, headers={"Content-Type": item.contentType}
+            )
             public_url = f"https://{ALICLOUD_OSS_BUCKET}.{ALICLOUD_OSS_ENDPOINT}/{file_key}"
 
             response_items.append(
                 MediaUploadUrlResponseItem(uploadUrl=upload_url, fileKey=file_key, fileUrl=public_url)
             )
 
+        meeting_media_index.expect_uploads(meeting_id)
         return MediaUploadUrlResponse(items=response_items)
     except oss2.exceptions.OssError as e:
         raise HTTPException(status_code=500, detail=f"AliCloud OSS error: {e!s}")
@@ -720,17 +763,17 @@ async def r_delete_meeting_media(
     Delete multiple media files from AliCloud OSS in a single request.
     """
     try:
-        meeting = get_meeting_by_id(meeting_id, user.uid if user else None)
+        meeting = await get_meeting_by_id(meeting_id, user.uid if user else None)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
-        # Set up OSS client
-        auth = oss2.Auth(ALICLOUD_ACCESS_KEY_ID, ALICLOUD_ACCESS_KEY_SECRET)
-        bucket = oss2.Bucket(auth, ALICLOUD_OSS_ENDPOINT, ALICLOUD_OSS_BUCKET)
-
         # Delete all specified objects
-        for file_key in request.fileKeys:
-            bucket.delete_object(file_key)
+        bucket = get_bucket()
+        try:
+            for file_key in request.fileKeys:
+                bucket.delete_object(file_key)
+        finally:
+            meeting_media_index.invalidate(meeting_id)
 
         return {"success": True}
     except oss2.exceptions.OssError as e:
@@ -1,37 +1,68 @@
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
 
-from ...db.content import get_content_items
+from ...db.content import get_content_items, get_content_items_by_cursor
 from ...db.core import (
     create_post,
     delete_post,
     get_post_by_slug,
     update_post,
 )
-from ...models.post import PaginatedContentItems, Post
+from ...db.response_cache import CONTENT
+from ...db.supabase import run_sync
+from ...models.post import CursorPaginatedContentItems, PaginatedContentItems, Post
 from ...models.users import User
+from ..http_cache import cached_json
 from .auth import get_current_user, get_optional_user
 
 post_router = r = APIRouter()
 
 
-@r.get("/posts", response_model=PaginatedContentItems)
+@r.get("/posts", response_model=Union[PaginatedContentItems, CursorPaginatedContentItems])
 async def r_list_posts(
+    request: Request,
     user: Optional[User] = Depends(get_optional_user),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
     kind: Literal["all", "post", "wxpost"] = Query("all", description="Content source filter"),
-) -> PaginatedContentItems:
+    cursor: Optional[str] = Query(
+        None, description="Keyset pagination: pass an empty cursor for the first page, then `next_cursor`"
+    ),
+    include_total: bool = Query(False, description="Keyset pagination only: include an estimated total"),
+) -> Response:
     """
     Get a paginated list of posts.
 
     Anonymous users can only see public posts.
     Authenticated users can see all posts.
+
+    Offset pages (`page`) are the default. Passing `cursor` switches to keyset
+    pages ordered by (created_at, id) for infinite scroll.
+
+    Responses carry an ETag; anonymous pages are cached until a post write.
     """
     user_id = user.uid if user else None
-    result = get_content_items(kind=kind, user_id=user_id, page=page, page_size=page_size)
-    return PaginatedContentItems(**result)
+
+    async def build() -> Union[PaginatedContentItems, CursorPaginatedContentItems]:
+        if cursor is not None:
+            try:
+                result = await run_sync(
+                    get_content_items_by_cursor,
+                    kind=kind,
+                    user_id=user_id,
+                    cursor=cursor,
+                    page_size=page_size,
+                    include_total=include_total,
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return CursorPaginatedContentItems(**result)
+
+        result = await run_sync(get_content_items, kind=kind, user_id=user_id, page=page, page_size=page_size)
+        return PaginatedContentItems(**result)
+
+    return await cached_json(request, CONTENT, build, shared=user_id is None)
 
 
 @r.get("/posts/{slug}", response_model=Post)
@@ -46,7 +77,7 @@ async def r_get_post(
     Authenticated users can access all posts.
     """
     user_id = user.uid if user else None
-    post = get_post_by_slug(slug=slug, user_id=user_id)
+    post = await run_sync(get_post_by_slug, slug=slug, user_id=user_id)
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
@@ -65,7 +96,7 @@ async def r_create_post(post_data: Post, user: User = Depends(get_current_user))
     post_dict = post_data.dict(exclude_unset=True, exclude={"author"})
 
     # Create the post
-    result = create_post(post_dict, user_id=user.uid)
+    result = await run_sync(create_post, post_dict, user_id=user.uid)
 
     if not result:
         raise HTTPException(status_code=500, detail="Failed to create post")
@@ -89,7 +120,7 @@ async def r_update_post(
     post_dict = post_data.dict(exclude_unset=True, exclude={"author"})
 
     # Update the post
-    result = update_post(post_data=post_dict, user_id=user.uid)
+    result = await run_sync(update_post, post_data=post_dict, user_id=user.uid)
 
     if not result:
         raise HTTPException(status_code=404, detail="Post not found or you don't have permission to update it")
@@ -108,7 +139,7 @@ async def r_delete_post(
     Only the author or an administrator can delete a post.
     """
     # Delete the post
-    success = delete_post(slug=slug, user_id=user.uid)
+    success = await run_sync(delete_post, slug=slug, user_id=user.uid)
 
     if not success:
         raise HTTPException(status_code=404, detail="Post not found or you don't have permission to delete it")
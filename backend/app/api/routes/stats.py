@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException
 
+from ...db.identity import identity_cache
+from ...db.meeting_cache import meeting_cache
+from ...db.meeting_search import meeting_search_cache
+from ...db.response_cache import response_cache
 from ...db.stats import get_meeting_attendance_stats, get_member_meeting_stats
+from ...db.supabase import run_sync
+from ...db.vote_tally import vote_tally
 from ...models.stats import DashboardStats, MeetingAttendanceRecord, MemberMeetingRecord
 from ...models.users import User
+from ...services.analytics_snapshot import analytics_snapshot
+from ...services.meeting_media import meeting_media_index
+from ...services.member_directory import member_directory
 from .auth import get_current_user
 
 stats_router = r = APIRouter()
@@ -26,11 +35,11 @@ async def r_get_dashboard_stats(
     """
     try:
         # Get member meeting stats (Chart 1)
-        member_meetings_data = get_member_meeting_stats(start_date, end_date)
+        member_meetings_data = await run_sync(get_member_meeting_stats, start_date, end_date)
         member_meetings = [MemberMeetingRecord(**record) for record in member_meetings_data]
 
         # Get meeting attendance stats (Chart 2)
-        meeting_attendance_data = get_meeting_attendance_stats(start_date, end_date)
+        meeting_attendance_data = await run_sync(get_meeting_attendance_stats, start_date, end_date)
         meeting_attendance = [MeetingAttendanceRecord(**record) for record in meeting_attendance_data]
 
         return DashboardStats(
@@ -39,3 +48,18 @@ async def r_get_dashboard_stats(
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get dashboard stats: {e!s}")
+
+
+@r.get("/stats/cache")
+async def r_get_cache_stats(user: User = Depends(get_current_user)) -> dict:
+    """Hit/miss counters of the in-process read caches (per worker process)."""
+    return {
+        "meetings": meeting_cache.stats(),
+        "analytics": analytics_snapshot.stats(),
+        "members": member_directory.stats(),
+        "votes": vote_tally.stats(),
+        "identities": identity_cache.stats(),
+        "responses": response_cache.stats(),
+        "media": meeting_media_index.stats(),
+        "searches": meeting_search_cache.stats(),
+    }
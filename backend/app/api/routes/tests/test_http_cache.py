@@ -0,0 +1,123 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.routes.meeting as meeting_route
+import app.api.routes.post as post_route
+from app.api.http_cache import etag_matches
+from app.api.serv import app
+from app.db.meeting_cache import meeting_cache
+from app.db.response_cache import CONTENT, ResponseCache, invalidates_responses, response_cache
+
+MEETING_ID = "0facf243-38cb-41dc-b65a-321fad1f6b16"
+MEETING = {
+    "id": MEETING_ID,
+    "type": "Regular",
+    "theme": "Culture in Every Voice",
+    "manager": {"id": None, "name": "Rui Zheng", "member_id": ""},
+    "date": "2026-07-15",
+    "start_time": "19:15",
+    "end_time": "21:15",
+    "location": "SoarHigh Club",
+    "introduction": "",
+    "segments": [],
+    "status": "published",
+    "awards": [],
+}
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+def meeting_reads(monkeypatch: pytest.MonkeyPatch) -> list:
+    reads: list = []
+
+    async def get_meeting(meeting_id: str, user_id: str | None = None):
+        reads.append(user_id)
+        return dict(MEETING)
+
+    monkeypatch.setattr(meeting_route, "get_meeting_by_id", get_meeting)
+    return reads
+
+
+def test_anonymous_reads_are_served_from_the_cache_and_revalidated(client: TestClient, meeting_reads: list) -> None:
+    first = client.get(f"/meetings/{MEETING_ID}")
+    etag = first.headers["etag"]
+
+    second = client.get(f"/meetings/{MEETING_ID}")
+    not_modified = client.get(f"/meetings/{MEETING_ID}", headers={"If-None-Match": etag})
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["cache-control"] == "public, no-cache"
+    assert second.content == first.content
+    assert second.headers["etag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert meeting_reads == [None]
+
+
+def test_meeting_writes_drop_the_cached_bodies(client: TestClient, meeting_reads: list) -> None:
+    client.get(f"/meetings/{MEETING_ID}")
+    meeting_cache.invalidate(MEETING_ID)
+    client.get(f"/meetings/{MEETING_ID}")
+
+    assert meeting_reads == [None, None]
+
+
+def test_reader_specific_responses_get_an_etag_but_are_not_cached(
+    client: TestClient, meeting_reads: list, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(meeting_route, "WXPOST_SERVICE_TOKEN", "service-token")
+    headers = {"Authorization": "Bearer service-token"}
+
+    first = client.get(f"/meetings/{MEETING_ID}", headers=headers)
+    second = client.get(f"/meetings/{MEETING_ID}", headers={**headers, "If-None-Match": first.headers["etag"]})
+
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert second.status_code == 304
+    assert meeting_reads == ["wxpost-service", "wxpost-service"]
+    assert response_cache.stats()["size"] == 0
+
+
+def test_feed_errors_are_not_cached(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    app.dependency_overrides[post_route.get_optional_user] = lambda: None
+    try:
+        response = client.get("/posts", params={"cursor": "not-base64!"})
+    finally:
+        app.dependency_overrides.pop(post_route.get_optional_user, None)
+
+    assert response.status_code == 400
+    assert response_cache.stats()["size"] == 0
+
+
+def test_a_build_that_raced_a_write_is_served_but_not_stored() -> None:
+    cache = ResponseCache(max_entries=8, ttl_seconds=60.0)
+    generation = cache.generation(CONTENT)
+    cache.invalidate(CONTENT)
+
+    response = cache.put("/posts?", CONTENT, b"[]", generation)
+
+    assert response.etag.startswith('"')
+    assert cache.get("/posts?") is None
+
+
+def test_decorated_writes_invalidate_their_scope_even_when_they_fail() -> None:
+    response_cache.put("/posts?", CONTENT, b"[]", response_cache.generation(CONTENT))
+
+    @invalidates_responses(CONTENT)
+    def failing_write() -> None:
+        raise RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        failing_write()
+    assert response_cache.get("/posts?") is None
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(None, False), ('"abc"', True), ('W/"abc"', True), ('"x", "abc"', True), ("*", True), ('"abd"', False)],
+)
+def test_if_none_match_uses_weak_comparison(header: str | None, expected: bool) -> None:
+    assert etag_matches(header, '"abc"') is expected
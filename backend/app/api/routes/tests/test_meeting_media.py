@@ -22,7 +22,7 @@ def test_meeting_media_exposes_import_metadata_to_the_scoped_service(
     prefix = f"public/meetings/{MEETING_ID}/media/"
     monkeypatch.setattr(meeting_route, "WXPOST_SERVICE_TOKEN", "service-token")
 
-    def get_meeting(meeting_id: str, user_id: str | None = None):
+    async def get_meeting(meeting_id: str, user_id: str | None = None):
         captured.update(meeting_id=meeting_id, user_id=user_id)
         return {"id": meeting_id}
 
@@ -77,7 +77,7 @@ def test_meeting_detail_is_available_to_the_scoped_wxpost_service(
     captured: dict = {}
     monkeypatch.setattr(meeting_route, "WXPOST_SERVICE_TOKEN", "service-token")
 
-    def get_meeting(meeting_id: str, user_id: str | None = None):
+    async def get_meeting(meeting_id: str, user_id: str | None = None):
         captured.update(meeting_id=meeting_id, user_id=user_id)
         return {
             "id": meeting_id,
@@ -114,13 +114,41 @@ def test_meeting_media_preserves_not_found_instead_of_returning_500(
     client: TestClient,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    monkeypatch.setattr(
-        meeting_route,
-        "get_meeting_by_id",
-        lambda meeting_id, user_id=None: None,
-    )
+    async def get_meeting(meeting_id: str, user_id: str | None = None):
+        return None
+
+    monkeypatch.setattr(meeting_route, "get_meeting_by_id", get_meeting)
 
     response = client.get(f"/meetings/{MEETING_ID}/media")
 
     assert response.status_code == 404
     assert response.json() == {"detail": "Meeting not found"}
+
+
+def test_meeting_media_pages_through_one_cached_listing(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    listings: list[str] = []
+    prefix = f"public/meetings/{MEETING_ID}/media/"
+
+    async def get_meeting(meeting_id: str, user_id: str | None = None):
+        return {"id": meeting_id}
+
+    def object_iterator(bucket, *, prefix: str):
+        listings.append(prefix)
+        return [SimpleNamespace(key=f"{prefix}{n}.jpg", last_modified=1_753_000_000 + n, size=n + 1) for n in range(3)]
+
+    monkeypatch.setattr(meeting_route, "get_meeting_by_id", get_meeting)
+    monkeypatch.setattr(meeting_route.oss2, "Auth", lambda key, secret: object())
+    monkeypatch.setattr(meeting_route.oss2, "Bucket", lambda auth, endpoint, bucket: object())
+    monkeypatch.setattr(meeting_route.oss2, "ObjectIterator", object_iterator)
+
+    first = client.get(f"/meetings/{MEETING_ID}/media", params={"page_size": 2}).json()
+    second = client.get(f"/meetings/{MEETING_ID}/media", params={"page_size": 2, "cursor": first["next_cursor"]}).json()
+    bad_cursor = client.get(f"/meetings/{MEETING_ID}/media", params={"cursor": "not-base64!"})
+
+    assert [item["filename"] for item in first["items"] + second["items"]] == ["0.jpg", "1.jpg", "2.jpg"]
+    assert (first["total"], second["next_cursor"]) == (3, None)
+    assert listings == [prefix]
+    assert bad_cursor.status_code == 400
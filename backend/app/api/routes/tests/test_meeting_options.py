@@ -23,6 +23,14 @@ class _MeetingOptionsQuery:
         self.is_count = count == "exact"
         return self
 
+    def or_(self, filters):
+        self.owner.or_filters.append(filters)
+        return self
+
+    def limit(self, size):
+        self.owner.limits.append(size)
+        return self
+
     def eq(self, column, value):
         self.owner.filters.append((column, value))
         return self
@@ -42,6 +50,8 @@ class _MeetingOptionsQuery:
     def execute(self):
         if self.is_count:
             return _QueryResult(count=len(self.owner.rows))
+        if self.owner.limits:
+            return _QueryResult(data=self.owner.rows[: self.owner.limits[-1]], count=len(self.owner.rows))
         return _QueryResult(data=self.owner.rows)
 
 
@@ -53,6 +63,8 @@ class _MeetingOptionsSupabase:
         self.in_filters = []
         self.orders = []
         self.ranges = []
+        self.or_filters = []
+        self.limits = []
 
     def table(self, table_name):
         assert table_name == "meetings"
@@ -76,7 +88,7 @@ def test_meeting_options_returns_only_selector_fields_for_an_authenticated_user(
 ) -> None:
     captured: dict = {}
 
-    def get_options(**kwargs):
+    async def get_options(**kwargs):
         captured.update(kwargs)
         return {
             "items": [
@@ -130,7 +142,7 @@ def test_meeting_options_uses_the_anonymous_visibility_scope(
 ) -> None:
     captured: dict = {}
 
-    def get_options(**kwargs):
+    async def get_options(**kwargs):
         captured.update(kwargs)
         return {
             "items": [],
@@ -201,7 +213,7 @@ def test_meeting_options_batch_returns_requested_records_in_request_order(
 ) -> None:
     captured: dict = {}
 
-    def get_options(ids, **kwargs):
+    async def get_options(ids, **kwargs):
         captured.update({"ids": ids, **kwargs})
         return [
             {
@@ -294,3 +306,88 @@ def test_meeting_options_batch_query_is_compact_and_deduplicated(
     assert fake_supabase.selects == [("id,no,type,theme,date", None)]
     assert fake_supabase.in_filters == [("id", ["meeting-461", "meeting-462"])]
     assert fake_supabase.filters == []
+
+
+def _option_rows(count: int) -> list[dict]:
+    return [
+        {"id": f"meeting-{n}", "no": n, "type": "Regular", "theme": f"Theme {n}", "date": f"2026-07-{n:02d}"}
+        for n in range(count, 0, -1)
+    ]
+
+
+def test_meeting_options_keyset_page_seeks_past_the_cursor_without_a_count_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows = _option_rows(3)
+    fake_supabase = _MeetingOptionsSupabase(rows)
+    monkeypatch.setattr(meeting_db, "supabase", fake_supabase)
+    cursor = meeting_db.encode_meeting_cursor({"id": "meeting-4", "date": "2026-07-04"})
+
+    result = meeting_db.get_meeting_options_by_cursor(user_id=None, cursor=cursor, page_size=2)
+
+    assert result["items"] == rows[:2]
+    assert meeting_db.decode_meeting_cursor(result["next_cursor"]) == ("2026-07-02", "meeting-2")
+    assert result["total"] is None
+    assert fake_supabase.selects == [("id,no,type,theme,date", None)]
+    assert fake_supabase.filters == [("status", "published")]
+    assert fake_supabase.or_filters == ["date.lt.2026-07-04,and(date.eq.2026-07-04,id.lt.meeting-4)"]
+    assert fake_supabase.orders == [("date", True), ("id", True)]
+    assert fake_supabase.limits == [3]
+    assert fake_supabase.ranges == []
+
+
+def test_meeting_options_keyset_last_page_has_no_next_cursor_and_can_estimate_total(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake_supabase = _MeetingOptionsSupabase(_option_rows(2))
+    monkeypatch.setattr(meeting_db, "supabase", fake_supabase)
+
+    result = meeting_db.get_meeting_options_by_cursor(user_id="member-1", page_size=2, include_total=True)
+
+    assert result["next_cursor"] is None
+    assert result["total"] == 2
+    assert fake_supabase.selects == [("id,no,type,theme,date", "estimated")]
+    assert fake_supabase.or_filters == []
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "WzEsMl0", "WyIyMDI2LTA3LTA0IiwiYSksaWQuZ3QuYiJd"])
+def test_meeting_cursor_rejects_malformed_or_injected_values(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        meeting_db.decode_meeting_cursor(cursor)
+
+
+@pytest.mark.parametrize("meeting_date", ["20260704", "2026W271", "2026-07-04T00:00"])
+def test_meeting_cursor_rejects_non_canonical_dates(meeting_date: str) -> None:
+    cursor = meeting_db.encode_meeting_cursor({"date": meeting_date, "id": "meeting-1"})
+
+    with pytest.raises(ValueError):
+        meeting_db.decode_meeting_cursor(cursor)
+
+
+def test_meeting_options_route_switches_to_keyset_pages_when_a_cursor_is_passed(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: dict = {}
+
+    async def get_options_by_cursor(**kwargs):
+        captured.update(kwargs)
+        return {"items": _option_rows(1), "page_size": 1, "next_cursor": "next", "total": None}
+
+    monkeypatch.setattr(meeting_route, "get_meeting_options_by_cursor", get_options_by_cursor)
+    app.dependency_overrides[meeting_route.get_meeting_reader_user_id] = lambda: None
+
+    response = client.get("/meetings/options", params={"cursor": "", "page_size": 1})
+
+    assert response.status_code == 200
+    assert response.json() == {"items": _option_rows(1), "page_size": 1, "next_cursor": "next", "total": None}
+    assert captured == {"user_id": None, "status": None, "cursor": "", "page_size": 1, "include_total": False}
+
+
+def test_meeting_options_route_rejects_a_malformed_cursor(client: TestClient) -> None:
+    app.dependency_overrides[meeting_route.get_meeting_reader_user_id] = lambda: None
+
+    response = client.get("/meetings/options", params={"cursor": "not-base64!"})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid meeting cursor"}
@@ -2,18 +2,19 @@ from typing import Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Path
 
+from ...db.aio import get_meeting_by_id
 from ...db.core import (
     can_control_timer,
     create_timing,
     create_timings_batch,
     create_timings_batch_all,
     delete_timing,
-    get_extended_user_wxid,
-    get_meeting_by_id,
     get_timings_by_meeting,
     update_timing,
     validate_segments_belong_to_meeting,
 )
+from ...db.identity import Identity
+from ...db.supabase import run_sync
 from ...models.timing import (
     Timing,
     TimingBatchAllCreate,
@@ -27,7 +28,7 @@ from ...models.timing import (
 )
 from ...models.users import User
 from ...models.wechat_user import WeChatUser
-from .auth import get_current_extended_user, get_optional_extended_user
+from .auth import get_current_extended_user, get_identity, get_optional_extended_user, get_optional_identity
 
 timing_router = r = APIRouter()
 
@@ -36,11 +37,12 @@ timing_router = r = APIRouter()
 async def get_meeting_timings(
     meeting_id: str = Path(..., description="The ID of the meeting"),
     current_user: Optional[Union[User, WeChatUser]] = Depends(get_optional_extended_user),
+    identity: Identity = Depends(get_optional_identity),
 ):
     """
     Get all timing records for a meeting.
 
-    Returns timing records with calculated fields (actual_duration_seconds, dot_color)
+    Returns timing records with their stored derived fields (actual_duration_seconds, dot_color)
     and a can_control flag indicating if the current user can control the timer.
 
     The can_control flag is True only if:
@@ -57,16 +59,16 @@ async def get_meeting_timings(
     """
     # Validate meeting exists (allow public access to timing results)
     user_id = current_user.uid if isinstance(current_user, User) else None
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = await get_meeting_by_id(meeting_id, user_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user can control timer
-    wxid = get_extended_user_wxid(current_user) if current_user else None
-    can_control = can_control_timer(meeting_id, wxid, user_id)
+    wxid = identity.wxid
+    can_control = await run_sync(can_control_timer, meeting_id, wxid, user_id)
 
     # Get timing records
-    timings = get_timings_by_meeting(meeting_id)
+    timings = await run_sync(get_timings_by_meeting, meeting_id)
     timing_models = [Timing(**t) for t in timings]
 
     return TimingsListResponse(can_control=can_control, timings=timing_models)
@@ -77,6 +79,7 @@ async def create_meeting_timing(
     timing_data: TimingCreate,
     meeting_id: str = Path(..., description="The ID of the meeting"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Create a single timing record for a segment.
@@ -98,25 +101,26 @@ async def create_meeting_timing(
     """
     # Validate meeting exists
     user_id = current_user.uid if isinstance(current_user, User) else None
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = await get_meeting_by_id(meeting_id, user_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user can control timer
-    wxid = get_extended_user_wxid(current_user)
-    if not can_control_timer(meeting_id, wxid, user_id):
+    wxid = identity.wxid
+    if not await run_sync(can_control_timer, meeting_id, wxid, user_id):
         raise HTTPException(
             status_code=403,
             detail="Only the Timer or an admin can create timing records.",
         )
 
     # Validate segment belongs to meeting
-    if not validate_segments_belong_to_meeting(meeting_id, [timing_data.segment_id]):
+    if not await run_sync(validate_segments_belong_to_meeting, meeting_id, [timing_data.segment_id]):
         raise HTTPException(status_code=422, detail="Segment does not belong to this meeting")
 
     # Create timing record
     try:
-        timing = create_timing(
+        timing = await run_sync(
+            create_timing,
             meeting_id=meeting_id,
             segment_id=timing_data.segment_id,
             planned_duration_minutes=timing_data.planned_duration_minutes,
@@ -136,6 +140,7 @@ async def create_meeting_timings_batch(
     batch_data: TimingBatchCreate,
     meeting_id: str = Path(..., description="The ID of the meeting"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Create multiple timing records in batch (for Table Topics).
@@ -159,20 +164,20 @@ async def create_meeting_timings_batch(
     """
     # Validate meeting exists
     user_id = current_user.uid if isinstance(current_user, User) else None
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = await get_meeting_by_id(meeting_id, user_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user can control timer
-    wxid = get_extended_user_wxid(current_user)
-    if not can_control_timer(meeting_id, wxid, user_id):
+    wxid = identity.wxid
+    if not await run_sync(can_control_timer, meeting_id, wxid, user_id):
         raise HTTPException(
             status_code=403,
             detail="Only the Timer or an admin can create timing records.",
         )
 
     # Validate segment belongs to meeting
-    if not validate_segments_belong_to_meeting(meeting_id, [batch_data.segment_id]):
+    if not await run_sync(validate_segments_belong_to_meeting, meeting_id, [batch_data.segment_id]):
         raise HTTPException(status_code=422, detail="Segment does not belong to this meeting")
 
     # Convert to dict format for db function (empty list is valid - means delete all)
@@ -188,7 +193,8 @@ async def create_meeting_timings_batch(
 
     # Create timing records (or delete all if empty list)
     try:
-        timings = create_timings_batch(
+        timings = await run_sync(
+            create_timings_batch,
             meeting_id=meeting_id,
             segment_id=batch_data.segment_id,
             timings_data=timings_data,
@@ -204,18 +210,18 @@ async def create_meeting_timings_batch_all(
     batch_data: TimingBatchAllCreate,
     meeting_id: str = Path(..., description="The ID of the meeting"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Create timing records for multiple segments in batch.
 
     Only the person checked in as Timer can create timing records.
     This endpoint saves all segment timings in a single request for better
-    network efficiency than multiple individual calls.
+    network efficiency than multiple individual calls. The batch is written
+    in one transaction: either every segment is updated or none is.
 
-    Note: This is not a fully atomic operation. If an error occurs mid-batch,
-    some segments may be updated while others are not.
-
-    Each segment's existing timings are deleted before inserting new ones.
+    Each regular segment's existing timings are deleted before inserting new
+    ones; Table Topics segments append.
 
     Args:
         batch_data: Batch timing data with list of segments and their timings
@@ -232,13 +238,13 @@ async def create_meeting_timings_batch_all(
     """
     # Validate meeting exists
     user_id = current_user.uid if isinstance(current_user, User) else None
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = await get_meeting_by_id(meeting_id, user_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user can control timer
-    wxid = get_extended_user_wxid(current_user)
-    if not can_control_timer(meeting_id, wxid, user_id):
+    wxid = identity.wxid
+    if not await run_sync(can_control_timer, meeting_id, wxid, user_id):
         raise HTTPException(
             status_code=403,
             detail="Only the Timer or an admin can create timing records.",
@@ -246,7 +252,7 @@ async def create_meeting_timings_batch_all(
 
     # Validate all segments belong to meeting
     segment_ids = [seg.segment_id for seg in batch_data.segments]
-    if segment_ids and not validate_segments_belong_to_meeting(meeting_id, segment_ids):
+    if segment_ids and not await run_sync(validate_segments_belong_to_meeting, meeting_id, segment_ids):
         raise HTTPException(status_code=422, detail="One or more segments do not belong to this meeting")
 
     # Convert to dict format for db function
@@ -268,7 +274,8 @@ async def create_meeting_timings_batch_all(
 
     # Create timing records
     try:
-        timings = create_timings_batch_all(
+        timings = await run_sync(
+            create_timings_batch_all,
             meeting_id=meeting_id,
             segments_data=segments_data,
         )
@@ -284,6 +291,7 @@ async def update_meeting_timing(
     meeting_id: str = Path(..., description="The ID of the meeting"),
     timing_id: str = Path(..., description="The ID of the timing record to update"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Update an existing timing record.
@@ -306,13 +314,13 @@ async def update_meeting_timing(
     """
     # Validate meeting exists
     user_id = current_user.uid if isinstance(current_user, User) else None
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = await get_meeting_by_id(meeting_id, user_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user can control timer
-    wxid = get_extended_user_wxid(current_user)
-    if not can_control_timer(meeting_id, wxid, user_id):
+    wxid = identity.wxid
+    if not await run_sync(can_control_timer, meeting_id, wxid, user_id):
         raise HTTPException(
             status_code=403,
             detail="Only members or the Timer can update timing records.",
@@ -320,7 +328,8 @@ async def update_meeting_timing(
 
     # Update timing record
     try:
-        timing = update_timing(
+        timing = await run_sync(
+            update_timing,
             timing_id=timing_id,
             meeting_id=meeting_id,
             name=timing_data.name,
@@ -340,6 +349,7 @@ async def delete_meeting_timing(
     meeting_id: str = Path(..., description="The ID of the meeting"),
     timing_id: str = Path(..., description="The ID of the timing record to delete"),
     current_user: Union[User, WeChatUser] = Depends(get_current_extended_user),
+    identity: Identity = Depends(get_identity),
 ):
     """
     Delete a single timing record.
@@ -360,13 +370,13 @@ async def delete_meeting_timing(
     """
     # Validate meeting exists
     user_id = current_user.uid if isinstance(current_user, User) else None
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = await get_meeting_by_id(meeting_id, user_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
     # Check if user can control timer
-    wxid = get_extended_user_wxid(current_user)
-    if not can_control_timer(meeting_id, wxid, user_id):
+    wxid = identity.wxid
+    if not await run_sync(can_control_timer, meeting_id, wxid, user_id):
         raise HTTPException(
             status_code=403,
             detail="Only the Timer or an admin can delete timing records.",
@@ -374,7 +384,7 @@ async def delete_meeting_timing(
 
     # Delete the timing
     try:
-        deleted = delete_timing(timing_id, meeting_id)
+        deleted = await run_sync(delete_timing, timing_id, meeting_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Timing record not found")
         return TimingDeleteResponse(success=True)
@@ -25,6 +25,8 @@ from ...config import (
     WXPOST_SERVICE_TOKEN,
 )
 from ...db import wxpost_wechat as wxpost_wechat_store
+from ...db.response_cache import CONTENT
+from ...db.supabase import run_sync
 from ...db.wxpost import (
     WxPostNotFoundError,
     WxPostRevisionConflictError,
@@ -85,6 +87,7 @@ from ...services.wxpost_wechat import (
     publish_wechat_draft,
     wechat_status,
 )
+from ..http_cache import cached_json
 from .auth import get_current_user
 
 wxpost_router = r = APIRouter()
@@ -1242,11 +1245,18 @@ async def r_get_wxpost_wechat_preview(
 
 @r.get("/posts/wxposts/{slug}", response_model=WxPostPublicDetail)
 async def r_get_public_wxpost(
+    request: Request,
     slug: str = Path(..., min_length=1, description="The stable public WxPost slug"),
-) -> WxPostPublicDetail:
-    """Return a backend-derived render document for a public WxPost."""
+) -> Response:
+    """Return a backend-derived render document for a public WxPost.
 
-    detail = get_public_wxpost_by_slug(slug)
-    if detail is None:
-        raise HTTPException(status_code=404, detail="WxPost not found.")
-    return detail
+    The serialized document is cached with its ETag until a post write.
+    """
+
+    async def build() -> WxPostPublicDetail:
+        detail = await run_sync(get_public_wxpost_by_slug, slug)
+        if detail is None:
+            raise HTTPException(status_code=404, detail="WxPost not found.")
+        return detail
+
+    return await cached_json(request, CONTENT, build, shared=True)
@@ -10,6 +10,7 @@ from .routes.agents.statistics import statistics_agent_router
 from .routes.agents.unified import agent_router
 from .routes.auth import auth_router
 from .routes.checkin import checkin_router
+from .routes.events import events_router
 from .routes.feedback import feedback_router
 from .routes.meeting import meeting_router
 from .routes.post import post_router
@@ -42,6 +43,7 @@ def get_application():
     app.include_router(agent_router, tags=["agent"])
     app.include_router(auth_router, tags=["auth"])
     app.include_router(checkin_router, tags=["checkin"])
+    app.include_router(events_router, tags=["events"])
     app.include_router(feedback_router, tags=["feedback"])
     app.include_router(meeting_router, tags=["meeting"])
     app.include_router(wxpost_router, tags=["wxpost"])
@@ -12,6 +12,63 @@ SUPABASE_URL = config("SUPABASE_URL", cast=str)
 SUPABASE_ANON_KEY = config("SUPABASE_ANON_KEY", cast=str)
 SUPABASE_SERVICE_ROLE_KEY = config("SUPABASE_SERVICE_ROLE_KEY", cast=str)
 SUPABASE_JWT_SECRET = config("SUPABASE_JWT_SECRET", cast=str)
+# Upper bound on worker threads that run the remaining sync Supabase calls off
+# the event loop (app/db/supabase.py `run_sync`). Sized for the single uvicorn
+# worker; raising it only helps while those calls dominate request latency.
+SUPABASE_SYNC_POOL_SIZE = config("SUPABASE_SYNC_POOL_SIZE", cast=int, default=16)
+# In-process cache of hydrated meetings (app/db/meeting_cache.py). Local writes
+# invalidate immediately; the TTL only bounds staleness for edits made by
+# another process or directly in Supabase. Set either to 0 to disable.
+MEETING_CACHE_TTL_SECONDS = config("MEETING_CACHE_TTL_SECONDS", cast=float, default=30.0)
+MEETING_CACHE_MAX_ENTRIES = config("MEETING_CACHE_MAX_ENTRIES", cast=int, default=256)
+# Concurrent chunk/page fetches per stats loader (app/services/meeting_stats.py
+# `_batch_in` / `_execute_all_pages`). Each worker thread holds its own Supabase
+# connection. 1 restores strictly sequential fetching.
+STATS_FETCH_CONCURRENCY = config("STATS_FETCH_CONCURRENCY", cast=int, default=4)
+# Columnar snapshot behind the statistics agent's tools
+# (app/services/analytics_snapshot.py). Reads within the TTL never touch the
+# DB; an expired snapshot pulls only rows whose `updated_at` moved. The full
+# reload interval bounds drift from anything the incremental diff can miss.
+ANALYTICS_SNAPSHOT_TTL_SECONDS = config("ANALYTICS_SNAPSHOT_TTL_SECONDS", cast=float, default=30.0)
+ANALYTICS_SNAPSHOT_FULL_RELOAD_SECONDS = config("ANALYTICS_SNAPSHOT_FULL_RELOAD_SECONDS", cast=float, default=3600.0)
+# Cached members directory (app/services/member_directory.py) behind name
+# resolution in the agents and stats. Members are only written by auth
+# triggers, so the TTL bounds how long a new signup or rename takes to show.
+MEMBER_DIRECTORY_TTL_SECONDS = config("MEMBER_DIRECTORY_TTL_SECONDS", cast=float, default=300.0)
+# Live meeting updates pushed over SSE (app/db/meeting_events.py). A client
+# that falls this many events behind is told to refetch instead; the keepalive
+# comment stops proxies from closing a quiet stream.
+MEETING_EVENTS_QUEUE_SIZE = config("MEETING_EVENTS_QUEUE_SIZE", cast=int, default=64)
+MEETING_EVENTS_KEEPALIVE_SECONDS = config("MEETING_EVENTS_KEEPALIVE_SECONDS", cast=float, default=15.0)
+# Vote counting (app/db/vote_tally.py). Ballots are validated against a ballot
+# box cached for the TTL; ballots arriving within the window of each other are
+# written with one RPC. A window of 0 writes every ballot on its own. A write
+# still pending after the timeout fails the ballots waiting on it.
+VOTE_TALLY_TTL_SECONDS = config("VOTE_TALLY_TTL_SECONDS", cast=float, default=30.0)
+VOTE_TALLY_WINDOW_SECONDS = config("VOTE_TALLY_WINDOW_SECONDS", cast=float, default=0.05)
+VOTE_TALLY_FLUSH_TIMEOUT_SECONDS = config("VOTE_TALLY_FLUSH_TIMEOUT_SECONDS", cast=float, default=10.0)
+# Caller identities (app/db/identity.py): a member's wxid / attendee / admin
+# lookup and a legacy WeChat token's binding are reused across requests for
+# this long, least recently used first out past the entry cap. Bindings and
+# admin flags are edited in Supabase, not by the app.
+IDENTITY_CACHE_TTL_SECONDS = config("IDENTITY_CACHE_TTL_SECONDS", cast=float, default=60.0)
+IDENTITY_CACHE_MAX_ENTRIES = config("IDENTITY_CACHE_MAX_ENTRIES", cast=int, default=1024)
+# Serialized bodies of anonymous public reads (meetings, the Posts feed, public
+# wxposts) with their ETags (app/db/response_cache.py). Local writes drop them;
+# the TTL bounds staleness for edits made elsewhere. Set either to 0 to disable.
+RESPONSE_CACHE_TTL_SECONDS = config("RESPONSE_CACHE_TTL_SECONDS", cast=float, default=60.0)
+RESPONSE_CACHE_MAX_ENTRIES = config("RESPONSE_CACHE_MAX_ENTRIES", cast=int, default=256)
+# Per-meeting OSS media listings (app/services/meeting_media.py). Uploads go
+# straight to OSS, so while upload URLs issued for a meeting are live its
+# listing is only kept for the shorter uploading TTL.
+MEETING_MEDIA_CACHE_TTL_SECONDS = config("MEETING_MEDIA_CACHE_TTL_SECONDS", cast=float, default=300.0)
+MEETING_MEDIA_UPLOADING_TTL_SECONDS = config("MEETING_MEDIA_UPLOADING_TTL_SECONDS", cast=float, default=5.0)
+# Agent `lookup_meeting` results shared across turns and users
+# (app/db/meeting_search.py). Local meeting writes drop them; edits made
+# elsewhere are noticed by re-reading the index version at most this often.
+# Set either to 0 to disable.
+MEETING_SEARCH_CACHE_MAX_ENTRIES = config("MEETING_SEARCH_CACHE_MAX_ENTRIES", cast=int, default=256)
+MEETING_SEARCH_REVALIDATE_SECONDS = config("MEETING_SEARCH_REVALIDATE_SECONDS", cast=float, default=10.0)
 
 
 def parse_cors_origins(v: str) -> List[str]:
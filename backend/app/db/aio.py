@@ -0,0 +1,166 @@
+"""Async counterparts of the hot read paths in `app.db.core`.
+
+Routes await these instead of calling the sync client on the event loop, so
+one slow PostgREST round-trip no longer stalls every other request and agent
+SSE stream on the worker. Queries go through the shared `AsyncClient`
+(`get_async_supabase`), and independent queries inside one read are issued
+concurrently.
+
+Only reads that are hit on every page view / mini-app poll live here. Write
+paths and multi-step composites (meeting saves, stats, timing batches) stay
+in `app.db.core` / `app.db.stats` as the single implementation; routes run
+those through `run_sync` on the bounded Supabase pool. Row shaping is shared
+with `app.db.core` so both paths return identical dicts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from .core import (
+    HYDRATED_MEETING_SELECT,
+    _apply_meeting_keyset,
+    _apply_meeting_list_filters,
+    _meeting_cursor_page,
+    _meeting_from_hydrated_row,
+    _meeting_page_metadata,
+    decode_meeting_cursor,
+)
+from .meeting_cache import meeting_cache, visibility_for
+from .supabase import get_async_supabase
+
+__all__ = [
+    "get_checkin_by_segment",
+    "get_checkins_by_meeting",
+    "get_meeting_by_id",
+    "get_meeting_options",
+    "get_meeting_options_by_cursor",
+    "get_meeting_options_by_ids",
+    "get_votes_by_meeting",
+    "get_votes_status",
+]
+
+
+async def get_meeting_by_id(meeting_id: str, user_id: Optional[str] = None) -> Optional[Dict]:
+    """Async `core.get_meeting_by_id`: same visibility rule, cache and embedded request."""
+    visibility = visibility_for(user_id)
+    cached = meeting_cache.get(meeting_id, visibility)
+    if cached is not None:
+        return cached
+    generation = meeting_cache.generation(meeting_id)
+
+    query = get_async_supabase().table("meetings").select(HYDRATED_MEETING_SELECT).eq("id", meeting_id)
+    if user_id is None:
+        query = query.eq("status", "published")
+
+    result = await query.execute()
+    if not result.data:
+        return None
+
+    meeting = _meeting_from_hydrated_row(result.data[0])
+    meeting_cache.put(meeting_id, visibility, meeting, generation)
+    return meeting
+
+
+async def get_meeting_options(
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 10,
+) -> Dict[str, Any]:
+    """Async `core.get_meeting_options`; the count and page queries run concurrently."""
+    client = get_async_supabase()
+    offset = (page - 1) * page_size
+
+    count_query = _apply_meeting_list_filters(
+        client.table("meetings").select("id", count="exact"),  # type: ignore
+        user_id,
+        status,
+    )
+    page_query = (
+        _apply_meeting_list_filters(client.table("meetings").select("id,no,type,theme,date"), user_id, status)
+        .order("date", desc=True)
+        .range(offset, offset + page_size - 1)
+    )
+    count_result, result = await asyncio.gather(count_query.execute(), page_query.execute())
+
+    return {
+        "items": result.data or [],
+        **_meeting_page_metadata(count_result.count or 0, page, page_size),
+    }
+
+
+async def get_meeting_options_by_cursor(
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 10,
+    include_total: bool = False,
+) -> Dict[str, Any]:
+    """Async `core.get_meeting_options_by_cursor`."""
+    seek = decode_meeting_cursor(cursor) if cursor else None
+    query = (
+        get_async_supabase()
+        .table("meetings")
+        .select("id,no,type,theme,date", count="estimated" if include_total else None)  # type: ignore
+    )
+    query = _apply_meeting_keyset(_apply_meeting_list_filters(query, user_id, status), seek, page_size)
+    result = await query.execute()
+    return _meeting_cursor_page(result.data or [], page_size, result.count if include_total else None)
+
+
+async def get_meeting_options_by_ids(
+    meeting_ids: list[str],
+    user_id: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Async `core.get_meeting_options_by_ids`."""
+    unique_ids = list(dict.fromkeys(meeting_ids))
+    if not unique_ids:
+        return []
+
+    query = get_async_supabase().table("meetings").select("id,no,type,theme,date").in_("id", unique_ids)
+    result = await _apply_meeting_list_filters(query, user_id, None).execute()
+    by_id = {item["id"]: item for item in result.data or []}
+    return [by_id[meeting_id] for meeting_id in unique_ids if meeting_id in by_id]
+
+
+async def get_votes_status(meeting_id: str) -> Optional[Dict]:
+    """Async `core.get_votes_status`."""
+    response = await get_async_supabase().table("votes_status").select("*").eq("meeting_id", meeting_id).execute()
+    return response.data[0] if response.data else None
+
+
+async def get_votes_by_meeting(meeting_id: str) -> List[Dict]:
+    """Async `core.get_votes_by_meeting`."""
+    response = (
+        await get_async_supabase()
+        .table("votes")
+        .select("*")
+        .eq("meeting_id", meeting_id)
+        .order("created_at", desc=False)
+        .execute()
+    )
+    return response.data
+
+
+async def get_checkins_by_meeting(meeting_id: str, wxid: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Async `core.get_checkins_by_meeting`."""
+    query = get_async_supabase().table("checkins").select("*").eq("meeting_id", meeting_id)
+    if wxid:
+        query = query.eq("wxid", wxid)
+    result = await query.execute()
+    return result.data
+
+
+async def get_checkin_by_segment(meeting_id: str, segment_id: str) -> Optional[Dict[str, Any]]:
+    """Async `core.get_checkin_by_segment`."""
+    result = (
+        await get_async_supabase()
+        .table("checkins")
+        .select("*")
+        .eq("meeting_id", meeting_id)
+        .eq("segment_id", segment_id)
+        .execute()
+    )
+    return result.data[0] if result.data else None
@@ -1,15 +1,36 @@
-"""Combined read model for the public Posts index."""
+"""Combined read model for the public Posts index.
+
+Cards are read from `content_index`, which triggers keep in step with
+`posts`, `wxposts` and member names, so a page is one ordered query without
+post bodies or an author lookup. Excerpts are computed here by `_excerpt`
+and stored back lazily: the index marks a row's excerpt stale when its
+content changes, and only stale rows on a page fetch their body.
+"""
 
 from __future__ import annotations
 
+import base64
+import json
+import logging
 import re
-from typing import Literal
+from datetime import datetime
+from typing import Any, Literal
+from uuid import UUID
 
 from ..config import WXPOST_PUBLISHER_NAME
-from .supabase import supabase
+
+# Per-thread client: the Posts routes call these through `run_sync` worker threads.
+from .supabase import thread_supabase as supabase
+
+logger = logging.getLogger(__name__)
 
 ContentKind = Literal["all", "post", "wxpost"]
 
+CONTENT_INDEX_SELECT = (
+    "id,kind,title,slug,is_public,author_member_id,author_name,"
+    "cover_image_url,article_revision,created_at,version,excerpt,excerpt_version"
+)
+
 
 def _excerpt(markdown: str, limit: int = 180) -> str:
     without_directives = re.sub(r":::[\s\S]*?:::", " ", markdown)
@@ -18,89 +39,86 @@ def _excerpt(markdown: str, limit: int = 180) -> str:
     return compact if len(compact) <= limit else f"{compact[: limit - 1].rstrip()}…"
 
 
-def _post_rows(*, user_id: str | None, limit: int) -> tuple[list[dict], int]:
-    count_query = supabase.table("posts").select("id", count="exact")  # type: ignore
-    data_query = supabase.table("posts").select("id,title,slug,content,is_public,author_id,created_at")
+def encode_content_cursor(item: dict) -> str:
+    """Opaque keyset cursor pointing just past `item` in `(created_at, id)` order."""
+    payload = json.dumps([item["created_at"], item["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_content_cursor(cursor: str) -> tuple[str, str]:
+    """Decode a cursor from `encode_content_cursor`.
+
+    Both values end up inside a PostgREST `or=(...)` filter, so they are
+    validated strictly rather than escaped.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, content_id = json.loads(raw)
+        datetime.fromisoformat(created_at)
+        UUID(content_id)
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ValueError("Invalid content cursor") from e
+    return created_at, content_id
+
+
+def _apply_content_filters(query, kind: ContentKind, user_id: str | None):
+    if kind != "all":
+        query = query.eq("kind", kind)
     if user_id is None:
-        count_query = count_query.eq("is_public", True)
-        data_query = data_query.eq("is_public", True)
-
-    count = count_query.execute().count or 0
-    rows = data_query.order("created_at", desc=True).limit(limit).execute().data or []
-
-    author_ids = list({row["author_id"] for row in rows})
-    authors: dict[str, str] = {}
-    if author_ids:
-        response = supabase.table("members").select("id,full_name").in_("id", author_ids).execute()
-        authors = {author["id"]: author["full_name"] for author in response.data or []}
-
-    items = [
-        {
-            "kind": "post",
-            "id": row["id"],
-            "title": row["title"],
-            "slug": row["slug"],
-            "excerpt": _excerpt(row["content"]),
-            "author": {
-                "member_id": row["author_id"],
-                "name": authors.get(row["author_id"], ""),
-            },
-            "is_public": row["is_public"],
-            "cover_image_url": None,
-            "created_at": row["created_at"],
-        }
-        for row in rows
-    ]
-    return items, count
-
-
-def _cover_url(row: dict) -> str | None:
-    cover_id = row.get("cover_media_id")
-    if not cover_id:
-        return None
-    for media in row.get("media_manifest") or []:
-        if media.get("id") == cover_id and media.get("include", True):
-            return media.get("sourceUrl")
-    return None
-
-
-def _wxpost_rows(*, limit: int) -> tuple[list[dict], int]:
-    count = (
-        supabase.table("wxposts")
-        .select("id", count="exact")  # type: ignore
-        .eq("status", "ready")
-        .eq("is_public", True)
-        .execute()
-        .count
-        or 0
-    )
-    rows = (
-        supabase.table("wxposts")
-        .select("id,title,slug,excerpt,content,is_public,media_manifest," "cover_media_id,article_revision,created_at")
-        .eq("status", "ready")
-        .eq("is_public", True)
-        .order("created_at", desc=True)
-        .limit(limit)
-        .execute()
-        .data
-        or []
-    )
-    items = [
-        {
-            "kind": "wxpost",
-            "id": row["id"],
-            "title": row["title"],
-            "slug": row["slug"],
-            "excerpt": row.get("excerpt") or _excerpt(row["content"]),
-            "author": {"member_id": None, "name": WXPOST_PUBLISHER_NAME},
-            "is_public": True,
-            "cover_image_url": _cover_url(row),
-            "article_revision": row["article_revision"],
-            "created_at": row["created_at"],
-        }
-        for row in rows
-    ]
-    return items, count
+        query = query.eq("is_public", True)
+    return query
+
+
+def _fill_stale_excerpts(rows: list[dict]) -> None:
+    """Compute excerpts the index marked stale and store them back.
+
+    Storing is best-effort: the page is served either way, and a failed or
+    raced store leaves the row stale for the next reader.
+    """
+    stale = [row for row in rows if row.get("excerpt_version") != row["version"]]
+    if not stale:
+        return
+
+    contents: dict[str, str] = {}
+    for kind, table in (("post", "posts"), ("wxpost", "wxposts")):
+        ids = [row["id"] for row in stale if row["kind"] == kind]
+        if ids:
+            response = supabase.table(table).select("id,content").in_("id", ids).execute()
+            contents.update({body["id"]: body["content"] or "" for body in response.data or []})
+
+    payload = []
+    for row in stale:
+        if row["id"] in contents:
+            row["excerpt"] = _excerpt(contents[row["id"]])
+            payload.append({"id": row["id"], "version": row["version"], "excerpt": row["excerpt"]})
+    if not payload:
+        return
+    try:
+        supabase.rpc("store_content_excerpts", {"excerpts": payload}).execute()
+    except Exception:
+        logger.warning("Failed to store %d content excerpts", len(payload), exc_info=True)
+
+
+def _content_item(row: dict) -> dict:
+    if row["kind"] == "wxpost":
+        author = {"member_id": None, "name": WXPOST_PUBLISHER_NAME}
+    else:
+        author = {"member_id": row["author_member_id"], "name": row.get("author_name") or ""}
+    return {
+        "kind": row["kind"],
+        "id": row["id"],
+        "title": row["title"],
+        "slug": row["slug"],
+        "excerpt": row.get("excerpt"),
+        "author": author,
+        "is_public": row["is_public"],
+        "cover_image_url": row.get("cover_image_url"),
+        "article_revision": row.get("article_revision"),
+        "created_at": row["created_at"],
+    }
 
 
 def get_content_items(
@@ -110,19 +128,66 @@ def get_content_items(
     page: int,
     page_size: int,
 ) -> dict:
-    """Merge independent sources before applying final ordering and pagination."""
+    """One offset page of posts and public wxposts, newest first."""
 
     offset = (page - 1) * page_size
-    source_limit = offset + page_size
-    posts, post_count = _post_rows(user_id=user_id, limit=source_limit) if kind != "wxpost" else ([], 0)
-    wxposts, wxpost_count = _wxpost_rows(limit=source_limit) if kind != "post" else ([], 0)
+    query = supabase.table("content_index").select(CONTENT_INDEX_SELECT, count="exact")  # type: ignore
+    result = (
+        _apply_content_filters(query, kind, user_id)
+        .order("created_at", desc=True)
+        .order("id", desc=True)
+        .range(offset, offset + page_size - 1)
+        .execute()
+    )
+    rows = result.data or []
+    _fill_stale_excerpts(rows)
 
-    items = sorted(posts + wxposts, key=lambda item: item["created_at"], reverse=True)
-    total = post_count + wxpost_count
+    total = result.count or 0
     return {
-        "items": items[offset : offset + page_size],
+        "items": [_content_item(row) for row in rows],
         "total": total,
         "page": page,
         "page_size": page_size,
         "pages": (total + page_size - 1) // page_size if total else 0,
     }
+
+
+def get_content_items_by_cursor(
+    *,
+    kind: ContentKind,
+    user_id: str | None,
+    cursor: str,
+    page_size: int,
+    include_total: bool = False,
+) -> dict[str, Any]:
+    """Keyset page of posts and public wxposts ordered by `(created_at, id)`.
+
+    Args:
+        cursor: "" for the first page, otherwise a `next_cursor` from a
+            previous page.
+        include_total: Attach PostgREST's planner-estimated row count to the
+            page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    seek = decode_content_cursor(cursor) if cursor else None
+    query = supabase.table("content_index").select(
+        CONTENT_INDEX_SELECT,
+        count="estimated" if include_total else None,  # type: ignore
+    )
+    query = _apply_content_filters(query, kind, user_id)
+    if seek:
+        created_at, content_id = seek
+        query = query.or_(f"created_at.lt.{created_at},and(created_at.eq.{created_at},id.lt.{content_id})")
+    result = query.order("created_at", desc=True).order("id", desc=True).limit(page_size + 1).execute()
+
+    rows = (result.data or [])[:page_size]
+    _fill_stale_excerpts(rows)
+    items = [_content_item(row) for row in rows]
+    return {
+        "items": items,
+        "page_size": page_size,
+        "next_cursor": encode_content_cursor(items[-1]) if len(result.data or []) > page_size else None,
+        "total": result.count if include_total else None,
+    }
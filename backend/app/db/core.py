@@ -1,10 +1,27 @@
+import base64
+import json
+import logging
+import re
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from postgrest.exceptions import APIError
 
 from ..models.users import User
 from ..models.wechat_user import WeChatUser
-from .supabase import create_user_client, supabase
+from . import meeting_events as events
+from .meeting_cache import invalidates_meeting, meeting_cache, visibility_for
+from .meeting_search import invalidates_meeting_search
+from .response_cache import CONTENT, MEETINGS, invalidates_responses
+from .supabase import create_user_client
+
+# Per-thread client: these sync functions run concurrently on worker threads
+# (`run_sync`, agent tools' `asyncio.to_thread`).
+from .supabase import thread_supabase as supabase
+from .vote_tally import vote_tally
+
+logger = logging.getLogger(__name__)
 
 
 def _split_related_segment_ids(value: str | None) -> list[str]:
@@ -63,77 +80,178 @@ def _assign_segment_ids_and_remap_related_ids(segments_data: list[dict], existin
         )
 
 
+def _manager_from_attendee(manager_id: str, attendee: Optional[Dict]) -> Dict:
+    """Shape a meeting's `manager_id` attendee row into the API manager dict."""
+    if not attendee:
+        return {"id": manager_id, "name": "", "member_id": ""}
+    return {
+        "id": manager_id,
+        "name": attendee["name"],
+        "member_id": attendee["member_id"] or "",
+    }
+
+
+def _role_taker_from_attendee(attendee: Dict) -> Dict:
+    """Shape a segment's attendee row into the API `role_taker` dict."""
+    return {
+        "id": attendee["id"],
+        "name": attendee.get("name") or "",
+        "member_id": attendee.get("member_id") or "",
+    }
+
+
+def _segment_from_row(segment: Dict, role_taker: Optional[Dict]) -> Dict:
+    """Shape a raw `segments` row into the API segment dict.
+
+    The DB stores `duration` as an interval (`HH:MM:SS`) and times with
+    seconds; the API speaks whole minutes and `HH:MM`.
+    """
+    hours, minutes, _ = map(int, segment["duration"].split(":"))
+    duration_minutes = str(hours * 60 + minutes)
+
+    return {
+        "id": segment["id"],
+        "type": segment["type"],
+        "start_time": segment["start_time"][:5],
+        "duration": duration_minutes,
+        "end_time": segment["end_time"][:5],
+        "role_taker": role_taker,
+        "title": segment["title"],
+        "content": segment["content"],
+        "related_segment_ids": segment["related_segment_ids"],
+        # "meeting_id": segment["meeting_id"],
+    }
+
+
+# One PostgREST request for a fully hydrated meeting: the meeting row, its
+# manager attendee (aliased, disambiguated by the `manager_id` FK), segments
+# with their role-taker attendee, and awards.
+HYDRATED_MEETING_SELECT = "*,manager:attendees!manager_id(*),segments(*,attendees(*)),awards(*)"
+
+
+def _meeting_from_hydrated_row(row: Dict, role_taker_ids: bool = True) -> Dict:
+    """Shape a `HYDRATED_MEETING_SELECT` row into the API meeting dict.
+
+    `get_meetings` has always returned role takers without their attendee
+    `id`; pass `role_taker_ids=False` to keep that shape.
+    """
+    meeting = dict(row)
+    manager_id = meeting.pop("manager_id")
+    manager = meeting.pop("manager", None)
+    segment_rows = meeting.pop("segments", None) or []
+    awards = meeting.pop("awards", None) or []
+
+    meeting["manager"] = _manager_from_attendee(manager_id, manager)
+
+    segments = []
+    # Embedded resources come back unordered; sort like the old
+    # `.order("start_time")` query did (stable for equal start times).
+    for segment in sorted(segment_rows, key=lambda segment: segment["start_time"]):
+        attendee = segment.pop("attendees", None)
+        role_taker = None
+        if segment["attendee_id"] and attendee:
+            role_taker = _role_taker_from_attendee(attendee)
+            if not role_taker_ids:
+                role_taker.pop("id")
+        segments.append(_segment_from_row(segment, role_taker))
+
+    meeting["segments"] = segments
+    meeting["awards"] = awards
+    return meeting
+
+
 def get_members():
     return supabase.table("members").select("id, username, full_name").execute().data
 
 
-def resolve_attendee_id(member_id_or_name: str) -> str:
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+        return True
+    except (ValueError, AttributeError):
+        return False
+
+
+def _role_taker_key(role_taker: Optional[Dict]) -> str:
+    """The `resolve_attendee_ids` key for a role taker / manager dict ("" if unassigned)."""
+    role_taker = role_taker or {}
+    return role_taker.get("member_id") or role_taker.get("name") or ""
+
+
+def resolve_attendee_ids(member_ids_or_names: Iterable[str]) -> Dict[str, str]:
     """
-    Resolves a member ID or custom name to an attendee ID.
-    - If input is a valid UUID (member ID): finds or creates an attendee record for that member
-    - If input is not a UUID: creates a guest attendee with the provided name
+    Resolve many member IDs / custom names to attendee IDs in a few queries.
+
+    Same rules as `resolve_attendee_id`, applied to a whole agenda at once:
+    one `in_` lookup for member attendees, one for guest attendees, one
+    member fetch for members without an attendee yet, and a single batch
+    insert for everything missing.
 
     Args:
-        member_id_or_name: Either a member ID (UUID) or a custom name string
+        member_ids_or_names: Member IDs (UUIDs) and/or custom names; duplicates
+            and empty strings are ignored
 
     Returns:
-        The ID of the corresponding attendee
-    """
+        Mapping of each given member ID / name to its attendee ID
 
-    # Check if the input is a valid UUID (member ID)
-    try:
-        uuid.UUID(member_id_or_name)
-        is_valid_uuid = True
-    except (ValueError, AttributeError):
-        is_valid_uuid = False
+    Raises:
+        ValueError: If a member ID does not exist or an insert fails
+    """
+    keys = list(dict.fromkeys(key for key in member_ids_or_names if key))
+    member_ids = [key for key in keys if _is_uuid(key)]
+    guest_names = [key for key in keys if not _is_uuid(key)]
+    resolved: Dict[str, str] = {}
 
-    # If it's not a valid UUID, create a guest attendee with the provided name
-    if not is_valid_uuid:
-        guest_name = member_id_or_name
+    if member_ids:
+        result = supabase.table("attendees").select("id,member_id").in_("member_id", member_ids).execute()
+        for attendee in result.data:
+            resolved.setdefault(attendee["member_id"], attendee["id"])
 
-        # Check if the guest name already exists
+    if guest_names:
         # role taker better pass in a member id or a unique name, otherwise it will
         # clash with other guest attendees
-        result = supabase.table("attendees").select("id").eq("name", guest_name).eq("type", "Guest").execute()
-        if result.data:
-            return result.data[0]["id"]
+        result = supabase.table("attendees").select("id,name").in_("name", guest_names).eq("type", "Guest").execute()
+        for attendee in result.data:
+            resolved.setdefault(attendee["name"], attendee["id"])
 
-        # Create a new guest attendee
-        create_result = supabase.table("attendees").insert({"name": guest_name, "type": "Guest"}).execute()
+    missing_member_ids = [member_id for member_id in member_ids if member_id not in resolved]
+    to_insert = [{"name": name, "type": "Guest"} for name in guest_names if name not in resolved]
 
-        if not create_result.data:
-            raise ValueError("Failed to create guest attendee")
+    if missing_member_ids:
+        member_result = supabase.table("members").select("id,full_name").in_("id", missing_member_ids).execute()
+        member_names = {member["id"]: member["full_name"] for member in member_result.data}
+        for member_id in missing_member_ids:
+            if member_id not in member_names:
+                raise ValueError(f"Member with ID {member_id} not found")
+            to_insert.append({"name": member_names[member_id], "type": "Member", "member_id": member_id})
 
-        return create_result.data[0]["id"]
+    if to_insert:
+        create_result = supabase.table("attendees").insert(to_insert).execute()
+        if not create_result.data or len(create_result.data) != len(to_insert):
+            raise ValueError("Failed to create attendees")
+        for attendee in create_result.data:
+            resolved[attendee.get("member_id") or attendee["name"]] = attendee["id"]
 
-    # If it's a valid UUID, proceed with member lookup
-    # First try to find an existing attendee for this member
-    result = supabase.table("attendees").select("id").eq("member_id", member_id_or_name).execute()
-
-    if result.data:
-        # Attendee exists, return the ID
-        return result.data[0]["id"]
+    return {key: resolved[key] for key in keys}
 
-    # No attendee exists, get member info to create one
-    member_result = supabase.table("members").select("full_name").eq("id", member_id_or_name).execute()
 
-    if not member_result.data:
-        raise ValueError(f"Member with ID {member_id_or_name} not found")
-
-    # Create a new attendee for this member
-    member_name = member_result.data[0]["full_name"]
-    create_result = (
-        supabase.table("attendees")
-        .insert({"name": member_name, "type": "Member", "member_id": member_id_or_name})
-        .execute()
-    )
+def resolve_attendee_id(member_id_or_name: str) -> str:
+    """
+    Resolves a member ID or custom name to an attendee ID.
+    - If input is a valid UUID (member ID): finds or creates an attendee record for that member
+    - If input is not a UUID: creates a guest attendee with the provided name
 
-    if not create_result.data:
-        raise ValueError("Failed to create attendee for member")
+    Args:
+        member_id_or_name: Either a member ID (UUID) or a custom name string
 
-    return create_result.data[0]["id"]
+    Returns:
+        The ID of the corresponding attendee
+    """
+    return resolve_attendee_ids([member_id_or_name])[member_id_or_name]
 
 
+@invalidates_responses(MEETINGS)
+@invalidates_meeting_search
 def create_meeting(meeting_data: Dict) -> Dict:
     """
     Create a new meeting in the database.
@@ -149,11 +267,13 @@ def create_meeting(meeting_data: Dict) -> Dict:
 
     # Handle member_id to attendee_id mapping
     manager = meeting_data.get("manager") or {}
-    member_id = manager.get("member_id") or ""
-    name = manager.get("name") or ""
+    manager_key = _role_taker_key(manager) or "TBD"
 
-    # Resolve the member_id or name to an attendee_id
-    attendee_id = resolve_attendee_id(member_id or name or "TBD")
+    # Resolve the manager and every segment role taker in one batch
+    attendee_ids = resolve_attendee_ids(
+        [manager_key, *(_role_taker_key(segment.get("role_taker")) for segment in segments_data)]
+    )
+    attendee_id = attendee_ids[manager_key]
 
     # Insert meeting into database
     result = (
@@ -186,7 +306,7 @@ def create_meeting(meeting_data: Dict) -> Dict:
     # Insert segments if provided
     if segments_data:
         _assign_segment_ids_and_remap_related_ids(segments_data)
-        segments_db = create_segments(segments_data, meeting_id, preserve_ids=True)
+        segments_db = create_segments(segments_data, meeting_id, preserve_ids=True, attendee_ids=attendee_ids)
 
         for s, s_db in zip(segments_data, segments_db):
             s["id"] = s_db["id"]
@@ -214,6 +334,60 @@ def _meeting_page_metadata(total_count: int, page: int, page_size: int) -> Dict[
     }
 
 
+_CURSOR_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def encode_meeting_cursor(meeting: Dict) -> str:
+    """Opaque keyset cursor pointing just past `meeting` in `(date, id)` order."""
+    payload = json.dumps([meeting["date"], meeting["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_meeting_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor from `encode_meeting_cursor`.
+
+    Both values end up inside a PostgREST `or=(...)` filter, so they are
+    validated strictly rather than escaped.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        meeting_date, meeting_id = json.loads(raw)
+        # fromisoformat also takes forms like "20240101"; only YYYY-MM-DD round-trips.
+        strict_date = date.fromisoformat(meeting_date).isoformat() == meeting_date
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid meeting cursor") from e
+    if not strict_date:
+        raise ValueError("Invalid meeting cursor")
+    if not isinstance(meeting_id, str) or not _CURSOR_ID_PATTERN.fullmatch(meeting_id):
+        raise ValueError("Invalid meeting cursor")
+    return meeting_date, meeting_id
+
+
+def _apply_meeting_keyset(query, seek: Optional[Tuple[str, str]], page_size: int):
+    """Order newest-first by `(date, id)` and seek past the decoded cursor.
+
+    One row beyond `page_size` is requested so the caller can tell whether a
+    next page exists without a count query.
+    """
+    if seek:
+        meeting_date, meeting_id = seek
+        query = query.or_(f"date.lt.{meeting_date},and(date.eq.{meeting_date},id.lt.{meeting_id})")
+    return query.order("date", desc=True).order("id", desc=True).limit(page_size + 1)
+
+
+def _meeting_cursor_page(rows: List[Dict], page_size: int, total: Optional[int]) -> Dict[str, Any]:
+    items = rows[:page_size]
+    return {
+        "items": items,
+        "page_size": page_size,
+        "next_cursor": encode_meeting_cursor(items[-1]) if len(rows) > page_size else None,
+        "total": total,
+    }
+
+
 def get_meeting_options(
     user_id: Optional[str] = None,
     status: Optional[str] = None,
@@ -241,6 +415,30 @@ def get_meeting_options(
     }
 
 
+def get_meeting_options_by_cursor(
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 10,
+    include_total: bool = False,
+) -> Dict[str, Any]:
+    """Keyset-paginated variant of `get_meeting_options`.
+
+    Args:
+        cursor: `next_cursor` from the previous page; None/empty for the first page.
+        include_total: Attach PostgREST's planner-estimated row count to the
+            page request instead of running a separate exact count.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    seek = decode_meeting_cursor(cursor) if cursor else None
+    query = supabase.table("meetings").select("id,no,type,theme,date", count="estimated" if include_total else None)  # type: ignore
+    query = _apply_meeting_keyset(_apply_meeting_list_filters(query, user_id, status), seek, page_size)
+    result = query.execute()
+    return _meeting_cursor_page(result.data or [], page_size, result.count if include_total else None)
+
+
 def get_meeting_options_by_ids(
     meeting_ids: list[str],
     user_id: Optional[str] = None,
@@ -274,8 +472,10 @@ def get_meetings(
     # Calculate offset for pagination
     offset = (page - 1) * page_size
 
-    # Base query with select first, then the shared visibility filters
-    query = _apply_meeting_list_filters(supabase.table("meetings").select("*"), user_id, status)
+    # Base query with select first, then the shared visibility filters. The
+    # embedded select hydrates manager, segments (+ role takers) and awards in
+    # the same request as the page itself.
+    query = _apply_meeting_list_filters(supabase.table("meetings").select(HYDRATED_MEETING_SELECT), user_id, status)
 
     # Get total count first for pagination metadata
     # Create a separate count query
@@ -286,114 +486,7 @@ def get_meetings(
 
     # Now get paginated data
     result = query.order("date", desc=True).range(offset, offset + page_size - 1).execute()
-    meetings = result.data
-
-    if not meetings:
-        return {
-            "items": [],
-            **_meeting_page_metadata(total_count, page, page_size),
-        }
-
-    # Process the meetings data as in the original function
-    manager_ids = [meeting["manager_id"] for meeting in meetings]
-    result = supabase.table("attendees").select("*").in_("id", manager_ids).execute()
-    manager_map = {manager["id"]: manager for manager in result.data}
-    for meeting in meetings:
-        manager_id = meeting.pop("manager_id")
-        if manager_id not in manager_map:
-            meeting["manager"] = {"id": manager_id, "name": "", "member_id": ""}
-        else:
-            manager = manager_map[manager_id]
-            meeting["manager"] = {
-                "id": manager_id,
-                "name": manager["name"],
-                "member_id": manager["member_id"] or "",
-            }
-
-    # Get all meeting IDs
-    meeting_ids = [meeting["id"] for meeting in meetings]
-
-    # Batch fetch all segments for these meetings in a single query
-    all_segments_result = (
-        supabase.table("segments").select("*").in_("meeting_id", meeting_ids).order("start_time", desc=False).execute()
-    )
-
-    # Collect all unique attendee IDs from segments using a set comprehension
-    attendee_ids = set(segment["attendee_id"] for segment in all_segments_result.data if segment["attendee_id"])
-
-    # Create a mapping of attendee details if there are any attendees
-    attendee_map = {}
-    if attendee_ids:
-        # Batch fetch all attendee details in a single query
-        attendee_details_result = supabase.table("attendees").select("*").in_("id", list(attendee_ids)).execute()
-
-        # Create a mapping of attendee ID to name
-        attendee_map = {
-            attendee["id"]: {
-                "name": attendee.get("name") or "",
-                "member_id": attendee.get("member_id") or "",
-            }
-            for attendee in attendee_details_result.data
-        }
-
-    # Group segments by meeting_id
-    segments_by_meeting: Dict[str, List[Dict]] = {}
-    for segment in all_segments_result.data:
-        meeting_id = segment["meeting_id"]
-        if meeting_id not in segments_by_meeting:
-            segments_by_meeting[meeting_id] = []
-        segments_by_meeting[meeting_id].append(segment)
-
-    # Batch fetch all awards for these meetings in a single query
-    all_awards_result = supabase.table("awards").select("*").in_("meeting_id", meeting_ids).execute()
-
-    # Group awards by meeting_id
-    awards_by_meeting: Dict[str, List[Dict]] = {}
-    for award in all_awards_result.data:
-        meeting_id = award["meeting_id"]
-        if meeting_id not in awards_by_meeting:
-            awards_by_meeting[meeting_id] = []
-        awards_by_meeting[meeting_id].append(award)
-
-    # Assign segments and awards to meetings
-    for meeting in meetings:
-        # Process segments
-        meeting_segments = segments_by_meeting.get(meeting["id"], [])
-        processed_segments = []
-
-        for segment in meeting_segments:
-            attendee_id = segment["attendee_id"]
-            if attendee_id:
-                role_taker = attendee_map[attendee_id]
-            else:
-                role_taker = None
-
-            hours, minutes, _ = map(int, segment["duration"].split(":"))
-            duration_minutes = str(hours * 60 + minutes)
-
-            processed_segments.append(
-                {
-                    "id": segment["id"],
-                    "type": segment["type"],
-                    "start_time": segment["start_time"][:5],
-                    "duration": duration_minutes,
-                    "end_time": segment["end_time"][:5],
-                    "role_taker": role_taker,
-                    "title": segment["title"],
-                    "content": segment["content"],
-                    "related_segment_ids": segment["related_segment_ids"],
-                    # "meeting_id": segment["meeting_id"],
-                }
-            )
-
-        meeting["segments"] = processed_segments
-
-        # Process awards
-        meeting_awards = awards_by_meeting.get(meeting["id"], [])
-        if meeting_awards:
-            meeting["awards"] = meeting_awards
-        else:
-            meeting["awards"] = []
+    meetings = [_meeting_from_hydrated_row(row, role_taker_ids=False) for row in result.data or []]
 
     # Return paginated meetings with metadata
     return {
@@ -402,6 +495,38 @@ def get_meetings(
     }
 
 
+def get_meetings_by_cursor(
+    user_id: Optional[str] = None,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 10,
+    include_total: bool = False,
+) -> Dict[str, Any]:
+    """Keyset-paginated variant of `get_meetings`: one request per page.
+
+    Pages are ordered newest-first by `(date, id)` and stay stable while
+    meetings are added, unlike offset pages. Items have the same shape as
+    `get_meetings` items.
+
+    Args:
+        user_id: Optional ID of user; None restricts to published meetings
+        status: Optional status to filter meetings by (draft or published)
+        cursor: `next_cursor` from the previous page; None/empty for the first page
+        page_size: Number of items per page
+        include_total: Attach PostgREST's planner-estimated row count to the
+            page request instead of running a separate exact count
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    seek = decode_meeting_cursor(cursor) if cursor else None
+    query = supabase.table("meetings").select(HYDRATED_MEETING_SELECT, count="estimated" if include_total else None)  # type: ignore
+    query = _apply_meeting_keyset(_apply_meeting_list_filters(query, user_id, status), seek, page_size)
+    result = query.execute()
+    rows = [_meeting_from_hydrated_row(row, role_taker_ids=False) for row in result.data or []]
+    return _meeting_cursor_page(rows, page_size, result.count if include_total else None)
+
+
 def get_meeting_id_by_no(no: int, user_id: Optional[str] = None) -> Optional[str]:
     """Resolve a meeting's display number to its row UUID.
 
@@ -422,18 +547,28 @@ def get_meeting_id_by_no(no: int, user_id: Optional[str] = None) -> Optional[str
     return result.data[0]["id"]
 
 
-def get_meeting_by_id(meeting_id: str, user_id: Optional[str] = None) -> Optional[Dict]:
+def get_meeting_by_id(meeting_id: str, user_id: Optional[str] = None, *, use_cache: bool = True) -> Optional[Dict]:
     """
     Get a specific meeting by ID.
 
     Args:
         meeting_id: ID of the meeting to retrieve
         user_id: Optional user ID. If None, only published meetings are returned.
+        use_cache: Serve a fresh cached copy if there is one. Write paths pass
+            False: a cached copy can miss writes made by other processes.
 
     Returns:
-        Meeting dictionary with segments and awards or None if not found
+        Meeting dictionary with segments and awards or None if not found.
+        Served from `meeting_cache` when a fresh copy is cached.
     """
-    query = supabase.table("meetings").select("*").eq("id", meeting_id)
+    visibility = visibility_for(user_id)
+    if use_cache:
+        cached = meeting_cache.get(meeting_id, visibility)
+        if cached is not None:
+            return cached
+    generation = meeting_cache.generation(meeting_id)
+
+    query = supabase.table("meetings").select(HYDRATED_MEETING_SELECT).eq("id", meeting_id)
 
     # If no user is provided (public access), only show published meetings
     if user_id is None:
@@ -444,86 +579,100 @@ def get_meeting_by_id(meeting_id: str, user_id: Optional[str] = None) -> Optiona
     if not result.data:
         return None
 
-    meeting = result.data[0]
+    meeting = _meeting_from_hydrated_row(result.data[0])
+    meeting_cache.put(meeting_id, visibility, meeting, generation)
+    return meeting
 
-    manager_id = meeting.pop("manager_id")
-    result = supabase.table("attendees").select("*").eq("id", manager_id).execute()
-    if not result.data:
-        meeting["manager"] = {"id": manager_id, "name": "", "member_id": ""}
-    else:
-        manager = result.data[0]
-        meeting["manager"] = {
-            "id": manager_id,
-            "name": manager["name"],
-            "member_id": manager["member_id"] or "",
-        }
 
-    # Fetch segments for this meeting
-    segments_result = (
-        supabase.table("segments").select("*").eq("meeting_id", meeting_id).order("start_time", desc=False).execute()
-    )
-    segments_data = segments_result.data
-
-    # Fetch awards for this meeting
-    awards_result = supabase.table("awards").select("*").eq("meeting_id", meeting_id).execute()
-    meeting["awards"] = awards_result.data or []
-
-    # If there are no segments, return early
-    if not segments_data:
-        meeting["segments"] = []
-        return meeting
-
-    # Collect all unique attendee IDs from segments using a set comprehension
-    attendee_ids = set(segment["attendee_id"] for segment in segments_data if segment["attendee_id"])
-
-    # Create a mapping of attendee details if there are any attendees
-    attendee_map = {}
-    if attendee_ids:
-        # Batch fetch all attendee details in a single query
-        attendee_details_result = supabase.table("attendees").select("*").in_("id", list(attendee_ids)).execute()
-
-        # Create a mapping of attendee ID to name
-        attendee_map = {
-            attendee["id"]: {
-                "id": attendee["id"],
-                "name": attendee.get("name") or "",
-                "member_id": attendee.get("member_id") or "",
-            }
-            for attendee in attendee_details_result.data
-        }
+def diff_meeting_segments(
+    existing_segments: List[Dict], segments_data: List[Dict]
+) -> Tuple[List[Dict], List[Dict], List[str]]:
+    """
+    Compute the minimal segment changes between a stored and an edited agenda.
+
+    Segments are matched by ID, so `segments_data` must already carry IDs
+    (see `_assign_segment_ids_and_remap_related_ids`).
+
+    Args:
+        existing_segments: Segments as returned by `get_meeting_by_id`
+        segments_data: The edited agenda's segments
+
+    Returns:
+        Tuple of (segments to add, segments to update, IDs to delete)
+    """
+    existing_ids = set([segment["id"] for segment in existing_segments])
+    ids = set([segment["id"] for segment in segments_data])
+    existing_by_ids = {segment["id"]: segment for segment in existing_segments}
+
+    ids_to_delete = list(existing_ids - ids)
+    segments_to_add = []
+    segments_to_update = []
 
-    # Process segments with attendee names
-    processed_segments = []
     for segment in segments_data:
-        attendee_id = segment["attendee_id"]
-        if attendee_id:
-            role_taker = attendee_map[attendee_id]
-        else:
-            role_taker = None
+        segment_id = segment["id"]
 
-        hours, minutes, _ = map(int, segment["duration"].split(":"))
-        duration_minutes = str(hours * 60 + minutes)
+        if segment_id not in existing_ids:
+            segments_to_add.append(segment)
+            continue
 
-        processed_segments.append(
-            {
-                "id": segment["id"],
-                "type": segment["type"],
-                "start_time": segment["start_time"][:5],
-                "duration": duration_minutes,
-                "end_time": segment["end_time"][:5],
-                "role_taker": role_taker,
-                "title": segment["title"],
-                "content": segment["content"],
-                "related_segment_ids": segment["related_segment_ids"],
-                # "meeting_id": segment["meeting_id"],
-            }
-        )
+        existing_segment = existing_by_ids[segment_id]
 
-    meeting["segments"] = processed_segments
+        for key, value in existing_segment.items():
+            if key == "attendee_id":
+                role_taker = segment.get("role_taker") or {}
+                member_id = role_taker.get("member_id") or ""
+                name = role_taker.get("name") or ""
 
-    return meeting
+                existing_role_taker = existing_segment.get("role_taker") or {}
+                existing_member_id = existing_role_taker.get("member_id") or ""
+                existing_name = existing_role_taker.get("name") or ""
+
+                if member_id != existing_member_id or (
+                    not member_id and not existing_member_id and name != existing_name
+                ):
+                    segments_to_update.append(segment)
+                    break
+
+            elif value != segment[key]:
+                segments_to_update.append(segment)
+                break
+
+    return segments_to_add, segments_to_update, ids_to_delete
+
+
+def save_meeting_changes(
+    meeting_id: str, meeting_diff: Dict, segment_rows: List[Dict], delete_segment_ids: List[str]
+) -> bool:
+    """
+    Apply a meeting diff in one transaction via the `save_meeting_changes` RPC.
+
+    The function locks the meeting row, updates the changed meeting columns,
+    deletes `delete_segment_ids` and upserts `segment_rows` (as produced by
+    `prepare_segment_data`, IDs included). Either everything is written or
+    nothing is, and concurrent saves of the same meeting are serialized.
+
+    Args:
+        meeting_id: ID of the meeting to save
+        meeting_diff: Changed `meetings` columns only
+        segment_rows: Segment rows to insert or update
+        delete_segment_ids: IDs of this meeting's segments to delete
+
+    Returns:
+        False if the meeting no longer exists, True otherwise
+    """
+    result = supabase.rpc(
+        "save_meeting_changes",
+        {
+            "meeting_id_param": meeting_id,
+            "meeting_diff": meeting_diff,
+            "upsert_segments": segment_rows,
+            "delete_segment_ids": delete_segment_ids,
+        },
+    ).execute()
+    return bool(result.data)
 
 
+@invalidates_meeting
 def update_meeting(meeting_id: str, meeting_data: Dict, user_id: str) -> Optional[Dict]:
     """
     Update an existing meeting.
@@ -536,8 +685,9 @@ def update_meeting(meeting_id: str, meeting_data: Dict, user_id: str) -> Optiona
     Returns:
         Updated meeting dictionary or None if not found
     """
-    # First verify the meeting exists
-    existing_meeting = get_meeting_by_id(meeting_id, user_id)
+    # First verify the meeting exists. Read past the cache: the segment diff
+    # below must start from what is stored now, not a copy up to a TTL old.
+    existing_meeting = get_meeting_by_id(meeting_id, user_id, use_cache=False)
     if not existing_meeting:
         return None
 
@@ -546,6 +696,7 @@ def update_meeting(meeting_id: str, meeting_data: Dict, user_id: str) -> Optiona
     manager = meeting_data.get("manager") or {}
     member_id = manager.get("member_id") or ""
     name = manager.get("name") or ""
+    manager_changed = False
 
     diff = {}
     for key, value in existing_meeting.items():
@@ -557,73 +708,46 @@ def update_meeting(meeting_id: str, meeting_data: Dict, user_id: str) -> Optiona
             existing_member_id = existing_manager.get("member_id") or ""
             existing_name = existing_manager.get("name") or ""
 
-            if member_id != existing_member_id or name != existing_name:
-                diff["manager_id"] = resolve_attendee_id(member_id or name or "TBD")
+            manager_changed = member_id != existing_member_id or name != existing_name
 
         elif key in meeting_data and meeting_data[key] != value:
             diff[key] = meeting_data[key]
 
-    if diff:
-        supabase.table("meetings").update(diff).eq("id", meeting_id).execute()
-
     segments_data = meeting_data.get("segments", [])
     existing_ids = set([segment["id"] for segment in existing_segments])
     _assign_segment_ids_and_remap_related_ids(segments_data, existing_ids)
 
-    ids = set([segment["id"] for segment in segments_data])
-    existing_by_ids = {segment["id"]: segment for segment in existing_segments}
-
-    ids_to_delete = list(existing_ids - ids)
-    segments_to_add = []
-    segments_to_update = []
-
-    for segment in segments_data:
-        segment_id = segment["id"]
-
-        if segment_id not in existing_ids:
-            segments_to_add.append(segment)
-            continue
-
-        existing_segment = existing_by_ids[segment_id]
-
-        for key, value in existing_segment.items():
-            if key == "attendee_id":
-                role_taker = segment.get("role_taker") or {}
-                member_id = role_taker.get("member_id") or ""
-                name = role_taker.get("name") or ""
-
-                existing_role_taker = existing_segment.get("role_taker") or {}
-                existing_member_id = existing_role_taker.get("member_id") or ""
-                existing_name = existing_role_taker.get("name") or ""
-
-                if member_id != existing_member_id or (
-                    not member_id and not existing_member_id and name != existing_name
-                ):
-                    segments_to_update.append(segment)
-                    break
+    segments_to_add, segments_to_update, ids_to_delete = diff_meeting_segments(existing_segments, segments_data)
 
-            elif value != segment[key]:
-                segments_to_update.append(segment)
-                break
+    # Resolve the new manager and all changed role takers in one batch
+    manager_key = _role_taker_key(manager) or "TBD"
+    attendee_ids = resolve_attendee_ids(
+        [
+            *([manager_key] if manager_changed else []),
+            *(_role_taker_key(segment.get("role_taker")) for segment in segments_to_update + segments_to_add),
+        ]
+    )
 
-    if ids_to_delete:
-        supabase.table("segments").delete().in_("id", ids_to_delete).execute()
+    if manager_changed:
+        diff["manager_id"] = attendee_ids[manager_key]
 
-    if segments_to_update:
-        segments_to_update = [
-            prepare_segment_data(segment, meeting_id, ignore_id=False) for segment in segments_to_update
-        ]
-        supabase.table("segments").upsert(segments_to_update).execute()
+    segment_rows = [
+        prepare_segment_data(segment, meeting_id, ignore_id=False, attendee_ids=attendee_ids)
+        for segment in segments_to_update + segments_to_add
+    ]
 
-    if segments_to_add:
-        segments_to_add = [prepare_segment_data(segment, meeting_id, ignore_id=False) for segment in segments_to_add]
-        supabase.table("segments").insert(segments_to_add).execute()
+    if (diff or segment_rows or ids_to_delete) and not save_meeting_changes(
+        meeting_id, diff, segment_rows, ids_to_delete
+    ):
+        # Deleted between the existence check and the save
+        return None
 
     meeting_data["id"] = meeting_id
 
     return meeting_data
 
 
+@invalidates_meeting
 def update_meeting_status(meeting_id: str, status: str, user_id: str) -> Optional[Dict]:
     """
     Update the status of a meeting.
@@ -637,7 +761,7 @@ def update_meeting_status(meeting_id: str, status: str, user_id: str) -> Optiona
         Updated meeting dictionary or None if not found
     """
     # First verify the meeting exists
-    existing_meeting = get_meeting_by_id(meeting_id, user_id)
+    existing_meeting = get_meeting_by_id(meeting_id, user_id, use_cache=False)
     if not existing_meeting:
         return None
 
@@ -655,6 +779,7 @@ def update_meeting_status(meeting_id: str, status: str, user_id: str) -> Optiona
     return meeting
 
 
+@invalidates_meeting
 def delete_meeting(meeting_id: str, user_id: str, user_token: str) -> bool:
     """
     Delete a meeting and its associated segments and awards.
@@ -668,7 +793,7 @@ def delete_meeting(meeting_id: str, user_id: str, user_token: str) -> bool:
         Boolean indicating success or failure
     """
     # First verify the meeting exists
-    existing_meeting = get_meeting_by_id(meeting_id, user_id)
+    existing_meeting = get_meeting_by_id(meeting_id, user_id, use_cache=False)
     if not existing_meeting:
         return False
 
@@ -727,6 +852,7 @@ def get_awards_by_meeting(meeting_id: str) -> List[Dict]:
     return result.data
 
 
+@invalidates_meeting
 def save_meeting_awards(meeting_id: str, awards_data: List[Dict], user_id: str) -> List[Dict]:
     """
     Replace all awards for a meeting.
@@ -746,7 +872,7 @@ def save_meeting_awards(meeting_id: str, awards_data: List[Dict], user_id: str)
         ValueError: If the meeting is not found or the user doesn't have permission.
     """
     # Verify the meeting exists and the user has permission to modify it
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = get_meeting_by_id(meeting_id, user_id, use_cache=False)
     if not meeting:
         raise ValueError(f"Meeting with ID {meeting_id} not found")
 
@@ -772,19 +898,31 @@ def save_meeting_awards(meeting_id: str, awards_data: List[Dict], user_id: str)
     return new_awards
 
 
-def create_segments(segments_data: List[Dict], meeting_id: str, preserve_ids: bool = False) -> List[Dict]:
+@invalidates_meeting
+def create_segments(
+    segments_data: List[Dict],
+    meeting_id: str,
+    preserve_ids: bool = False,
+    attendee_ids: Optional[Dict[str, str]] = None,
+) -> List[Dict]:
     """
     Create segments for a meeting.
 
     Args:
         segments_data: List of dictionaries containing segment information
         meeting_id: ID of the meeting these segments belong to
+        attendee_ids: Role takers already resolved by `resolve_attendee_ids`;
+            resolved here in one batch when omitted
 
     Returns:
         List of dictionaries containing the created segments data
     """
+    if attendee_ids is None:
+        attendee_ids = resolve_attendee_ids(_role_taker_key(segment.get("role_taker")) for segment in segments_data)
+
     segments_to_insert = [
-        prepare_segment_data(segment, meeting_id, ignore_id=not preserve_ids) for segment in segments_data
+        prepare_segment_data(segment, meeting_id, ignore_id=not preserve_ids, attendee_ids=attendee_ids)
+        for segment in segments_data
     ]
 
     if segments_to_insert:
@@ -794,7 +932,9 @@ def create_segments(segments_data: List[Dict], meeting_id: str, preserve_ids: bo
     return []
 
 
-def prepare_segment_data(segment: Dict, meeting_id: str, ignore_id: bool = True) -> Dict:
+def prepare_segment_data(
+    segment: Dict, meeting_id: str, ignore_id: bool = True, attendee_ids: Optional[Dict[str, str]] = None
+) -> Dict:
     """
     Prepare segment data for insertion or update by handling role_taker,
     calculating end_time, and formatting duration.
@@ -802,18 +942,21 @@ def prepare_segment_data(segment: Dict, meeting_id: str, ignore_id: bool = True)
     Args:
         segment: Dictionary containing segment information
         meeting_id: ID of the meeting this segment belongs to
+        attendee_ids: Pre-resolved role takers from `resolve_attendee_ids`;
+            falls back to a per-segment `resolve_attendee_id` lookup
 
     Returns:
         Dictionary prepared for database insertion/update
     """
     # For role_taker, convert to attendee_id
-    role_taker = segment.get("role_taker") or {}
-    member_id = role_taker.get("member_id") or ""
-    name = role_taker.get("name") or ""
+    role_taker_key = _role_taker_key(segment.get("role_taker"))
     attendee_id = None
 
-    if member_id or name:
-        attendee_id = resolve_attendee_id(member_id or name)
+    if role_taker_key:
+        if attendee_ids is not None and role_taker_key in attendee_ids:
+            attendee_id = attendee_ids[role_taker_key]
+        else:
+            attendee_id = resolve_attendee_id(role_taker_key)
 
     # Calculate end_time if needed
     start_time = segment.get("start_time")
@@ -897,6 +1040,7 @@ def get_post_by_slug(slug: str, user_id: Optional[str] = None) -> Optional[Dict]
     return post
 
 
+@invalidates_responses(CONTENT)
 def create_post(post_data: Dict, user_id: str) -> Dict:
     """
     Create a new post.
@@ -940,6 +1084,7 @@ def create_post(post_data: Dict, user_id: str) -> Dict:
     return post
 
 
+@invalidates_responses(CONTENT)
 def update_post(post_data: Dict, user_id: str) -> Optional[Dict]:
     """
     Update an existing post.
@@ -1001,6 +1146,7 @@ def update_post(post_data: Dict, user_id: str) -> Optional[Dict]:
     return post
 
 
+@invalidates_responses(CONTENT)
 def delete_post(slug: str, user_id: str) -> bool:
     """
     Delete a post.
@@ -1086,7 +1232,7 @@ def update_votes_status(meeting_id: str, is_open: bool, user_id: str) -> Optiona
         Updated vote status or None if meeting not found/accessible
     """
     # Check if the meeting exists and user can manage it
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = get_meeting_by_id(meeting_id, user_id, use_cache=False)
     if not meeting:
         return None
 
@@ -1101,7 +1247,6 @@ def update_votes_status(meeting_id: str, is_open: bool, user_id: str) -> Optiona
         update_data = {"open": is_open}
 
         response = supabase.table("votes_status").update(update_data).eq("id", existing_status["id"]).execute()
-        return response.data[0] if response.data else None
     else:
         # Create new status
         new_status = {
@@ -1110,7 +1255,12 @@ def update_votes_status(meeting_id: str, is_open: bool, user_id: str) -> Optiona
         }
 
         response = supabase.table("votes_status").insert(new_status).execute()
-        return response.data[0] if response.data else None
+
+    vote_tally.invalidate(meeting_id)
+    if not response.data:
+        return None
+    events.meeting_events.publish(meeting_id, events.VOTES_STATUS, response.data[0])
+    return response.data[0]
 
 
 def save_vote_form(meeting_id: str, vote_form: List[Dict], user_id: str) -> List[Dict]:
@@ -1127,7 +1277,7 @@ def save_vote_form(meeting_id: str, vote_form: List[Dict], user_id: str) -> List
         List of created/updated vote objects
     """
     # Check if the meeting exists
-    meeting = get_meeting_by_id(meeting_id, user_id)
+    meeting = get_meeting_by_id(meeting_id, user_id, use_cache=False)
     if not meeting:
         raise ValueError("Meeting not found")
 
@@ -1207,84 +1357,51 @@ def save_vote_form(meeting_id: str, vote_form: List[Dict], user_id: str) -> List
     if to_delete_ids:
         supabase.table("votes").delete().in_("id", to_delete_ids).execute()
 
+    vote_tally.invalidate(meeting_id)
     return vote_form
 
 
-def cast_votes(meeting_id: str, votes: List[Dict[str, str]]) -> List[Dict]:
+async def cast_votes(meeting_id: str, votes: List[Dict[str, str]]) -> List[Dict]:
     """
     Cast multiple votes at once by incrementing the count for specified candidates in categories.
 
+    Ballots are validated against a cached ballot box and coalesced with
+    concurrent ballots into one counting RPC (see app/db/vote_tally.py).
+    Unlike the rest of this module it is awaited on the event loop: waiting
+    for the batch must not hold a `run_sync` worker thread.
+
     Args:
         meeting_id: The ID of the meeting
         votes: List of dicts with 'category' and 'name' keys
 
     Returns:
-        List of updated vote objects
+        List of updated vote objects, empty if voting is closed, the meeting
+        has ended or no vote names an existing candidate
     """
-    # First, check if the meeting has ended (current time is after end_time)
-    meeting_data = supabase.table("meetings").select("end_time, date").eq("id", meeting_id).execute()
-
-    if meeting_data.data:
-        from datetime import datetime
-
-        meeting = meeting_data.data[0]
-        meeting_date = meeting.get("date")
-        meeting_end_time = meeting.get("end_time")
-
-        if meeting_date and meeting_end_time:
-            # Create meeting end datetime
-            meeting_datetime_str = f"{meeting_date} {meeting_end_time}"
-            try:
-                meeting_end = datetime.strptime(meeting_datetime_str, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                # Try alternative format if the first one fails
-                meeting_end = datetime.strptime(meeting_datetime_str, "%Y-%m-%d %H:%M")
+    return await vote_tally.cast(meeting_id, votes)
 
-            # Get current time
-            current_time = datetime.now()
-
-            # If current time is after meeting end time, treat as closed
-            if current_time > meeting_end:
-                return []
-
-    # Check if voting is open
-    status = get_votes_status(meeting_id)
-    if not status or not status["open"]:
-        return []
 
-    # Validate and process each vote
-    if not votes:
-        return []
+# Checkins functions
+class MeetingNotFoundError(Exception):
+    """Raised when a checkin targets a missing meeting, or a draft the caller cannot see."""
 
-    # First, get all existing votes for this meeting to validate vote existence
-    all_votes = get_votes_by_meeting(meeting_id)
-    vote_map = {f"{v['category']}|{v['name']}": v for v in all_votes}
 
-    # Prepare valid votes for batch processing
-    valid_votes = []
-    for vote in votes:
-        if "category" not in vote or "name" not in vote:
-            continue
+class SegmentNotInMeetingError(ValueError):
+    """Raised when a checkin names a segment of another meeting."""
 
-        key = f"{vote['category']}|{vote['name']}"
-        if key in vote_map:
-            valid_votes.append({"category": vote["category"], "name": vote["name"]})
 
-    # If no valid votes, return early
-    if not valid_votes:
-        return []
+class TimerRoleTakenError(Exception):
+    """Raised when someone else is already checked in as Timer."""
 
-    # Use the PostgreSQL function for atomic increments
-    # This handles concurrent voting safely at the database level
-    result = supabase.rpc("increment_votes", {"meeting_id_param": meeting_id, "vote_data": valid_votes}).execute()
 
-    if result.data:
-        return result.data
+# SQLSTATEs raised by the `checkin` RPC
+_CHECKIN_ERRORS = {
+    "P0002": MeetingNotFoundError,
+    "22023": SegmentNotInMeetingError,
+    "23P01": TimerRoleTakenError,
+}
 
-    return []
 
-
-# Checkins functions
 def create_checkins(
     meeting_id: str,
     wxid: str,
@@ -1292,56 +1409,55 @@ def create_checkins(
     name: Optional[str] = None,
     referral_source: Optional[str] = None,
     is_member: bool = False,
+    published_only: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Create checkins for a user, replacing any existing ones for the same meeting.
 
+    The `checkin` RPC validates and replaces in one transaction, so a
+    check-in tap is a single round-trip.
+
     Args:
         meeting_id: Meeting ID
         wxid: WeChat ID of the user
         segment_ids: None=general attendance, []=uncheckin all, [ids]=specific segments
         name: Optional name for the checkin
         referral_source: Optional referral source (how user heard about the meeting)
-        is_member: Whether the user is a club member at checkin time
+        is_member: Whether the caller is a club member; a wxid bound to a
+            member counts as one either way
+        published_only: Refuse draft meetings (callers who are not members)
 
     Returns:
         List of created checkin records
-    """
-    # First delete existing checkins for this wxid + meeting_id
-    supabase.table("checkins").delete().eq("meeting_id", meeting_id).eq("wxid", wxid).execute()
 
-    # Handle different segment_ids cases
-    if segment_ids is None:
-        # General attendance - create a checkin with no specific segment
-        checkin_data = {
-            "meeting_id": meeting_id,
-            "wxid": wxid,
-            "segment_id": None,
-            "name": name,
-            "referral_source": referral_source,
-            "is_member": is_member,
-        }
-        result = supabase.table("checkins").insert([checkin_data]).execute()
-        return result.data
-    elif len(segment_ids) == 0:
-        # Empty list means uncheckin - we already deleted existing records above
-        return []
-    else:
-        # Specific segments - create checkins for each segment
-        checkins_data = []
-        for segment_id in segment_ids:
-            checkin_data = {
-                "meeting_id": meeting_id,
-                "wxid": wxid,
-                "segment_id": segment_id,
-                "name": name,
-                "referral_source": referral_source,
-                "is_member": is_member,
-            }
-            checkins_data.append(checkin_data)
-
-        result = supabase.table("checkins").insert(checkins_data).execute()
-        return result.data
+    Raises:
+        MeetingNotFoundError: If the meeting does not exist or is hidden
+        SegmentNotInMeetingError: If a segment belongs to another meeting
+        TimerRoleTakenError: If another wxid holds the Timer segment
+    """
+    try:
+        result = supabase.rpc(
+            "checkin",
+            {
+                "meeting_id_param": meeting_id,
+                "wxid_param": wxid,
+                "segment_ids_param": segment_ids,
+                "name_param": name,
+                "referral_source_param": referral_source,
+                "is_member_param": is_member,
+                "published_only": published_only,
+            },
+        ).execute()
+    except APIError as e:
+        error_type = _CHECKIN_ERRORS.get(getattr(e, "code", None) or "")
+        if error_type is None:
+            raise
+        raise error_type(e.message) from e
+    checkins = result.data or []
+
+    # This wxid's checkins are now exactly `checkins`
+    events.meeting_events.publish(meeting_id, events.CHECKINS, {"wxid": wxid, "checkins": checkins})
+    return checkins
 
 
 def get_checkins_by_meeting(meeting_id: str, wxid: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -1403,11 +1519,17 @@ def reset_segment_checkin(meeting_id: str, segment_id: str) -> Optional[Dict[str
     if checkin_count > 1:
         # Multiple checkins - delete this one
         delete_checkin(checkin_id)
-        return {"success": True, "action": "deleted"}
+        action = "deleted"
     else:
         # Only one checkin - nullify segment_id to preserve attendance
         nullify_checkin_segment(checkin_id)
-        return {"success": True, "action": "nullified"}
+        action = "nullified"
+
+    if events.meeting_events.has_subscribers(meeting_id):
+        events.meeting_events.publish(
+            meeting_id, events.CHECKINS, {"wxid": wxid, "checkins": get_checkins_by_meeting(meeting_id, wxid)}
+        )
+    return {"success": True, "action": action}
 
 
 # Feedbacks functions
@@ -1433,6 +1555,12 @@ def create_feedback(
     return result.data[0] if result.data else {}
 
 
+def _or_filter_value(value: str) -> str:
+    """Quote a value for a PostgREST `or` filter so commas or parentheses in it stay literal."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 def get_feedbacks_by_meeting(
     meeting_id: str,
     wxid: Optional[str] = None,
@@ -1462,7 +1590,19 @@ def get_feedbacks_by_meeting(
     Returns:
         List of feedback dictionaries matching the access control and filter criteria
     """
+    # Access control runs in the query: feedbacks sent by the user's wxid or
+    # received by their attendee_id
+    visible = []
+    if wxid:
+        visible.append(f"from_wxid.eq.{_or_filter_value(wxid)}")
+    if user_attendee_id:
+        visible.append(f"to_attendee_id.eq.{_or_filter_value(user_attendee_id)}")
+    if not is_admin and not visible:
+        return []
+
     query = supabase.table("feedbacks").select("*").eq("meeting_id", meeting_id)
+    if not is_admin:
+        query = query.or_(",".join(visible))
 
     # Apply filters
     if feedback_type:
@@ -1470,24 +1610,8 @@ def get_feedbacks_by_meeting(
     if segment_id:
         query = query.eq("segment_id", segment_id)
 
-    # Get all feedbacks first, then filter based on access control
     result = query.execute()
-    feedbacks = result.data
-
-    if is_admin:
-        return feedbacks
-
-    # Apply access control filtering
-    filtered_feedbacks = []
-    for feedback in feedbacks:
-        # User can see feedbacks they sent
-        if wxid and feedback["from_wxid"] == wxid:
-            filtered_feedbacks.append(feedback)
-        # User can see feedbacks sent to their attendee_id
-        elif user_attendee_id and feedback["to_attendee_id"] == user_attendee_id:
-            filtered_feedbacks.append(feedback)
-
-    return filtered_feedbacks
+    return result.data
 
 
 def update_feedback(feedback_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -1584,12 +1708,6 @@ def is_table_topics_segment(segment_id: str) -> bool:
     return result.data[0].get("type") == "Table Topic Session"
 
 
-def get_existing_timing_names_for_segment(segment_id: str) -> Set[str]:
-    """Get all existing timing names for a segment (lowercased for comparison)."""
-    result = supabase.table("timings").select("name").eq("segment_id", segment_id).execute()
-    return {t["name"].lower() for t in result.data if t.get("name")}
-
-
 def format_time_suffix(iso_timestamp: str) -> str:
     """Format ISO timestamp into suffix like '(14:32)'."""
     try:
@@ -1599,14 +1717,6 @@ def format_time_suffix(iso_timestamp: str) -> str:
         return ""
 
 
-def make_unique_timing_name(base_name: str, existing_names: Set[str], start_time: str) -> str:
-    """Generate unique name by adding time suffix if duplicate exists."""
-    if base_name.lower() not in existing_names:
-        return base_name
-    suffix = format_time_suffix(start_time)
-    return f"{base_name} {suffix}" if suffix else base_name
-
-
 def check_timing_name_exists(segment_id: str, name: str, exclude_timing_id: Optional[str] = None) -> bool:
     """Check if timing name exists for segment (for validation)."""
     result = supabase.table("timings").select("id, name").eq("segment_id", segment_id).execute()
@@ -1699,6 +1809,34 @@ def is_extended_user_admin(user: Union[User, WeChatUser]) -> bool:
     return False
 
 
+def get_extended_user_identity(user: Union[User, WeChatUser]) -> Dict[str, Any]:
+    """
+    Resolve a user's wxid, attendee_id and admin flag in one lookup.
+
+    WeChat users carry their wxid and attendee_id on the token; members need a
+    single members query with their attendee row embedded, instead of the
+    three queries behind the separate get_extended_user_* helpers.
+
+    Returns:
+        Dict with wxid, attendee_id (both optional) and is_admin
+    """
+    if isinstance(user, WeChatUser):
+        return {"wxid": user.wxid, "attendee_id": user.attendee_id, "is_admin": False}
+
+    result = supabase.table("members").select("is_admin, attendees(id, wxid)").eq("id", user.uid).execute()
+    if not result.data:
+        return {"wxid": None, "attendee_id": None, "is_admin": False}
+
+    member = result.data[0]
+    attendees = member.get("attendees") or []
+    attendee = attendees[0] if attendees else {}
+    return {
+        "wxid": attendee.get("wxid") or None,
+        "attendee_id": attendee.get("id"),
+        "is_admin": bool(member.get("is_admin", False)),
+    }
+
+
 # Timing functions
 def get_timer_segment_id(meeting_id: str) -> Optional[str]:
     """
@@ -1739,11 +1877,8 @@ def can_control_timer(meeting_id: str, wxid: Optional[str], user_id: Optional[st
     Returns:
         True if the user can control the timer, False otherwise
     """
-    # Check if user is admin
-    if user_id and is_user_admin(user_id):
-        return True
-
-    # Check if user is a club member (authenticated users have user_id)
+    # Admins and club members (authenticated users have user_id) can always
+    # control the timer, so no admin lookup is needed
     if user_id:
         return True
 
@@ -1856,6 +1991,40 @@ def calculate_timing_fields(
     return actual_seconds, dot_color
 
 
+def _timing_record(timing: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shape a `timings` row for the API.
+
+    `actual_duration_seconds` and `dot_color` are stored at write time; rows
+    written before those columns existed get them computed here.
+
+    Raises:
+        ValueError: If a legacy row has invalid timestamps
+    """
+    actual_seconds = timing.get("actual_duration_seconds")
+    dot_color = timing.get("dot_color")
+    if actual_seconds is None or not dot_color:
+        actual_seconds, dot_color = calculate_timing_fields(
+            timing["actual_start_time"],
+            timing["actual_end_time"],
+            timing["planned_duration_minutes"],
+        )
+
+    return {
+        "id": timing["id"],
+        "meeting_id": timing["meeting_id"],
+        "segment_id": timing["segment_id"],
+        "name": timing.get("name"),
+        "planned_duration_minutes": timing["planned_duration_minutes"],
+        "actual_start_time": timing["actual_start_time"],
+        "actual_end_time": timing["actual_end_time"],
+        "actual_duration_seconds": actual_seconds,
+        "dot_color": dot_color,
+        "created_at": timing.get("created_at"),
+        "updated_at": timing.get("updated_at"),
+    }
+
+
 def get_timings_by_meeting(meeting_id: str) -> List[Dict[str, Any]]:
     """
     Get all timing records for a meeting.
@@ -1864,7 +2033,7 @@ def get_timings_by_meeting(meeting_id: str) -> List[Dict[str, Any]]:
         meeting_id: The ID of the meeting
 
     Returns:
-        List of timing records with calculated fields
+        List of timing records with their stored duration and dot color
     """
     result = (
         supabase.table("timings").select("*").eq("meeting_id", meeting_id).order("created_at", desc=False).execute()
@@ -1873,34 +2042,32 @@ def get_timings_by_meeting(meeting_id: str) -> List[Dict[str, Any]]:
     timings = []
     for timing in result.data:
         try:
-            actual_seconds, dot_color = calculate_timing_fields(
-                timing["actual_start_time"],
-                timing["actual_end_time"],
-                timing["planned_duration_minutes"],
-            )
+            timings.append(_timing_record(timing))
         except ValueError:
             # Skip malformed timing records
             continue
 
-        timings.append(
-            {
-                "id": timing["id"],
-                "meeting_id": timing["meeting_id"],
-                "segment_id": timing["segment_id"],
-                "name": timing.get("name"),
-                "planned_duration_minutes": timing["planned_duration_minutes"],
-                "actual_start_time": timing["actual_start_time"],
-                "actual_end_time": timing["actual_end_time"],
-                "actual_duration_seconds": actual_seconds,
-                "dot_color": dot_color,
-                "created_at": timing.get("created_at"),
-                "updated_at": timing.get("updated_at"),
-            }
-        )
-
     return timings
 
 
+def publish_timings(meeting_id: str) -> None:
+    """
+    Push the meeting's timing list to live subscribers after a timing write.
+
+    Timer saves replace whole segments, so subscribers get the full list the
+    timer screen used to poll for. Read once per write, and only while
+    someone is listening; a failed read never fails the write.
+    """
+    if not events.meeting_events.has_subscribers(meeting_id):
+        return
+    try:
+        timings = get_timings_by_meeting(meeting_id)
+    except Exception:
+        logger.exception("Could not publish timings for meeting %s", meeting_id)
+        return
+    events.meeting_events.publish(meeting_id, events.TIMINGS, {"timings": timings})
+
+
 def create_timing(
     meeting_id: str,
     segment_id: str,
@@ -1952,6 +2119,8 @@ def create_timing(
         "planned_duration_minutes": planned_duration_minutes,
         "actual_start_time": actual_start_time,
         "actual_end_time": actual_end_time,
+        "actual_duration_seconds": actual_seconds,
+        "dot_color": dot_color,
     }
 
     result = supabase.table("timings").insert(timing_data).execute()
@@ -1959,21 +2128,8 @@ def create_timing(
     if not result.data:
         raise ValueError("Failed to create timing record")
 
-    timing = result.data[0]
-
-    return {
-        "id": timing["id"],
-        "meeting_id": timing["meeting_id"],
-        "segment_id": timing["segment_id"],
-        "name": timing.get("name"),
-        "planned_duration_minutes": timing["planned_duration_minutes"],
-        "actual_start_time": timing["actual_start_time"],
-        "actual_end_time": timing["actual_end_time"],
-        "actual_duration_seconds": actual_seconds,
-        "dot_color": dot_color,
-        "created_at": timing.get("created_at"),
-        "updated_at": timing.get("updated_at"),
-    }
+    publish_timings(meeting_id)
+    return _timing_record(result.data[0])
 
 
 def create_timings_batch(
@@ -2001,82 +2157,7 @@ def create_timings_batch(
     Raises:
         ValueError: If any timestamps are invalid or end is before start
     """
-    # Validate all timestamps before inserting
-    for timing in timings_data:
-        calculate_timing_fields(
-            timing["actual_start_time"],
-            timing["actual_end_time"],
-            timing["planned_duration_minutes"],
-        )
-
-    is_table_topics = is_table_topics_segment(segment_id)
-
-    if is_table_topics:
-        # APPEND mode for Table Topics: get existing names, track batch names
-        existing_names = get_existing_timing_names_for_segment(segment_id)
-        batch_names: Set[str] = set()
-    else:
-        # OVERWRITE mode for regular segments: delete existing timings
-        supabase.table("timings").delete().eq("meeting_id", meeting_id).eq("segment_id", segment_id).execute()
-
-    # If no timings to insert, just return empty list
-    if not timings_data:
-        return []
-
-    records_to_insert = []
-    for timing in timings_data:
-        name = timing["name"]
-
-        if is_table_topics and name:
-            # Auto-suffix duplicate names with start time
-            all_existing = existing_names | batch_names
-            unique_name = make_unique_timing_name(name, all_existing, timing["actual_start_time"])
-            batch_names.add(unique_name.lower())
-        else:
-            unique_name = name
-
-        records_to_insert.append(
-            {
-                "meeting_id": meeting_id,
-                "segment_id": segment_id,
-                "name": unique_name,
-                "planned_duration_minutes": timing["planned_duration_minutes"],
-                "actual_start_time": timing["actual_start_time"],
-                "actual_end_time": timing["actual_end_time"],
-            }
-        )
-
-    result = supabase.table("timings").insert(records_to_insert).execute()
-
-    if not result.data:
-        raise ValueError("Failed to create timing records")
-
-    # Process results with calculated fields
-    created_timings = []
-    for timing in result.data:
-        actual_seconds, dot_color = calculate_timing_fields(
-            timing["actual_start_time"],
-            timing["actual_end_time"],
-            timing["planned_duration_minutes"],
-        )
-
-        created_timings.append(
-            {
-                "id": timing["id"],
-                "meeting_id": timing["meeting_id"],
-                "segment_id": timing["segment_id"],
-                "name": timing.get("name"),
-                "planned_duration_minutes": timing["planned_duration_minutes"],
-                "actual_start_time": timing["actual_start_time"],
-                "actual_end_time": timing["actual_end_time"],
-                "actual_duration_seconds": actual_seconds,
-                "dot_color": dot_color,
-                "created_at": timing.get("created_at"),
-                "updated_at": timing.get("updated_at"),
-            }
-        )
-
-    return created_timings
+    return create_timings_batch_all(meeting_id, [{"segment_id": segment_id, "timings": timings_data}])
 
 
 def create_timings_batch_all(
@@ -2091,9 +2172,9 @@ def create_timings_batch_all(
 
     Duplicate names in Table Topics are auto-suffixed with start time "(HH:MM)".
 
-    Note: This is NOT atomic - if an error occurs mid-way, some segments may
-    be updated while others are not. For true atomicity, a Supabase RPC/stored
-    procedure would be required.
+    Every record is validated and its duration / dot color computed here;
+    the `save_meeting_timings` RPC then applies the whole batch in one
+    transaction, so either every segment is updated or none is.
 
     Args:
         meeting_id: The ID of the meeting
@@ -2108,88 +2189,38 @@ def create_timings_batch_all(
     Raises:
         ValueError: If any timestamps are invalid or end is before start
     """
-    # Validate all timestamps before making any changes
+    segments_param = []
     for segment in segments_data:
+        timings_param = []
         for timing in segment.get("timings", []):
-            calculate_timing_fields(
-                timing["actual_start_time"],
-                timing["actual_end_time"],
-                timing["planned_duration_minutes"],
-            )
-
-    all_created_timings = []
-
-    for segment in segments_data:
-        segment_id = segment["segment_id"]
-        timings_data = segment.get("timings", [])
-
-        is_table_topics = is_table_topics_segment(segment_id)
-
-        if is_table_topics:
-            # APPEND mode for Table Topics: get existing names, track batch names
-            existing_names = get_existing_timing_names_for_segment(segment_id)
-            batch_names: Set[str] = set()
-        else:
-            # OVERWRITE mode for regular segments: delete existing timings
-            supabase.table("timings").delete().eq("meeting_id", meeting_id).eq("segment_id", segment_id).execute()
-
-        # If no timings for this segment, continue to next
-        if not timings_data:
-            continue
-
-        records_to_insert = []
-        for timing in timings_data:
-            name = timing.get("name")
-
-            if is_table_topics and name:
-                # Auto-suffix duplicate names with start time
-                all_existing = existing_names | batch_names
-                unique_name = make_unique_timing_name(name, all_existing, timing["actual_start_time"])
-                batch_names.add(unique_name.lower())
-            else:
-                unique_name = name
-
-            records_to_insert.append(
-                {
-                    "meeting_id": meeting_id,
-                    "segment_id": segment_id,
-                    "name": unique_name,
-                    "planned_duration_minutes": timing["planned_duration_minutes"],
-                    "actual_start_time": timing["actual_start_time"],
-                    "actual_end_time": timing["actual_end_time"],
-                }
-            )
-
-        result = supabase.table("timings").insert(records_to_insert).execute()
-
-        if not result.data:
-            raise ValueError(f"Failed to create timing records for segment {segment_id}")
-
-        # Process results with calculated fields
-        for timing in result.data:
             actual_seconds, dot_color = calculate_timing_fields(
                 timing["actual_start_time"],
                 timing["actual_end_time"],
                 timing["planned_duration_minutes"],
             )
-
-            all_created_timings.append(
+            timings_param.append(
                 {
-                    "id": timing["id"],
-                    "meeting_id": timing["meeting_id"],
-                    "segment_id": timing["segment_id"],
                     "name": timing.get("name"),
                     "planned_duration_minutes": timing["planned_duration_minutes"],
                     "actual_start_time": timing["actual_start_time"],
                     "actual_end_time": timing["actual_end_time"],
                     "actual_duration_seconds": actual_seconds,
                     "dot_color": dot_color,
-                    "created_at": timing.get("created_at"),
-                    "updated_at": timing.get("updated_at"),
+                    "time_suffix": format_time_suffix(timing["actual_start_time"]),
                 }
             )
+        segments_param.append({"segment_id": segment["segment_id"], "timings": timings_param})
 
-    return all_created_timings
+    if not segments_param:
+        return []
+
+    result = supabase.rpc(
+        "save_meeting_timings",
+        {"meeting_id_param": meeting_id, "segments_param": segments_param},
+    ).execute()
+
+    publish_timings(meeting_id)
+    return [_timing_record(timing) for timing in result.data or []]
 
 
 def delete_timing(timing_id: str, meeting_id: str) -> bool:
@@ -2218,6 +2249,7 @@ def delete_timing(timing_id: str, meeting_id: str) -> bool:
 
     # Delete the timing
     supabase.table("timings").delete().eq("id", timing_id).execute()
+    publish_timings(meeting_id)
     return True
 
 
@@ -2278,31 +2310,20 @@ def update_timing(
                 "Delete it first if you want to replace it."
             )
 
+    # Recompute the stored derived fields from the final values
+    actual_seconds, dot_color = calculate_timing_fields(
+        update_data.get("actual_start_time") or timing["actual_start_time"],
+        update_data.get("actual_end_time") or timing["actual_end_time"],
+        update_data.get("planned_duration_minutes") or timing["planned_duration_minutes"],
+    )
+    update_data["actual_duration_seconds"] = actual_seconds
+    update_data["dot_color"] = dot_color
+
     # Update the timing
     result = supabase.table("timings").update(update_data).eq("id", timing_id).execute()
 
     if not result.data:
         raise ValueError("Failed to update timing record")
 
-    updated = result.data[0]
-
-    # Calculate derived fields using final values
-    final_start = updated.get("actual_start_time") or timing["actual_start_time"]
-    final_end = updated.get("actual_end_time") or timing["actual_end_time"]
-    final_planned = updated.get("planned_duration_minutes") or timing["planned_duration_minutes"]
-
-    actual_seconds, dot_color = calculate_timing_fields(final_start, final_end, final_planned)
-
-    return {
-        "id": updated["id"],
-        "meeting_id": updated["meeting_id"],
-        "segment_id": updated["segment_id"],
-        "name": updated.get("name"),
-        "planned_duration_minutes": updated["planned_duration_minutes"],
-        "actual_start_time": updated["actual_start_time"],
-        "actual_end_time": updated["actual_end_time"],
-        "actual_duration_seconds": actual_seconds,
-        "dot_color": dot_color,
-        "created_at": updated.get("created_at"),
-        "updated_at": updated.get("updated_at"),
-    }
+    publish_timings(meeting_id)
+    return _timing_record(result.data[0])
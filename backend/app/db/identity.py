@@ -0,0 +1,137 @@
+"""Who is calling: the wxid, attendee and admin state behind a request.
+
+The checkin, feedback and timer routes used to look a caller up with
+separate queries (`get_extended_user_wxid`, `get_extended_user_attendee_id`,
+`is_extended_user_admin`), often several per request and again on the next
+tap in the mini-app. `identity_cache.resolve(user)` builds an `Identity` from
+one `get_extended_user_identity` lookup and keeps members' lookups by uid for
+`IDENTITY_CACHE_TTL_SECONDS`, up to `IDENTITY_CACHE_MAX_ENTRIES`. WeChat users carry their wxid and attendee_id
+on the token, so resolving them is free. Legacy WeChat tokens without
+embedded user data resolve their binding through `wechat_user(wxid)`, cached
+by wxid.
+
+The app never writes wxid bindings or admin flags (both are managed in
+Supabase), so the TTL alone bounds how long a change takes to apply.
+`get_identity` / `get_optional_identity` in `app/api/routes/auth.py` expose
+this as a FastAPI dependency, which FastAPI resolves once per request.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from ..config import IDENTITY_CACHE_MAX_ENTRIES, IDENTITY_CACHE_TTL_SECONDS
+from ..models.users import User
+from ..models.wechat_user import WeChatUser
+from . import core, process_caches
+
+
+@dataclass(frozen=True)
+class Identity:
+    """A caller and the attendee / admin state the permission checks need."""
+
+    user: Optional[Union[User, WeChatUser]] = None
+    wxid: Optional[str] = None
+    attendee_id: Optional[str] = None
+    is_admin: bool = False
+
+    @property
+    def is_member(self) -> bool:
+        return isinstance(self.user, User)
+
+    @property
+    def uid(self) -> Optional[str]:
+        """Member id, or None for WeChat users and anonymous callers."""
+        return self.user.uid if isinstance(self.user, User) else None
+
+
+ANONYMOUS = Identity()
+
+
+class IdentityCache:
+    """Bounded TTL + LRU map of member identities by uid and WeChat bindings by wxid."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = IDENTITY_CACHE_TTL_SECONDS,
+        max_entries: int = IDENTITY_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[str, str], Tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def _cached(self, key: Tuple[str, str], load: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        value = load()
+        if self.enabled:
+            with self._lock:
+                self._entries[key] = (self._clock() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def resolve(self, user: Optional[Union[User, WeChatUser]]) -> Identity:
+        """The caller's identity; members cost at most one query per TTL."""
+        if user is None:
+            return ANONYMOUS
+        if isinstance(user, WeChatUser):
+            return Identity(user, wxid=user.wxid, attendee_id=user.attendee_id)
+        found = self._cached(("uid", user.uid), lambda: core.get_extended_user_identity(user))
+        return Identity(user, wxid=found["wxid"], attendee_id=found["attendee_id"], is_admin=found["is_admin"])
+
+    def wechat_user(self, wxid: str) -> Union[User, WeChatUser]:
+        """The member a wxid is bound to, else a WeChatUser with its attendee_id."""
+
+        def load() -> Union[User, WeChatUser]:
+            user_data = core.get_user_by_wxid(wxid)
+            if user_data:
+                return User(**user_data)
+            return WeChatUser(wxid=wxid, attendee_id=core.get_attendee_id_by_wxid(wxid))
+
+        return self._cached(("wxid", wxid), load)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+identity_cache = IdentityCache()
+process_caches.register(identity_cache.clear)
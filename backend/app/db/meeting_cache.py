@@ -0,0 +1,159 @@
+"""Process-wide read-through cache of hydrated meetings.
+
+During a live club meeting every phone polls the same meeting through
+checkins, feedback, votes and media, and each of those paths calls
+`get_meeting_by_id`. Entries are keyed by `(meeting_id, visibility)` because
+anonymous readers only see published meetings, so a hit can never leak a
+draft to a caller that could not have loaded it.
+
+Writes that change a hydrated meeting (`update_meeting`,
+`update_meeting_status`, `delete_meeting`, `save_meeting_awards`,
+`create_segments`) are wrapped with `invalidates_meeting`. Every
+invalidation bumps a per-meeting generation; a reader that started loading
+before the write cannot store its (possibly stale) result afterwards. The TTL
+bounds staleness for writes made outside this process, which is why only
+read routes are served from here: write paths check existence and ownership
+against a fresh read (`get_meeting_by_id(..., use_cache=False)`).
+
+Other in-process views of meeting data (the analytics snapshot, the vote
+tally's ballot boxes) register with `on_invalidate` to hear about the same
+writes.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, ParamSpec, Tuple, TypeVar
+
+from ..config import MEETING_CACHE_MAX_ENTRIES, MEETING_CACHE_TTL_SECONDS
+from . import process_caches
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+PUBLIC = "public"
+AUTHENTICATED = "authenticated"
+
+
+def visibility_for(user_id: Optional[str]) -> str:
+    """Visibility scope of a `get_meeting_by_id` caller (drafts need a user)."""
+    return PUBLIC if user_id is None else AUTHENTICATED
+
+
+class MeetingCache:
+    """Bounded TTL + LRU map of `(meeting_id, visibility)` to hydrated meetings.
+
+    Values are deep-copied on the way in and out: callers such as
+    `update_meeting` mutate the dict they get back.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[str, str], Tuple[float, Dict]] = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._listeners: List[Callable[[str], None]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def generation(self, meeting_id: str) -> int:
+        with self._lock:
+            return self._generations.get(meeting_id, 0)
+
+    def get(self, meeting_id: str, visibility: str) -> Optional[Dict]:
+        key = (meeting_id, visibility)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def put(self, meeting_id: str, visibility: str, meeting: Dict, generation: int) -> None:
+        """Store `meeting` unless the meeting was invalidated since `generation` was read."""
+        if not self.enabled:
+            return
+        value = copy.deepcopy(meeting)
+        with self._lock:
+            if self._generations.get(meeting_id, 0) != generation:
+                return
+            key = (meeting_id, visibility)
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, meeting_id: str) -> None:
+        with self._lock:
+            self._generations[meeting_id] = self._generations.get(meeting_id, 0) + 1
+            self._entries.pop((meeting_id, PUBLIC), None)
+            self._entries.pop((meeting_id, AUTHENTICATED), None)
+            self.invalidations += 1
+        for listener in self._listeners:
+            listener(meeting_id)
+
+    def on_invalidate(self, listener: Callable[[str], None]) -> None:
+        """Call `listener(meeting_id)` after every invalidation (local meeting write)."""
+        self._listeners.append(listener)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+meeting_cache = MeetingCache(MEETING_CACHE_MAX_ENTRIES, MEETING_CACHE_TTL_SECONDS)
+process_caches.register(meeting_cache.clear)
+
+
+def invalidates_meeting(fn: Callable[P, T]) -> Callable[P, T]:
+    """Drop cached copies of the `meeting_id` argument's meeting once `fn` returns.
+
+    Runs on failure too: a write that raised half-way may still have changed
+    rows.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        meeting_id = signature.bind(*args, **kwargs).arguments["meeting_id"]
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            meeting_cache.invalidate(meeting_id)
+
+    return wrapper
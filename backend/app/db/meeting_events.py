@@ -0,0 +1,143 @@
+"""Process-wide fan-out of live meeting updates (timings, checkins, votes).
+
+During a live club meeting every phone used to poll `/timings`, `/checkins`
+and `/votes`, each poll paying for the meeting lookup plus the table query.
+Instead, the writes in `app/db/core.py` publish an event here once they have
+committed, and `GET /meetings/{meeting_id}/events` streams the events of one
+meeting to each connected client as server-sent events: one broadcast per
+write instead of a read per client per poll.
+
+Writes run on worker threads (`run_sync`) while subscribers live on the event
+loop, so `publish` hands each event over with `call_soon_threadsafe`. A
+subscriber that falls `MEETING_EVENTS_QUEUE_SIZE` events behind has its
+backlog replaced by a single `resync` event, telling the client to refetch
+over REST.
+
+The hub only reaches clients connected to the process that handled the write,
+which is the whole audience for the single uvicorn worker this app runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set
+
+from ..config import MEETING_EVENTS_QUEUE_SIZE
+from . import process_caches
+
+TIMINGS = "timings"
+CHECKINS = "checkins"
+VOTES = "votes"
+VOTES_STATUS = "votes_status"
+RESYNC = "resync"
+
+
+@dataclass(frozen=True)
+class MeetingEvent:
+    """One update; `data` is shared by every subscriber and must not be mutated."""
+
+    event: str
+    data: Dict[str, Any]
+
+
+class Subscription:
+    """One client's queue of events for one meeting, bound to its event loop."""
+
+    def __init__(self, meeting_id: str, loop: asyncio.AbstractEventLoop, max_queue: int):
+        self.meeting_id = meeting_id
+        self.loop = loop
+        self._queue: asyncio.Queue[MeetingEvent] = asyncio.Queue(maxsize=max_queue)
+
+    def deliver(self, event: MeetingEvent) -> None:
+        """Queue `event`; runs on the subscriber's loop."""
+        if self._queue.full():
+            # Too far behind to replay: drop the backlog, have the client refetch.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            event = MeetingEvent(RESYNC, {})
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[MeetingEvent]:
+        """The next event, or None if nothing arrived within `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class MeetingEventHub:
+    """Subscribers per meeting id; `publish` is safe to call from any thread."""
+
+    def __init__(self, max_queue: int = MEETING_EVENTS_QUEUE_SIZE):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.published = 0
+        self.delivered = 0
+
+    def has_subscribers(self, meeting_id: str) -> bool:
+        """Lets publishers skip building a payload nobody will receive."""
+        with self._lock:
+            return bool(self._subscribers.get(meeting_id))
+
+    def publish(self, meeting_id: str, event: str, data: Dict[str, Any]) -> int:
+        """Send `event` to the meeting's subscribers; returns how many it reached."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(meeting_id, ()))
+        if not subscribers:
+            return 0
+        message = MeetingEvent(event, copy.deepcopy(data))
+        reached = 0
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+                reached += 1
+            except RuntimeError:
+                # The subscriber's loop is closed; it will never read again.
+                self._remove(subscription)
+        with self._lock:
+            self.published += 1
+            self.delivered += reached
+        return reached
+
+    @contextlib.contextmanager
+    def subscribe(self, meeting_id: str) -> Iterator[Subscription]:
+        """Receive the meeting's events until the block exits (call on the event loop)."""
+        subscription = Subscription(meeting_id, asyncio.get_running_loop(), self.max_queue)
+        with self._lock:
+            self._subscribers.setdefault(meeting_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._remove(subscription)
+
+    def _remove(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.meeting_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.meeting_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._subscribers.clear()
+            self.published = self.delivered = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "meetings": len(self._subscribers),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+                "published": self.published,
+                "delivered": self.delivered,
+            }
+
+
+meeting_events = MeetingEventHub()
+process_caches.register(meeting_events.clear)
@@ -0,0 +1,275 @@
+"""Search over every published meeting's card fields.
+
+`meeting_search` holds one row per meeting (theme, introduction, manager
+name, segment count), kept in step by triggers and indexed with trigrams, so
+`search_meeting_cards` is a single `search_meetings` RPC that covers all
+history and returns only card fields and the full match count.
+
+Text filters travel as case-insensitive regular expressions built by
+`search_pattern`. Python's `re` and Postgres agree on the small subset it
+emits, so a pattern means the same under `re.search` as under `~*`.
+
+Results are shared across agent turns and users through
+`meeting_search_cache`. Every entry belongs to the index version
+(`meeting_search_version`: row count plus the sum of per-row revisions,
+which every write raises) it was read at; the version is re-read at most
+every `MEETING_SEARCH_REVALIDATE_SECONDS` and a change drops every entry. Local meeting writes drop them at once:
+through `meeting_cache.on_invalidate`, and `create_meeting` through
+`invalidates_meeting_search`.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, ParamSpec, Tuple, TypeVar
+
+from ..config import MEETING_SEARCH_CACHE_MAX_ENTRIES, MEETING_SEARCH_REVALIDATE_SECONDS
+from . import process_caches
+from .meeting_cache import meeting_cache
+
+# Per-thread client: agent lookups run concurrently on worker threads.
+from .supabase import thread_supabase as supabase
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+CARD_FIELDS = ("no", "type", "date", "theme", "manager_name", "segment_count")
+
+# Characters with a meaning in both Python and Postgres regular expressions
+_REGEX_SPECIAL = re.compile(r"[\\^$.|?*+()\[\]{}]")
+_SHORT_ASCII_TERM = re.compile(r"[A-Za-z0-9]{2,3}")
+
+
+def search_pattern(needle: Optional[str], *, word_boundaries: bool = True) -> Optional[str]:
+    """Case-insensitive regular expression matching `needle` as a substring.
+
+    Short English acronyms like "AI" should not match inside unrelated words
+    such as "Gain", so with `word_boundaries` a two- or three-character
+    alphanumeric ASCII needle must have non-alphanumeric characters (or the
+    ends of the text) on both sides. Longer terms, and CJK text, which has no
+    word separators, match anywhere.
+
+    Returns None for a blank needle, which matches everything.
+    """
+    query = (needle or "").strip()
+    if not query:
+        return None
+    literal = _REGEX_SPECIAL.sub(lambda m: "\\" + m.group(), query)
+    if word_boundaries and _SHORT_ASCII_TERM.fullmatch(query):
+        return f"(^|[^A-Za-z0-9]){literal}([^A-Za-z0-9]|$)"
+    return literal
+
+
+def search_meeting_cards(
+    *,
+    no: Optional[int] = None,
+    manager: Optional[str] = None,
+    theme: Optional[str] = None,
+    introduction: Optional[str] = None,
+    meeting_type: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    limit: int = 5,
+) -> Dict[str, Any]:
+    """Published meetings matching every given filter, newest first.
+
+    Args:
+        no: Exact display number.
+        manager: Substring of the meeting manager's name.
+        theme: Substring of the theme, with `search_pattern` word boundaries.
+        introduction: Substring of the introduction, with word boundaries.
+        meeting_type: Exact meeting type.
+        date_from: Inclusive ISO lower bound on the meeting date.
+        date_to: Inclusive ISO upper bound on the meeting date.
+        limit: Maximum number of rows returned.
+
+    Returns:
+        `{"rows": [...], "total": int}`: up to `limit` rows of `CARD_FIELDS`
+        plus `introduction`, and the number of meetings that match.
+    """
+    result = supabase.rpc(
+        "search_meetings",
+        {
+            "manager_pattern": search_pattern(manager, word_boundaries=False),
+            "theme_pattern": search_pattern(theme),
+            "introduction_pattern": search_pattern(introduction),
+            "type_param": meeting_type,
+            "date_from": date_from,
+            "date_to": date_to,
+            "max_results": limit,
+            "no_param": no,
+        },
+    ).execute()
+    rows: List[Dict[str, Any]] = result.data or []
+    return {
+        "rows": [{key: row.get(key) for key in (*CARD_FIELDS, "introduction")} for row in rows],
+        "total": rows[0]["total_matches"] if rows else 0,
+    }
+
+
+def search_index_version() -> str:
+    """Stamp that changes whenever any `meeting_search` row does."""
+    return supabase.rpc("meeting_search_version", {}).execute().data or ""
+
+
+SearchKey = Tuple[
+    Optional[int], Optional[str], Optional[str], Optional[str], Optional[str], Optional[str], Optional[str], int
+]
+
+
+class MeetingSearchCache:
+    """Bounded LRU of `search_meeting_cards` results for the current index version."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        revalidate_seconds: float,
+        load: Callable[..., Dict[str, Any]] = search_meeting_cards,
+        version: Callable[[], str] = search_index_version,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.revalidate_seconds = revalidate_seconds
+        self._load = load
+        self._version = version
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[SearchKey, Dict[str, Any]] = OrderedDict()
+        self._generation = 0
+        self._index_version: Optional[str] = None
+        self._checked_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.revalidate_seconds > 0
+
+    def search(
+        self,
+        *,
+        no: Optional[int] = None,
+        manager: Optional[str] = None,
+        theme: Optional[str] = None,
+        introduction: Optional[str] = None,
+        meeting_type: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 5,
+    ) -> Dict[str, Any]:
+        """`search_meeting_cards`, answered from the cache while the index is unchanged."""
+        filters: Dict[str, Any] = {
+            "no": no,
+            "manager": manager,
+            "theme": theme,
+            "introduction": introduction,
+            "meeting_type": meeting_type,
+            "date_from": date_from,
+            "date_to": date_to,
+            "limit": limit,
+        }
+        if not self.enabled:
+            return self._load(**filters)
+        self._revalidate()
+        key: SearchKey = (no, manager, theme, introduction, meeting_type, date_from, date_to, limit)
+        with self._lock:
+            found = self._entries.get(key)
+            if found is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy(found)
+            self.misses += 1
+            generation = self._generation
+        found = self._load(**filters)
+        with self._lock:
+            # A write (or version change) during the query wins.
+            if self._generation == generation:
+                self._entries[key] = found
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return _copy(found)
+
+    def _revalidate(self) -> None:
+        """Drop every entry if the index changed since they were read."""
+        if self._clock() < self._checked_until:
+            return
+        with self._lock:
+            generation = self._generation
+        try:
+            version: Optional[str] = self._version()
+        except Exception:
+            logger.warning("Could not read the meeting search index version; dropping cached lookups", exc_info=True)
+            version = None
+        with self._lock:
+            self.revalidations += 1
+            changed = version is None or version != self._index_version
+            if changed:
+                self._drop()
+            # A version read before a concurrent write cannot vouch for the index.
+            if version is not None and self._generation == generation + changed:
+                self._index_version = version
+                self._checked_until = self._clock() + self.revalidate_seconds
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._drop()
+            self._index_version = None
+            self._checked_until = 0.0
+            self.invalidations += 1
+
+    def _drop(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._index_version = None
+            self._checked_until = 0.0
+            self.hits = self.misses = self.revalidations = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "revalidate_seconds": self.revalidate_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "revalidations": self.revalidations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _copy(found: Dict[str, Any]) -> Dict[str, Any]:
+    return {"rows": [dict(row) for row in found["rows"]], "total": found["total"]}
+
+
+meeting_search_cache = MeetingSearchCache(MEETING_SEARCH_CACHE_MAX_ENTRIES, MEETING_SEARCH_REVALIDATE_SECONDS)
+process_caches.register(meeting_search_cache.clear)
+meeting_cache.on_invalidate(lambda _meeting_id: meeting_search_cache.invalidate())
+
+
+def invalidates_meeting_search(fn: Callable[P, T]) -> Callable[P, T]:
+    """Drop cached lookups once the decorated write returns (or raises)."""
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            meeting_search_cache.invalidate()
+
+    return wrapper
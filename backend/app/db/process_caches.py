@@ -0,0 +1,24 @@
+"""Registry of the process-wide caches and hubs.
+
+Singletons that keep state across requests (the meeting cache, the analytics
+snapshot, the live-event hub, ...) register their `clear` here right where
+they are created, so code that needs a clean process — the test suite,
+between tests — resets every one of them without keeping its own list.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, List
+
+_clears: List[Callable[[], None]] = []
+
+
+def register(clear: Callable[[], None]) -> None:
+    """Have `clear_all` call `clear`."""
+    _clears.append(clear)
+
+
+def clear_all() -> None:
+    """Drop the state of every registered cache."""
+    for clear in _clears:
+        clear()
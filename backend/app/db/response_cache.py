@@ -0,0 +1,146 @@
+"""Serialized bodies of public reads, with strong ETags.
+
+Crawlers and WeChat share previews fetch the same public pages over and
+over: the meetings list and detail, the Posts feed and public wxposts.
+`app/api/http_cache.py` keeps the JSON an anonymous request produced here,
+keyed by path and query string, with an ETag computed from the body, so a
+repeat is served without rebuilding it and a matching `If-None-Match` gets
+a 304.
+
+Entries belong to a scope. Writes drop every entry of their scope: meeting
+writes through `meeting_cache.on_invalidate` (plus `create_meeting`, which
+has no meeting to invalidate yet), post and wxpost writes through
+`invalidates_responses(CONTENT)`. As in the meeting cache, a per-scope
+generation stops a build that raced a write from being stored, and the TTL
+bounds staleness for writes made outside this process.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, ParamSpec, Tuple, TypeVar
+
+from ..config import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS
+from . import process_caches
+from .meeting_cache import meeting_cache
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+MEETINGS = "meetings"
+CONTENT = "content"
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a serialized body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """Bounded TTL + LRU map of request keys to serialized responses."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, str, CachedResponse]] = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def generation(self, scope: str) -> int:
+        with self._lock:
+            return self._generations.get(scope, 0)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: str, scope: str, body: bytes, generation: int) -> CachedResponse:
+        """Wrap `body` with its ETag and store it unless `scope` was invalidated since `generation` was read."""
+        response = CachedResponse(body, make_etag(body))
+        if not self.enabled:
+            return response
+        with self._lock:
+            if self._generations.get(scope, 0) != generation:
+                return response
+            self._entries[key] = (self._clock() + self.ttl_seconds, scope, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return response
+
+    def invalidate(self, scope: str) -> None:
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in [key for key, entry in self._entries.items() if entry[1] == scope]:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS)
+process_caches.register(response_cache.clear)
+meeting_cache.on_invalidate(lambda _meeting_id: response_cache.invalidate(MEETINGS))
+
+
+def invalidates_responses(scope: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Drop the cached responses of `scope` once the decorated write returns (or raises)."""
+
+    def decorator(fn: Callable[P, T]) -> Callable[P, T]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                response_cache.invalidate(scope)
+
+        return wrapper
+
+    return decorator
@@ -13,8 +13,10 @@ identical row shapes.
 from typing import Any, Dict, List
 
 from app.services import meeting_stats
+from app.services.member_directory import member_directory
 
-from .supabase import supabase
+# Per-thread client: the batched loaders fan out over the stats worker pool.
+from .supabase import thread_supabase as supabase
 
 __all__ = [
     "get_meeting_attendance_stats",
@@ -114,43 +116,6 @@ def get_member_meeting_stats(start_date: str | None, end_date: str | None) -> Li
     return result
 
 
-def _resolve_member_from_rows(name: str, members: list[dict]) -> dict | None:
-    """Resolve a raw name against preloaded member rows.
-
-    Mirrors `meeting_stats.resolve_member` resolution order, but avoids
-    fetching the whole members table once per award row. Ambiguous and missing
-    names both return None because award rows must remain in the result as raw
-    winners when canonical member identity is not safe.
-    """
-    needle = (name or "").strip()
-    if not needle:
-        return None
-
-    needle_lower = needle.lower()
-
-    exact_full = [m for m in members if ((m.get("full_name") or "").strip().lower() == needle_lower)]
-    if len(exact_full) == 1:
-        return exact_full[0]
-    if len(exact_full) > 1:
-        return None
-
-    exact_user = [m for m in members if ((m.get("username") or "").strip().lower() == needle_lower)]
-    if len(exact_user) == 1:
-        return exact_user[0]
-    if len(exact_user) > 1:
-        return None
-
-    substring = [
-        m
-        for m in members
-        if needle_lower in (m.get("full_name") or "").strip().lower()
-        or needle_lower in (m.get("username") or "").strip().lower()
-    ]
-    if len(substring) == 1:
-        return substring[0]
-    return None
-
-
 def get_member_award_stats(start_date: str | None, end_date: str | None) -> List[Dict[str, Any]]:
     """
     Get raw data for award statistics.
@@ -186,7 +151,7 @@ def get_member_award_stats(start_date: str | None, end_date: str | None) -> List
     if not awards:
         return []
 
-    members = meeting_stats._execute_all_pages(lambda: supabase.table("members").select("id, username, full_name"))
+    members = member_directory.current()
 
     result: List[Dict[str, Any]] = []
     for award in awards:
@@ -195,7 +160,7 @@ def get_member_award_stats(start_date: str | None, end_date: str | None) -> List
             continue
 
         winner_name = award.get("winner") or ""
-        member = _resolve_member_from_rows(winner_name, members)
+        member = members.resolve(winner_name)
         winner_resolved = member is not None
 
         result.append(
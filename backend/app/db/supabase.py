@@ -1,6 +1,15 @@
-from supabase import Client, ClientOptions, create_client
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, ParamSpec, TypeVar
 
-from ..config import SUPABASE_ANON_KEY, SUPABASE_SERVICE_ROLE_KEY, SUPABASE_URL
+from supabase import AsyncClient, Client, ClientOptions, create_client
+
+from ..config import SUPABASE_ANON_KEY, SUPABASE_SERVICE_ROLE_KEY, SUPABASE_SYNC_POOL_SIZE, SUPABASE_URL
+
+P = ParamSpec("P")
+T = TypeVar("T")
 
 supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
 
@@ -10,3 +19,59 @@ def create_user_client(user_token: str) -> Client:
         SUPABASE_URL, SUPABASE_ANON_KEY, options=ClientOptions(headers={"Authorization": f"Bearer {user_token}"})
     )
     return client
+
+
+class _ThreadLocalClient:
+    """Service-role client proxy that gives every thread its own `Client`.
+
+    The shared `supabase` client's HTTP/2 stream state corrupts when several
+    threads use it at once (surfacing as `httpx.RemoteProtocolError: Server
+    disconnected`). Sync db-layer code that runs on worker threads goes
+    through this proxy instead: each thread lazily builds a client with its
+    own connection, so concurrent requests never share a stream.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def client(self) -> Client:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+        return client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client(), name)
+
+
+thread_supabase = _ThreadLocalClient()
+
+
+# Async service-role client for routes that await PostgREST natively. Built
+# lazily because its httpx.AsyncClient binds its connection pool to the event
+# loop of first use; creating it at import time would tie it to whatever loop
+# (if any) exists during module import rather than uvicorn's serving loop.
+_async_supabase: Optional[AsyncClient] = None
+
+
+def get_async_supabase() -> AsyncClient:
+    """Return the process-wide async client (one shared HTTP/2 connection pool)."""
+    global _async_supabase
+    if _async_supabase is None:
+        _async_supabase = AsyncClient(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+    return _async_supabase
+
+
+# Bounded pool for db-layer functions that are still sync (multi-step writes,
+# stats composites). `asyncio.to_thread` shares the loop's default executor
+# with every other blocking call in the process; a dedicated pool keeps a burst
+# of slow PostgREST round-trips from starving agent streams of threads. Every
+# db-layer module reachable from here queries through `thread_supabase`; the
+# shared `supabase` client is not safe to use from several of these threads.
+_sync_executor = ThreadPoolExecutor(max_workers=SUPABASE_SYNC_POOL_SIZE, thread_name_prefix="supabase-sync")
+
+
+async def run_sync(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a sync db-layer call on the bounded Supabase pool and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_sync_executor, functools.partial(fn, *args, **kwargs))
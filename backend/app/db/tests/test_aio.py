@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.db import aio, core
+from app.db import supabase as db_supabase
+
+MEETING_ID = "meeting-1"
+
+TABLES: dict[str, list[dict]] = {
+    "meetings": [
+        {
+            "id": MEETING_ID,
+            "no": 462,
+            "type": "Regular",
+            "theme": "Culture in Every Voice",
+            "manager_id": "att-manager",
+            "date": "2026-07-15",
+            "start_time": "19:15:00",
+            "end_time": "21:30:00",
+            "location": "Club room",
+            "introduction": "",
+            "status": "draft",
+        }
+    ],
+    "attendees": [
+        {"id": "att-manager", "name": "Joyce Feng", "member_id": "member-joyce"},
+        {"id": "att-guest", "name": "Lucas", "member_id": None},
+    ],
+    "segments": [
+        {
+            "id": "seg-2",
+            "meeting_id": MEETING_ID,
+            "attendee_id": None,
+            "type": "Tea Break",
+            "start_time": "20:00:00",
+            "duration": "00:10:00",
+            "end_time": "20:10:00",
+            "title": "",
+            "content": "",
+            "related_segment_ids": "",
+        },
+        {
+            "id": "seg-1",
+            "meeting_id": MEETING_ID,
+            "attendee_id": "att-guest",
+            "type": "Timer",
+            "start_time": "19:20:00",
+            "duration": "00:03:00",
+            "end_time": "19:23:00",
+            "title": "",
+            "content": "",
+            "related_segment_ids": "seg-2",
+        },
+    ],
+    "awards": [{"id": "award-1", "meeting_id": MEETING_ID, "category": "Best Speaker", "winner": "Lucas"}],
+}
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data)
+
+
+def _hydrate(meeting: dict) -> dict:
+    """Mimic PostgREST's response to `core.HYDRATED_MEETING_SELECT`."""
+    attendees = {attendee["id"]: attendee for attendee in TABLES["attendees"]}
+    # Embedded arrays carry no ordering guarantee; reverse them so the loader
+    # has to sort segments itself.
+    segments = [segment for segment in TABLES["segments"] if segment["meeting_id"] == meeting["id"]][::-1]
+    return {
+        **meeting,
+        "manager": attendees.get(meeting["manager_id"]),
+        "segments": [{**segment, "attendees": attendees.get(segment["attendee_id"])} for segment in segments],
+        "awards": [award for award in TABLES["awards"] if award["meeting_id"] == meeting["id"]],
+    }
+
+
+class _Query:
+    def __init__(self, name: str, rows: list[dict]):
+        self._name = name
+        self._rows = list(rows)
+        self._order: tuple[str, bool] | None = None
+        self._range: tuple[int, int] | None = None
+        self.columns = "*"
+
+    def select(self, columns="*", **_kwargs):
+        self.columns = columns
+        SELECTS.append((self._name, columns))
+        return self
+
+    def eq(self, column, value):
+        self._rows = [row for row in self._rows if row.get(column) == value]
+        return self
+
+    def in_(self, column, values):
+        self._rows = [row for row in self._rows if row.get(column) in values]
+        return self
+
+    def order(self, column, desc=False):
+        self._order = (column, desc)
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def _result(self) -> _Result:
+        rows = [dict(row) for row in self._rows]
+        if self._order:
+            column, desc = self._order
+            rows.sort(key=lambda row: row[column], reverse=desc)
+        if self._range:
+            rows = rows[self._range[0] : self._range[1] + 1]
+        if self._name == "meetings" and self.columns == core.HYDRATED_MEETING_SELECT:
+            rows = [_hydrate(row) for row in rows]
+        return _Result(rows)
+
+    def execute(self):
+        return self._result()
+
+
+class _AsyncQuery(_Query):
+    async def execute(self):  # type: ignore[override]
+        return self._result()
+
+
+class _Client:
+    def __init__(self, query_type: type[_Query]):
+        self._query_type = query_type
+
+    def table(self, name):
+        return self._query_type(name, TABLES[name])
+
+
+SELECTS: list[tuple[str, str]] = []
+
+
+@pytest.fixture
+def fake_clients(monkeypatch: pytest.MonkeyPatch) -> None:
+    SELECTS.clear()
+    monkeypatch.setattr(core, "supabase", _Client(_Query))
+    monkeypatch.setattr(aio, "get_async_supabase", lambda: _Client(_AsyncQuery))
+
+
+async def test_async_meeting_hydration_matches_the_sync_loader(fake_clients) -> None:
+    expected = core.get_meeting_by_id(MEETING_ID, user_id="member-1")
+
+    meeting = await aio.get_meeting_by_id(MEETING_ID, user_id="member-1")
+
+    assert meeting == expected
+    assert meeting is not None
+    assert [segment["id"] for segment in meeting["segments"]] == ["seg-1", "seg-2"]
+    assert meeting["segments"][0]["role_taker"] == {"id": "att-guest", "name": "Lucas", "member_id": ""}
+    assert meeting["manager"] == {"id": "att-manager", "name": "Joyce Feng", "member_id": "member-joyce"}
+
+
+def test_meeting_hydration_is_a_single_embedded_request(fake_clients) -> None:
+    meeting = core.get_meeting_by_id(MEETING_ID, user_id="member-1")
+
+    assert SELECTS == [("meetings", core.HYDRATED_MEETING_SELECT)]
+    assert meeting is not None
+    assert meeting["awards"] == TABLES["awards"]
+    assert "manager_id" not in meeting
+    assert meeting["segments"][1] == {
+        "id": "seg-2",
+        "type": "Tea Break",
+        "start_time": "20:00",
+        "duration": "10",
+        "end_time": "20:10",
+        "role_taker": None,
+        "title": "",
+        "content": "",
+        "related_segment_ids": "",
+    }
+
+
+def test_meeting_list_hydrates_each_page_row_and_omits_role_taker_ids(fake_clients) -> None:
+    page = core.get_meetings(user_id="member-1", page=1, page_size=10)
+
+    assert [table for table, _ in SELECTS] == ["meetings", "meetings"]
+    assert page["total"] == 1
+    (meeting,) = page["items"]
+    assert meeting["manager"] == {"id": "att-manager", "name": "Joyce Feng", "member_id": "member-joyce"}
+    assert [segment["id"] for segment in meeting["segments"]] == ["seg-1", "seg-2"]
+    assert meeting["segments"][0]["role_taker"] == {"name": "Lucas", "member_id": ""}
+
+
+async def test_async_meeting_hydration_hides_drafts_from_anonymous_readers(fake_clients) -> None:
+    assert await aio.get_meeting_by_id(MEETING_ID, user_id=None) is None
+
+
+async def test_run_sync_executes_on_the_bounded_supabase_pool() -> None:
+    thread_name = await db_supabase.run_sync(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("supabase-sync")
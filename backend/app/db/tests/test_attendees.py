@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import core
+
+MEMBER_WITH_ATTENDEE = "11111111-1111-1111-1111-111111111111"
+MEMBER_WITHOUT_ATTENDEE = "22222222-2222-2222-2222-222222222222"
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client: _Client, table: str):
+        self.client = client
+        self.table = table
+        self.filters: list[tuple[str, str, object]] = []
+        self.payload: list[dict] | dict | None = None
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(("eq", column, value))
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(("in", column, list(values)))
+        return self
+
+    def insert(self, payload):
+        self.payload = payload
+        return self
+
+    def execute(self):
+        self.client.calls.append((self.table, "insert" if self.payload is not None else "select"))
+        rows = self.client.tables[self.table]
+        if self.payload is not None:
+            inserted = []
+            for row in self.payload if isinstance(self.payload, list) else [self.payload]:
+                inserted.append({"id": f"att-{len(rows) + 1}", "member_id": None, **row})
+                rows.append(inserted[-1])
+            return _Result(inserted)
+        for op, column, value in self.filters:
+            if op == "eq":
+                rows = [row for row in rows if row.get(column) == value]
+            else:
+                rows = [row for row in rows if row.get(column) in value]  # type: ignore[operator]
+        return _Result(list(rows))
+
+
+class _Client:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+        self.tables: dict[str, list[dict]] = {
+            "attendees": [
+                {"id": "att-1", "name": "Joyce Feng", "type": "Member", "member_id": MEMBER_WITH_ATTENDEE},
+                {"id": "att-2", "name": "Lucas", "type": "Guest", "member_id": None},
+            ],
+            "members": [
+                {"id": MEMBER_WITH_ATTENDEE, "full_name": "Joyce Feng"},
+                {"id": MEMBER_WITHOUT_ATTENDEE, "full_name": "Rui Zheng"},
+            ],
+        }
+
+    def table(self, name):
+        return _Query(self, name)
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch: pytest.MonkeyPatch) -> _Client:
+    client = _Client()
+    monkeypatch.setattr(core, "supabase", client)
+    return client
+
+
+def test_bulk_resolution_uses_one_lookup_per_kind_and_one_insert(fake_supabase) -> None:
+    resolved = core.resolve_attendee_ids(
+        [MEMBER_WITH_ATTENDEE, "Lucas", MEMBER_WITHOUT_ATTENDEE, "Ada", "Lucas", "", "Ada"]
+    )
+
+    assert resolved == {
+        MEMBER_WITH_ATTENDEE: "att-1",
+        "Lucas": "att-2",
+        MEMBER_WITHOUT_ATTENDEE: "att-4",
+        "Ada": "att-3",
+    }
+    assert fake_supabase.calls == [
+        ("attendees", "select"),
+        ("attendees", "select"),
+        ("members", "select"),
+        ("attendees", "insert"),
+    ]
+    assert fake_supabase.tables["attendees"][2:] == [
+        {"id": "att-3", "name": "Ada", "type": "Guest", "member_id": None},
+        {"id": "att-4", "name": "Rui Zheng", "type": "Member", "member_id": MEMBER_WITHOUT_ATTENDEE},
+    ]
+
+
+def test_bulk_resolution_rejects_unknown_members_before_inserting(fake_supabase) -> None:
+    unknown = "33333333-3333-3333-3333-333333333333"
+
+    with pytest.raises(ValueError, match=unknown):
+        core.resolve_attendee_ids(["Ada", unknown])
+
+    assert ("attendees", "insert") not in fake_supabase.calls
+
+
+def test_single_resolution_keeps_its_existing_contract(fake_supabase) -> None:
+    assert core.resolve_attendee_id("Lucas") == "att-2"
+    assert core.resolve_attendee_id(MEMBER_WITHOUT_ATTENDEE) == "att-3"
+
+
+def test_segments_share_one_resolution_batch(fake_supabase) -> None:
+    segments: list[dict] = [
+        {"type": "Timer", "start_time": "19:20", "duration": "3", "role_taker": {"name": "Lucas"}},
+        {"type": "Grammarian", "start_time": "19:23", "duration": "3", "role_taker": {"name": "Ada"}},
+        {
+            "type": "Table Topic Master",
+            "start_time": "19:26",
+            "duration": "20",
+            "role_taker": {"name": "Rui Zheng", "member_id": MEMBER_WITHOUT_ATTENDEE},
+        },
+        {"type": "Tea Break", "start_time": "19:46", "duration": "10", "role_taker": None},
+    ]
+    fake_supabase.tables["segments"] = []
+
+    core.create_segments(segments, "meeting-1")
+
+    assert [row["attendee_id"] for row in fake_supabase.tables["segments"]] == ["att-2", "att-3", "att-4", None]
+    assert fake_supabase.calls == [
+        ("attendees", "select"),
+        ("attendees", "select"),
+        ("members", "select"),
+        ("attendees", "insert"),
+        ("segments", "insert"),
+    ]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from postgrest.exceptions import APIError
+
+import app.api.routes.checkin as checkin_route
+from app.api.serv import app
+from app.db import core
+from app.db.identity import Identity
+from app.models.wechat_user import WeChatUser
+
+MEETING_ID = "meeting-1"
+
+
+class _Call:
+    def __init__(self, data=None, error: APIError | None = None):
+        self.data = data
+        self.error = error
+
+    def execute(self):
+        if self.error:
+            raise self.error
+        return self
+
+
+class _Client:
+    def __init__(self, data=None, error: APIError | None = None):
+        self.data = data
+        self.error = error
+        self.rpcs: list[tuple[str, dict]] = []
+
+    def rpc(self, name, params):
+        self.rpcs.append((name, params))
+        return _Call(self.data, self.error)
+
+    def table(self, name):
+        raise AssertionError(f"unexpected {name} query")
+
+
+def test_a_checkin_is_one_rpc(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [{"id": "c-1", "segment_id": "seg-1"}, {"id": "c-2", "segment_id": "seg-2"}]
+    client = _Client(rows)
+    monkeypatch.setattr(core, "supabase", client)
+
+    created = core.create_checkins(MEETING_ID, "wx-1", ["seg-1", "seg-2"], name="Joyce", published_only=True)
+
+    assert created == rows
+    assert client.rpcs == [
+        (
+            "checkin",
+            {
+                "meeting_id_param": MEETING_ID,
+                "wxid_param": "wx-1",
+                "segment_ids_param": ["seg-1", "seg-2"],
+                "name_param": "Joyce",
+                "referral_source_param": None,
+                "is_member_param": False,
+                "published_only": True,
+            },
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    ("code", "error_type"),
+    [
+        ("P0002", core.MeetingNotFoundError),
+        ("22023", core.SegmentNotInMeetingError),
+        ("23P01", core.TimerRoleTakenError),
+    ],
+)
+def test_rpc_refusals_become_checkin_errors(monkeypatch: pytest.MonkeyPatch, code: str, error_type: type) -> None:
+    monkeypatch.setattr(core, "supabase", _Client(error=APIError({"code": code, "message": "refused"})))
+
+    with pytest.raises(error_type, match="refused"):
+        core.create_checkins(MEETING_ID, "wx-1", ["seg-1"])
+
+
+def test_other_rpc_errors_propagate(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core, "supabase", _Client(error=APIError({"code": "23502", "message": "name is null"})))
+
+    with pytest.raises(APIError):
+        core.create_checkins(MEETING_ID, "wx-1", None)
+
+
+@pytest.mark.parametrize(
+    ("error", "status_code"),
+    [
+        (core.MeetingNotFoundError("missing"), 404),
+        (core.SegmentNotInMeetingError("elsewhere"), 422),
+        (core.TimerRoleTakenError("taken"), 409),
+    ],
+)
+def test_the_route_maps_refusals_to_http_errors(
+    monkeypatch: pytest.MonkeyPatch, error: Exception, status_code: int
+) -> None:
+    calls: list[dict] = []
+    guest = WeChatUser(wxid="wx-1")
+
+    def create_checkins(**kwargs):
+        calls.append(kwargs)
+        raise error
+
+    monkeypatch.setattr(checkin_route, "create_checkins", create_checkins)
+    app.dependency_overrides[checkin_route.get_current_extended_user] = lambda: guest
+    app.dependency_overrides[checkin_route.get_identity] = lambda: Identity(guest, wxid="wx-1")
+    try:
+        response = TestClient(app).post(f"/meetings/{MEETING_ID}/checkins", json={"segment_ids": ["seg-1"]})
+    finally:
+        app.dependency_overrides.pop(checkin_route.get_current_extended_user, None)
+        app.dependency_overrides.pop(checkin_route.get_identity, None)
+
+    assert response.status_code == status_code
+    assert calls[0]["published_only"] is True
+    assert calls[0]["is_member"] is False
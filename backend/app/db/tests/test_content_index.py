@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import pytest
+
+import app.db.content as content_db
+
+POST_ID = "00000000-0000-4000-8000-000000000101"
+WXPOST_ID = "00000000-0000-4000-8000-000000000102"
+
+
+class _Result:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class _Query:
+    def __init__(self, client: _Client, name: str):
+        self.client = client
+        self.name = name
+
+    def _record(self, *call):
+        self.client.calls.append((self.name, *call))
+        return self
+
+    def select(self, columns, count=None):
+        return self._record("select", columns, count)
+
+    def eq(self, column, value):
+        return self._record("eq", column, value)
+
+    def in_(self, column, values):
+        return self._record("in", column, values)
+
+    def or_(self, filters):
+        return self._record("or", filters)
+
+    def order(self, column, desc=False):
+        return self._record("order", column, desc)
+
+    def range(self, start, end):
+        return self._record("range", start, end)
+
+    def limit(self, size):
+        return self._record("limit", size)
+
+    def execute(self):
+        data, count = self.client.tables.get(self.name, ([], None))
+        return _Result(data, count)
+
+
+class _Client:
+    def __init__(self, tables, rpc_error: Exception | None = None):
+        self.tables = tables
+        self.rpc_error = rpc_error
+        self.calls: list[tuple] = []
+        self.rpcs: list[tuple[str, dict]] = []
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def rpc(self, name, params):
+        self.rpcs.append((name, params))
+        if self.rpc_error:
+            raise self.rpc_error
+        return _Query(self, "rpc")
+
+
+def _row(content_id: str, kind: str, created_at: str, **overrides) -> dict:
+    row = {
+        "id": content_id,
+        "kind": kind,
+        "title": f"{kind} title",
+        "slug": f"{kind}-slug",
+        "is_public": True,
+        "author_member_id": "member-1" if kind == "post" else None,
+        "author_name": "Joyce Feng" if kind == "post" else None,
+        "cover_image_url": None,
+        "article_revision": 2 if kind == "wxpost" else None,
+        "created_at": created_at,
+        "version": 1,
+        "excerpt": f"{kind} excerpt",
+        "excerpt_version": 1,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_a_page_is_one_index_query_without_bodies(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        _row(WXPOST_ID, "wxpost", "2026-07-26T12:00:00+00:00"),
+        _row(POST_ID, "post", "2026-07-25T12:00:00+00:00"),
+    ]
+    client = _Client({"content_index": (rows, 4)})
+    monkeypatch.setattr(content_db, "supabase", client)
+
+    page = content_db.get_content_items(kind="all", user_id=None, page=2, page_size=2)
+
+    assert {call[0] for call in client.calls} == {"content_index"}
+    assert ("content_index", "eq", "is_public", True) in client.calls
+    assert ("content_index", "range", 2, 3) in client.calls
+    assert "content," not in client.calls[0][2]
+    assert [item["id"] for item in page["items"]] == [WXPOST_ID, POST_ID]
+    assert page["items"][0]["author"] == {"member_id": None, "name": content_db.WXPOST_PUBLISHER_NAME}
+    assert page["items"][1]["author"] == {"member_id": "member-1", "name": "Joyce Feng"}
+    assert (page["total"], page["pages"]) == (4, 2)
+    assert client.rpcs == []
+
+
+def test_stale_excerpts_are_computed_from_their_bodies_and_stored(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        _row(POST_ID, "post", "2026-07-25T12:00:00+00:00", version=3, excerpt="old", excerpt_version=2),
+        _row(WXPOST_ID, "wxpost", "2026-07-24T12:00:00+00:00"),
+    ]
+    client = _Client(
+        {
+            "content_index": (rows, 2),
+            "posts": ([{"id": POST_ID, "content": "# Hello **world**"}], None),
+        }
+    )
+    monkeypatch.setattr(content_db, "supabase", client)
+
+    page = content_db.get_content_items(kind="all", user_id="member-1", page=1, page_size=10)
+
+    assert page["items"][0]["excerpt"] == "Hello world"
+    assert page["items"][1]["excerpt"] == "wxpost excerpt"
+    assert ("posts", "in", "id", [POST_ID]) in client.calls
+    assert not [call for call in client.calls if call[0] == "wxposts"]
+    assert client.rpcs == [
+        ("store_content_excerpts", {"excerpts": [{"id": POST_ID, "version": 3, "excerpt": "Hello world"}]})
+    ]
+
+
+def test_a_failed_excerpt_store_still_serves_the_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [_row(POST_ID, "post", "2026-07-25T12:00:00+00:00", excerpt=None, excerpt_version=None)]
+    client = _Client(
+        {"content_index": (rows, 1), "posts": ([{"id": POST_ID, "content": "Body"}], None)},
+        rpc_error=RuntimeError("database unavailable"),
+    )
+    monkeypatch.setattr(content_db, "supabase", client)
+
+    page = content_db.get_content_items(kind="post", user_id=None, page=1, page_size=10)
+
+    assert page["items"][0]["excerpt"] == "Body"
+    assert ("content_index", "eq", "kind", "post") in client.calls
+
+
+def test_keyset_pages_seek_past_the_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        _row(WXPOST_ID, "wxpost", "2026-07-24T12:00:00+00:00"),
+        _row(POST_ID, "post", "2026-07-23T12:00:00+00:00"),
+    ]
+    client = _Client({"content_index": (rows, None)})
+    monkeypatch.setattr(content_db, "supabase", client)
+    cursor = content_db.encode_content_cursor({"created_at": "2026-07-25T12:00:00+00:00", "id": POST_ID})
+
+    page = content_db.get_content_items_by_cursor(kind="all", user_id="member-1", cursor=cursor, page_size=1)
+
+    assert (
+        "content_index",
+        "or",
+        f"created_at.lt.2026-07-25T12:00:00+00:00,and(created_at.eq.2026-07-25T12:00:00+00:00,id.lt.{POST_ID})",
+    ) in client.calls
+    assert ("content_index", "limit", 2) in client.calls
+    assert [item["id"] for item in page["items"]] == [WXPOST_ID]
+    assert content_db.decode_content_cursor(page["next_cursor"]) == ("2026-07-24T12:00:00+00:00", WXPOST_ID)
+    assert page["total"] is None
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "WyJ5ZXN0ZXJkYXkiLCAiMSJd", "WzEsMl0"])
+def test_malformed_content_cursors_are_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Invalid content cursor"):
+        content_db.decode_content_cursor(cursor)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import core
+from app.models.users import User
+from app.models.wechat_user import WeChatUser
+
+MEETING_ID = "meeting-1"
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    def __init__(self, client: _Client, data):
+        self.client = client
+        self.data = data
+
+    def select(self, columns):
+        self.client.calls.append(("select", columns))
+        return self
+
+    def eq(self, column, value):
+        self.client.calls.append(("eq", column, value))
+        return self
+
+    def or_(self, filters):
+        self.client.calls.append(("or", filters))
+        return self
+
+    def execute(self):
+        return _Result(self.data)
+
+
+class _Client:
+    def __init__(self, data=None):
+        self.data = data if data is not None else []
+        self.tables: list[str] = []
+        self.calls: list[tuple] = []
+
+    def table(self, name):
+        self.tables.append(name)
+        return _Query(self, self.data)
+
+
+def test_reader_visibility_is_applied_in_the_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _Client([{"id": "f-1"}])
+    monkeypatch.setattr(core, "supabase", client)
+
+    rows = core.get_feedbacks_by_meeting(MEETING_ID, wxid="wx-1", user_attendee_id="att-1", feedback_type="segment")
+
+    assert rows == [{"id": "f-1"}]
+    assert ("eq", "type", "segment") in client.calls
+    assert ("or", 'from_wxid.eq."wx-1",to_attendee_id.eq."att-1"') in client.calls
+
+
+def test_admins_read_unfiltered_and_anonymous_readers_skip_the_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _Client()
+    monkeypatch.setattr(core, "supabase", client)
+
+    core.get_feedbacks_by_meeting(MEETING_ID, wxid="wx-1", is_admin=True)
+    assert not [call for call in client.calls if call[0] == "or"]
+
+    client.tables.clear()
+    assert core.get_feedbacks_by_meeting(MEETING_ID) == []
+    assert client.tables == []
+
+
+def test_or_filter_values_are_quoted() -> None:
+    assert core._or_filter_value('a,b)"c') == '"a,b)\\"c"'
+
+
+def test_member_identity_is_one_members_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _Client([{"is_admin": True, "attendees": [{"id": "att-1", "wxid": "wx-1"}]}])
+    monkeypatch.setattr(core, "supabase", client)
+
+    identity = core.get_extended_user_identity(User(uid="u-1", username="joyce", full_name="Joyce Feng"))
+
+    assert identity == {"wxid": "wx-1", "attendee_id": "att-1", "is_admin": True}
+    assert client.tables == ["members"]
+
+
+def test_wechat_identity_comes_from_the_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _Client()
+    monkeypatch.setattr(core, "supabase", client)
+
+    identity = core.get_extended_user_identity(WeChatUser(wxid="wx-2", attendee_id="att-2"))
+
+    assert identity == {"wxid": "wx-2", "attendee_id": "att-2", "is_admin": False}
+    assert client.tables == []
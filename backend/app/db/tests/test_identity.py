@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import core
+from app.db.identity import ANONYMOUS, IdentityCache
+from app.models.users import User
+from app.models.wechat_user import WeChatUser
+
+MEMBER = User(uid="u-1", username="joyce", full_name="Joyce Feng")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_member_identity_is_looked_up_once_per_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    def lookup(user: User) -> dict:
+        lookups.append(user.uid)
+        return {"wxid": "wx-1", "attendee_id": "att-1", "is_admin": True}
+
+    monkeypatch.setattr(core, "get_extended_user_identity", lookup)
+    clock = _Clock()
+    cache = IdentityCache(ttl_seconds=60, clock=clock)
+
+    first = cache.resolve(MEMBER)
+    second = cache.resolve(MEMBER)
+    clock.now = 61
+    cache.resolve(MEMBER)
+
+    assert (first.wxid, first.attendee_id, first.is_admin, first.uid) == ("wx-1", "att-1", True, "u-1")
+    assert second == first
+    assert lookups == ["u-1", "u-1"]
+
+
+def test_wechat_and_anonymous_callers_need_no_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(core, "get_extended_user_identity", pytest.fail)
+    cache = IdentityCache()
+
+    identity = cache.resolve(WeChatUser(wxid="wx-2", attendee_id="att-2"))
+
+    assert (identity.wxid, identity.attendee_id, identity.is_admin, identity.uid) == ("wx-2", "att-2", False, None)
+    assert cache.resolve(None) is ANONYMOUS
+
+
+def test_legacy_wechat_bindings_are_cached_by_wxid(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    def get_user_by_wxid(wxid: str) -> dict | None:
+        lookups.append(wxid)
+        return {"uid": "u-1", "username": "joyce", "full_name": "Joyce Feng"} if wxid == "wx-1" else None
+
+    monkeypatch.setattr(core, "get_user_by_wxid", get_user_by_wxid)
+    monkeypatch.setattr(core, "get_attendee_id_by_wxid", lambda _wxid: "att-9")
+    cache = IdentityCache()
+
+    assert cache.wechat_user("wx-1") == MEMBER
+    assert cache.wechat_user("wx-1") == MEMBER
+    assert cache.wechat_user("wx-9") == WeChatUser(wxid="wx-9", attendee_id="att-9")
+    assert lookups == ["wx-1", "wx-9"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_identities_are_evicted_past_the_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    def lookup(user: User) -> dict:
+        lookups.append(user.uid)
+        return {"wxid": None, "attendee_id": None, "is_admin": False}
+
+    monkeypatch.setattr(core, "get_extended_user_identity", lookup)
+    cache = IdentityCache(ttl_seconds=60, max_entries=2)
+    members = [User(uid=f"u-{n}", username=f"m{n}", full_name=f"Member {n}") for n in range(3)]
+
+    cache.resolve(members[0])
+    cache.resolve(members[1])
+    cache.resolve(members[0])
+    cache.resolve(members[2])
+    cache.resolve(members[0])
+    cache.resolve(members[1])
+
+    assert lookups == ["u-0", "u-1", "u-2", "u-1"]
+    assert cache.stats()["size"] == 2
+    assert cache.stats()["evictions"] == 2
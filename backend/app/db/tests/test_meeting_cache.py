@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import core
+from app.db.meeting_cache import AUTHENTICATED, PUBLIC, MeetingCache, meeting_cache
+
+MEETING = {"id": "meeting-1", "status": "published", "segments": [], "awards": []}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_the_ttl_and_count_hits_and_misses() -> None:
+    clock = _Clock()
+    cache = MeetingCache(max_entries=8, ttl_seconds=30, clock=clock)
+
+    assert cache.get("meeting-1", PUBLIC) is None
+    cache.put("meeting-1", PUBLIC, MEETING, cache.generation("meeting-1"))
+    assert cache.get("meeting-1", PUBLIC) == MEETING
+    assert cache.get("meeting-1", AUTHENTICATED) is None
+
+    clock.now = 30
+    assert cache.get("meeting-1", PUBLIC) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted_first() -> None:
+    cache = MeetingCache(max_entries=2, ttl_seconds=30)
+    for meeting_id in ("a", "b"):
+        cache.put(meeting_id, PUBLIC, {"id": meeting_id}, 0)
+    cache.get("a", PUBLIC)
+
+    cache.put("c", PUBLIC, {"id": "c"}, 0)
+
+    assert cache.get("b", PUBLIC) is None
+    assert cache.get("a", PUBLIC) == {"id": "a"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_copies_are_isolated_from_caller_mutation() -> None:
+    cache = MeetingCache(max_entries=8, ttl_seconds=30)
+    cache.put("meeting-1", PUBLIC, {"id": "meeting-1", "segments": [{"id": "s"}]}, 0)
+
+    cache.get("meeting-1", PUBLIC)["segments"].clear()  # type: ignore[index]
+
+    assert cache.get("meeting-1", PUBLIC) == {"id": "meeting-1", "segments": [{"id": "s"}]}
+
+
+def test_a_load_that_raced_an_invalidation_is_not_stored() -> None:
+    cache = MeetingCache(max_entries=8, ttl_seconds=30)
+    generation = cache.generation("meeting-1")
+
+    cache.invalidate("meeting-1")
+    cache.put("meeting-1", PUBLIC, MEETING, generation)
+
+    assert cache.get("meeting-1", PUBLIC) is None
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _MeetingsQuery:
+    def __init__(self, client: _CountingClient):
+        self.client = client
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, *_args):
+        return self
+
+    def execute(self):
+        self.client.calls += 1
+        row = {"id": "meeting-1", "manager_id": "att-1", "status": "published", "theme": self.client.theme}
+        return _Result([{**row, "manager": None, "segments": [], "awards": []}])
+
+
+class _CountingClient:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.theme = "Before"
+
+    def table(self, name):
+        assert name == "meetings"
+        return _MeetingsQuery(self)
+
+
+@pytest.fixture
+def counting_client(monkeypatch: pytest.MonkeyPatch) -> _CountingClient:
+    client = _CountingClient()
+    monkeypatch.setattr(core, "supabase", client)
+    return client
+
+
+def test_get_meeting_by_id_reads_through_the_cache_per_visibility(counting_client) -> None:
+    core.get_meeting_by_id("meeting-1")
+    core.get_meeting_by_id("meeting-1")
+    core.get_meeting_by_id("meeting-1", user_id="member-1")
+
+    assert counting_client.calls == 2
+    assert meeting_cache.stats()["hits"] == 1
+
+
+def test_meeting_writes_invalidate_both_visibilities(counting_client) -> None:
+    core.get_meeting_by_id("meeting-1")
+    core.get_meeting_by_id("meeting-1", user_id="member-1")
+    counting_client.theme = "After"
+
+    # An empty segment batch does no I/O, leaving only the invalidation.
+    core.create_segments([], "meeting-1")
+
+    assert core.get_meeting_by_id("meeting-1")["theme"] == "After"  # type: ignore[index]
+    assert core.get_meeting_by_id("meeting-1", user_id="member-1")["theme"] == "After"  # type: ignore[index]
+    assert counting_client.calls == 4
+
+
+def test_write_paths_read_past_a_stale_cached_copy(counting_client) -> None:
+    core.get_meeting_by_id("meeting-1", user_id="member-1")
+    # Another process edits the meeting; this process's copy is now stale.
+    counting_client.theme = "Edited elsewhere"
+
+    fresh = core.get_meeting_by_id("meeting-1", user_id="member-1", use_cache=False)
+
+    assert fresh["theme"] == "Edited elsewhere"  # type: ignore[index]
+    assert counting_client.calls == 2
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.api.routes.events import _visible_event
+from app.db import core
+from app.db import meeting_events as events
+from app.db import vote_tally as vote_tally_module
+from app.db.meeting_events import MeetingEvent, MeetingEventHub, meeting_events
+from app.models.users import User
+from app.models.wechat_user import WeChatUser
+
+MEETING_ID = "meeting-1"
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Call:
+    def __init__(self, data):
+        self._data = data
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def insert(self, rows):
+        self._data = [{"id": f"c-{i}", **row} for i, row in enumerate(rows)]
+        return self
+
+    def delete(self):
+        return self
+
+    def eq(self, *_args):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def execute(self):
+        return _Result(self._data)
+
+
+class _Client:
+    def __init__(self, tables=None, rpc_result=None):
+        self.tables = tables or {}
+        self.rpc_result = rpc_result
+
+    def table(self, name):
+        return _Call(self.tables.get(name, []))
+
+    def rpc(self, _name, _params):
+        return _Call(self.rpc_result)
+
+
+async def _next(subscription, timeout=1.0) -> MeetingEvent:
+    event = await subscription.get(timeout)
+    assert event is not None
+    return event
+
+
+async def test_publish_fans_out_to_the_meetings_subscribers_only() -> None:
+    hub = MeetingEventHub()
+    with hub.subscribe(MEETING_ID) as first, hub.subscribe(MEETING_ID) as second, hub.subscribe("other") as other:
+        assert hub.publish(MEETING_ID, events.VOTES_STATUS, {"open": True}) == 2
+
+        assert (await _next(first)).data == {"open": True}
+        assert (await _next(second)).data == {"open": True}
+        assert await other.get(0.01) is None
+
+
+async def test_publish_from_a_worker_thread_reaches_the_loop() -> None:
+    hub = MeetingEventHub()
+    with hub.subscribe(MEETING_ID) as subscription:
+        await asyncio.to_thread(hub.publish, MEETING_ID, events.TIMINGS, {"timings": []})
+
+        event = await _next(subscription)
+
+    assert event == MeetingEvent(events.TIMINGS, {"timings": []})
+
+
+async def test_a_subscriber_that_falls_behind_is_told_to_resync() -> None:
+    hub = MeetingEventHub(max_queue=2)
+    with hub.subscribe(MEETING_ID) as subscription:
+        for n in range(3):
+            hub.publish(MEETING_ID, events.VOTES, {"n": n})
+        await asyncio.sleep(0)
+
+        assert (await _next(subscription)).event == events.RESYNC
+        assert await subscription.get(0.01) is None
+
+
+async def test_leaving_the_block_unsubscribes() -> None:
+    hub = MeetingEventHub()
+    with hub.subscribe(MEETING_ID):
+        assert hub.has_subscribers(MEETING_ID)
+
+    assert not hub.has_subscribers(MEETING_ID)
+    assert hub.publish(MEETING_ID, events.VOTES, {}) == 0
+    assert hub.stats()["subscribers"] == 0
+
+
+async def test_create_checkins_publishes_the_wxids_checkins(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [{"id": "c-0", "meeting_id": MEETING_ID, "wxid": "wx-1", "segment_id": "seg-1"}]
+    monkeypatch.setattr(core, "supabase", _Client(rpc_result=rows))
+    with meeting_events.subscribe(MEETING_ID) as subscription:
+        created = await asyncio.to_thread(core.create_checkins, MEETING_ID, "wx-1", ["seg-1"])
+
+        event = await _next(subscription)
+
+    assert event.event == events.CHECKINS
+    assert event.data == {"wxid": "wx-1", "checkins": created}
+    assert created == rows
+
+
+async def test_cast_votes_publishes_the_incremented_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    votes = [{"category": "Best Speaker", "name": "Lucas", "count": 3}]
+    tables = {"votes_status": [{"open": True}], "votes": votes}
+    monkeypatch.setattr(vote_tally_module, "supabase", _Client(tables, rpc_result=votes))
+    with meeting_events.subscribe(MEETING_ID) as subscription:
+        await core.cast_votes(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}])
+
+        event = await _next(subscription)
+
+    assert event == MeetingEvent(events.VOTES, {"votes": votes})
+
+
+async def test_timing_writes_publish_the_full_list_only_while_someone_listens(monkeypatch) -> None:
+    reads: list[str] = []
+
+    def get_timings(meeting_id: str) -> list[dict]:
+        reads.append(meeting_id)
+        return []
+
+    monkeypatch.setattr(core, "get_timings_by_meeting", get_timings)
+
+    core.publish_timings(MEETING_ID)
+    assert reads == []
+
+    with meeting_events.subscribe(MEETING_ID) as subscription:
+        core.publish_timings(MEETING_ID)
+
+        assert (await _next(subscription)).data == {"timings": []}
+    assert reads == [MEETING_ID]
+
+
+def test_checkins_and_vote_counts_follow_the_rest_visibility_rules() -> None:
+    member = User(uid="u-1", username="joyce", full_name="Joyce Feng")
+    guest = WeChatUser(wxid="wx-1")
+    mine = MeetingEvent(events.CHECKINS, {"wxid": "wx-1", "checkins": []})
+    theirs = MeetingEvent(events.CHECKINS, {"wxid": "wx-2", "checkins": []})
+    votes = MeetingEvent(events.VOTES, {"votes": []})
+    timings = MeetingEvent(events.TIMINGS, {"timings": []})
+
+    assert _visible_event(theirs, member) is theirs.data
+    assert _visible_event(mine, guest) is mine.data
+    assert _visible_event(theirs, guest) is None
+    assert _visible_event(mine, None) is None
+    assert _visible_event(votes, guest) is None
+    assert _visible_event(votes, member) is votes.data
+    assert _visible_event(timings, None) is timings.data
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db.meeting_cache import meeting_cache
+from app.db.meeting_search import MeetingSearchCache, invalidates_meeting_search, meeting_search_cache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Index:
+    def __init__(self) -> None:
+        self.version = "1:2026-07-15"
+        self.version_reads = 0
+        self.loads: list[dict] = []
+
+    def read_version(self) -> str:
+        self.version_reads += 1
+        return self.version
+
+    def load(self, **filters) -> dict:
+        self.loads.append(filters)
+        return {"rows": [{"no": len(self.loads), "theme": filters["theme"]}], "total": 1}
+
+
+def _cache(index: _Index, clock: _Clock, **kwargs) -> MeetingSearchCache:
+    return MeetingSearchCache(
+        max_entries=kwargs.get("max_entries", 8),
+        revalidate_seconds=10.0,
+        load=index.load,
+        version=index.read_version,
+        clock=clock,
+    )
+
+
+def test_repeat_lookups_are_served_without_querying_the_index() -> None:
+    index, clock = _Index(), _Clock()
+    cache = _cache(index, clock)
+
+    first = cache.search(theme="AI")
+    first["rows"][0]["theme"] = "mutated by a caller"
+    second = cache.search(theme="AI")
+
+    assert second == {"rows": [{"no": 1, "theme": "AI"}], "total": 1}
+    assert len(index.loads) == 1
+    assert index.version_reads == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_the_version_is_rechecked_after_the_window_and_a_change_drops_lookups() -> None:
+    index, clock = _Index(), _Clock()
+    cache = _cache(index, clock)
+    cache.search(theme="AI")
+
+    clock.now += 11
+    cache.search(theme="AI")
+    assert (index.version_reads, len(index.loads)) == (2, 1)
+
+    index.version = "2:2026-07-16"
+    clock.now += 11
+    assert cache.search(theme="AI")["rows"][0]["no"] == 2
+
+
+def test_meeting_writes_drop_shared_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    index = _Index()
+    monkeypatch.setattr(meeting_search_cache, "_load", index.load)
+    monkeypatch.setattr(meeting_search_cache, "_version", index.read_version)
+    meeting_search_cache.search(theme="AI")
+
+    meeting_cache.invalidate("meeting-1")
+    meeting_search_cache.search(theme="AI")
+
+    assert len(index.loads) == 2
+    assert index.version_reads == 2
+
+
+def test_a_lookup_that_raced_a_write_is_not_stored() -> None:
+    index, clock = _Index(), _Clock()
+    cache: MeetingSearchCache
+
+    def load(**filters) -> dict:
+        cache.invalidate()
+        return index.load(**filters)
+
+    cache = MeetingSearchCache(8, 10.0, load=load, version=index.read_version, clock=clock)
+    cache.search(theme="AI")
+
+    assert cache.stats()["size"] == 0
+
+
+def test_an_unreadable_version_disables_caching_until_it_recovers() -> None:
+    index, clock = _Index(), _Clock()
+
+    def read_version() -> str:
+        raise RuntimeError("database unavailable")
+
+    cache = MeetingSearchCache(8, 10.0, load=index.load, version=read_version, clock=clock)
+    cache.search(theme="AI")
+    cache.search(theme="AI")
+
+    assert len(index.loads) == 2
+
+
+def test_the_least_recently_used_lookup_is_evicted() -> None:
+    index, clock = _Index(), _Clock()
+    cache = _cache(index, clock, max_entries=2)
+    cache.search(theme="a")
+    cache.search(theme="b")
+    cache.search(theme="a")
+    cache.search(theme="c")
+
+    cache.search(theme="a")
+    cache.search(theme="b")
+    assert [load["theme"] for load in index.loads] == ["a", "b", "c", "b"]
+
+
+def test_created_meetings_drop_lookups_even_when_the_write_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    index = _Index()
+    monkeypatch.setattr(meeting_search_cache, "_load", index.load)
+    monkeypatch.setattr(meeting_search_cache, "_version", index.read_version)
+    meeting_search_cache.search(theme="AI")
+
+    @invalidates_meeting_search
+    def failing_create() -> None:
+        raise RuntimeError("insert failed")
+
+    with pytest.raises(RuntimeError):
+        failing_create()
+    assert meeting_search_cache.stats()["size"] == 0
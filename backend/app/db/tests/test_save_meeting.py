@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+from app.db import core
+
+MEETING_ID = "meeting-1"
+
+EXISTING_MEETING: dict[str, Any] = {
+    "id": MEETING_ID,
+    "no": 462,
+    "type": "Regular",
+    "theme": "Culture in Every Voice",
+    "date": "2026-07-15",
+    "start_time": "19:15:00",
+    "end_time": "21:30:00",
+    "location": "Club room",
+    "introduction": "",
+    "status": "draft",
+    "manager": {"id": "att-manager", "name": "Joyce Feng", "member_id": ""},
+    "awards": [],
+    "segments": [
+        {
+            "id": "seg-keep",
+            "type": "Timer",
+            "start_time": "19:20",
+            "duration": "3",
+            "end_time": "19:23",
+            "role_taker": None,
+            "title": "",
+            "content": "",
+            "related_segment_ids": "",
+        },
+        {
+            "id": "seg-edit",
+            "type": "Grammarian",
+            "start_time": "19:23",
+            "duration": "3",
+            "end_time": "19:26",
+            "role_taker": None,
+            "title": "",
+            "content": "",
+            "related_segment_ids": "",
+        },
+        {
+            "id": "seg-drop",
+            "type": "Tea Break",
+            "start_time": "19:26",
+            "duration": "10",
+            "end_time": "19:36",
+            "role_taker": None,
+            "title": "",
+            "content": "",
+            "related_segment_ids": "",
+        },
+    ],
+}
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Call:
+    def __init__(self, data):
+        self._data = data
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, *_args):
+        return self
+
+    def in_(self, *_args):
+        return self
+
+    def execute(self):
+        return _Result(self._data)
+
+
+class _Client:
+    def __init__(self, rpc_result=True):
+        self.tables: list[str] = []
+        self.rpcs: list[tuple[str, dict]] = []
+        self.rpc_result = rpc_result
+
+    def table(self, name):
+        self.tables.append(name)
+        assert name == "attendees", "meeting saves must only read attendees outside the RPC"
+        return _Call([{"id": "att-lucas", "name": "Lucas"}])
+
+    def rpc(self, name, params):
+        self.rpcs.append((name, params))
+        return _Call(self.rpc_result)
+
+
+@pytest.fixture
+def existing_meeting(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    """Serves EXISTING_MEETING and records the keyword arguments of each read."""
+    reads: list[dict] = []
+
+    def get_meeting_by_id(*_args, **kwargs):
+        reads.append(kwargs)
+        return copy.deepcopy(EXISTING_MEETING)
+
+    monkeypatch.setattr(core, "get_meeting_by_id", get_meeting_by_id)
+    return reads
+
+
+def _edited_agenda() -> dict:
+    meeting = copy.deepcopy(EXISTING_MEETING)
+    keep, edit, _drop = meeting["segments"]
+    edit["role_taker"] = {"name": "Lucas"}
+    added = {"type": "Closing", "start_time": "19:26", "duration": "5", "role_taker": None}
+    meeting["segments"] = [keep, edit, added]
+    meeting["theme"] = "Every Voice Counts"
+    return meeting
+
+
+def test_segment_diff_keeps_unchanged_segments_out_of_the_write_set() -> None:
+    edited = _edited_agenda()["segments"]
+    edited[2]["id"] = "seg-new"
+
+    to_add, to_update, to_delete = core.diff_meeting_segments(EXISTING_MEETING["segments"], edited)
+
+    assert [segment["id"] for segment in to_add] == ["seg-new"]
+    assert [segment["id"] for segment in to_update] == ["seg-edit"]
+    assert to_delete == ["seg-drop"]
+
+
+def test_update_meeting_applies_the_whole_diff_in_one_rpc(existing_meeting, monkeypatch) -> None:
+    client = _Client()
+    monkeypatch.setattr(core, "supabase", client)
+
+    result = core.update_meeting(MEETING_ID, _edited_agenda(), user_id="member-1")
+
+    assert result is not None
+    # The diff starts from a fresh read, never a cached copy.
+    assert existing_meeting == [{"use_cache": False}]
+    assert client.tables == ["attendees"]
+    ((name, params),) = client.rpcs
+    assert name == "save_meeting_changes"
+    assert params["meeting_id_param"] == MEETING_ID
+    assert params["meeting_diff"] == {"theme": "Every Voice Counts"}
+    assert params["delete_segment_ids"] == ["seg-drop"]
+    edited_row, added_row = params["upsert_segments"]
+    assert edited_row["id"] == "seg-edit"
+    assert edited_row["attendee_id"] == "att-lucas"
+    assert added_row["id"] == result["segments"][2]["id"]
+    assert added_row["end_time"] == "19:31"
+    assert added_row["duration"] == "5 minutes"
+
+
+def test_update_meeting_skips_the_rpc_when_nothing_changed(existing_meeting, monkeypatch) -> None:
+    client = _Client()
+    monkeypatch.setattr(core, "supabase", client)
+
+    assert core.update_meeting(MEETING_ID, copy.deepcopy(EXISTING_MEETING), user_id="member-1") is not None
+
+    assert client.rpcs == []
+
+
+def test_update_meeting_reports_a_meeting_deleted_mid_save(existing_meeting, monkeypatch) -> None:
+    monkeypatch.setattr(core, "supabase", _Client(rpc_result=False))
+
+    assert core.update_meeting(MEETING_ID, _edited_agenda(), user_id="member-1") is None
@@ -93,6 +93,7 @@ def test_get_member_award_stats_keeps_unresolved_and_ambiguous_winners():
     with (
         patch("app.services.meeting_stats.load_meetings_in_range", return_value=meetings),
         _stub_supabase_tables(table_data),
+        patch("app.db.core.get_members", lambda: table_data["members"]),
     ):
         rows = db_stats.get_member_award_stats("2026-01-01", "2026-12-31")
 
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.db import core, meeting_search
+from app.db import supabase as supabase_module
+from app.db.supabase import _ThreadLocalClient
+
+
+class _StatefulClient:
+    """Client whose in-flight request state lives on the instance, like the
+    HTTP/2 stream state of a real one: two threads sharing it would read
+    each other's answers."""
+
+    def __init__(self, stats: _Stats) -> None:
+        self.stats = stats
+        self.threads: set[int] = set()
+        self._pending: dict | None = None
+
+    def rpc(self, name: str, params: dict):
+        return SimpleNamespace(execute=lambda: self._send("rpc", name, params))
+
+    def table(self, name: str):
+        return _Query(self, name)
+
+    def _send(self, kind: str, name: str, params: dict):
+        self.threads.add(threading.get_ident())
+        self._pending = {"kind": kind, "name": name, **params}
+        with self.stats.lock:
+            self.stats.in_flight += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        time.sleep(0.002)
+        with self.stats.lock:
+            self.stats.in_flight -= 1
+        sent = self._pending
+        if kind == "rpc":
+            return SimpleNamespace(data=[{"no": 1, "theme": sent["theme_pattern"], "total_matches": 1}])
+        return SimpleNamespace(data=[{"id": f"uuid-{sent['no']}"}])
+
+
+class _Query:
+    def __init__(self, client: _StatefulClient, name: str) -> None:
+        self.client = client
+        self.name = name
+        self.filters: dict = {}
+
+    def select(self, *_args, **_kwargs) -> _Query:
+        return self
+
+    def eq(self, column: str, value) -> _Query:
+        self.filters[column] = value
+        return self
+
+    def limit(self, _count: int) -> _Query:
+        return self
+
+    def execute(self):
+        return self.client._send("table", self.name, self.filters)
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+
+def test_concurrent_queries_run_in_parallel_without_cross_talk(monkeypatch: pytest.MonkeyPatch) -> None:
+    stats = _Stats()
+    clients: list[_StatefulClient] = []
+
+    def create_client(*_args) -> _StatefulClient:
+        client = _StatefulClient(stats)
+        clients.append(client)
+        return client
+
+    proxy = _ThreadLocalClient()
+    monkeypatch.setattr(supabase_module, "create_client", create_client)
+    monkeypatch.setattr(core, "supabase", proxy)
+    monkeypatch.setattr(meeting_search, "supabase", proxy)
+
+    def lookup(n: int) -> tuple[str | None, str]:
+        found = meeting_search.search_meeting_cards(theme=f"theme {n}")
+        return core.get_meeting_id_by_no(n), found["rows"][0]["theme"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lookup, range(400)))
+
+    assert results == [(f"uuid-{n}", f"theme {n}") for n in range(400)]
+    assert 1 < len(clients) <= 8
+    assert all(len(client.threads) == 1 for client in clients)
+    assert stats.max_in_flight > 1
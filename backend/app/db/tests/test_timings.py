@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import pytest
+
+from app.db import core
+
+MEETING_ID = "meeting-1"
+START = "2026-07-15T19:30:00+08:00"
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Call:
+    def __init__(self, client: _Client, table: str | None = None, data=None):
+        self.client = client
+        self.table = table
+        self.data = data
+        self.payload: dict | None = None
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def eq(self, *_args):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def update(self, payload):
+        self.payload = payload
+        self.client.updates.append(payload)
+        return self
+
+    def execute(self):
+        if self.payload is not None:
+            return _Result([{**self.client.rows[0], **self.payload}])
+        return _Result(self.data if self.data is not None else self.client.rows)
+
+
+class _Client:
+    def __init__(self, rows=None, rpc_result=None):
+        self.rows: list[dict] = rows or []
+        self.rpc_result = rpc_result or []
+        self.rpcs: list[tuple[str, dict]] = []
+        self.updates: list[dict] = []
+
+    def table(self, name):
+        assert name == "timings"
+        return _Call(self, name)
+
+    def rpc(self, name, params):
+        self.rpcs.append((name, params))
+        return _Call(self, data=self.rpc_result)
+
+
+def _row(**fields) -> dict:
+    return {
+        "id": "t-1",
+        "meeting_id": MEETING_ID,
+        "segment_id": "seg-1",
+        "name": None,
+        "planned_duration_minutes": 2,
+        "actual_start_time": START,
+        "actual_end_time": "2026-07-15T19:32:10+08:00",
+        "actual_duration_seconds": None,
+        "dot_color": None,
+        **fields,
+    }
+
+
+def test_batch_all_saves_every_segment_in_one_rpc(monkeypatch):
+    client = _Client(rpc_result=[_row(actual_duration_seconds=130, dot_color="red")])
+    monkeypatch.setattr(core, "supabase", client)
+
+    timings = core.create_timings_batch_all(
+        MEETING_ID,
+        [
+            {
+                "segment_id": "seg-1",
+                "timings": [
+                    {
+                        "name": None,
+                        "planned_duration_minutes": 2,
+                        "actual_start_time": START,
+                        "actual_end_time": "2026-07-15T19:32:10+08:00",
+                    }
+                ],
+            },
+            {"segment_id": "seg-2", "timings": []},
+        ],
+    )
+
+    ((name, params),) = client.rpcs
+    assert name == "save_meeting_timings"
+    assert params["meeting_id_param"] == MEETING_ID
+    first, cleared = params["segments_param"]
+    assert first["timings"][0] == {
+        "name": None,
+        "planned_duration_minutes": 2,
+        "actual_start_time": START,
+        "actual_end_time": "2026-07-15T19:32:10+08:00",
+        "actual_duration_seconds": 130,
+        "dot_color": "red",
+        "time_suffix": "(19:30)",
+    }
+    assert cleared == {"segment_id": "seg-2", "timings": []}
+    assert timings[0]["actual_duration_seconds"] == 130
+    assert timings[0]["dot_color"] == "red"
+
+
+def test_batch_rejects_invalid_timestamps_before_writing(monkeypatch):
+    client = _Client()
+    monkeypatch.setattr(core, "supabase", client)
+
+    with pytest.raises(ValueError):
+        core.create_timings_batch(
+            MEETING_ID,
+            "seg-1",
+            [
+                {
+                    "name": "Ada",
+                    "planned_duration_minutes": 2,
+                    "actual_start_time": START,
+                    "actual_end_time": "2026-07-15T19:29:00+08:00",
+                }
+            ],
+        )
+
+    assert client.rpcs == []
+
+
+def test_timings_are_read_from_the_stored_columns(monkeypatch):
+    stored = _row(actual_duration_seconds=130, dot_color="red")
+    monkeypatch.setattr(core, "supabase", _Client(rows=[stored]))
+    monkeypatch.setattr(core, "calculate_timing_fields", pytest.fail)
+
+    (timing,) = core.get_timings_by_meeting(MEETING_ID)
+
+    assert (timing["actual_duration_seconds"], timing["dot_color"]) == (130, "red")
+
+
+def test_legacy_timings_without_stored_columns_are_computed_on_read(monkeypatch):
+    legacy = _row()
+    malformed = _row(id="t-2", actual_end_time="2026-07-15T19:00:00+08:00")
+    monkeypatch.setattr(core, "supabase", _Client(rows=[legacy, malformed]))
+
+    timings = core.get_timings_by_meeting(MEETING_ID)
+
+    assert [(t["id"], t["actual_duration_seconds"], t["dot_color"]) for t in timings] == [("t-1", 130, "red")]
+
+
+def test_update_timing_stores_the_recomputed_fields(monkeypatch):
+    client = _Client(rows=[_row(actual_duration_seconds=130, dot_color="red")])
+    monkeypatch.setattr(core, "supabase", client)
+
+    timing = core.update_timing("t-1", MEETING_ID, actual_end_time="2026-07-15T19:31:00+08:00")
+
+    assert client.updates == [
+        {"actual_end_time": "2026-07-15T19:31:00+08:00", "actual_duration_seconds": 60, "dot_color": "green"}
+    ]
+    assert (timing["actual_duration_seconds"], timing["dot_color"]) == (60, "green")
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from app.db import core
+from app.db.meeting_cache import meeting_cache
+from app.db.supabase import run_sync
+from app.db.vote_tally import VoteKey, VoteTally, vote_tally
+
+MEETING_ID = "meeting-1"
+CANDIDATES = frozenset({("Best Speaker", "Lucas"), ("Best Speaker", "Joyce"), ("Best Evaluator", "Amy")})
+NOW = datetime(2026, 7, 15, 21, 0)
+
+
+class _Ballots:
+    """Fake loader / RPC pair that counts its calls."""
+
+    def __init__(self, is_open: bool = True, ends_at: datetime | None = datetime(2026, 7, 15, 21, 30)):
+        self.is_open = is_open
+        self.ends_at = ends_at
+        self.counts: dict[VoteKey, int] = dict.fromkeys(CANDIDATES, 0)
+        self.loads = 0
+        self.flushes: list[dict[VoteKey, int]] = []
+
+    def load(self, _meeting_id: str):
+        self.loads += 1
+        return self.ends_at, self.is_open, CANDIDATES
+
+    def flush(self, _meeting_id: str, deltas: dict[VoteKey, int]) -> list[dict]:
+        self.flushes.append(deltas)
+        for key, delta in deltas.items():
+            self.counts[key] += delta
+        return [{"category": key[0], "name": key[1], "count": self.counts[key]} for key in deltas]
+
+
+def _tally(ballots: _Ballots, window_seconds: float = 0.0, ttl_seconds: float = 30.0) -> VoteTally:
+    return VoteTally(
+        ttl_seconds=ttl_seconds,
+        window_seconds=window_seconds,
+        load=ballots.load,
+        flush=ballots.flush,
+        now=lambda: NOW,
+    )
+
+
+async def test_ballots_are_validated_against_one_cached_load() -> None:
+    ballots = _Ballots()
+    tally = _tally(ballots)
+
+    first = await tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}, {"category": "Best Speaker"}])
+    second = await tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Nobody"}])
+    third = await tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}])
+
+    assert first == [{"category": "Best Speaker", "name": "Lucas", "count": 1}]
+    assert second == []
+    assert third == [{"category": "Best Speaker", "name": "Lucas", "count": 2}]
+    assert ballots.loads == 1
+    assert len(ballots.flushes) == 2
+
+
+@pytest.mark.parametrize(
+    "ballots",
+    [_Ballots(is_open=False), _Ballots(ends_at=datetime(2026, 7, 15, 20, 30))],
+    ids=["closed", "ended"],
+)
+async def test_no_votes_are_counted_once_voting_is_over(ballots: _Ballots) -> None:
+    assert await _tally(ballots).cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}]) == []
+    assert ballots.flushes == []
+
+
+async def test_concurrent_ballots_are_written_in_one_flush_with_accurate_counts() -> None:
+    ballots = _Ballots()
+    tally = _tally(ballots, window_seconds=0.2)
+    await tally.cast(MEETING_ID, [])  # load the ballot box up front
+    names = ["Lucas", "Lucas", "Joyce", "Lucas"]
+
+    results = await asyncio.gather(
+        *(
+            tally.cast(
+                MEETING_ID, [{"category": "Best Speaker", "name": name}, {"category": "Best Evaluator", "name": "Amy"}]
+            )
+            for name in names
+        )
+    )
+
+    assert ballots.flushes == [
+        {("Best Speaker", "Lucas"): 3, ("Best Evaluator", "Amy"): 4, ("Best Speaker", "Joyce"): 1}
+    ]
+    assert sorted(row["count"] for rows in results for row in rows if row["name"] == "Amy") == [4, 4, 4, 4]
+    assert tally.stats()["ballots"] == 4
+
+
+async def test_a_failed_flush_fails_every_ballot_in_it() -> None:
+    def fail(_meeting_id: str, _deltas: dict) -> list[dict]:
+        raise RuntimeError("database unavailable")
+
+    tally = VoteTally(window_seconds=0.05, load=_Ballots().load, flush=fail, now=lambda: NOW)
+    ballot = [{"category": "Best Speaker", "name": "Lucas"}]
+
+    results = await asyncio.gather(
+        tally.cast(MEETING_ID, ballot), tally.cast(MEETING_ID, ballot), return_exceptions=True
+    )
+
+    assert [str(result) for result in results] == ["database unavailable", "database unavailable"]
+
+
+async def test_a_hung_flush_times_out_instead_of_holding_its_ballots() -> None:
+    def hang(_meeting_id: str, _deltas: dict) -> list[dict]:
+        time.sleep(0.5)
+        return []
+
+    tally = VoteTally(window_seconds=0.0, flush_timeout_seconds=0.05, load=_Ballots().load, flush=hang, now=lambda: NOW)
+
+    with pytest.raises(TimeoutError):
+        await tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}])
+
+
+async def test_waiting_ballots_do_not_hold_worker_threads() -> None:
+    """Only the ballot-box load and the flush run on the `run_sync` pool;
+    ballots waiting out the window are plain coroutines."""
+    ballots = _Ballots()
+    tally = _tally(ballots, window_seconds=0.1)
+    await tally.cast(MEETING_ID, [])
+    flush_threads: list[str] = []
+
+    def flush(meeting_id: str, deltas: dict[VoteKey, int]) -> list[dict]:
+        flush_threads.append(threading.current_thread().name)
+        return ballots.flush(meeting_id, deltas)
+
+    tally._flush_counts = flush
+    ballot = [{"category": "Best Speaker", "name": "Lucas"}]
+    pending = [asyncio.create_task(tally.cast(MEETING_ID, ballot)) for _ in range(40)]
+    await asyncio.sleep(0.02)
+
+    assert not any(task.done() for task in pending)
+    # More ballots are waiting than the pool has threads, yet it is free.
+    await asyncio.wait_for(run_sync(lambda: None), 0.05)
+    results = await asyncio.gather(*pending)
+    assert {rows[0]["count"] for rows in results} == {40}
+    assert len(flush_threads) == 1 and flush_threads[0].startswith("supabase-sync")
+
+
+async def test_status_changes_and_meeting_writes_reload_the_ballot_box(monkeypatch: pytest.MonkeyPatch) -> None:
+    ballots = _Ballots()
+    monkeypatch.setattr(vote_tally, "_load", ballots.load)
+    monkeypatch.setattr(vote_tally, "_flush_counts", ballots.flush)
+    monkeypatch.setattr(vote_tally, "_now", lambda: NOW)
+    monkeypatch.setattr(vote_tally, "window_seconds", 0.0)
+    await vote_tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}])
+
+    ballots.is_open = False
+    vote_tally.invalidate(MEETING_ID)
+    assert await vote_tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}]) == []
+
+    ballots.is_open = True
+    meeting_cache.invalidate(MEETING_ID)
+    assert (await vote_tally.cast(MEETING_ID, [{"category": "Best Speaker", "name": "Lucas"}]))[0]["count"] == 2
+    assert ballots.loads == 3
+
+
+def test_update_votes_status_drops_the_cached_ballot_box(monkeypatch: pytest.MonkeyPatch) -> None:
+    dropped: list[str] = []
+    monkeypatch.setattr(core, "get_meeting_by_id", lambda *_args, **_kwargs: {"id": MEETING_ID})
+    monkeypatch.setattr(core, "get_votes_status", lambda _meeting_id: None)
+    monkeypatch.setattr(core.vote_tally, "invalidate", dropped.append)
+
+    class _Insert:
+        def insert(self, row):
+            return self
+
+        def execute(self):
+            return type("Result", (), {"data": [{"meeting_id": MEETING_ID, "open": False}]})()
+
+    monkeypatch.setattr(core, "supabase", type("Client", (), {"table": lambda self, _name: _Insert()})())
+
+    assert core.update_votes_status(MEETING_ID, False, "member-1") == {"meeting_id": MEETING_ID, "open": False}
+    assert dropped == [MEETING_ID]
@@ -3,7 +3,6 @@ from uuid import UUID
 
 from postgrest.exceptions import APIError
 
-import app.db.content as content_db
 import app.db.wxpost as wxpost_db
 from app.models.wxpost import ArticleDocument
 
@@ -374,39 +373,3 @@ def test_batch_publication_lookup_uses_one_query(monkeypatch) -> None:
 
     assert result == rows
     assert query.filters == [("source_workspace_id", ["wxpost-a", "wxpost-b"])]
-
-
-def test_combined_content_is_sorted_before_final_pagination(monkeypatch) -> None:
-    monkeypatch.setattr(
-        content_db,
-        "_post_rows",
-        lambda user_id, limit: (
-            [
-                {"id": "post-new", "created_at": "2026-07-25T12:00:00+00:00"},
-                {"id": "post-old", "created_at": "2026-07-23T12:00:00+00:00"},
-            ],
-            2,
-        ),
-    )
-    monkeypatch.setattr(
-        content_db,
-        "_wxpost_rows",
-        lambda limit: (
-            [
-                {"id": "wx-new", "created_at": "2026-07-26T12:00:00+00:00"},
-                {"id": "wx-old", "created_at": "2026-07-24T12:00:00+00:00"},
-            ],
-            2,
-        ),
-    )
-
-    page = content_db.get_content_items(
-        kind="all",
-        user_id=None,
-        page=2,
-        page_size=2,
-    )
-
-    assert [item["id"] for item in page["items"]] == ["wx-old", "post-old"]
-    assert page["total"] == 4
-    assert page["pages"] == 2
@@ -0,0 +1,221 @@
+"""Coalesced vote counting for the end-of-meeting voting burst.
+
+Every ballot used to re-read the meeting's end time, its votes status and all
+of its vote rows before calling `increment_votes`, and the whole club votes
+within the same minute. `cast_votes` now goes through `vote_tally` instead:
+
+- The ballot box of a meeting (end time, open flag, candidate keys) is cached
+  for `VOTE_TALLY_TTL_SECONDS` and ballots are validated against it in
+  memory. `update_votes_status` and `save_vote_form` drop it, as does any
+  meeting write (`meeting_cache.on_invalidate`), since the end time can move.
+- Ballots for one meeting arriving within `VOTE_TALLY_WINDOW_SECONDS` of the
+  first are summed and applied with one `add_vote_counts` RPC. Each ballot
+  waits for that flush and returns the rows it wrote, so the counts a voter
+  sees are the database's, not an in-memory estimate.
+- Batching happens on the event loop. Only the ballot-box load and the flush
+  run on the `run_sync` pool, so waiting ballots hold no thread, and a flush
+  that outlasts `VOTE_TALLY_FLUSH_TIMEOUT_SECONDS` fails its ballots instead
+  of holding them.
+- `add_vote_counts` re-checks that voting is open, so a close handled by
+  another process takes effect at once even while this box is cached.
+
+Like the meeting cache, this only coalesces ballots handled by this process;
+counts stay correct across processes because the RPC adds deltas in SQL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from ..config import VOTE_TALLY_FLUSH_TIMEOUT_SECONDS, VOTE_TALLY_TTL_SECONDS, VOTE_TALLY_WINDOW_SECONDS
+from . import meeting_events as events
+from . import process_caches
+from .meeting_cache import meeting_cache
+from .supabase import run_sync
+
+# Per-thread client: ballot boxes are loaded and flushed on `run_sync` worker threads.
+from .supabase import thread_supabase as supabase
+
+VoteKey = Tuple[str, str]
+
+
+def _meeting_end(meeting: Dict[str, Any]) -> Optional[datetime]:
+    meeting_date = meeting.get("date")
+    meeting_end_time = meeting.get("end_time")
+    if not meeting_date or not meeting_end_time:
+        return None
+    meeting_datetime_str = f"{meeting_date} {meeting_end_time}"
+    try:
+        return datetime.strptime(meeting_datetime_str, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return datetime.strptime(meeting_datetime_str, "%Y-%m-%d %H:%M")
+
+
+@dataclass(frozen=True)
+class BallotBox:
+    """What a ballot is validated against, loaded once per meeting per TTL."""
+
+    ends_at: Optional[datetime]
+    is_open: bool
+    candidates: FrozenSet[VoteKey]
+    expires_at: float
+
+    def accepts(self, now: datetime) -> bool:
+        """Voting is open and the meeting has not ended."""
+        return self.is_open and (self.ends_at is None or now <= self.ends_at)
+
+
+def load_ballot_box(meeting_id: str) -> Tuple[Optional[datetime], bool, FrozenSet[VoteKey]]:
+    """Read a meeting's end time, votes status and candidate keys."""
+    meeting = supabase.table("meetings").select("date, end_time").eq("id", meeting_id).execute()
+    status = supabase.table("votes_status").select("open").eq("meeting_id", meeting_id).execute()
+    votes = supabase.table("votes").select("category, name").eq("meeting_id", meeting_id).execute()
+
+    ends_at = _meeting_end(meeting.data[0]) if meeting.data else None
+    is_open = bool(status.data and status.data[0]["open"])
+    return ends_at, is_open, frozenset((v["category"], v["name"]) for v in votes.data or [])
+
+
+def add_vote_counts(meeting_id: str, deltas: Dict[VoteKey, int]) -> List[Dict]:
+    """Add each delta to its vote row in one RPC; returns the updated rows
+    (none once voting is closed)."""
+    vote_data = [{"category": category, "name": name, "delta": delta} for (category, name), delta in deltas.items()]
+    result = supabase.rpc("add_vote_counts", {"meeting_id_param": meeting_id, "vote_data": vote_data}).execute()
+    return result.data or []
+
+
+class _Batch:
+    """Ballots waiting for the same flush."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.deltas: Counter[VoteKey] = Counter()
+        self.rows: asyncio.Future[Dict[VoteKey, Dict]] = loop.create_future()
+        self.flush: Optional[asyncio.Task[None]] = None
+
+
+class VoteTally:
+    """Per-meeting ballot boxes plus the pending batch each ballot joins."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = VOTE_TALLY_TTL_SECONDS,
+        window_seconds: float = VOTE_TALLY_WINDOW_SECONDS,
+        flush_timeout_seconds: float = VOTE_TALLY_FLUSH_TIMEOUT_SECONDS,
+        load: Callable[[str], Tuple[Optional[datetime], bool, FrozenSet[VoteKey]]] = load_ballot_box,
+        flush: Callable[[str, Dict[VoteKey, int]], List[Dict]] = add_vote_counts,
+        clock: Callable[[], float] = time.monotonic,
+        now: Callable[[], datetime] = datetime.now,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.window_seconds = window_seconds
+        self.flush_timeout_seconds = flush_timeout_seconds
+        self._load = load
+        self._flush_counts = flush
+        self._clock = clock
+        self._now = now
+        self._lock = threading.Lock()
+        self._boxes: Dict[str, BallotBox] = {}
+        self._generations: Dict[str, int] = {}
+        self._pending: Dict[str, _Batch] = {}
+        self.ballots = 0
+        self.flushes = 0
+        self.loads = 0
+
+    async def cast(self, meeting_id: str, votes: List[Dict[str, str]]) -> List[Dict]:
+        """
+        Count one ballot; returns the updated row of each valid vote.
+
+        Returns [] when voting is closed, the meeting has ended, or none of
+        the votes names an existing candidate.
+        """
+        box = await self._box(meeting_id)
+        if not box.accepts(self._now()):
+            return []
+        keys = [
+            (vote["category"], vote["name"])
+            for vote in votes
+            if "category" in vote and "name" in vote and (vote["category"], vote["name"]) in box.candidates
+        ]
+        if not keys:
+            return []
+
+        with self._lock:
+            batch = self._pending.get(meeting_id)
+            if batch is None:
+                batch = self._pending[meeting_id] = _Batch(asyncio.get_running_loop())
+                batch.flush = asyncio.create_task(self._flush(meeting_id, batch))
+            batch.deltas.update(keys)
+            self.ballots += 1
+
+        # Shielded: a voter hanging up must not cancel the others' result.
+        rows = await asyncio.shield(batch.rows)
+        return [rows[key] for key in keys if key in rows]
+
+    async def _flush(self, meeting_id: str, batch: _Batch) -> None:
+        # The batch stays open for the window, then everything that joined it
+        # is written at once.
+        if self.window_seconds > 0:
+            await asyncio.sleep(self.window_seconds)
+        with self._lock:
+            del self._pending[meeting_id]
+            self.flushes += 1
+        try:
+            rows = await asyncio.wait_for(
+                run_sync(self._flush_counts, meeting_id, dict(batch.deltas)), self.flush_timeout_seconds
+            )
+        except Exception as e:
+            batch.rows.set_exception(e)
+            return
+        batch.rows.set_result({(row["category"], row["name"]): row for row in rows})
+        if rows:
+            events.meeting_events.publish(meeting_id, events.VOTES, {"votes": rows})
+
+    async def _box(self, meeting_id: str) -> BallotBox:
+        with self._lock:
+            box = self._boxes.get(meeting_id)
+            if box is not None and box.expires_at > self._clock():
+                return box
+            generation = self._generations.get(meeting_id, 0)
+            self.loads += 1
+        ends_at, is_open, candidates = await run_sync(self._load, meeting_id)
+        box = BallotBox(ends_at, is_open, candidates, self._clock() + self.ttl_seconds)
+        with self._lock:
+            # A status change or vote form save during the load wins.
+            if self.ttl_seconds > 0 and self._generations.get(meeting_id, 0) == generation:
+                self._boxes[meeting_id] = box
+        return box
+
+    def invalidate(self, meeting_id: str) -> None:
+        with self._lock:
+            self._generations[meeting_id] = self._generations.get(meeting_id, 0) + 1
+            self._boxes.pop(meeting_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boxes.clear()
+            self._generations.clear()
+            self._pending.clear()
+            self.ballots = self.flushes = self.loads = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._boxes),
+                "ttl_seconds": self.ttl_seconds,
+                "window_seconds": self.window_seconds,
+                "flush_timeout_seconds": self.flush_timeout_seconds,
+                "ballots": self.ballots,
+                "flushes": self.flushes,
+                "loads": self.loads,
+            }
+
+
+vote_tally = VoteTally()
+process_caches.register(vote_tally.clear)
+meeting_cache.on_invalidate(vote_tally.invalidate)
@@ -11,7 +11,10 @@ from postgrest.exceptions import APIError
 
 from ..models.wxpost import ArticleDocument, ArticleType, WxPostPublicDetail
 from ..services.wxpost_document import validate_and_parse
-from .supabase import supabase
+from .response_cache import CONTENT, invalidates_responses
+
+# Per-thread client: routes call these through `run_sync` worker threads.
+from .supabase import thread_supabase as supabase
 
 
 class WxPostNotFoundError(Exception):
@@ -59,6 +62,7 @@ def _is_unique_violation(error: APIError) -> bool:
     return getattr(error, "code", None) == "23505"
 
 
+@invalidates_responses(CONTENT)
 def create_wxpost(document: ArticleDocument) -> dict:
     """Insert a validated article, suffixing only on a real slug collision."""
 
@@ -426,6 +430,7 @@ def has_abandoned_wxpost_assets(wxpost_id: UUID) -> bool:
     return bool(response.data)
 
 
+@invalidates_responses(CONTENT)
 def begin_wxpost_deletion(
     wxpost_id: UUID,
     *,
@@ -457,6 +462,7 @@ def begin_wxpost_deletion(
     raise WxPostRevisionConflictError
 
 
+@invalidates_responses(CONTENT)
 def delete_hidden_wxpost(
     wxpost_id: UUID,
     *,
@@ -477,6 +483,7 @@ def delete_hidden_wxpost(
     raise WxPostRevisionConflictError
 
 
+@invalidates_responses(CONTENT)
 def finalize_workspace_publication(
     wxpost_id: UUID,
     *,
@@ -519,6 +526,7 @@ def finalize_workspace_publication(
     raise WxPostRevisionConflictError
 
 
+@invalidates_responses(CONTENT)
 def update_wxpost(
     wxpost_id: UUID,
     *,
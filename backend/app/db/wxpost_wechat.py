@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import UUID
 
-from .supabase import supabase
+# Per-thread client: routes call these through `run_sync` worker threads.
+from .supabase import thread_supabase as supabase
 
 
 def get_projection(workspace_id: str) -> dict | None:
@@ -250,10 +250,26 @@ class PaginatedResponse(BaseModel, Generic[T]):
     pages: int
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Keyset page: follow `next_cursor` until it is None.
+
+    `total` is only set when requested, and is PostgREST's planner estimate.
+    """
+
+    items: List[T]
+    page_size: int
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
 class PaginatedMeetings(PaginatedResponse[Meeting]):
     pass
 
 
+class CursorPaginatedMeetings(CursorPaginatedResponse[Meeting]):
+    pass
+
+
 class MeetingOption(BaseModel):
     """Minimal meeting data needed by selectors and other compact lists."""
 
@@ -268,6 +284,10 @@ class PaginatedMeetingOptions(PaginatedResponse[MeetingOption]):
     pass
 
 
+class CursorPaginatedMeetingOptions(CursorPaginatedResponse[MeetingOption]):
+    pass
+
+
 class MeetingOptionsByIdsRequest(BaseModel):
     ids: List[
         Annotated[
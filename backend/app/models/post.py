@@ -2,6 +2,8 @@ from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from .meeting import CursorPaginatedResponse
+
 
 class Author(BaseModel):
     name: str = Field(description="The name of the author.")
@@ -49,3 +51,7 @@ class PaginatedContentItems(BaseModel):
     page: int
     page_size: int
     pages: int
+
+
+class CursorPaginatedContentItems(CursorPaginatedResponse[ContentListItem]):
+    pass
@@ -0,0 +1,574 @@
+"""Columnar in-memory snapshot of the tables behind the statistics agent.
+
+The matrix tools used to re-query meetings → segments → attendees → members
+(or awards) and rebuild the same dict joins on every call, so one chat turn
+firing three tools cost around fifteen round-trips. `AnalyticsSnapshot`
+loads meetings, segments, attendees, members, awards and checkins through
+the `analytics_changes` RPC and keeps them as `array`-backed columns with
+integer-encoded ids:
+
+  - Published meetings are sorted by date, so a date range is a contiguous
+    index range (two bisects). Segments, awards and checkins are sorted by
+    meeting index, so their rows for that range are a contiguous slice too.
+  - Foreign keys are positions into the parent columns (`segment_attendee`
+    → `attendee_member` → member columns). Joins are array lookups instead
+    of dict probes on UUID strings.
+  - `member_segments` indexes each member's segment rows in chronological
+    order, so role-history questions ("when did X last do Y") cost
+    O(log n + result) instead of a scan.
+
+Reads within `ANALYTICS_SNAPSHOT_TTL_SECONDS` never touch the DB. An expired
+snapshot asks for rows whose `updated_at` moved since the previous refresh
+(one RPC) and reloads everything when a table shrank — deletes are
+invisible to `updated_at` — or every `ANALYTICS_SNAPSHOT_FULL_RELOAD_SECONDS`.
+Meeting writes in this process (`meeting_cache` invalidations) expire the
+snapshot at once and have the next refresh re-read those meetings whole.
+
+Query methods return the exact row shapes of the DB-backed functions they
+stand in for (`app.db.stats`, `meeting_stats`). The statistics matrix tools
+read through the entry points at the bottom of this module, and
+`meeting_stats.member_segment_history` / `meetings_managed_by` delegate
+here outright, so the snapshot is their only definition.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Any, Callable, Collection
+
+from app.config import ANALYTICS_SNAPSHOT_FULL_RELOAD_SECONDS, ANALYTICS_SNAPSHOT_TTL_SECONDS
+from app.db import process_caches
+from app.db.meeting_cache import meeting_cache
+from app.db.supabase import thread_supabase as supabase
+from app.services import meeting_stats
+from app.services.member_directory import MemberIndex, member_directory
+
+logger = logging.getLogger(__name__)
+
+TABLES = ("members", "attendees", "meetings", "segments", "awards", "checkins")
+MEETING_CHILD_TABLES = ("segments", "awards", "checkins")
+
+# Code of a missing reference (no manager, unassigned segment, guest attendee).
+NULL = -1
+
+# Re-read rows written shortly before the previous refresh: a transaction that
+# commits after it can still carry an earlier `updated_at`.
+_REFRESH_OVERLAP = timedelta(minutes=1)
+
+
+class _Codes:
+    """Dense integer codes for repeated strings (ids, segment types)."""
+
+    __slots__ = ("_index", "values")
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str | None) -> int:
+        if not value:
+            return NULL
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str | None) -> int:
+        return self._index.get(value, NULL) if value else NULL
+
+
+def _day(date_str: str | None) -> int:
+    """'YYYY-MM-DD' → YYYYMMDD, so date bounds are integer compares."""
+    try:
+        return int((date_str or "")[:10].replace("-", ""))
+    except ValueError:
+        return 0
+
+
+class AnalyticsColumns:
+    """Immutable columnar view of one set of raw rows.
+
+    Built whole on every refresh that changed something; readers keep
+    whichever instance they got, so a refresh never mutates columns under a
+    running query.
+    """
+
+    def __init__(self, rows: dict[str, dict[str, dict]]):
+        # --- members (also coded when only referenced by an attendee) ---
+        self.members = _Codes()
+        self.member_username: list[str | None] = []
+        self.member_full_name: list[str | None] = []
+        for member in rows["members"].values():
+            code = self._member_code(member["id"])
+            self.member_username[code] = member.get("username") or ""
+            self.member_full_name[code] = member.get("full_name") or ""
+
+        # --- attendees ---
+        self.attendees = _Codes()
+        self.attendee_member = array("l")
+        self.attendee_name: list[str] = []
+        self.attendee_wxid: list[str | None] = []
+        self.attendee_known = bytearray()
+        for attendee in rows["attendees"].values():
+            code = self._attendee_code(attendee["id"])
+            self.attendee_known[code] = 1
+            self.attendee_name[code] = attendee.get("name") or ""
+            self.attendee_wxid[code] = attendee.get("wxid")
+            self.attendee_member[code] = self._member_code(attendee.get("member_id"))
+
+        # --- published meetings, date ascending ---
+        published = sorted(
+            (m for m in rows["meetings"].values() if m.get("status") == "published"),
+            key=lambda m: m.get("date") or "",
+        )
+        self.meeting_types = _Codes()
+        self.meeting_id: list[str] = [m["id"] for m in published]
+        self.meeting_index = {meeting_id: i for i, meeting_id in enumerate(self.meeting_id)}
+        self.meeting_day = array("l", (_day(m.get("date")) for m in published))
+        self.meeting_date: list[str | None] = [m.get("date") for m in published]
+        self.meeting_no = array("q", (NULL if m.get("no") is None else m["no"] for m in published))
+        self.meeting_theme: list[str | None] = [m.get("theme") for m in published]
+        self.meeting_type = array("l", (self.meeting_types.encode(m.get("type")) for m in published))
+        self.meeting_manager = array("l", (self._attendee_code(m.get("manager_id")) for m in published))
+
+        # --- segments, by meeting then start time ---
+        segments = self._children(rows["segments"], sort_key=lambda s: s.get("start_time") or "")
+        self.segment_types = _Codes()
+        self.segment_meeting = array("l", (m for m, _ in segments))
+        self.segment_attendee = array("l", (self._attendee_code(s.get("attendee_id")) for _, s in segments))
+        self.segment_member = array("l", (self._member_of(a) for a in self.segment_attendee))
+        self.segment_type = array("l", (self.segment_types.encode(s.get("type")) for _, s in segments))
+        self.segment_start: list[str | None] = [s.get("start_time") for _, s in segments]
+
+        # --- awards ---
+        awards = self._children(rows["awards"])
+        self.award_meeting = array("l", (m for m, _ in awards))
+        self.award_id: list[str] = [a["id"] for _, a in awards]
+        self.award_category: list[str] = [a.get("category") or "" for _, a in awards]
+        self.award_winner: list[str] = [a.get("winner") or "" for _, a in awards]
+
+        # --- checkins ---
+        checkins = self._children(rows["checkins"])
+        self.checkin_meeting = array("l", (m for m, _ in checkins))
+        self.checkin_wxid: list[str | None] = [c.get("wxid") for _, c in checkins]
+        self.checkin_name: list[str | None] = [c.get("name") for _, c in checkins]
+        self.checkin_is_member = bytearray(1 if c.get("is_member") else 0 for _, c in checkins)
+
+        self._member_index = MemberIndex(
+            {"id": member_id, "username": self.member_username[code], "full_name": self.member_full_name[code]}
+            for code, member_id in enumerate(self.members.values)
+            if self.member_full_name[code] is not None
+        )
+        self._winners: dict[str, dict | None] = {}
+
+    # ---------- building ----------
+
+    def _member_code(self, member_id: str | None) -> int:
+        code = self.members.encode(member_id)
+        if code == len(self.member_full_name):
+            # Referenced but not (yet) loaded: unknown until its row arrives.
+            self.member_username.append(None)
+            self.member_full_name.append(None)
+        return code
+
+    def _attendee_code(self, attendee_id: str | None) -> int:
+        code = self.attendees.encode(attendee_id)
+        if code == len(self.attendee_name):
+            self.attendee_member.append(NULL)
+            self.attendee_name.append("")
+            self.attendee_wxid.append(None)
+            self.attendee_known.append(0)
+        return code
+
+    def _member_of(self, attendee: int) -> int:
+        return NULL if attendee == NULL else self.attendee_member[attendee]
+
+    def _children(
+        self, rows: dict[str, dict], sort_key: Callable[[dict], Any] = lambda _row: 0
+    ) -> list[tuple[int, dict]]:
+        """Rows of published meetings as (meeting index, row), meeting-sorted."""
+        indexed = [
+            (meeting, row)
+            for row in rows.values()
+            if (meeting := self.meeting_index.get(row["meeting_id"])) is not None
+        ]
+        indexed.sort(key=lambda pair: (pair[0], sort_key(pair[1])))
+        return indexed
+
+    # ---------- primitives ----------
+
+    def meeting_range(self, date_from: str | None, date_to: str | None) -> range:
+        """Indices of published meetings dated within [date_from, date_to]."""
+        lo = bisect_left(self.meeting_day, _day(date_from)) if date_from else 0
+        hi = bisect_right(self.meeting_day, _day(date_to)) if date_to else len(self.meeting_day)
+        return range(lo, max(lo, hi))
+
+    def meetings_of_type(self, meetings: range, type_filter: str | None) -> range | list[int]:
+        if not type_filter:
+            return meetings
+        code = self.meeting_types.lookup(type_filter)
+        return [i for i in meetings if self.meeting_type[i] == code]
+
+    @staticmethod
+    def child_rows(meeting_column: array, meetings: range) -> range:
+        """Row range of a meeting-sorted child column (`segment_meeting`,
+        `award_meeting`, `checkin_meeting`) for a contiguous meeting range."""
+        return range(bisect_left(meeting_column, meetings.start), bisect_left(meeting_column, meetings.stop))
+
+    @cached_property
+    def member_segments(self) -> dict[int, array]:
+        """Member code → that member's segment rows, chronological (segment
+        rows are stored by meeting date, then start time)."""
+        index: dict[int, array] = {}
+        for row, member in enumerate(self.segment_member):
+            if member != NULL:
+                index.setdefault(member, array("l")).append(row)
+        return index
+
+    def member_segment_rows(self, member: int, meetings: range) -> array:
+        """A member's segment rows within a contiguous meeting range."""
+        rows = self.member_segments.get(member)
+        if not rows:
+            return array("l")
+        meeting_of = self.segment_meeting.__getitem__
+        return rows[
+            bisect_left(rows, meetings.start, key=meeting_of) : bisect_left(rows, meetings.stop, key=meeting_of)
+        ]
+
+    def _meeting_fields(self, meeting: int) -> dict:
+        no = self.meeting_no[meeting]
+        return {
+            "meeting_id": self.meeting_id[meeting],
+            "meeting_date": self.meeting_date[meeting],
+            "meeting_theme": self.meeting_theme[meeting],
+            "meeting_no": None if no == NULL else no,
+        }
+
+    # ---------- queries ----------
+
+    def member_meeting_rows(
+        self, date_from: str | None, date_to: str | None, member_id: str | None = None
+    ) -> list[dict]:
+        """Same rows as `app.db.stats.get_member_meeting_stats`, optionally
+        only `member_id`'s (read off the per-member index)."""
+        meetings = self.meeting_range(date_from, date_to)
+        rows: range | array = (
+            self.child_rows(self.segment_meeting, meetings)
+            if member_id is None
+            else self.member_segment_rows(self.members.lookup(member_id), meetings)
+        )
+        out: list[dict] = []
+        for i in rows:
+            member = self.segment_member[i]
+            if member == NULL or self.member_full_name[member] is None:
+                continue
+            segment_type = self.segment_type[i]
+            out.append(
+                {
+                    "member_id": self.members.values[member],
+                    "username": self.member_username[member],
+                    "full_name": self.member_full_name[member],
+                    **self._meeting_fields(self.segment_meeting[i]),
+                    "role": self.segment_types.values[segment_type] if segment_type != NULL else "",
+                }
+            )
+        return out
+
+    def member_award_rows(self, date_from: str | None, date_to: str | None) -> list[dict]:
+        """Same rows as `app.db.stats.get_member_award_stats`."""
+        out: list[dict] = []
+        for i in self.child_rows(self.award_meeting, self.meeting_range(date_from, date_to)):
+            winner_name = self.award_winner[i]
+            if winner_name not in self._winners:
+                self._winners[winner_name] = self._member_index.resolve(winner_name)
+            member = self._winners[winner_name]
+            out.append(
+                {
+                    "award_id": self.award_id[i],
+                    **self._meeting_fields(self.award_meeting[i]),
+                    "category": self.award_category[i],
+                    "winner_name": winner_name,
+                    "member_id": member.get("id") if member else None,
+                    "username": member.get("username") if member else None,
+                    "full_name": member.get("full_name") if member else None,
+                    "winner_resolved": member is not None,
+                }
+            )
+        return out
+
+    def group_meetings_by_manager(
+        self,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        type_filter: meeting_stats.MeetingType | None = None,
+    ) -> list[dict]:
+        """Same rows as `meeting_stats.group_meetings_by_manager`."""
+        meetings = self.meetings_of_type(self.meeting_range(date_from, date_to), type_filter)
+        by_attendee = Counter(self.meeting_manager[i] for i in meetings)
+        by_attendee.pop(NULL, None)
+
+        member_counts: Counter[int] = Counter()
+        out: list[dict] = []
+        for attendee, count in by_attendee.items():
+            member = self.attendee_member[attendee]
+            if member != NULL:
+                member_counts[member] += count
+            else:
+                out.append(
+                    {
+                        "member_id": "",
+                        "full_name": self.attendee_name[attendee],
+                        "username": "",
+                        "count": count,
+                        "is_member": False,
+                    }
+                )
+        out.extend(
+            {
+                "member_id": self.members.values[member],
+                "full_name": self.member_full_name[member] or "",
+                "username": self.member_username[member] or "",
+                "count": count,
+                "is_member": True,
+            }
+            for member, count in member_counts.items()
+        )
+        out.sort(key=lambda r: (-r["count"], r["full_name"]))
+        return out
+
+    def member_segment_history(
+        self,
+        member_id: str,
+        segment_types: list[str] | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Rows of `meeting_stats.member_segment_history`, newest first; `limit`
+        keeps only the most recent ("when did X last do Y")."""
+        member = self.members.lookup(member_id)
+        if member == NULL:
+            return []
+        type_codes = {self.segment_types.lookup(t) for t in segment_types} if segment_types else None
+        out: list[dict] = []
+        for i in reversed(self.member_segment_rows(member, self.meeting_range(date_from, date_to))):
+            segment_type = self.segment_type[i]
+            if type_codes is not None and segment_type not in type_codes:
+                continue
+            meeting = self.segment_meeting[i]
+            no = self.meeting_no[meeting]
+            out.append(
+                {
+                    "meeting_id": self.meeting_id[meeting],
+                    "no": None if no == NULL else no,
+                    "date": self.meeting_date[meeting],
+                    "theme": self.meeting_theme[meeting],
+                    "segment_type": self.segment_types.values[segment_type] if segment_type != NULL else "",
+                    "start_time": self.segment_start[i],
+                }
+            )
+            if limit is not None and len(out) >= limit:
+                break
+        out.sort(key=lambda r: (r.get("date") or "", r.get("start_time") or ""), reverse=True)
+        return out
+
+    def meetings_managed_by(
+        self,
+        member_id: str,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> list[dict]:
+        """Rows of `meeting_stats.meetings_managed_by`, newest first."""
+        member = self.members.lookup(member_id)
+        if member == NULL:
+            return []
+        return [
+            {
+                "meeting_id": self.meeting_id[i],
+                "no": None if self.meeting_no[i] == NULL else self.meeting_no[i],
+                "date": self.meeting_date[i],
+                "theme": self.meeting_theme[i],
+            }
+            for i in reversed(self.meeting_range(date_from, date_to))
+            if self._member_of(self.meeting_manager[i]) == member
+        ]
+
+
+def _fetch_changes(since: str | None, meeting_ids: list[str]) -> dict:
+    return supabase.rpc("analytics_changes", {"since": since, "meeting_ids": meeting_ids}).execute().data
+
+
+class AnalyticsSnapshot:
+    """Process-wide holder of the current `AnalyticsColumns`.
+
+    Keeps the raw rows keyed by id per table so an incremental refresh can
+    upsert changed rows and rebuild columns from the merged set.
+    """
+
+    def __init__(
+        self,
+        fetch_changes: Callable[[str | None, list[str]], dict] = _fetch_changes,
+        ttl_seconds: float = ANALYTICS_SNAPSHOT_TTL_SECONDS,
+        full_reload_seconds: float = ANALYTICS_SNAPSHOT_FULL_RELOAD_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self._fetch_changes = fetch_changes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dirty_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._rows: dict[str, dict[str, dict]] = {table: {} for table in TABLES}
+        self._columns: AnalyticsColumns | None = None
+        self._as_of: datetime | None = None
+        self._fresh_until = 0.0
+        self._full_reload_at = 0.0
+        self._dirty_meetings: set[str] = set()
+        self.refreshes = 0
+        self.full_reloads = 0
+
+    def current(self) -> AnalyticsColumns:
+        """Columns no older than the TTL, refreshing (one RPC) if needed."""
+        columns = self._columns
+        if columns is not None and self._clock() < self._fresh_until:
+            return columns
+        with self._lock:
+            if self._columns is None or self._clock() >= self._fresh_until:
+                self._refresh()
+            assert self._columns is not None
+            return self._columns
+
+    def expire(self, meeting_id: str | None = None) -> None:
+        """Make the next read refresh (incrementally) instead of waiting out
+        the TTL, re-reading `meeting_id` and all its child rows."""
+        if meeting_id:
+            with self._dirty_lock:
+                self._dirty_meetings.add(meeting_id)
+        self._fresh_until = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "loaded": self._columns is not None,
+            "as_of": self._as_of.isoformat() if self._as_of else None,
+            "rows": {table: len(rows) for table, rows in self._rows.items()},
+            "refreshes": self.refreshes,
+            "full_reloads": self.full_reloads,
+        }
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        full = self._as_of is None or now >= self._full_reload_at
+        since = None if full or self._as_of is None else (self._as_of - _REFRESH_OVERLAP).isoformat()
+        with self._dirty_lock:
+            dirty, self._dirty_meetings = self._dirty_meetings, set()
+        try:
+            payload = self._fetch_changes(since, [] if full else sorted(dirty))
+            changed = self._apply(payload, full=full, replace_meetings=dirty)
+            if not full and any(len(self._rows[table]) > payload["counts"][table] for table in TABLES):
+                # Something was deleted; `updated_at` cannot say what.
+                full = True
+                payload = self._fetch_changes(None, [])
+                changed = self._apply(payload, full=True)
+        except Exception:
+            with self._dirty_lock:
+                self._dirty_meetings |= dirty
+            if self._columns is None:
+                raise
+            logger.warning("Analytics snapshot refresh failed; serving the previous snapshot", exc_info=True)
+            return
+
+        if changed or self._columns is None:
+            self._columns = AnalyticsColumns(self._rows)
+        if full:
+            self._full_reload_at = now + self.full_reload_seconds
+            self.full_reloads += 1
+        self._as_of = datetime.fromisoformat(payload["as_of"])
+        self._fresh_until = now + self.ttl_seconds
+        self.refreshes += 1
+
+    def _apply(self, payload: dict, *, full: bool, replace_meetings: Collection[str] = ()) -> bool:
+        if full:
+            previous_members = self._rows["members"]
+            self._rows = {table: {row["id"]: row for row in payload.get(table) or []} for table in TABLES}
+            if previous_members and previous_members != self._rows["members"]:
+                member_directory.invalidate()
+            return True
+        changed = False
+        if replace_meetings:
+            # The payload carries these meetings (if they still exist) with
+            # every child row; drop the local copies so deletions show.
+            for meeting_id in replace_meetings:
+                changed |= self._rows["meetings"].pop(meeting_id, None) is not None
+            for table in MEETING_CHILD_TABLES:
+                rows = self._rows[table]
+                stale = [row_id for row_id, row in rows.items() if row["meeting_id"] in replace_meetings]
+                for row_id in stale:
+                    del rows[row_id]
+                changed |= bool(stale)
+        for table in TABLES:
+            rows = self._rows[table]
+            for row in payload.get(table) or []:
+                if rows.get(row["id"]) != row:
+                    rows[row["id"]] = row
+                    changed = True
+                    if table == "members":
+                        # Members are only written by auth triggers; this diff
+                        # is where the process gets to see those writes.
+                        member_directory.invalidate()
+        return changed
+
+
+analytics_snapshot = AnalyticsSnapshot()
+process_caches.register(analytics_snapshot.clear)
+meeting_cache.on_invalidate(analytics_snapshot.expire)
+
+
+# ---------- Statistics-tool entry points ----------
+
+
+def member_meeting_rows(date_from: str | None, date_to: str | None, member_id: str | None = None) -> list[dict]:
+    return analytics_snapshot.current().member_meeting_rows(date_from, date_to, member_id)
+
+
+def member_award_rows(date_from: str | None, date_to: str | None) -> list[dict]:
+    return analytics_snapshot.current().member_award_rows(date_from, date_to)
+
+
+def group_meetings_by_manager(
+    date_from: str | None = None,
+    date_to: str | None = None,
+    type_filter: meeting_stats.MeetingType | None = None,
+) -> list[dict]:
+    return analytics_snapshot.current().group_meetings_by_manager(date_from, date_to, type_filter)
+
+
+def member_segment_history(
+    member_id: str,
+    segment_types: list[str] | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    limit: int | None = None,
+) -> list[dict]:
+    return analytics_snapshot.current().member_segment_history(member_id, segment_types, date_from, date_to, limit)
+
+
+def meetings_managed_by(member_id: str, date_from: str | None = None, date_to: str | None = None) -> list[dict]:
+    return analytics_snapshot.current().meetings_managed_by(member_id, date_from, date_to)
@@ -8,18 +8,21 @@ agent-and-router-design.md.
 
 Three layers:
 
-  1. **DB helpers** — sync wrappers around `app.db.core` that hold the
-     module-level `DB_LOCK`. Supabase-py's underlying httpx client is sync
-     and NOT thread-safe under concurrent access, so the lock serializes
-     every DB call this module makes. Tests can monkeypatch the wrappers
-     directly.
-
-  2. **Projections** — `meeting_to_card`, `meeting_to_preview`. Pure
-     functions that take a raw meeting dict from the DB and project it
-     into the shape the agents and route surface to the chat UI.
+  1. **DB helpers** — sync wrappers around `app.db.core` and
+     `app.db.meeting_search`. Both query through `thread_supabase`, so
+     every worker thread has its own client and parallel agent tools
+     (several `preview_meeting` calls in one turn, lookups from different
+     users) run their DB I/O concurrently. Tests can monkeypatch the
+     wrappers directly.
+
+  2. **Projections** — `meeting_to_card` (from a search index row) and
+     `meeting_to_preview` (from a fully-hydrated meeting). Pure functions
+     that project DB rows into the shape the agents and route surface to
+     the chat UI.
 
   3. **Resolution** — `resolve_meetings(filters)` is the high-level entry
-     point. Takes a `MeetingFilters` and returns a list of cards.
+     point. Takes a `MeetingFilters` and returns a list of cards from one
+     `search_meetings` query over every published meeting.
      `parse_query(query)` translates a free-text descriptor into filters
      (number, manager substring, theme substring via OR, type, recency).
      Both agents can call `resolve_meetings` directly with structured
@@ -29,15 +32,19 @@ Three layers:
 from __future__ import annotations
 
 import asyncio
+import logging
 import re
-import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
-from typing import Any, Literal
+from typing import Literal
 
 from pydantic_ai import ModelRetry
 
-from app.db.core import get_meeting_by_id, get_meeting_id_by_no, get_meetings
+from app.db.core import get_meeting_by_id, get_meeting_id_by_no
+from app.db.meeting_search import meeting_search_cache
+from app.services.member_directory import member_directory
+
+logger = logging.getLogger(__name__)
 
 
 def parse_iso_date_or_raise(label: str, value: str) -> date:
@@ -59,14 +66,6 @@ def parse_iso_date_or_raise(label: str, value: str) -> date:
         ) from None
 
 
-# Supabase-py wraps a sync httpx client whose HTTP/2 stream state corrupts
-# under concurrent access — surfaces as `httpx.RemoteProtocolError: Server
-# disconnected`. Every DB call in this module goes through this lock so
-# parallel agent tools (e.g. several preview_meeting in one turn) fall back
-# to sequential DB I/O. Costs a few hundred ms per extra call but is fully
-# reliable.
-DB_LOCK = threading.Lock()
-
 MeetingType = Literal["Regular", "Workshop", "Custom"]
 
 
@@ -80,8 +79,7 @@ class MeetingFilters:
     keyword). This separation lets reply text disclose which result came
     from which field, which is itself useful information.
 
-      `no`                        — exact display number; bypasses the
-                                    pool scan via fetch_meeting_full.
+      `no`                        — exact display number.
       `name_substring`            — case-insensitive substring on
                                     `manager.name` ONLY. Use for "Joyce
                                     主持的" / "managed by Frank" queries.
@@ -110,33 +108,43 @@ class MeetingFilters:
     limit: int = 5
 
 
-# ---------- DB helpers (locked) ----------
-
-
-def db_meetings_recent(limit: int = 50) -> list[dict]:
-    """Most-recent N meetings as raw DB dicts. Use for candidate-pool scans
-    where targeted-by-no isn't applicable (fuzzy descriptor queries)."""
-    with DB_LOCK:
-        page = get_meetings(user_id=None, status=None, page=1, page_size=limit)
-    return page.get("items", [])
+# ---------- DB helpers ----------
+
+
+def db_search_meetings(filters: MeetingFilters) -> dict:
+    """Card rows for every published meeting matching `filters`, newest
+    first, plus the full match count. One indexed query over all history
+    that reads card fields only (no segment or attendee rows), shared with
+    every other agent turn through `meeting_search_cache` — see
+    `app.db.meeting_search`."""
+    return meeting_search_cache.search(
+        no=filters.no,
+        manager=filters.name_substring,
+        theme=filters.theme_substring,
+        introduction=filters.introduction_substring,
+        meeting_type=filters.type_filter,
+        date_from=filters.date_from,
+        date_to=filters.date_to,
+        limit=filters.limit,
+    )
 
 
 def fetch_meeting_full(no: int) -> dict | None:
     """Resolve a meeting by display number to a fully-hydrated dict (meta +
-    all segments + manager attendee).
+    all segments + manager attendee). For `preview_meeting` and the clone
+    path, which need the segments; lookups stay on `db_search_meetings`.
 
     Two cheap targeted queries (`get_meeting_id_by_no` then
-    `get_meeting_by_id`) instead of a bulk `db_meetings_recent(N)` scan.
-    The bulk path uses `.in_(meeting_ids)` whose URL grows with N and
+    `get_meeting_by_id`) instead of a bulk hydrated page. The bulk path
+    used `.in_(meeting_ids)` whose URL grows with N and
     overflows PostgREST / Cloudflare URL-length limits when several preview
     or clone tools fire concurrently in one turn. The targeted path also
     sidesteps the PostgREST 1000-row response cap that truncated cloned
     agendas past 21:03."""
-    with DB_LOCK:
-        meeting_id = get_meeting_id_by_no(no)
-        if meeting_id is None:
-            return None
-        return get_meeting_by_id(meeting_id, user_id=None)
+    meeting_id = get_meeting_id_by_no(no)
+    if meeting_id is None:
+        return None
+    return get_meeting_by_id(meeting_id, user_id=None)
 
 
 # ---------- Projections ----------
@@ -151,9 +159,11 @@ def _meeting_manager_name(meeting: dict) -> str:
     return manager or ""
 
 
-def meeting_to_card(meeting: dict, *, include_introduction: bool = False) -> dict:
-    """Project a raw meeting dict into the lightweight card shape the
-    agents surface to the chat UI from `lookup_meeting`.
+def meeting_to_card(row: dict, *, include_introduction: bool = False) -> dict:
+    """Project a `search_meetings` row into the lightweight card shape the
+    agents surface to the chat UI from `lookup_meeting`. The row already
+    carries `manager_name` and `segment_count`, so building a card never
+    needs the meeting's segment or attendee rows.
 
     `include_introduction` adds the meeting's full `introduction` field
     to the card. The resolver sets this when the call used
@@ -162,15 +172,15 @@ def meeting_to_card(meeting: dict, *, include_introduction: bool = False) -> dic
     plausible-sounding intro content from the theme alone — observed
     regression in production)."""
     card = {
-        "no": meeting.get("no"),
-        "type": meeting.get("type", ""),
-        "date": meeting.get("date", ""),
-        "theme": meeting.get("theme", ""),
-        "manager_name": _meeting_manager_name(meeting),
-        "segment_count": len(meeting.get("segments") or []),
+        "no": row.get("no"),
+        "type": row.get("type") or "",
+        "date": row.get("date") or "",
+        "theme": row.get("theme") or "",
+        "manager_name": row.get("manager_name") or "",
+        "segment_count": row.get("segment_count") or 0,
     }
     if include_introduction:
-        card["introduction"] = meeting.get("introduction") or ""
+        card["introduction"] = row.get("introduction") or ""
     return card
 
 
@@ -381,117 +391,67 @@ def parse_query(query: str) -> MeetingFilters:
 # ---------- Resolution ----------
 
 
-def _matches_filters(meeting: dict, filters: MeetingFilters) -> bool:
-    if filters.type_filter and meeting.get("type") != filters.type_filter:
-        return False
-    if filters.name_substring:
-        if filters.name_substring.lower() not in _meeting_manager_name(meeting).lower():
-            return False
-    if filters.theme_substring:
-        if not _field_matches_substring(meeting.get("theme") or "", filters.theme_substring):
-            return False
-    if filters.introduction_substring:
-        if not _field_matches_substring(
-            meeting.get("introduction") or "",
-            filters.introduction_substring,
-        ):
-            return False
-    if filters.date_from or filters.date_to:
-        # ISO date strings sort lexicographically. Missing meeting.date
-        # treated as "doesn't match the range" — preserves the typical
-        # user intent ("show me meetings in October" → must HAVE a date).
-        meeting_date = meeting.get("date") or ""
-        if not meeting_date:
-            return False
-        if filters.date_from and meeting_date < filters.date_from:
-            return False
-        if filters.date_to and meeting_date > filters.date_to:
-            return False
-    return True
-
-
-def _field_matches_substring(value: str, needle: str) -> bool:
-    """Case-insensitive field match with token boundaries for short ASCII.
-
-    Literal substring matching is useful for natural meeting titles, but
-    short English acronyms like "AI" should not match inside unrelated
-    words such as "Gain". For two- or three-character alphanumeric ASCII
-    needles, require non-alphanumeric boundaries on both sides; longer
-    terms keep the original substring behavior.
-    """
-    haystack = value or ""
-    query = (needle or "").strip()
-    if not query:
-        return True
-    if re.fullmatch(r"[A-Za-z0-9]{2,3}", query):
-        return (
-            re.search(
-                rf"(?<![A-Za-z0-9]){re.escape(query)}(?![A-Za-z0-9])",
-                haystack,
-                re.IGNORECASE,
-            )
-            is not None
-        )
-    return query.lower() in haystack.lower()
-
-
-_POOL_SIZE = 200
+# Largest `limit` a lookup may ask for; enumeration queries ('哪几期')
+# rarely need more and the cards go straight into the model's context.
+_MAX_LIMIT = 200
 
 
-def resolve_meetings(filters: MeetingFilters, *, pool: list[dict] | None = None) -> dict:
-    """Apply `filters` against the recent-meetings pool. Returns:
+def resolve_meetings(filters: MeetingFilters) -> dict:
+    """Apply `filters` across every published meeting. Returns:
 
         {
             "cards": [...up to filters.limit cards, most-recent first...],
-            "total_matches": int,   # full count in the candidate pool
-            "pool_size": int,       # how big the candidate pool is (200)
+            "total_matches": int,   # every meeting that matches
             "limit_clamped": bool,  # True if total_matches > len(cards)
+            "manager_matched": str, # only when `name_substring` was respelled
         }
 
-    The pool is bounded at 200 most-recent meetings (covers ~4 years of
-    weekly meetings — enough for typical fuzzy queries; deeper history
-    needs the explicit `no=` path). Filtering scans the whole pool so
-    `total_matches` reflects ALL pool matches, not the post-limit slice.
-
-    Exact-`no` filter is a fast path: targeted fetch_meeting_full bypasses
-    the pool scan. Other filters still apply (e.g. `no=425,
+    Filters run as one `search_meetings` query against the
+    trigger-maintained search index, which returns only card fields and
+    counts all matches, not just the post-limit slice. An exact `no`
+    composes with the other filters like any axis (e.g. `no=425,
     type_filter="Workshop"` returns the meeting only if it's a Workshop).
 
-    `pool` (kw-only) lets the caller pre-fetch the candidate pool ONCE and
-    reuse it across multiple resolve calls — the agent uses this to share
-    one DB fetch across parallel `lookup_meeting` tool calls within a
-    single turn (e.g. cross-language theme + intro fan-out)."""
+    A `name_substring` that matches no manager as typed ("郑锐", "Zheng Rui")
+    is retried once with the member it resolves to through the members
+    directory, and `manager_matched` names that member, so the model gets
+    the meetings instead of an empty result it would re-query with a
+    guessed spelling."""
     # Introduction text is included in cards only when the call used
     # `introduction_substring` — the model needs the actual matched text
     # to quote rather than paraphrase. For other queries we keep the
     # lightweight default to avoid bloating the LLM's tool-result context.
     include_intro = filters.introduction_substring is not None
 
-    if filters.no is not None:
-        meeting = fetch_meeting_full(filters.no)
-        if meeting is None or not _matches_filters(meeting, filters):
-            return {
-                "cards": [],
-                "total_matches": 0,
-                "pool_size": 1,
-                "limit_clamped": False,
-            }
-        return {
-            "cards": [meeting_to_card(meeting, include_introduction=include_intro)],
-            "total_matches": 1,
-            "pool_size": 1,
-            "limit_clamped": False,
-        }
-
-    items = pool if pool is not None else db_meetings_recent(limit=_POOL_SIZE)
-    all_matches = [m for m in items if _matches_filters(m, filters)]
-    capped = all_matches[: filters.limit]
-    return {
-        "cards": [meeting_to_card(m, include_introduction=include_intro) for m in capped],
-        "total_matches": len(all_matches),
-        "pool_size": len(items),
-        "limit_clamped": len(all_matches) > len(capped),
+    found = db_search_meetings(filters)
+    manager_matched = None
+    if not found["total"] and filters.name_substring:
+        manager_matched = _member_full_name(filters.name_substring)
+        if manager_matched:
+            found = db_search_meetings(replace(filters, name_substring=manager_matched))
+    cards = [meeting_to_card(row, include_introduction=include_intro) for row in found["rows"]]
+    result = {
+        "cards": cards,
+        "total_matches": found["total"],
+        "limit_clamped": found["total"] > len(cards),
     }
+    if manager_matched and found["total"]:
+        result["manager_matched"] = manager_matched
+    return result
+
+
+def _member_full_name(name: str) -> str | None:
+    """Full name of the one member `name` resolves to (word order, spacing
+    and pinyin tolerant), when that differs from `name` as typed."""
+    try:
+        member = member_directory.current().resolve(name, fuzzy=True)
+    except Exception:
+        logger.warning("Member directory unavailable; not respelling %r", name, exc_info=True)
+        return None
+    full_name = ((member or {}).get("full_name") or "").strip()
+    if not full_name or name.strip().lower() in full_name.lower():
+        return None
+    return full_name
 
 
 # ---------- Convenience: free-text → cards ----------
@@ -506,7 +466,7 @@ def resolve_from_query(query: str) -> dict:
     right default for a fuzzy chat tool)."""
     filters = parse_query(query)
     if filters == MeetingFilters():
-        return {"cards": [], "total_matches": 0, "pool_size": 0, "limit_clamped": False}
+        return {"cards": [], "total_matches": 0, "limit_clamped": False}
     return resolve_meetings(filters)
 
 
@@ -514,29 +474,8 @@ def resolve_from_query(query: str) -> dict:
 #
 # The meeting agent and the statistics agent both register a `lookup_meeting`
 # and a `preview_meeting` tool. Both registrations delegate to the helpers
-# here so there is exactly one definition of arg-validation, one pool-cache
-# helper, and one set of envelope-shape rules. Both agents' deps types
-# (`AgendaDeps`, `StatsDeps`) carry the per-turn pool cache fields
-# (`meeting_pool_cache`, `meeting_pool_lock`) — the helpers duck-type on
-# those attributes.
-
-
-async def get_or_fetch_pool(deps: Any) -> list[dict]:
-    """Lazy-fetch the candidate-meetings pool once per turn and cache it
-    on `deps`. The asyncio.Lock is bound to the current event loop on
-    first use (cannot be created at deps construction time because the
-    loop may not exist yet there).
-
-    Multiple parallel `lookup_meeting` calls within one turn — the
-    typical pattern for cross-language theme + intro fan-out — share
-    one Supabase fetch instead of each hitting the DB through `DB_LOCK`
-    sequentially."""
-    if deps.meeting_pool_lock is None:
-        deps.meeting_pool_lock = asyncio.Lock()
-    async with deps.meeting_pool_lock:
-        if deps.meeting_pool_cache is None:
-            deps.meeting_pool_cache = await asyncio.to_thread(db_meetings_recent, _POOL_SIZE)
-    return deps.meeting_pool_cache
+# here so there is exactly one definition of arg-validation and one set of
+# envelope-shape rules.
 
 
 async def apply_lookup_meeting(
@@ -557,8 +496,8 @@ async def apply_lookup_meeting(
     parsing happens here.
 
     Returns the resolver's full result envelope ({cards, total_matches,
-    pool_size, limit_clamped}) so the LLM can disclose to the user when
-    its result was clamped."""
+    limit_clamped}) so the LLM can disclose to the user when its result
+    was clamped."""
     if type_filter is not None and type_filter not in {"Regular", "Workshop", "Custom"}:
         raise ModelRetry(f"type_filter must be one of: Regular, Workshop, Custom. Got: {type_filter!r}.")
     parsed_from = parse_iso_date_or_raise("date_from", date_from) if date_from else None
@@ -567,10 +506,9 @@ async def apply_lookup_meeting(
         raise ModelRetry(f"date_from ({date_from}) must not be after date_to ({date_to}).")
     if limit < 1:
         raise ModelRetry(f"limit must be >= 1; got {limit}")
-    if limit > _POOL_SIZE:
+    if limit > _MAX_LIMIT:
         raise ModelRetry(
-            f"limit must be <= {_POOL_SIZE} (the candidate pool size). "
-            f"For deeper history use no= for an exact lookup."
+            f"limit must be <= {_MAX_LIMIT}. Read `total_matches` for the full count instead of listing every match."
         )
     filters = MeetingFilters(
         no=no,
@@ -600,12 +538,7 @@ async def apply_lookup_meeting(
             "extract any filter, do NOT call this tool — ask the user for "
             "clarification in text."
         )
-    # Exact-no path skips the pool entirely; everything else shares the
-    # per-turn pool cache so parallel calls don't redundantly hit Supabase.
-    if filters.no is not None:
-        return await asyncio.to_thread(resolve_meetings, filters)
-    pool = await get_or_fetch_pool(ctx.deps)
-    return await asyncio.to_thread(resolve_meetings, filters, pool=pool)
+    return await asyncio.to_thread(resolve_meetings, filters)
 
 
 async def apply_preview_meeting(ctx, no: int) -> dict:
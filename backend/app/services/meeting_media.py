@@ -0,0 +1,194 @@
+"""Per-meeting index of the media files a meeting keeps in OSS.
+
+`GET /meetings/{id}/media` used to build a new `oss2.Bucket` and walk the
+meeting's whole prefix on every call, and the WxPost controller lists it on
+every `sync_meeting_media`. `meeting_media_index.get(meeting_id)` keeps each
+meeting's sorted listing for `MEETING_MEDIA_CACHE_TTL_SECONDS`, and every OSS
+call shares one bucket client.
+
+Uploads go straight from the browser to OSS through pre-signed URLs, so the
+backend never sees one finish. Issuing upload URLs drops the listing and opens
+an upload window (the URL lifetime) during which listings are only kept for
+`MEETING_MEDIA_UPLOADING_TTL_SECONDS`. Deletes drop the listing.
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import functools
+import json
+import mimetypes
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import oss2  # type: ignore
+
+from ..config import (
+    ALICLOUD_ACCESS_KEY_ID,
+    ALICLOUD_ACCESS_KEY_SECRET,
+    ALICLOUD_OSS_BUCKET,
+    ALICLOUD_OSS_ENDPOINT,
+    ALICLOUD_OSS_MEETING_MEDIA_PREFIX,
+    MEETING_MEDIA_CACHE_TTL_SECONDS,
+    MEETING_MEDIA_UPLOADING_TTL_SECONDS,
+)
+from ..db import process_caches
+
+MEDIA_UPLOAD_URL_EXPIRES_SECONDS = 3600
+
+
+@functools.cache
+def get_bucket() -> Any:
+    """The shared bucket client; oss2 pools its HTTP connections per client."""
+    auth = oss2.Auth(ALICLOUD_ACCESS_KEY_ID, ALICLOUD_ACCESS_KEY_SECRET)
+    return oss2.Bucket(auth, ALICLOUD_OSS_ENDPOINT, ALICLOUD_OSS_BUCKET)
+
+
+def media_prefix(meeting_id: str) -> str:
+    return f"{ALICLOUD_OSS_MEETING_MEDIA_PREFIX}/{meeting_id}/media/"
+
+
+def list_meeting_media(meeting_id: str) -> List[Dict[str, Any]]:
+    """List a meeting's media from OSS, oldest upload first."""
+    prefix = media_prefix(meeting_id)
+    items = []
+    for obj in oss2.ObjectIterator(get_bucket(), prefix=prefix):
+        if obj.key == prefix:  # Skip the directory itself
+            continue
+        filename = obj.key.split("/")[-1]
+        modified_time = datetime.fromtimestamp(obj.last_modified, tz=timezone.utc)
+        items.append(
+            {
+                "filename": filename,
+                "url": f"https://{ALICLOUD_OSS_BUCKET}.{ALICLOUD_OSS_ENDPOINT}/{quote(obj.key, safe='/')}",
+                "fileKey": obj.key,
+                "uploadedAt": modified_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "mimeType": mimetypes.guess_type(filename)[0] or "application/octet-stream",
+                "sizeBytes": obj.size,
+            }
+        )
+    items.sort(key=_media_sort_key)
+    return items
+
+
+def _media_sort_key(item: Dict[str, Any]) -> Tuple[str, str]:
+    # uploadedAt is a fixed-width UTC timestamp, so it sorts as a string
+    return item["uploadedAt"], item["fileKey"]
+
+
+def encode_media_cursor(item: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just past `item` in listing order."""
+    payload = json.dumps(list(_media_sort_key(item)), separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_media_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor from `encode_media_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        uploaded_at, file_key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid media cursor") from e
+    if not isinstance(uploaded_at, str) or not isinstance(file_key, str):
+        raise ValueError("Invalid media cursor")
+    return uploaded_at, file_key
+
+
+def media_page(items: List[Dict[str, Any]], cursor: Optional[str], page_size: Optional[int]) -> Dict[str, Any]:
+    """Slice a listing after `cursor`; no `page_size` returns the rest in one page.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    start = bisect.bisect_right(items, decode_media_cursor(cursor), key=_media_sort_key) if cursor else 0
+    end = len(items) if page_size is None else start + page_size
+    page = items[start:end]
+    return {
+        "items": page,
+        "next_cursor": encode_media_cursor(page[-1]) if page and end < len(items) else None,
+        "total": len(items),
+    }
+
+
+class MeetingMediaIndex:
+    """TTL map of meeting id to its sorted media listing."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = MEETING_MEDIA_CACHE_TTL_SECONDS,
+        uploading_ttl_seconds: float = MEETING_MEDIA_UPLOADING_TTL_SECONDS,
+        load: Callable[[str], List[Dict[str, Any]]] = list_meeting_media,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.uploading_ttl_seconds = uploading_ttl_seconds
+        self._load = load
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._generations: Dict[str, int] = {}
+        self._uploading_until: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, meeting_id: str) -> List[Dict[str, Any]]:
+        """The meeting's listing; items are shared, so callers must not mutate them."""
+        with self._lock:
+            entry = self._entries.get(meeting_id)
+            if entry is not None and entry[0] > self._clock():
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+            generation = self._generations.get(meeting_id, 0)
+        items = self._load(meeting_id)
+        with self._lock:
+            now = self._clock()
+            uploading = self._uploading_until.get(meeting_id, 0.0) > now
+            ttl = self.uploading_ttl_seconds if uploading else self.ttl_seconds
+            # An upload URL or delete issued during the listing wins.
+            if ttl > 0 and self._generations.get(meeting_id, 0) == generation:
+                self._entries[meeting_id] = (now + ttl, items)
+        return list(items)
+
+    def expect_uploads(self, meeting_id: str, window_seconds: float = MEDIA_UPLOAD_URL_EXPIRES_SECONDS) -> None:
+        """Upload URLs were issued: drop the listing and keep the next ones briefly."""
+        with self._lock:
+            self._uploading_until[meeting_id] = self._clock() + window_seconds
+        self.invalidate(meeting_id)
+
+    def invalidate(self, meeting_id: str) -> None:
+        with self._lock:
+            self._generations[meeting_id] = self._generations.get(meeting_id, 0) + 1
+            self._entries.pop(meeting_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._uploading_until.clear()
+            self.hits = self.misses = 0
+        get_bucket.cache_clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            now = self._clock()
+            return {
+                "size": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+                "uploading": sum(1 for until in self._uploading_until.values() if until > now),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+meeting_media_index = MeetingMediaIndex()
+process_caches.register(meeting_media_index.clear)
@@ -12,9 +12,12 @@ Design rules:
   - Every Supabase `.in_(ids)` call goes through `_batch_in` so an "all
     history" leaderboard query doesn't blow past PostgREST's URL-length
     limit. This is the same class of bug that bit the lookup path.
+    Chunks (and pages past the first) are fetched concurrently on a
+    bounded pool, each worker on its own Supabase connection.
   - Attendance is defined ONCE — `compute_meeting_attendance` — so the
     dashboard's `get_meeting_attendance_stats` and the chat agent's
-    `attendance_summary` tool always agree on who attended what.
+    `attendance_summary` tool always agree on who attended what. The
+    `meeting_attendance` table only caches that merge's output.
   - Manager is a meta field (`meetings.manager_id`), not a segment row.
     The "manager as virtual role" framing only happens at the tool /
     user-facing layer; the data layer keeps the two paths separate.
@@ -22,13 +25,44 @@ Design rules:
 
 from __future__ import annotations
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Literal
+from typing import Any, Callable, Iterable, Literal, TypeVar
 
-from app.db.supabase import supabase
+from app.config import STATS_FETCH_CONCURRENCY
+from app.db.supabase import thread_supabase as supabase
+from app.services.member_directory import member_directory
+
+logger = logging.getLogger(__name__)
 
 # ---------- Generic batching ----------
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Bounded pool shared by every stats loader. Workers query through
+# `thread_supabase`, so each holds its own connection (the shared sync
+# client is not safe under concurrent use).
+_worker_state = threading.local()
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=max(STATS_FETCH_CONCURRENCY, 1),
+    thread_name_prefix="stats-fetch",
+    initializer=lambda: setattr(_worker_state, "in_pool", True),
+)
+
+
+def _fan_out(fn: Callable[[T], R], items: list[T]) -> list[R]:
+    """`[fn(item) for item in items]`, run concurrently on the stats pool.
+
+    Results keep input order. Calls made from inside a pool worker (a page
+    walk nested in a chunk fetch) run inline: queueing them behind their
+    own caller could deadlock the bounded pool."""
+    if len(items) <= 1 or STATS_FETCH_CONCURRENCY <= 1 or getattr(_worker_state, "in_pool", False):
+        return [fn(item) for item in items]
+    return list(_fetch_executor.map(fn, items))
+
 
 def _batch_in(
     fetch: Callable[[list[str]], list[dict]],
@@ -41,17 +75,15 @@ def _batch_in(
 
     `fetch` is a callable that receives a chunk of ids and returns the
     matching rows. Caller-supplied so each call site can express its own
-    select / filter shape. Returns the concatenation of all chunks in
-    call order; rows are not deduplicated (caller's responsibility if
-    that matters)."""
-    out: list[dict] = []
+    select / filter shape. Chunks are fetched concurrently (bounded by
+    `STATS_FETCH_CONCURRENCY`); the result is still the concatenation of
+    all chunks in id order. Rows are not deduplicated (caller's
+    responsibility if that matters)."""
     ids_list = [i for i in ids if i]
     if not ids_list:
-        return out
-    for i in range(0, len(ids_list), chunk_size):
-        chunk = ids_list[i : i + chunk_size]
-        out.extend(fetch(chunk))
-    return out
+        return []
+    chunks = [ids_list[i : i + chunk_size] for i in range(0, len(ids_list), chunk_size)]
+    return [row for rows in _fan_out(fetch, chunks) for row in rows]
 
 
 def _execute_all_pages(
@@ -67,15 +99,27 @@ def _execute_all_pages(
     continuing until the returned page is shorter than the requested page.
     `build_query` must return a fresh query builder each time so repeated
     range calls do not mutate a reused builder.
+
+    The first page is fetched alone (most queries fit in it); after a full
+    page, the following pages are requested `STATS_FETCH_CONCURRENCY` at a
+    time and stitched together in order.
     """
-    out: list[dict] = []
-    start = 0
+
+    def _page(start: int) -> list[dict]:
+        return build_query().range(start, start + page_size - 1).execute().data or []
+
+    out = _page(0)
+    if len(out) < page_size:
+        return out
+    start = page_size
+    wave = max(STATS_FETCH_CONCURRENCY, 1)
     while True:
-        page = build_query().range(start, start + page_size - 1).execute().data or []
-        out.extend(page)
-        if len(page) < page_size:
-            return out
-        start += page_size
+        starts = [start + i * page_size for i in range(wave)]
+        for page in _fan_out(_page, starts):
+            out.extend(page)
+            if len(page) < page_size:
+                return out
+        start = starts[-1] + page_size
 
 
 # ---------- Member resolver ----------
@@ -111,50 +155,45 @@ def _row_to_member(row: dict) -> Member:
 def resolve_member(name: str) -> Member | AmbiguousMember | None:
     """Resolve a display-style member name into a canonical `Member`.
 
-    Resolution order:
+    Resolution order (`MemberIndex.candidates` with `fuzzy=True`):
       1. Case-insensitive exact match against `members.full_name`.
       2. Case-insensitive exact match against `members.username`.
-      3. Substring match (case-insensitive) against full_name or username.
-         Single match → that Member. Multiple matches → AmbiguousMember.
-
-    Returns None if nothing matches anywhere. Callers decide whether to
-    error out (stats tools) or treat as a guest (other contexts).
+      3. Same spelling ignoring word order, spacing and Chinese script
+         ("郑锐" / "Zheng Rui" → "Rui Zheng").
+      4. A whole word of full_name, then a substring of full_name or
+         username.
+      At each step a single match → that Member; multiple matches →
+      AmbiguousMember.
+
+    Returns None if nothing matches anywhere — typos included: "Amy Wang"
+    is not silently taken for "Amy Fang". Callers decide whether to error
+    out (stats tools, offering `suggest_members`) or treat as a guest
+    (other contexts).
 
     DB is authoritative. The static CLUB_MEMBERS prompt list is NOT
-    consulted — it can drift from reality. Every resolution hits the
-    members table."""
-    needle = (name or "").strip()
-    if not needle:
+    consulted — it can drift from reality. Lookups go through the cached
+    members directory (`member_directory`), which reloads the members table
+    on a TTL instead of once per call."""
+    if not (name or "").strip():
         return None
 
-    rows = supabase.table("members").select("id, username, full_name").execute().data or []
-    members = [_row_to_member(r) for r in rows]
-    needle_lower = needle.lower()
-
-    # 1) exact full_name
-    exact_full = [m for m in members if m.full_name.lower() == needle_lower]
-    if len(exact_full) == 1:
-        return exact_full[0]
-    if len(exact_full) > 1:
-        return AmbiguousMember(candidates=tuple(exact_full))
-
-    # 2) exact username
-    exact_user = [m for m in members if m.username.lower() == needle_lower]
-    if len(exact_user) == 1:
-        return exact_user[0]
-    if len(exact_user) > 1:
-        return AmbiguousMember(candidates=tuple(exact_user))
-
-    # 3) substring (full_name OR username)
-    substring = [m for m in members if needle_lower in m.full_name.lower() or needle_lower in m.username.lower()]
-    if len(substring) == 1:
-        return substring[0]
-    if len(substring) > 1:
-        return AmbiguousMember(candidates=tuple(substring))
-
+    matches = [_row_to_member(row) for row in member_directory.current().candidates(name, fuzzy=True)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        return AmbiguousMember(candidates=tuple(matches))
     return None
 
 
+def suggest_members(name: str) -> tuple[Member, ...]:
+    """Members whose name is within a few typos of `name` ("Joyse Feng" →
+    Joyce Feng), for a "did you mean" prompt when `resolve_member` found
+    nothing. The user has to confirm one; these are never used as is."""
+    if not (name or "").strip():
+        return ()
+    return tuple(_row_to_member(row) for row in member_directory.current().nearest(name))
+
+
 # ---------- Meeting loader (date-range scoped) ----------
 
 MeetingType = Literal["Regular", "Workshop", "Custom"]
@@ -228,9 +267,77 @@ class MeetingAttendance:
 
 
 def compute_meeting_attendance(meeting_ids: list[str]) -> dict[str, MeetingAttendance]:
-    """Smart-merge attendance for the given meetings. THE SHARED
-    DEFINITION of "attended" — every consumer (dashboard, stats agent)
-    must use this to stay consistent.
+    """Attendance for the given meetings. THE SHARED DEFINITION of
+    "attended" — every consumer (dashboard, stats agent) must use this to
+    stay consistent.
+
+    Served from the `meeting_attendance` snapshot table: one query per
+    50-id batch instead of five. Snapshots that DB triggers marked stale
+    (segment / checkin / attendee / member-name writes), or that were never
+    computed, are re-merged by `_merge_meeting_attendance` and stored back.
+    Storing is best-effort; a failed store only means the next read merges
+    again.
+
+    Returns a dict keyed by meeting_id so tools can look up attendance
+    per meeting in O(1) without re-running the merge.
+    """
+    if not meeting_ids:
+        return {}
+
+    def _fetch_snapshots(chunk: list[str]) -> list[dict]:
+        return (
+            supabase.table("meeting_attendance")
+            .select("meeting_id, version, computed_version, member_ids, guest_names")
+            .in_("meeting_id", chunk)
+            .execute()
+            .data
+        )
+
+    snapshots = {row["meeting_id"]: row for row in _batch_in(_fetch_snapshots, meeting_ids)}
+
+    out: dict[str, MeetingAttendance] = {}
+    stale_ids: list[str] = []
+    for meeting_id in dict.fromkeys(meeting_ids):
+        row = snapshots.get(meeting_id)
+        if row and row.get("computed_version") is not None and row["computed_version"] == row["version"]:
+            out[meeting_id] = MeetingAttendance(
+                meeting_id=meeting_id,
+                member_ids=set(row.get("member_ids") or []),
+                guest_names=set(row.get("guest_names") or []),
+            )
+        else:
+            stale_ids.append(meeting_id)
+
+    if stale_ids:
+        merged = _merge_meeting_attendance(stale_ids)
+        _store_attendance_snapshots(merged, {mid: (snapshots.get(mid) or {}).get("version", 0) for mid in stale_ids})
+        out.update(merged)
+
+    return {meeting_id: out[meeting_id] for meeting_id in meeting_ids}
+
+
+def _store_attendance_snapshots(attendance: dict[str, MeetingAttendance], versions: dict[str, int]) -> None:
+    """Persist merged attendance against the snapshot versions it was read
+    at. The RPC skips meetings whose version moved on in the meantime."""
+    payload = [
+        {
+            "meeting_id": meeting_id,
+            "version": versions.get(meeting_id, 0),
+            "member_ids": sorted(record.member_ids),
+            "guest_names": sorted(record.guest_names),
+        }
+        for meeting_id, record in attendance.items()
+    ]
+    try:
+        supabase.rpc("store_meeting_attendance", {"snapshots": payload}).execute()
+    except Exception:
+        logger.warning("Failed to store %d meeting attendance snapshots", len(payload), exc_info=True)
+
+
+def _merge_meeting_attendance(meeting_ids: list[str]) -> dict[str, MeetingAttendance]:
+    """Smart-merge attendance for the given meetings from the raw segment
+    and checkin rows. `compute_meeting_attendance` is the public entry
+    point; this is what fills its snapshot table.
 
     Logic (extracted from the original dashboard `get_meeting_attendance_stats`):
       - Build segments group: members via attendees.member_id, guests
@@ -243,9 +350,6 @@ def compute_meeting_attendance(meeting_ids: list[str]) -> dict[str, MeetingAtten
         (segments wins ties — historical dashboard convention).
       - Merge additional members by exact member_id; merge additional
         guests by bidirectional substring against major guests.
-
-    Returns a dict keyed by meeting_id so tools can look up attendance
-    per meeting in O(1) without re-running the merge.
     """
     if not meeting_ids:
         return {}
@@ -574,57 +678,21 @@ def member_segment_history(
     segment_types: list[str] | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
+    limit: int | None = None,
 ) -> list[dict]:
     """Meetings (in scope) where this member appeared as a SEGMENT role
     matching `segment_types` (closed list). If `segment_types` is None,
-    returns all segment-role appearances.
-
-    Returns list of {meeting_id, no, date, theme, segment_type} sorted
-    by date desc."""
-    meetings = load_meetings_in_range(date_from, date_to)
-    if not meetings:
-        return []
-    meeting_map = {m["id"]: m for m in meetings}
+    returns all segment-role appearances; `limit` keeps the most recent.
 
-    # Find attendee rows for this member (a member can have multiple
-    # attendee rows historically; collect them all).
-    attendee_rows = _execute_all_pages(lambda: supabase.table("attendees").select("id").eq("member_id", member_id))
-    attendee_ids = [a["id"] for a in attendee_rows]
-    if not attendee_ids:
-        return []
-
-    def _fetch_segments(chunk: list[str]) -> list[dict]:
-        return _execute_all_pages(
-            lambda: supabase.table("segments")
-            .select("meeting_id, type, attendee_id, start_time")
-            .in_("attendee_id", chunk)
-        )
+    Returns list of {meeting_id, no, date, theme, segment_type, start_time}
+    sorted by date desc.
 
-    segments = _batch_in(_fetch_segments, attendee_ids)
+    Read off the analytics snapshot's per-member index (every attendee row
+    of the member is folded into it), so the cost is the size of the
+    answer rather than a segments scan; local meeting saves refresh it."""
+    from app.services import analytics_snapshot
 
-    # Filter by meeting scope and (optionally) segment types.
-    type_set = set(segment_types) if segment_types else None
-    out: list[dict] = []
-    for s in segments:
-        mid = s.get("meeting_id")
-        if mid not in meeting_map:
-            continue
-        seg_type = s.get("type") or ""
-        if type_set is not None and seg_type not in type_set:
-            continue
-        m = meeting_map[mid]
-        out.append(
-            {
-                "meeting_id": mid,
-                "no": m.get("no"),
-                "date": m.get("date"),
-                "theme": m.get("theme"),
-                "segment_type": seg_type,
-                "start_time": s.get("start_time"),
-            }
-        )
-    out.sort(key=lambda r: (r.get("date") or "", r.get("start_time") or ""), reverse=True)
-    return out
+    return analytics_snapshot.member_segment_history(member_id, segment_types, date_from, date_to, limit)
 
 
 def meetings_managed_by(
@@ -636,29 +704,11 @@ def meetings_managed_by(
     a segment role). Returns list of {meeting_id, no, date, theme}
     sorted by date desc.
 
-    `meetings.manager_id` references `attendees.id`, so we resolve the
-    attendee IDs that map back to this member first."""
-    meetings = load_meetings_in_range(date_from, date_to)
-    if not meetings:
-        return []
-
-    attendee_rows = _execute_all_pages(lambda: supabase.table("attendees").select("id").eq("member_id", member_id))
-    attendee_ids = {a["id"] for a in attendee_rows}
-    if not attendee_ids:
-        return []
+    `meetings.manager_id` references `attendees.id`; the analytics
+    snapshot maps it back to the member."""
+    from app.services import analytics_snapshot
 
-    out = [
-        {
-            "meeting_id": m["id"],
-            "no": m.get("no"),
-            "date": m.get("date"),
-            "theme": m.get("theme"),
-        }
-        for m in meetings
-        if m.get("manager_id") in attendee_ids
-    ]
-    out.sort(key=lambda r: (r.get("date") or ""), reverse=True)
-    return out
+    return analytics_snapshot.meetings_managed_by(member_id, date_from, date_to)
 
 
 def member_role_distribution(
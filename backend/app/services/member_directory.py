@@ -26,11 +26,34 @@ restores the correct precedence:
     model has no DB and needs the static list to resolve first-name
     references.
 
-Phase 2 of the broader agent work plans to make this dynamic from Supabase.
-Until then, edit this list when the active member roster changes."""
+`member_directory` is that dynamic directory: a process-wide snapshot of the
+members table with case-insensitive full-name / username / first-name maps,
+plus spelling and trigram indexes for the fuzzy steps (word order, spacing,
+pinyin for Chinese names) and typo suggestions, shared by every resolver
+that used to fetch and scan the whole table per call
+(`meeting_stats.resolve_member`, award winner resolution, the meeting
+agent's role-taker resolution, `is_member_name`). It reloads after
+`MEMBER_DIRECTORY_TTL_SECONDS` or as soon as `invalidate()` is called —
+members are only written by auth triggers, so the analytics snapshot calls
+it when its diff carries changed member rows. `CLUB_MEMBERS` remains the
+prompt hint and the fallback when the directory cannot be loaded; edit it
+when the active member roster changes."""
 
 from __future__ import annotations
 
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+import pypinyin
+
+from app.config import MEMBER_DIRECTORY_TTL_SECONDS
+from app.db import core, process_caches
+
+logger = logging.getLogger(__name__)
+
 CLUB_MEMBERS: list[str] = [
     "Rui Zheng",
     "Joyce Feng",
@@ -57,16 +80,300 @@ CLUB_MEMBERS: list[str] = [
 ]
 
 
+def _key(value: str | None) -> str:
+    return (value or "").strip().lower()
+
+
+def _first_name(full_name: str | None) -> str:
+    return _key(full_name).split(" ", 1)[0]
+
+
+_CJK = re.compile(r"[\u3400-\u9fff]")
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _words(name: str | None) -> tuple[str, ...]:
+    """Lowercased words of `name`, Chinese characters spelled out in pinyin
+    ("郑锐" → ("zheng", "rui"))."""
+    text = _key(name)
+    if _CJK.search(text):
+        text = " ".join(pypinyin.lazy_pinyin(text))
+    return tuple(_WORD.findall(text))
+
+
+def _spelling(name: str | None) -> str:
+    """`name` with case, spacing, punctuation and Chinese script ignored."""
+    return "".join(_words(name))
+
+
+def _spellings(name: str | None) -> set[str]:
+    """`_spelling` of `name` with the family name first or last, so "Zheng
+    Rui", "郑锐" and "Rui Zheng" share a spelling."""
+    words = _words(name)
+    return {"".join(words[i:] + words[:i]) for i in (0, 1, len(words) - 1) if words} - {""}
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _padded_trigrams(text: str) -> set[str]:
+    return _trigrams(f"^^{text}$$")
+
+
+def _max_edits(spelling: str) -> int:
+    """Typos tolerated in a spelling: none below three letters, two past six."""
+    if len(spelling) < 3:
+        return 0
+    return 1 if len(spelling) <= 6 else 2
+
+
+def _edit_distance(a: str, b: str, bound: int) -> int | None:
+    """Levenshtein distance of `a` and `b`, or None once it exceeds `bound`."""
+    if abs(len(a) - len(b)) > bound:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > bound:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= bound else None
+
+
+def _group(rows: Iterable[dict], keys: Callable[[dict], Iterable[str]]) -> dict[str, tuple[dict, ...]]:
+    groups: dict[str, list[dict]] = {}
+    for row in rows:
+        for k in dict.fromkeys(keys(row)):
+            if k:
+                groups.setdefault(k, []).append(row)
+    return {k: tuple(v) for k, v in groups.items()}
+
+
+class MemberIndex:
+    """Case-insensitive lookup maps over one list of member rows.
+
+    Rows keep the DB shape `{"id", "username", "full_name"}`; the maps are
+    keyed by the stripped, lowercased value so exact lookups are O(1).
+    Substring and edit-distance lookups go through trigram postings, so
+    they only compare against the few rows sharing the needle's trigrams.
+    """
+
+    def __init__(self, rows: Iterable[dict] = ()):
+        self.rows: tuple[dict, ...] = tuple(rows)
+        self.by_id: dict[str, dict] = {row["id"]: row for row in self.rows}
+        self._full_name = _group(self.rows, lambda row: [_key(row.get("full_name"))])
+        self._username = _group(self.rows, lambda row: [_key(row.get("username"))])
+        self._first_name = _group(self.rows, lambda row: [_first_name(row.get("full_name"))])
+        self._word = _group(self.rows, lambda row: _key(row.get("full_name")).split())
+        self._spelling = _group(self.rows, lambda row: _spellings(row.get("full_name")))
+        # Row positions per trigram of the lowercased full name / username
+        self._substring_postings: dict[str, set[int]] = {}
+        # Spellings (plus usernames and longer words) to match typos against,
+        # and the positions of those spellings per padded trigram
+        self._fuzzy_targets: list[tuple[str, int]] = []
+        self._fuzzy_postings: dict[str, set[int]] = {}
+        for position, row in enumerate(self.rows):
+            for text in (_key(row.get("full_name")), _key(row.get("username"))):
+                for gram in _trigrams(text):
+                    self._substring_postings.setdefault(gram, set()).add(position)
+            words = [word for word in _words(row.get("full_name")) if len(word) >= 4]
+            for target in {*_spellings(row.get("full_name")), _spelling(row.get("username")), *words} - {""}:
+                for gram in _padded_trigrams(target):
+                    self._fuzzy_postings.setdefault(gram, set()).add(len(self._fuzzy_targets))
+                self._fuzzy_targets.append((target, position))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def with_full_name(self, name: str | None) -> tuple[dict, ...]:
+        return self._full_name.get(_key(name), ())
+
+    def with_first_name(self, name: str | None) -> tuple[dict, ...]:
+        return self._first_name.get(_key(name), ())
+
+    def with_spelling(self, name: str | None) -> tuple[dict, ...]:
+        """Rows whose full name is spelled like `name` once case, spacing,
+        word order and Chinese script are ignored ("zheng rui", "ZhengRui"
+        and "郑锐" all find "Rui Zheng")."""
+        return self._spelling.get(_spelling(name), ())
+
+    def with_word(self, name: str | None) -> tuple[dict, ...]:
+        """Rows with `name` as one whole word of their full name."""
+        return self._word.get(_key(name), ())
+
+    def containing(self, name: str | None) -> tuple[dict, ...]:
+        """Rows with `name` as a substring of their full name or username."""
+        needle = _key(name)
+        if not needle:
+            return ()
+        if len(needle) < 3:
+            positions: Iterable[int] = range(len(self.rows))
+        else:
+            postings = [self._substring_postings.get(gram, set()) for gram in _trigrams(needle)]
+            positions = sorted(set.intersection(*postings))
+        return tuple(
+            row
+            for row in (self.rows[p] for p in positions)
+            if needle in _key(row.get("full_name")) or needle in _key(row.get("username"))
+        )
+
+    def nearest(self, name: str | None) -> tuple[dict, ...]:
+        """Rows closest to `name` within a few typos ("Joyse" → "Joyce
+        Feng"), compared by spelling against full names, usernames and
+        longer name words. Only the rows at the smallest distance.
+
+        Suggestions only, never a resolution: a near miss is as often a
+        different person ("Amy Wang", a guest, is one edit from "Amy
+        Fang"), so callers must have it confirmed before using it."""
+        spelling = _spelling(name)
+        bound = _max_edits(spelling)
+        if not bound:
+            return ()
+        grams = _padded_trigrams(spelling)
+        # Each edit breaks at most three padded trigrams, so a target within
+        # `bound` edits shares at least this many with the needle.
+        min_shared = max(1, len(grams) - 3 * bound)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for target in self._fuzzy_postings.get(gram, ()):
+                shared[target] = shared.get(target, 0) + 1
+        best: dict[int, int] = {}
+        for target, count in shared.items():
+            if count < min_shared:
+                continue
+            text, position = self._fuzzy_targets[target]
+            distance = _edit_distance(spelling, text, bound)
+            if distance is not None and distance < best.get(position, bound + 1):
+                best[position] = distance
+        if not best:
+            return ()
+        closest = min(best.values())
+        return tuple(self.rows[p] for p in sorted(best) if best[p] == closest)
+
+    def candidates(self, name: str | None, *, fuzzy: bool = False) -> tuple[dict, ...]:
+        """Rows matching `name` at the first step that matches anything:
+
+          1. Case-insensitive exact `full_name`.
+          2. Case-insensitive exact `username`.
+          3. Same spelling (`with_spelling`), or one whole word spelled
+             like it ("冯" → "Joyce Feng"), with `fuzzy` only.
+          4. A whole word of `full_name` ("Lee" → "Libra Lee", not "Leta").
+          5. Case-insensitive substring of `full_name` or `username`.
+
+        More than one row means the name is ambiguous; callers decide
+        whether to surface the candidates or treat the name as unresolved.
+        The fuzzy step suits callers talking to a person who can correct a
+        wrong guess; award winners stay on the strict steps so a guest with
+        a member-like name is not credited to the member. Typos are not a
+        step (see `nearest`).
+        """
+        needle = _key(name)
+        if not needle:
+            return ()
+        exact = self._full_name.get(needle) or self._username.get(needle)
+        if exact:
+            return exact
+        if fuzzy and (spelled := self.with_spelling(needle) or self.with_word(_spelling(needle))):
+            return spelled
+        return self.with_word(needle) or self.containing(needle)
+
+    def resolve(self, name: str | None, *, fuzzy: bool = False) -> dict | None:
+        """The single row `name` resolves to, or None if missing or ambiguous."""
+        matches = self.candidates(name, fuzzy=fuzzy)
+        return matches[0] if len(matches) == 1 else None
+
+
+class MemberDirectory:
+    """Process-wide holder of the current `MemberIndex`.
+
+    A failed reload keeps serving the previous index; with nothing loaded
+    yet the error propagates.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], list[dict]] | None = None,
+        ttl_seconds: float = MEMBER_DIRECTORY_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        # Resolved at call time so a patched `core.get_members` is honoured.
+        self._fetch = fetch or (lambda: core.get_members() or [])
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._index: MemberIndex | None = None
+        self._fresh_until = 0.0
+        self.loads = 0
+
+    def current(self) -> MemberIndex:
+        """Index no older than the TTL, reloading (one query) if needed."""
+        index = self._index
+        if index is not None and self._clock() < self._fresh_until:
+            return index
+        with self._lock:
+            if self._index is None or self._clock() >= self._fresh_until:
+                self._load()
+            assert self._index is not None
+            return self._index
+
+    def members(self) -> list[dict]:
+        """All member rows, as `core.get_members` returns them."""
+        return [dict(row) for row in self.current().rows]
+
+    def invalidate(self) -> None:
+        """Make the next read reload instead of waiting out the TTL."""
+        self._fresh_until = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def stats(self) -> dict[str, Any]:
+        return {"loaded": self._index is not None, "members": len(self._index or ()), "loads": self.loads}
+
+    def _load(self) -> None:
+        now = self._clock()
+        try:
+            rows = self._fetch()
+        except Exception:
+            if self._index is None:
+                raise
+            logger.warning("Member directory reload failed; serving the previous directory", exc_info=True)
+            self._fresh_until = now + self.ttl_seconds
+            return
+        self._index = MemberIndex(rows)
+        self._fresh_until = now + self.ttl_seconds
+        self.loads += 1
+
+
+member_directory = MemberDirectory()
+process_caches.register(member_directory.clear)
+
+_CLUB_MEMBER_KEYS = frozenset(_key(name) for name in CLUB_MEMBERS)
+
+
 def is_member_name(name: str) -> bool:
-    """Case-insensitive full-name match against the static directory.
+    """Case-insensitive full-name match against the member directory.
 
     LEGACY-FALLBACK USE ONLY. Callers that have a DB-authoritative
     `member_id` available MUST consult that instead — see the module
     docstring for why. This function exists for the remaining bare-string
     paths (current draft agenda; legacy preview rows that lack the
-    `role_taker_member_id` sidecar).
+    `role_taker_member_id` sidecar). Falls back to the static
+    `CLUB_MEMBERS` list when the directory cannot be loaded.
     """
-    needle = (name or "").strip().lower()
+    needle = _key(name)
     if not needle:
         return False
-    return any(member.lower() == needle for member in CLUB_MEMBERS)
+    try:
+        index = member_directory.current()
+    except Exception:
+        logger.warning("Member directory unavailable; using the static CLUB_MEMBERS list", exc_info=True)
+        return needle in _CLUB_MEMBER_KEYS
+    return bool(index.with_full_name(needle))
@@ -0,0 +1,389 @@
+"""Analytics snapshot tests.
+
+Parity: every snapshot query must return what the DB-backed function it
+replaces returns for the same tables. Refresh: reads within the TTL cost no
+DB call, expired reads one incremental call, and deletes force a reload.
+"""
+
+from __future__ import annotations
+
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from app.db import stats
+from app.db.meeting_cache import meeting_cache
+from app.services import analytics_snapshot, meeting_stats
+from app.services.analytics_snapshot import AnalyticsSnapshot
+from app.services.member_directory import member_directory
+from app.services.tests.test_meeting_stats import _stub_supabase_with_tables
+
+OLD = "2026-01-01T00:00:00+00:00"
+AS_OF = "2026-01-02T00:00:00+00:00"
+
+
+def _tables() -> dict[str, list[dict]]:
+    def row(**fields):
+        return {**fields, "updated_at": OLD}
+
+    return {
+        "members": [
+            row(id="mem-joyce", username="joyce", full_name="Joyce Feng"),
+            row(id="mem-rui", username="rui", full_name="Rui Zheng"),
+            row(id="mem-frank", username="frank", full_name="Frank Zeng"),
+        ],
+        "attendees": [
+            row(id="att-joyce", name="Joyce", wxid="wx-joyce", member_id="mem-joyce"),
+            row(id="att-rui", name="Rui", wxid="wx-rui", member_id="mem-rui"),
+            row(id="att-lucas", name="Lucas", wxid=None, member_id=None),
+            # Member link to a member row that no longer exists.
+            row(id="att-ghost", name="Ghost", wxid=None, member_id="mem-gone"),
+        ],
+        "meetings": [
+            row(
+                id="m1",
+                no=401,
+                type="Regular",
+                theme="A",
+                date="2025-01-07",
+                manager_id="att-joyce",
+                status="published",
+            ),
+            row(
+                id="m2",
+                no=402,
+                type="Workshop",
+                theme="B",
+                date="2025-02-04",
+                manager_id="att-lucas",
+                status="published",
+            ),
+            row(id="m3", no=403, type="Regular", theme="C", date="2025-03-04", manager_id="att-rui", status="draft"),
+            row(
+                id="m4",
+                no=404,
+                type="Regular",
+                theme="D",
+                date="2025-03-11",
+                manager_id="att-joyce",
+                status="published",
+            ),
+        ],
+        "segments": [
+            row(id="s1", meeting_id="m1", attendee_id="att-joyce", type="Timer", start_time="19:30:00"),
+            row(id="s2", meeting_id="m1", attendee_id="att-lucas", type="Grammarian", start_time="19:33:00"),
+            row(id="s3", meeting_id="m1", attendee_id=None, type="Tea Break", start_time="20:00:00"),
+            row(id="s4", meeting_id="m2", attendee_id="att-rui", type="Workshop", start_time="19:30:00"),
+            row(id="s5", meeting_id="m2", attendee_id="att-ghost", type="Timer", start_time="19:20:00"),
+            row(id="s6", meeting_id="m3", attendee_id="att-joyce", type="Timer", start_time="19:30:00"),
+            row(
+                id="s7", meeting_id="m4", attendee_id="att-joyce", type="Table Topic Evaluation", start_time="20:30:00"
+            ),
+            row(id="s8", meeting_id="m4", attendee_id="att-joyce", type="Timer", start_time="19:30:00"),
+        ],
+        "awards": [
+            row(id="a1", meeting_id="m1", category="Best Evaluator", winner="Joyce"),
+            row(id="a2", meeting_id="m2", category="Best Joke", winner="Lucas"),
+            row(id="a3", meeting_id="m3", category="Best Host", winner="Rui"),
+            row(id="a4", meeting_id="m4", category="Best Host", winner="Rui Zheng"),
+        ],
+        "checkins": [
+            row(id="c1", meeting_id="m1", wxid="wx-rui", name="Rui", is_member=True),
+            row(id="c2", meeting_id="m2", wxid="wx-ada", name="Ada", is_member=False),
+            row(id="c3", meeting_id="m2", wxid="wx-lucas", name="Lucas L.", is_member=False),
+        ],
+    }
+
+
+class _Feed:
+    """Stands in for the `analytics_changes` RPC over in-memory tables."""
+
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = tables
+        self.as_of = AS_OF
+        self.calls: list[str | None] = []
+        self.meeting_ids: list[list[str]] = []
+
+    def __call__(self, since: str | None, meeting_ids: list[str]) -> dict:
+        self.calls.append(since)
+        self.meeting_ids.append(meeting_ids)
+        payload: dict = {
+            "as_of": self.as_of,
+            "counts": {table: len(rows) for table, rows in self.tables.items()},
+        }
+        for table, rows in self.tables.items():
+            meeting_key = "id" if table == "meetings" else "meeting_id"
+            payload[table] = [
+                {k: v for k, v in r.items() if k != "updated_at"}
+                for r in rows
+                if since is None or r["updated_at"] >= since or r.get(meeting_key) in meeting_ids
+            ]
+        return copy.deepcopy(payload)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _snapshot(tables: dict[str, list[dict]], **kwargs) -> tuple[AnalyticsSnapshot, _Feed, _Clock]:
+    feed, clock = _Feed(tables), _Clock()
+    snapshot = AnalyticsSnapshot(fetch_changes=feed, ttl_seconds=30, full_reload_seconds=3600, clock=clock, **kwargs)
+    return snapshot, feed, clock
+
+
+@pytest.fixture
+def db_tables():
+    """The same tables behind both DB-backed implementations (stub client)."""
+    tables = _tables()
+    with (
+        _stub_supabase_with_tables(tables) as client,
+        patch("app.db.stats.supabase", client),
+        patch("app.db.core.get_members", lambda: tables["members"]),
+    ):
+        yield tables
+
+
+def _sorted(rows: list[dict], *keys: str) -> list[dict]:
+    return sorted(rows, key=lambda r: tuple(str(r.get(k)) for k in keys))
+
+
+# ---------- parity with the DB-backed queries ----------
+
+
+@pytest.mark.parametrize("date_from, date_to", [(None, None), ("2025-01-07", "2025-02-04"), ("2025-03-01", None)])
+def test_member_meeting_rows_match_the_dashboard_query(db_tables, date_from, date_to):
+    snapshot, _, _ = _snapshot(db_tables)
+
+    expected = stats.get_member_meeting_stats(date_from, date_to)
+    actual = snapshot.current().member_meeting_rows(date_from, date_to)
+
+    assert _sorted(actual, "meeting_id", "role") == _sorted(expected, "meeting_id", "role")
+
+
+def test_member_meeting_rows_skip_drafts_guests_and_unknown_members(db_tables):
+    snapshot, _, _ = _snapshot(db_tables)
+
+    rows = snapshot.current().member_meeting_rows(None, None)
+
+    assert {r["meeting_id"] for r in rows} == {"m1", "m2", "m4"}
+    assert {r["member_id"] for r in rows} == {"mem-joyce", "mem-rui"}
+
+
+def test_member_award_rows_match_the_dashboard_query(db_tables):
+    snapshot, _, _ = _snapshot(db_tables)
+
+    expected = stats.get_member_award_stats(None, None)
+    actual = snapshot.current().member_award_rows(None, None)
+
+    assert _sorted(actual, "award_id") == _sorted(expected, "award_id")
+    assert [r["award_id"] for r in actual] == ["a1", "a2", "a4"]
+
+
+@pytest.mark.parametrize("type_filter", [None, "Regular", "Workshop"])
+def test_group_meetings_by_manager_matches_the_service(db_tables, type_filter):
+    snapshot, _, _ = _snapshot(db_tables)
+
+    expected = meeting_stats.group_meetings_by_manager(type_filter=type_filter)
+    actual = snapshot.current().group_meetings_by_manager(type_filter=type_filter)
+
+    assert actual == expected
+
+
+# ---------- per-member role history ----------
+
+
+@pytest.fixture
+def module_snapshot(monkeypatch):
+    """The process-wide snapshot behind `meeting_stats`, fed from fixtures."""
+    feed = _Feed(_tables())
+    monkeypatch.setattr(analytics_snapshot.analytics_snapshot, "_fetch_changes", feed)
+    return feed
+
+
+def test_member_segment_history_is_newest_first_and_published_only(module_snapshot):
+    history = meeting_stats.member_segment_history("mem-joyce")
+
+    assert [(r["meeting_id"], r["segment_type"], r["start_time"]) for r in history] == [
+        ("m4", "Table Topic Evaluation", "20:30:00"),
+        ("m4", "Timer", "19:30:00"),
+        ("m1", "Timer", "19:30:00"),
+    ]
+    assert history[0] == {
+        "meeting_id": "m4",
+        "no": 404,
+        "date": "2025-03-11",
+        "theme": "D",
+        "segment_type": "Table Topic Evaluation",
+        "start_time": "20:30:00",
+    }
+
+
+def test_member_segment_history_filters_types_dates_and_limits(module_snapshot):
+    def history(**kwargs):
+        return [
+            (r["meeting_id"], r["segment_type"]) for r in meeting_stats.member_segment_history("mem-joyce", **kwargs)
+        ]
+
+    assert history(segment_types=["Timer"]) == [("m4", "Timer"), ("m1", "Timer")]
+    assert history(segment_types=["Timer"], limit=1) == [("m4", "Timer")]
+    assert history(date_from="2025-01-01", date_to="2025-02-28") == [("m1", "Timer")]
+    assert history(segment_types=["Hark Master"]) == []
+    assert meeting_stats.member_segment_history("mem-nobody") == []
+    # Attendee rows whose member row is gone still index under the member id.
+    assert [r["meeting_id"] for r in meeting_stats.member_segment_history("mem-gone")] == ["m2"]
+
+
+def test_member_role_distribution_reads_the_index(module_snapshot):
+    assert meeting_stats.member_role_distribution("mem-joyce") == {"Timer": 2, "Table Topic Evaluation": 1}
+    assert meeting_stats.member_role_distribution("mem-joyce", include_manager=True) == {
+        "Timer": 2,
+        "Table Topic Evaluation": 1,
+        "Meeting Manager": 2,
+    }
+    assert [m["meeting_id"] for m in meeting_stats.meetings_managed_by("mem-joyce")] == ["m4", "m1"]
+    assert module_snapshot.calls == [None]
+
+
+def test_member_meeting_rows_for_one_member_match_the_filtered_scan(db_tables):
+    snapshot, _, _ = _snapshot(db_tables)
+    columns = snapshot.current()
+
+    everyone = columns.member_meeting_rows("2025-02-01", None)
+    rui = columns.member_meeting_rows("2025-02-01", None, member_id="mem-rui")
+
+    assert rui == [r for r in everyone if r["member_id"] == "mem-rui"]
+    assert columns.member_meeting_rows(None, None, member_id="mem-nobody") == []
+
+
+# ---------- refresh ----------
+
+
+def test_reads_within_the_ttl_reuse_one_load():
+    snapshot, feed, clock = _snapshot(_tables())
+
+    snapshot.current().member_meeting_rows(None, None)
+    clock.now = 29
+    snapshot.current().member_award_rows(None, None)
+    snapshot.current().group_meetings_by_manager()
+
+    assert feed.calls == [None]
+
+
+def test_expired_snapshot_pulls_only_rows_written_since_the_last_refresh():
+    tables = _tables()
+    snapshot, feed, clock = _snapshot(tables)
+    snapshot.current()
+
+    tables["segments"].append(
+        {
+            "id": "s9",
+            "meeting_id": "m4",
+            "attendee_id": "att-rui",
+            "type": "Grammarian",
+            "start_time": "19:33:00",
+            "updated_at": "2026-01-02T00:00:05+00:00",
+        }
+    )
+    tables["members"][1].update(full_name="Rui Z.", updated_at="2026-01-02T00:00:06+00:00")
+    clock.now = 31
+    rows = snapshot.current().member_meeting_rows("2025-03-01", None)
+
+    assert feed.calls == [None, "2026-01-01T23:59:00+00:00"]
+    assert {"member_id": "mem-rui", "full_name": "Rui Z.", "role": "Grammarian"}.items() <= rows[1].items()
+    assert snapshot.stats()["full_reloads"] == 1
+
+
+def test_member_rows_in_the_diff_expire_the_member_directory():
+    tables = _tables()
+    snapshot, _, clock = _snapshot(tables)
+    snapshot.current()
+    loads: list[int] = []
+
+    def _get_members():
+        loads.append(1)
+        return [{k: v for k, v in m.items() if k != "updated_at"} for m in tables["members"]]
+
+    with patch("app.db.core.get_members", _get_members):
+        member_directory.current()
+        clock.now = 31
+        snapshot.current()
+        assert member_directory.current().resolve("Rui Zheng") is not None
+        assert len(loads) == 1
+
+        tables["members"][1].update(full_name="Rui Z.", updated_at="2026-01-02T00:00:06+00:00")
+        clock.now = 62
+        snapshot.current()
+        assert member_directory.current().resolve("Rui Z.")["id"] == "mem-rui"
+        assert len(loads) == 2
+
+
+def test_deleted_rows_force_a_full_reload():
+    tables = _tables()
+    snapshot, feed, clock = _snapshot(tables)
+    snapshot.current()
+
+    tables["awards"] = [a for a in tables["awards"] if a["id"] != "a4"]
+    clock.now = 31
+    rows = snapshot.current().member_award_rows(None, None)
+
+    assert feed.calls == [None, "2026-01-01T23:59:00+00:00", None]
+    assert [r["award_id"] for r in rows] == ["a1", "a2"]
+
+
+def test_full_reload_interval_bounds_incremental_refreshes():
+    snapshot, feed, clock = _snapshot(_tables())
+    snapshot.current()
+
+    clock.now = 3600
+    snapshot.current()
+
+    assert feed.calls == [None, None]
+    assert snapshot.stats()["full_reloads"] == 2
+
+
+def test_failed_refresh_serves_the_previous_snapshot():
+    snapshot, feed, clock = _snapshot(_tables())
+    columns = snapshot.current()
+
+    def _down(_since, _meeting_ids):
+        raise RuntimeError("supabase unavailable")
+
+    snapshot._fetch_changes = _down
+    clock.now = 31
+
+    assert snapshot.current() is columns
+
+
+def test_local_meeting_save_re_reads_that_meeting_whole(module_snapshot):
+    tables = module_snapshot.tables
+    assert meeting_stats.member_role_distribution("mem-joyce") == {"Timer": 2, "Table Topic Evaluation": 1}
+
+    # An agenda save dropped a segment and reassigned another; a deletion is
+    # invisible to `updated_at`, so only the save notification can reveal it.
+    tables["segments"] = [s for s in tables["segments"] if s["id"] != "s8"]
+    next(s for s in tables["segments"] if s["id"] == "s7")["attendee_id"] = "att-rui"
+    meeting_cache.invalidate("m4")
+
+    assert meeting_stats.member_role_distribution("mem-joyce") == {"Timer": 1}
+    assert meeting_stats.member_role_distribution("mem-rui") == {"Workshop": 1, "Table Topic Evaluation": 1}
+    assert module_snapshot.calls == [None, "2026-01-01T23:59:00+00:00"]
+    assert module_snapshot.meeting_ids[1] == ["m4"]
+    assert analytics_snapshot.analytics_snapshot.stats()["full_reloads"] == 1
+
+
+def test_deleted_meeting_leaves_the_snapshot_on_save(module_snapshot):
+    tables = module_snapshot.tables
+    meeting_stats.member_segment_history("mem-joyce")
+
+    tables["meetings"] = [m for m in tables["meetings"] if m["id"] != "m4"]
+    tables["segments"] = [s for s in tables["segments"] if s["meeting_id"] != "m4"]
+    tables["awards"] = [a for a in tables["awards"] if a["meeting_id"] != "m4"]
+    meeting_cache.invalidate("m4")
+
+    assert [r["meeting_id"] for r in meeting_stats.member_segment_history("mem-joyce")] == ["m1"]
+    assert analytics_snapshot.analytics_snapshot.stats()["full_reloads"] == 1
@@ -1,14 +1,17 @@
 """Tests for the shared meeting-lookup service.
 
 Covers parse_query (free-text → filters), resolve_meetings (filters → cards),
-the projections (meeting_to_card / meeting_to_preview), and the lock /
-exact-no fast-path invariants. The agent-facing wrappers in
+the search-index patterns, the projections (meeting_to_card /
+meeting_to_preview), and the fetch_meeting_full invariants. The agent-facing wrappers in
 `agents.meeting.tools` are exercised through their own test file."""
 
 from __future__ import annotations
 
+import re
+from types import SimpleNamespace
 from unittest.mock import patch
 
+from app.db.meeting_search import search_meeting_cards, search_pattern
 from app.services.meeting_lookup import (
     MeetingFilters,
     fetch_meeting_full,
@@ -20,9 +23,70 @@ from app.services.meeting_lookup import (
 )
 
 
-def _meetings_pool() -> list[dict]:
-    """A small recent-meetings pool covering every filter axis. Order matches
-    `get_meetings(page=1)` semantics (most recent first)."""
+class FakeSearchIndex:
+    """Stands in for the `search_meetings` RPC over hydrated meeting dicts:
+    the same filters, with the patterns evaluated the way Postgres `~*`
+    would. Meetings are kept in the given (newest-first) order."""
+
+    def __init__(self, meetings: list[dict]):
+        self.meetings = meetings
+        self.calls: list[dict] = []
+        self.version_reads = 0
+
+    def rpc(self, name: str, params: dict):
+        if name == "meeting_search_version":
+            self.version_reads += 1
+            return SimpleNamespace(execute=lambda: SimpleNamespace(data=f"{len(self.meetings)}:{id(self.meetings)}"))
+        assert name == "search_meetings"
+        self.calls.append(params)
+        matches = [self._row(m) for m in self.meetings if self._matches(m, params)]
+        page = [{**row, "total_matches": len(matches)} for row in matches[: params["max_results"]]]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=page))
+
+    @staticmethod
+    def _row(meeting: dict) -> dict:
+        manager = meeting.get("manager") or {}
+        return {
+            "no": meeting.get("no"),
+            "type": meeting.get("type"),
+            "date": meeting.get("date"),
+            "theme": meeting.get("theme"),
+            "manager_name": manager.get("name") if isinstance(manager, dict) else manager,
+            "segment_count": len(meeting.get("segments") or []),
+            "introduction": meeting.get("introduction"),
+        }
+
+    def _matches(self, meeting: dict, params: dict) -> bool:
+        row = self._row(meeting)
+        if meeting.get("status", "published") != "published":
+            return False
+        if params.get("no_param") is not None and row["no"] != params["no_param"]:
+            return False
+        for field, key in (
+            ("manager_name", "manager_pattern"),
+            ("theme", "theme_pattern"),
+            ("introduction", "introduction_pattern"),
+        ):
+            pattern = params[key]
+            if pattern is not None and (row[field] is None or not re.search(pattern, row[field], re.IGNORECASE)):
+                return False
+        if params["type_param"] is not None and row["type"] != params["type_param"]:
+            return False
+        if params["date_from"] is not None and (not row["date"] or row["date"] < params["date_from"]):
+            return False
+        if params["date_to"] is not None and (not row["date"] or row["date"] > params["date_to"]):
+            return False
+        return True
+
+
+def indexed(meetings: list[dict]):
+    """Serve `search_meetings` from `meetings` for the duration of a `with`."""
+    return patch("app.db.meeting_search.supabase", FakeSearchIndex(meetings))
+
+
+def _meetings() -> list[dict]:
+    """A small set of meetings covering every filter axis, most recent
+    first (the index's `date DESC` order)."""
     return [
         {
             "id": "u1",
@@ -75,15 +139,16 @@ def _meetings_pool() -> list[dict]:
 # ---------- meeting_to_card / meeting_to_preview ----------
 
 
-def test_meeting_to_card_extracts_manager_name_from_attendee_dict():
+def test_meeting_to_card_projects_a_search_row():
     card = meeting_to_card(
         {
             "no": 425,
             "type": "Workshop",
             "theme": "Emojis",
             "date": "2025-11-01",
-            "manager": {"id": "m1", "name": "Joyce Feng"},
-            "segments": [{}, {}, {}],
+            "manager_name": "Joyce Feng",
+            "segment_count": 3,
+            "introduction": "Not on the card unless asked for.",
         }
     )
     assert card == {
@@ -96,18 +161,12 @@ def test_meeting_to_card_extracts_manager_name_from_attendee_dict():
     }
 
 
-def test_meeting_to_card_handles_string_manager_and_missing_fields():
-    """Some legacy DB rows store manager as a bare string, and theme/date can
-    be null. Card output normalizes empties to '' rather than None so the
-    chat UI doesn't render literal 'None' values."""
-    card = meeting_to_card(
-        {
-            "no": None,
-            "manager": "Rui Zheng",
-            "segments": None,
-        }
-    )
-    assert card["manager_name"] == "Rui Zheng"
+def test_meeting_to_card_handles_missing_fields():
+    """Theme, date and manager can be null (a meeting without a manager has
+    no `manager_name`). Card output normalizes empties to '' rather than
+    None so the chat UI doesn't render literal 'None' values."""
+    card = meeting_to_card({"no": None, "theme": None, "manager_name": None, "segment_count": None})
+    assert card["manager_name"] == ""
     assert card["theme"] == ""
     assert card["date"] == ""
     assert card["segment_count"] == 0
@@ -384,19 +443,18 @@ def test_parse_query_handles_mixed_chinese_english_manager_phrasing():
 
 
 def test_resolve_meetings_empty_filters_returns_recent_top_5():
-    """Default MeetingFilters() with limit=5 takes the recent pool and
-    returns the top 5 in DB order (most recent first), with envelope
+    """Default MeetingFilters() with limit=5 returns the top 5 in index
+    order (most recent first), with envelope
     metadata reflecting that nothing was filtered out."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters())
     assert [c["no"] for c in result["cards"]] == [451, 450, 449, 448, 447]
     assert result["total_matches"] == 5
-    assert result["pool_size"] == 5
     assert result["limit_clamped"] is False
 
 
-def test_resolve_meetings_envelope_signals_clamp_when_pool_exceeds_limit():
-    """The whole reason for the envelope: when the pool has more matches
+def test_resolve_meetings_envelope_signals_clamp_when_matches_exceed_limit():
+    """The whole reason for the envelope: when the index has more matches
     than `limit`, the LLM needs to know so it can disclose to the user.
     Pre-envelope the agent silently returned top-5 and users had to
     follow up with 'why didn't I see meeting X' (observed regression
@@ -441,34 +499,36 @@ def test_resolve_meetings_envelope_signals_clamp_when_pool_exceeds_limit():
             "segments": [],
         },
     ]
-    pool = [*_meetings_pool(), *extras]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    meetings = [*_meetings(), *extras]
+    with indexed(meetings):
         result = resolve_meetings(MeetingFilters(type_filter="Workshop", limit=5))
     assert len(result["cards"]) == 5
     assert result["total_matches"] == 6
     assert result["limit_clamped"] is True
 
 
-def test_resolve_meetings_exact_no_uses_fetch_full_path():
-    """Filter with `no=` set must hit fetch_meeting_full (targeted fetch),
-    not scan the bulk recent pool — that's the URL-length / row-cap fix."""
-    fake_meeting = {"no": 425, "type": "Workshop", "theme": "Test", "manager": {"name": "Joyce"}, "segments": []}
+def test_resolve_meetings_exact_no_reads_card_fields_without_hydrating():
+    """Filter with `no=` set is a card query on the search index — the
+    meeting's segments and attendees are only loaded by preview/clone."""
+    fake_meeting = {"no": 425, "type": "Workshop", "theme": "Test", "manager": {"name": "Joyce"}, "segments": [{}] * 4}
     with (
-        patch("app.services.meeting_lookup.fetch_meeting_full", return_value=fake_meeting) as mock_full,
-        patch("app.services.meeting_lookup.db_meetings_recent") as mock_pool,
+        indexed([*_meetings(), fake_meeting]) as index,
+        patch("app.services.meeting_lookup.fetch_meeting_full") as mock_full,
     ):
         result = resolve_meetings(MeetingFilters(no=425))
 
-    mock_full.assert_called_once_with(425)
-    mock_pool.assert_not_called()
-    assert len(result["cards"]) == 1
+    mock_full.assert_not_called()
+    assert index.calls[0]["no_param"] == 425
+    assert result["cards"] == [
+        {"no": 425, "type": "Workshop", "date": "", "theme": "Test", "manager_name": "Joyce", "segment_count": 4}
+    ]
     assert result["cards"][0]["no"] == 425
     assert result["total_matches"] == 1
     assert result["limit_clamped"] is False
 
 
 def test_resolve_meetings_exact_no_returns_empty_envelope_when_missing():
-    with patch("app.services.meeting_lookup.fetch_meeting_full", return_value=None):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(no=99999))
     assert result["cards"] == []
     assert result["total_matches"] == 0
@@ -479,13 +539,13 @@ def test_resolve_meetings_exact_no_respects_type_filter():
     """`MeetingFilters(no=425, type_filter='Regular')` must return [] if
     the meeting exists but isn't Regular — filters AND."""
     fake = {"no": 425, "type": "Workshop", "theme": "T", "manager": {"name": "J"}, "segments": []}
-    with patch("app.services.meeting_lookup.fetch_meeting_full", return_value=fake):
+    with indexed([fake]):
         assert resolve_meetings(MeetingFilters(no=425, type_filter="Regular"))["cards"] == []
         assert resolve_meetings(MeetingFilters(no=425, type_filter="Workshop"))["cards"][0]["no"] == 425
 
 
 def test_resolve_meetings_filters_by_type_only():
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(type_filter="Workshop"))
     assert [c["no"] for c in result["cards"]] == [450, 447]
     assert result["total_matches"] == 2
@@ -496,7 +556,7 @@ def test_resolve_meetings_name_substring_matches_manager_only():
     """`name_substring` matches manager.name ONLY — separated from theme
     so the model can search each field independently and disclose which
     matches came from where."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(name_substring="joyce"))
     # Joyce manages 451 and 449 — both surface.
     assert {c["no"] for c in result["cards"]} == {451, 449}
@@ -506,21 +566,37 @@ def test_resolve_meetings_name_substring_does_not_match_theme():
     """A theme containing the substring must NOT surface via
     name_substring — that's the whole point of the split. Use
     `theme_substring` for theme search."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(name_substring="emojis"))
     # 'Emojis' is in meeting 450's theme, but no manager has 'emojis' in
     # their name — should be empty.
     assert result["cards"] == []
 
 
+def test_resolve_meetings_respells_a_manager_name_that_matches_nobody():
+    """A reordered manager name is retried as the member it resolves to,
+    and the envelope says which member that was. A misspelling is not
+    guessed at: it may be someone else entirely."""
+    members = [{"id": "m-joyce", "username": "joyce", "full_name": "Joyce Feng"}]
+    with indexed(_meetings()) as index, patch("app.db.core.get_members", lambda: members):
+        result = resolve_meetings(MeetingFilters(name_substring="Feng Joyce"))
+        misspelled = resolve_meetings(MeetingFilters(name_substring="Joyse Feng"))
+        unknown = resolve_meetings(MeetingFilters(name_substring="Steve"))
+
+    assert {c["no"] for c in result["cards"]} == {451, 449}
+    assert result["manager_matched"] == "Joyce Feng"
+    assert [call["manager_pattern"] for call in index.calls] == ["Feng Joyce", "Joyce Feng", "Joyse Feng", "Steve"]
+    assert misspelled == unknown == {"cards": [], "total_matches": 0, "limit_clamped": False}
+
+
 def test_resolve_meetings_theme_substring_matches_theme_only():
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(theme_substring="emojis"))
     assert [c["no"] for c in result["cards"]] == [450]
 
 
 def test_resolve_meetings_short_ascii_theme_search_respects_word_boundaries():
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 500,
@@ -540,7 +616,7 @@ def test_resolve_meetings_short_ascii_theme_search_respects_word_boundaries():
             "segments": [],
         },
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = resolve_meetings(MeetingFilters(theme_substring="AI"))
     assert [c["no"] for c in result["cards"]] == [499]
 
@@ -548,13 +624,13 @@ def test_resolve_meetings_short_ascii_theme_search_respects_word_boundaries():
 def test_resolve_meetings_theme_substring_does_not_match_manager():
     """Symmetric to the name-doesn't-match-theme test — `theme_substring`
     is field-isolated."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(theme_substring="joyce"))
     assert result["cards"] == []
 
 
 def test_resolve_meetings_introduction_substring_matches_intro_field():
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 500,
@@ -576,7 +652,7 @@ def test_resolve_meetings_introduction_substring_matches_intro_field():
             "segments": [],
         },
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = resolve_meetings(MeetingFilters(introduction_substring="leadership"))
     # Only #500 — 499 has 'Leadership' in theme but not in introduction.
     assert [c["no"] for c in result["cards"]] == [500]
@@ -590,7 +666,7 @@ def test_resolve_meetings_includes_full_introduction_when_intro_filter_used():
     intro_text = (
         "This meeting will explore leadership in modern startups, " "from product founders to engineering managers."
     )
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 500,
@@ -602,7 +678,7 @@ def test_resolve_meetings_includes_full_introduction_when_intro_filter_used():
             "segments": [],
         },
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = resolve_meetings(MeetingFilters(introduction_substring="leadership"))
     assert result["cards"][0]["introduction"] == intro_text
 
@@ -612,7 +688,7 @@ def test_resolve_meetings_omits_introduction_for_non_intro_queries():
     (no introduction field). Adding intro for every query would inflate
     the model's tool-result tokens at limit=50 by ~15KB for a query
     that doesn't need them."""
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 500,
@@ -624,7 +700,7 @@ def test_resolve_meetings_omits_introduction_for_non_intro_queries():
             "segments": [],
         },
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         # theme-only filter
         r1 = resolve_meetings(MeetingFilters(theme_substring="leadership"))
         # name-only filter
@@ -647,7 +723,7 @@ def test_resolve_meetings_intro_included_on_exact_no_path_when_filter_used():
         "manager": {"name": "M"},
         "segments": [],
     }
-    with patch("app.services.meeting_lookup.fetch_meeting_full", return_value=fake):
+    with indexed([fake]):
         with_intro = resolve_meetings(MeetingFilters(no=500, introduction_substring="leadership"))
         without_intro = resolve_meetings(MeetingFilters(no=500))
     assert with_intro["cards"][0]["introduction"] == "Something about leadership."
@@ -659,7 +735,7 @@ def test_resolve_meetings_three_substring_axes_compose_with_and():
     SAME meeting (AND across distinct fields). Demonstrates the
     structural-AND semantics — for OR-across-fields the agent fires
     multiple parallel calls."""
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 600,
@@ -693,7 +769,7 @@ def test_resolve_meetings_three_substring_axes_compose_with_and():
             "segments": [],
         },
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = resolve_meetings(
             MeetingFilters(
                 name_substring="Joyce",
@@ -706,14 +782,14 @@ def test_resolve_meetings_three_substring_axes_compose_with_and():
 
 def test_resolve_meetings_date_from_inclusive():
     """`date_from` filters out meetings strictly before that date."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(date_from="2026-04-11"))
     # 451 (04-25), 450 (04-18), 449 (04-11) match; 448 (04-04), 447 (03-28) drop.
     assert {c["no"] for c in result["cards"]} == {451, 450, 449}
 
 
 def test_resolve_meetings_date_to_inclusive():
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(date_to="2026-04-11"))
     # 449 (04-11), 448 (04-04), 447 (03-28) match.
     assert {c["no"] for c in result["cards"]} == {449, 448, 447}
@@ -721,7 +797,7 @@ def test_resolve_meetings_date_to_inclusive():
 
 def test_resolve_meetings_closed_date_range():
     """date_from + date_to combine for a closed inclusive interval."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(date_from="2026-04-04", date_to="2026-04-18"))
     assert {c["no"] for c in result["cards"]} == {450, 449, 448}
 
@@ -729,10 +805,10 @@ def test_resolve_meetings_closed_date_range():
 def test_resolve_meetings_date_filter_excludes_undated_meetings():
     """A meeting with no date can't satisfy a date filter — preserves
     the natural user intent ('meetings in October' must HAVE a date)."""
-    pool = [
+    meetings = [
         {"id": "u1", "no": 500, "type": "Regular", "theme": "T", "date": "", "manager": {"name": "M"}, "segments": []},
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = resolve_meetings(MeetingFilters(date_from="2026-01-01"))
     assert result["cards"] == []
 
@@ -740,7 +816,7 @@ def test_resolve_meetings_date_filter_excludes_undated_meetings():
 def test_resolve_meetings_date_combines_with_type_filter():
     """Real query: '10月份第一次例会' → type_filter='Regular' AND
     date_from='2025-10-01' AND date_to='2025-10-31'."""
-    pool = [
+    meetings = [
         {
             "id": "u1",
             "no": 425,
@@ -769,7 +845,7 @@ def test_resolve_meetings_date_combines_with_type_filter():
             "segments": [],
         },
     ]
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=pool):
+    with indexed(meetings):
         result = resolve_meetings(MeetingFilters(type_filter="Regular", date_from="2025-10-01", date_to="2025-10-31"))
     # Only the Regular meeting in October.
     assert {c["no"] for c in result["cards"]} == {424}
@@ -778,7 +854,7 @@ def test_resolve_meetings_date_combines_with_type_filter():
 def test_resolve_meetings_combined_type_and_name():
     """`Joyce` + `Workshop` should narrow further than each filter alone.
     Joyce never managed a Workshop in the fixture → empty."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(name_substring="joyce", type_filter="Workshop"))
     assert result["cards"] == []
     assert result["total_matches"] == 0
@@ -786,9 +862,9 @@ def test_resolve_meetings_combined_type_and_name():
 
 def test_resolve_meetings_limit_clamps_results():
     """Recency='上次' parses to limit=1; resolve must clamp to first
-    match. The envelope still reports total_matches across the WHOLE
-    pool so the LLM knows there's more."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    match. The envelope still reports total_matches across ALL
+    meetings so the LLM knows there's more."""
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(name_substring="joyce", limit=1))
     assert [c["no"] for c in result["cards"]] == [451]
     assert result["total_matches"] == 2  # Joyce manages 451 AND 449
@@ -798,12 +874,87 @@ def test_resolve_meetings_limit_clamps_results():
 def test_resolve_meetings_returns_card_shape_not_raw_dict():
     """resolve_meetings must always return projected cards, never the raw
     DB dicts (which would leak internal id and full segment lists)."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_meetings(MeetingFilters(limit=1))
     assert "id" not in result["cards"][0]
     assert "segment_count" in result["cards"][0]
 
 
+# ---------- search index ----------
+
+
+def test_search_pattern_escapes_regex_syntax_and_bounds_short_ascii_terms():
+    assert search_pattern("AI") == "(^|[^A-Za-z0-9])AI([^A-Za-z0-9]|$)"
+    assert search_pattern("AI", word_boundaries=False) == "AI"
+    assert search_pattern(" C++ (intro) ") == r"C\+\+ \(intro\)"
+    assert search_pattern("教育") == "教育"
+    assert search_pattern("   ") is None
+    assert search_pattern(None) is None
+
+
+def test_search_patterns_match_as_postgres_would():
+    def matches(value: str, needle: str, **kwargs) -> bool:
+        pattern = search_pattern(needle, **kwargs)
+        return pattern is None or re.search(pattern, value, re.IGNORECASE) is not None
+
+    assert matches("AI in Daily Life", "ai")
+    assert not matches("No Pain, No Gain", "AI")
+    assert matches("No Pain, No Gain", "AI", word_boundaries=False)
+    assert matches("Q&A (part 1)", "(part")
+    assert matches("", "  ")
+
+
+def test_search_meeting_cards_is_one_rpc_returning_card_fields():
+    fake = FakeSearchIndex(
+        [
+            {**_meetings()[0], "introduction": "AI and aging", "segments": [{}] * 3},
+            {**_meetings()[2], "introduction": "AI, again"},
+        ]
+    )
+    with patch("app.db.meeting_search.supabase", fake):
+        found = search_meeting_cards(introduction="AI", manager="joyce", date_from="2026-01-01", limit=1)
+
+    assert fake.calls == [
+        {
+            "manager_pattern": "joyce",
+            "theme_pattern": None,
+            "introduction_pattern": "(^|[^A-Za-z0-9])AI([^A-Za-z0-9]|$)",
+            "type_param": None,
+            "date_from": "2026-01-01",
+            "date_to": None,
+            "max_results": 1,
+            "no_param": None,
+        }
+    ]
+    assert found == {
+        "rows": [
+            {
+                "no": 451,
+                "type": "Regular",
+                "date": "2026-04-25",
+                "theme": "Aging Gracefully",
+                "manager_name": "Joyce Feng",
+                "segment_count": 3,
+                "introduction": "AI and aging",
+            }
+        ],
+        "total": 2,
+    }
+
+
+def test_lookups_reach_past_the_most_recent_200_meetings():
+    """The old resolver only scanned the 200 most recent meetings; the
+    index covers all history."""
+    meetings = [
+        {"id": f"u{no}", "no": no, "type": "Regular", "theme": f"Theme {no}", "manager": {"name": "M"}}
+        for no in range(450, 150, -1)
+    ]
+    meetings[-1]["theme"] = "Founding Night"
+    with indexed(meetings):
+        result = resolve_meetings(MeetingFilters(theme_substring="founding"))
+    assert [c["no"] for c in result["cards"]] == [151]
+
+
 # ---------- resolve_from_query convenience ----------
 
 
@@ -813,13 +964,13 @@ def test_resolve_from_query_composes_parse_and_resolve():
     the meeting with that theme. Manager-only queries like 'Joyce 主持的'
     no longer compose through parse_query — agent uses structured args
     directly with name_substring for that case."""
-    with patch("app.services.meeting_lookup.db_meetings_recent", return_value=_meetings_pool()):
+    with indexed(_meetings()):
         result = resolve_from_query("Emojis 那次")
     assert [c["no"] for c in result["cards"]] == [450]
 
 
 def test_resolve_from_query_blank_returns_empty_envelope():
-    empty = {"cards": [], "total_matches": 0, "pool_size": 0, "limit_clamped": False}
+    empty = {"cards": [], "total_matches": 0, "limit_clamped": False}
     assert resolve_from_query("") == empty
     assert resolve_from_query("   ") == empty
 
@@ -828,12 +979,12 @@ def test_resolve_from_query_blank_returns_empty_envelope():
 
 
 def test_fetch_meeting_full_uses_targeted_two_query_path():
-    """Don't fall back to bulk db_meetings_recent — see the URL-length and
+    """Don't fall back to the search index — see the URL-length and
     1000-row-cap regressions documented in the source."""
     with (
         patch("app.services.meeting_lookup.get_meeting_id_by_no", return_value="uuid-X") as mock_id,
         patch("app.services.meeting_lookup.get_meeting_by_id", return_value={"id": "uuid-X", "no": 425}) as mock_full,
-        patch("app.services.meeting_lookup.db_meetings_recent") as mock_bulk,
+        patch("app.services.meeting_lookup.db_search_meetings") as mock_bulk,
     ):
         result = fetch_meeting_full(425)
     mock_id.assert_called_once_with(425)
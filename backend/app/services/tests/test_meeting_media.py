@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import meeting_media
+from app.services.meeting_media import MeetingMediaIndex, decode_media_cursor, media_page
+
+MEETING_ID = "meeting-1"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Listing:
+    def __init__(self) -> None:
+        self.loads = 0
+
+    def __call__(self, meeting_id: str) -> list[dict]:
+        self.loads += 1
+        return [_item(f"photo-{self.loads}.jpg", "2026-07-15T12:00:00Z")]
+
+
+def _item(name: str, uploaded_at: str) -> dict:
+    return {"filename": name, "fileKey": f"media/{name}", "uploadedAt": uploaded_at}
+
+
+def test_listings_are_cached_until_a_delete() -> None:
+    listing = _Listing()
+    index = MeetingMediaIndex(ttl_seconds=300.0, uploading_ttl_seconds=5.0, load=listing, clock=_Clock())
+
+    index.get(MEETING_ID)
+    index.get(MEETING_ID)
+    assert listing.loads == 1
+
+    index.invalidate(MEETING_ID)
+    assert index.get(MEETING_ID)[0]["filename"] == "photo-2.jpg"
+    assert index.stats()["hits"] == 1
+
+
+def test_listings_are_kept_briefly_while_upload_urls_are_live() -> None:
+    listing = _Listing()
+    clock = _Clock()
+    index = MeetingMediaIndex(ttl_seconds=300.0, uploading_ttl_seconds=5.0, load=listing, clock=clock)
+    index.get(MEETING_ID)
+
+    index.expect_uploads(MEETING_ID, window_seconds=60.0)
+    index.get(MEETING_ID)
+    clock.now += 10
+    index.get(MEETING_ID)
+    assert listing.loads == 3
+
+    clock.now += 60
+    index.get(MEETING_ID)
+    clock.now += 10
+    index.get(MEETING_ID)
+    assert listing.loads == 4
+
+
+def test_a_listing_that_raced_a_delete_is_not_stored() -> None:
+    index: MeetingMediaIndex
+
+    def load(meeting_id: str) -> list[dict]:
+        index.invalidate(meeting_id)
+        return []
+
+    index = MeetingMediaIndex(ttl_seconds=300.0, load=load, clock=_Clock())
+    index.get(MEETING_ID)
+
+    assert index.stats()["size"] == 0
+
+
+def test_pages_follow_the_cursor_through_the_listing() -> None:
+    items = [_item(f"{n}.jpg", f"2026-07-15T12:00:0{n}Z") for n in range(5)]
+
+    first = media_page(items, None, 2)
+    second = media_page(items, first["next_cursor"], 2)
+    last = media_page(items, second["next_cursor"], 2)
+
+    assert [item["filename"] for item in first["items"] + second["items"] + last["items"]] == [
+        f"{n}.jpg" for n in range(5)
+    ]
+    assert last["next_cursor"] is None
+    assert first["total"] == 5
+    assert media_page(items, None, None)["items"] == items
+
+
+def test_malformed_media_cursors_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Invalid media cursor"):
+        decode_media_cursor("not-base64!")
+
+
+def test_listing_sorts_by_upload_time_and_reuses_one_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    buckets: list[object] = []
+    prefix = meeting_media.media_prefix(MEETING_ID)
+
+    def make_bucket(*_args) -> object:
+        buckets.append(object())
+        return buckets[-1]
+
+    monkeypatch.setattr(meeting_media.oss2, "Auth", lambda *_args: object())
+    monkeypatch.setattr(meeting_media.oss2, "Bucket", make_bucket)
+    monkeypatch.setattr(
+        meeting_media.oss2,
+        "ObjectIterator",
+        lambda bucket, *, prefix: [
+            SimpleNamespace(key=prefix, last_modified=0, size=0),
+            SimpleNamespace(key=f"{prefix}b.jpg", last_modified=1_753_000_100, size=2),
+            SimpleNamespace(key=f"{prefix}a.mp4", last_modified=1_753_000_000, size=1),
+        ],
+    )
+
+    first = meeting_media.list_meeting_media(MEETING_ID)
+    meeting_media.list_meeting_media(MEETING_ID)
+
+    assert [item["fileKey"] for item in first] == [f"{prefix}a.mp4", f"{prefix}b.jpg"]
+    assert first[0]["mimeType"] == "video/mp4"
+    assert len(buckets) == 1
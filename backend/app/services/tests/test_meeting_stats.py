@@ -5,7 +5,8 @@ agent both depend on. If a refactor breaks any of these, both surfaces
 diverge from the single source of truth.
 
 Specifically:
-  - `_batch_in` chunks correctly (regression for URL-length cap).
+  - `_batch_in` chunks correctly (regression for URL-length cap) and
+    keeps input order when chunks are fetched concurrently.
   - `resolve_member` resolves canonical / ambiguous / missing cleanly,
     and DB is the only source of truth (no static-list fallback).
   - `compute_meeting_attendance` produces the same merged attendance
@@ -18,6 +19,8 @@ Specifically:
 
 from __future__ import annotations
 
+import threading
+import time
 from unittest.mock import patch
 
 from app.services import meeting_stats
@@ -38,7 +41,8 @@ def test_batch_in_chunks_at_the_specified_size():
     ids = [f"id-{i}" for i in range(125)]
     out = meeting_stats._batch_in(fake_fetch, ids, chunk_size=50)
     assert len(out) == 125
-    assert [len(c) for c in seen_chunks] == [50, 50, 25]
+    # Chunks run concurrently, so only their sizes are fixed, not call order.
+    assert sorted(len(c) for c in seen_chunks) == [25, 50, 50]
 
 
 def test_batch_in_skips_empty_inputs():
@@ -53,7 +57,36 @@ def test_batch_in_skips_empty_inputs():
     assert calls == []
 
 
-def test_execute_all_pages_fetches_until_short_page():
+def test_batch_in_keeps_input_order_when_chunks_finish_out_of_order():
+    def slow_first_chunk(chunk: list[str]) -> list[dict]:
+        if chunk[0] == "id-0":
+            time.sleep(0.05)
+        return [{"id": x} for x in chunk]
+
+    ids = [f"id-{i}" for i in range(10)]
+    out = meeting_stats._batch_in(slow_first_chunk, ids, chunk_size=2)
+
+    assert out == [{"id": x} for x in ids]
+
+
+def test_batch_in_fetches_chunks_concurrently_up_to_the_limit(monkeypatch):
+    monkeypatch.setattr(meeting_stats, "STATS_FETCH_CONCURRENCY", 4)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fetch(chunk: list[str]) -> list[dict]:
+        # Deadlocks (and times out) unless four chunks are in flight at once.
+        barrier.wait()
+        return [{"id": x, "thread": threading.current_thread().name} for x in chunk]
+
+    out = meeting_stats._batch_in(fetch, [f"id-{i}" for i in range(4)], chunk_size=1)
+
+    assert len({row["thread"] for row in out}) == 4
+    assert all(row["thread"].startswith("stats-fetch") for row in out)
+
+
+def test_execute_all_pages_fetches_until_short_page(monkeypatch):
+    # Sequential mode: exactly one request per page.
+    monkeypatch.setattr(meeting_stats, "STATS_FETCH_CONCURRENCY", 1)
     rows = [{"id": f"row-{i}"} for i in range(2005)]
     seen_ranges: list[tuple[int, int]] = []
 
@@ -81,39 +114,42 @@ def test_execute_all_pages_fetches_until_short_page():
     assert seen_ranges == [(0, 999), (1000, 1999), (2000, 2999)]
 
 
-# ---------- resolve_member ----------
-
-
-def _stub_supabase_members(rows: list[dict]):
-    """Patch the supabase singleton inside meeting_stats so resolver
-    tests don't require a live DB connection."""
+def test_execute_all_pages_fetches_later_pages_in_concurrent_waves():
+    rows = [{"id": f"row-{i}"} for i in range(2005)]
+    seen_ranges: list[tuple[int, int]] = []
 
-    class _StubSelect:
-        def __init__(self, data):
-            self._data = data
+    class _Query:
+        def range(self, start: int, end: int):
+            self._range = (start, end)
+            seen_ranges.append((start, end))
+            return self
 
         def execute(self):
+            start, end = self._range
+
             class _Result:
                 def __init__(self, d):
                     self.data = d
 
-            return _Result(self._data)
+            return _Result(rows[start : end + 1])
 
-    class _StubTable:
-        def __init__(self, rows):
-            self._rows = rows
+    out = meeting_stats._execute_all_pages(_Query, page_size=1000)
 
-        def select(self, *_args, **_kwargs):
-            return _StubSelect(self._rows)
+    assert out == rows
+    assert seen_ranges[0] == (0, 999)
+    # One wave after the first full page; pages past the end come back empty.
+    assert sorted(seen_ranges[1:]) == [
+        (1000 * i, 1000 * i + 999) for i in range(1, meeting_stats.STATS_FETCH_CONCURRENCY + 1)
+    ]
 
-    class _StubClient:
-        def __init__(self, rows):
-            self._rows = rows
 
-        def table(self, _name):
-            return _StubTable(self._rows)
+# ---------- resolve_member ----------
+
 
-    return patch("app.services.meeting_stats.supabase", _StubClient(rows))
+def _stub_supabase_members(rows: list[dict]):
+    """Patch the members query behind the cached directory so resolver
+    tests don't require a live DB connection."""
+    return patch("app.db.core.get_members", lambda: rows)
 
 
 def test_resolve_member_blank_returns_none():
@@ -176,6 +212,26 @@ def test_resolve_member_substring_ambiguous():
     assert {c.id for c in result.candidates} == {"m1", "m2"}
 
 
+def test_resolve_member_tolerates_word_order_but_only_suggests_typos():
+    """A reordered name resolves instead of costing a 'which member did you
+    mean' round-trip; a typo is only a suggestion, since "Amy Wang" one
+    letter off "Amy Fang" may well be a guest."""
+    rows = [
+        {"id": "m1", "full_name": "Joyce Feng", "username": "jfeng"},
+        {"id": "m2", "full_name": "Rui Zheng", "username": "rui"},
+        {"id": "m3", "full_name": "Amy Fang", "username": "amy"},
+    ]
+    with _stub_supabase_members(rows):
+        reordered = meeting_stats.resolve_member("Zheng Rui")
+        typo = meeting_stats.resolve_member("Joyse Feng")
+        guest = meeting_stats.resolve_member("Amy Wang")
+        suggestions = meeting_stats.suggest_members("Amy Wang")
+    assert isinstance(reordered, meeting_stats.Member) and reordered.id == "m2"
+    assert typo is None
+    assert guest is None
+    assert [m.id for m in suggestions] == ["m3"]
+
+
 def test_resolve_member_unknown_returns_none():
     rows = [{"id": "m1", "full_name": "Joyce Feng", "username": "joyce"}]
     with _stub_supabase_members(rows):
@@ -289,10 +345,17 @@ def _stub_supabase_with_tables(table_data: dict[str, list[dict]]):
     class _Client:
         def __init__(self, data):
             self._data = data
+            self.tables: list[str] = []
+            self.rpcs: list[tuple[str, dict]] = []
 
         def table(self, name):
+            self.tables.append(name)
             return _Table(self._data.get(name, []))
 
+        def rpc(self, name, params):
+            self.rpcs.append((name, params))
+            return _Query([])
+
     return patch("app.services.meeting_stats.supabase", _Client(table_data))
 
 
@@ -397,6 +460,89 @@ def test_compute_meeting_attendance_empty_meeting_ids():
     assert meeting_stats.compute_meeting_attendance([]) == {}
 
 
+def _attendance_history() -> dict[str, list[dict]]:
+    """Three meetings exercising every merge branch: checkins winning as
+    the major group, guest-vs-member dedupe, placeholder guests and a
+    meeting nobody attended."""
+    return {
+        "segments": [
+            {"meeting_id": "mtg-1", "attendee_id": "att-joyce"},
+            {"meeting_id": "mtg-1", "attendee_id": "att-lucas"},
+            {"meeting_id": "mtg-2", "attendee_id": "att-joyce"},
+            {"meeting_id": "mtg-2", "attendee_id": "att-joyce-guest"},
+            {"meeting_id": "mtg-2", "attendee_id": "att-tbd"},
+        ],
+        "attendees": [
+            {"id": "att-joyce", "name": "Joyce", "wxid": "wx-joyce", "member_id": "mem-joyce"},
+            {"id": "att-joyce-guest", "name": "Joyce", "wxid": None, "member_id": None},
+            {"id": "att-lucas", "name": "Lucas", "wxid": None, "member_id": None},
+            {"id": "att-rui", "name": "Rui", "wxid": "wx-rui", "member_id": "mem-rui"},
+            {"id": "att-tbd", "name": "TBD", "wxid": None, "member_id": None},
+        ],
+        "checkins": [
+            {"meeting_id": "mtg-1", "wxid": "wx-joyce", "name": "Joyce", "is_member": True},
+            {"meeting_id": "mtg-1", "wxid": "wx-rui", "name": "Rui", "is_member": True},
+            {"meeting_id": "mtg-1", "wxid": "wx-ada", "name": "Ada", "is_member": False},
+            {"meeting_id": "mtg-1", "wxid": "wx-lucas", "name": "Lucas L.", "is_member": False},
+        ],
+        "members": [{"id": "mem-joyce", "full_name": "Joyce Feng"}, {"id": "mem-rui", "full_name": "Rui Zheng"}],
+    }
+
+
+def test_attendance_snapshots_round_trip_to_the_python_merge():
+    """Parity: whatever the merge stores is exactly what later reads
+    serve, and warm reads never touch the raw attendance tables."""
+    meeting_ids = ["mtg-1", "mtg-2", "mtg-3"]
+    table_data = _attendance_history()
+    with _stub_supabase_with_tables(table_data):
+        expected = meeting_stats._merge_meeting_attendance(meeting_ids)
+
+    with _stub_supabase_with_tables(table_data) as cold_client:
+        cold = meeting_stats.compute_meeting_attendance(meeting_ids)
+    ((rpc_name, params),) = cold_client.rpcs
+    assert rpc_name == "store_meeting_attendance"
+    assert [row["version"] for row in params["snapshots"]] == [0, 0, 0]
+
+    stored = [{**row, "computed_version": row["version"]} for row in params["snapshots"]]
+    with _stub_supabase_with_tables({**table_data, "meeting_attendance": stored}) as warm_client:
+        warm = meeting_stats.compute_meeting_attendance(meeting_ids)
+
+    assert cold == expected
+    assert warm == expected
+    assert expected["mtg-1"].member_ids == {"mem-joyce", "mem-rui"}
+    assert expected["mtg-1"].guest_names == {"Ada", "Lucas L."}
+    assert expected["mtg-2"].guest_names == set()
+    assert expected["mtg-3"].member_ids == set()
+    assert warm_client.tables == ["meeting_attendance"]
+    assert warm_client.rpcs == []
+
+
+def test_stale_attendance_snapshots_are_re_merged_at_their_version():
+    table_data = _attendance_history()
+    table_data["meeting_attendance"] = [
+        # Fresh: served as stored even though the raw rows disagree.
+        {"meeting_id": "mtg-2", "version": 3, "computed_version": 3, "member_ids": ["mem-x"], "guest_names": []},
+        # A checkin landed since the last merge.
+        {"meeting_id": "mtg-1", "version": 5, "computed_version": 4, "member_ids": [], "guest_names": []},
+    ]
+
+    with _stub_supabase_with_tables(table_data) as client:
+        out = meeting_stats.compute_meeting_attendance(["mtg-1", "mtg-2"])
+
+    assert list(out) == ["mtg-1", "mtg-2"]
+    assert out["mtg-2"].member_ids == {"mem-x"}
+    assert out["mtg-1"].member_ids == {"mem-joyce", "mem-rui"}
+    ((_, params),) = client.rpcs
+    assert params["snapshots"] == [
+        {
+            "meeting_id": "mtg-1",
+            "version": 5,
+            "member_ids": ["mem-joyce", "mem-rui"],
+            "guest_names": ["Ada", "Lucas L."],
+        }
+    ]
+
+
 # ---------- count_meetings / group ----------
 
 
@@ -17,10 +17,16 @@ must win over a static name list. Hence the split:
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+
 from app.services.meeting_preview_markdown import format_role_display
-from app.services.member_directory import CLUB_MEMBERS, is_member_name
+from app.services.member_directory import CLUB_MEMBERS, MemberDirectory, MemberIndex, is_member_name
 
 # ---------- is_member_name (legacy bare-string fallback only) ----------
+# Tests can't reach the members table, so these exercise the static
+# CLUB_MEMBERS fallback; the directory-backed path is covered further down.
 
 
 def test_is_member_name_matches_full_name_case_insensitively():
@@ -116,3 +122,166 @@ def test_format_role_display_member_id_none_treated_as_legacy_fallback():
     None means 'no information', so fall back to CLUB_MEMBERS."""
     assert format_role_display("Liz Huang", member_id=None) == "Liz Huang (member)"
     assert format_role_display("Lucas", member_id=None) == "Lucas (guest)"
+
+
+# ---------- MemberIndex / MemberDirectory ----------
+
+ROWS = [
+    {"id": "m-joyce", "username": "joyce", "full_name": "Joyce Feng"},
+    {"id": "m-jenny-li", "username": "jenny", "full_name": "Jenny Li"},
+    {"id": "m-jenny-lin", "username": "jlin", "full_name": "Jenny Lin"},
+    {"id": "m-libra", "username": "libra", "full_name": " Libra Lee "},
+]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Fetch:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self) -> list[dict]:
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("members table unreachable")
+        return list(self.rows)
+
+
+def test_member_index_lookups_are_case_and_whitespace_insensitive():
+    index = MemberIndex(ROWS)
+
+    assert [m["id"] for m in index.with_full_name("  JOYCE feng ")] == ["m-joyce"]
+    assert [m["id"] for m in index.with_full_name("libra lee")] == ["m-libra"]
+    assert [m["id"] for m in index.with_first_name("jenny")] == ["m-jenny-li", "m-jenny-lin"]
+    assert index.by_id["m-joyce"]["username"] == "joyce"
+
+
+def test_member_index_candidates_follow_the_resolver_order():
+    index = MemberIndex(ROWS)
+
+    # Exact full name beats the substring match on "Jenny Lin".
+    assert [m["id"] for m in index.candidates("Jenny Li")] == ["m-jenny-li"]
+    assert [m["id"] for m in index.candidates("jlin")] == ["m-jenny-lin"]
+    assert [m["id"] for m in index.candidates("Jenn")] == ["m-jenny-li", "m-jenny-lin"]
+    assert index.candidates("") == ()
+    assert index.resolve("Jenn") is None
+    assert index.resolve("Guest A") is None
+    assert index.resolve("feng")["id"] == "m-joyce"
+
+
+def test_member_index_matches_spellings_words_and_typos():
+    index = MemberIndex([*ROWS, {"id": "m-rui", "username": "rui", "full_name": "Rui Zheng"}])
+
+    assert [m["id"] for m in index.with_spelling("zheng rui")] == ["m-rui"]
+    assert [m["id"] for m in index.with_spelling("ZhengRui")] == ["m-rui"]
+    assert [m["id"] for m in index.with_word("lee")] == ["m-libra"]
+    assert [m["id"] for m in index.containing("enny li")] == ["m-jenny-li", "m-jenny-lin"]
+    assert [m["id"] for m in index.containing("li")] == ["m-jenny-li", "m-jenny-lin", "m-libra"]
+    assert [m["id"] for m in index.nearest("Joyse")] == ["m-joyce"]
+    assert [m["id"] for m in index.nearest("Jeny Lin")] == ["m-jenny-lin"]
+    assert index.nearest("Jo") == ()
+    assert index.nearest("Steve Jobs") == ()
+
+
+def test_member_index_fuzzy_steps_are_opt_in():
+    index = MemberIndex([*ROWS, {"id": "m-rui", "username": "rui", "full_name": "Rui Zheng"}])
+
+    assert index.resolve("Zheng Rui") is None
+    assert index.resolve("Zheng Rui", fuzzy=True)["id"] == "m-rui"
+    assert index.resolve("Joyse Feng") is None
+    assert index.resolve("Joyse Feng", fuzzy=True) is None
+    # A whole-word match beats substring hits inside other names.
+    assert [m["id"] for m in index.candidates("Lee", fuzzy=True)] == ["m-libra"]
+    # Exact steps still win over a closer-looking typo match.
+    assert [m["id"] for m in index.candidates("Jenny Li", fuzzy=True)] == ["m-jenny-li"]
+
+
+def test_member_index_never_resolves_near_miss_names():
+    """A guest one or two letters off a member's name is a different
+    person; `nearest` may suggest the member but `candidates` never picks it."""
+    index = MemberIndex(
+        [
+            {"id": "m-amy", "username": "amy", "full_name": "Amy Fang"},
+            {"id": "m-jenny", "username": "jenny", "full_name": "Jenny Li"},
+            {"id": "m-max", "username": "max", "full_name": "Max Long"},
+        ]
+    )
+
+    for guest in ("Amy Wang", "Jerry Li", "Mary Long"):
+        assert index.candidates(guest, fuzzy=True) == ()
+    assert [m["id"] for m in index.nearest("Amy Wang")] == ["m-amy"]
+
+
+def test_member_index_spells_chinese_names_in_pinyin():
+    index = MemberIndex([*ROWS, {"id": "m-rui", "username": "rui", "full_name": "Rui Zheng"}])
+
+    assert [m["id"] for m in index.with_spelling("郑锐")] == ["m-rui"]
+    assert index.resolve("郑锐", fuzzy=True)["id"] == "m-rui"
+    assert index.resolve("冯", fuzzy=True)["id"] == "m-joyce"
+
+
+def test_member_directory_serves_one_load_within_the_ttl():
+    fetch, clock = _Fetch(ROWS), _Clock()
+    directory = MemberDirectory(fetch=fetch, ttl_seconds=60, clock=clock)
+
+    first = directory.current()
+    clock.now += 59
+    assert directory.current() is first
+    assert directory.members() == ROWS
+    assert fetch.calls == 1
+
+    clock.now += 1
+    directory.current()
+    assert fetch.calls == 2
+
+
+def test_member_directory_invalidate_reloads_on_next_read():
+    fetch = _Fetch(ROWS)
+    directory = MemberDirectory(fetch=fetch, ttl_seconds=60, clock=_Clock())
+    directory.current()
+
+    fetch.rows = [*ROWS, {"id": "m-new", "username": "new", "full_name": "New Member"}]
+    directory.invalidate()
+
+    assert directory.current().resolve("New Member")["id"] == "m-new"
+    assert fetch.calls == 2
+
+
+def test_member_directory_keeps_the_previous_index_when_a_reload_fails():
+    fetch, clock = _Fetch(ROWS), _Clock()
+    directory = MemberDirectory(fetch=fetch, ttl_seconds=60, clock=clock)
+    loaded = directory.current()
+
+    fetch.fail = True
+    clock.now += 60
+    assert directory.current() is loaded
+    # The failure counts as a refresh; the next attempt waits out the TTL.
+    assert directory.current() is loaded
+    assert fetch.calls == 2
+
+
+def test_member_directory_raises_when_nothing_is_loaded_yet():
+    fetch = _Fetch(ROWS)
+    fetch.fail = True
+    directory = MemberDirectory(fetch=fetch, ttl_seconds=60, clock=_Clock())
+
+    with pytest.raises(RuntimeError):
+        directory.current()
+
+
+def test_is_member_name_prefers_the_live_directory():
+    """A member the static list has never heard of is still a member, and a
+    name dropped from the members table is no longer one."""
+    rows = [{"id": "m-libra", "username": "libra", "full_name": "Libra Lee"}]
+    with patch("app.db.core.get_members", lambda: rows):
+        assert is_member_name("libra lee") is True
+        assert is_member_name("Joyce Feng") is False
+        assert format_role_display("Libra Lee") == "Libra Lee (member)"
@@ -13,7 +13,6 @@ from ..config import (
     MEETING_TEXT_PLANNER_REASONING_EFFORT,
     OPENAI_API_KEY,
 )
-from ..db.core import get_members
 from ..models.meeting import (
     Attendee,
     Meeting,
@@ -23,6 +22,7 @@ from ..models.meeting import (
     Segment,
     defaultSegmentTypes,
 )
+from ..services.member_directory import member_directory
 from .prompts import (
     parse_meeting_agenda_image_system_prompt,
     plan_meeting_from_text_developer_prompt,
@@ -134,7 +134,7 @@ def convert_parsed_meeting_to_meeting(
     Maps names to member IDs using the members database.
     """
     # Get all members
-    members = get_members()
+    members = member_directory.members()
 
     def find_member_id(query_name: str) -> str:
         """Simple case-insensitive partial name matching"""
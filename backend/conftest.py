@@ -14,6 +14,7 @@ import pytest
 
 import app.db.core as db_core
 import app.db.supabase as db_supabase
+from app.db import process_caches
 
 
 class ProductionAccessBlocked(RuntimeError):
@@ -37,7 +38,18 @@ def _block_supabase(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPa
     client_type = type(db_supabase.supabase)
     monkeypatch.setattr(client_type, "table", _blocked)
     monkeypatch.setattr(client_type, "rpc", _blocked)
+    # The async client used by app/db/aio.py is a separate class with its
+    # own connection pool; block it the same way.
+    monkeypatch.setattr(db_supabase.AsyncClient, "table", _blocked)
+    monkeypatch.setattr(db_supabase.AsyncClient, "rpc", _blocked)
     # create_user_client builds a fresh (blocked-anyway) client and performs
     # network auth setup; block it at both import sites.
     monkeypatch.setattr(db_supabase, "create_user_client", _blocked)
     monkeypatch.setattr(db_core, "create_user_client", _blocked)
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_caches() -> None:
+    # Process-wide caches and hubs register themselves where they are
+    # created; state left by one test's fake client must not answer another.
+    process_caches.clear_all()
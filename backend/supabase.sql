@@ -428,6 +428,8 @@ CREATE TABLE timings (
     planned_duration_minutes INTEGER NOT NULL,
     actual_start_time TIMESTAMPTZ NOT NULL,
     actual_end_time TIMESTAMPTZ NOT NULL,
+    actual_duration_seconds INTEGER,     -- Computed by the backend at write time (NULL on legacy rows)
+    dot_color TEXT,                      -- gray/green/yellow/red/bell, computed with actual_duration_seconds
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
@@ -440,6 +442,9 @@ CREATE TABLE timings (
 -- Ensures meeting numbers are unique within each type
 CREATE UNIQUE INDEX unique_type_no_not_null ON meetings(type, no) WHERE no IS NOT NULL;
 
+-- Supports keyset pagination of meeting lists, newest first by (date, id)
+CREATE INDEX idx_meetings_date_id ON meetings(date DESC, id DESC);
+
 -- Ensures post slugs are unique
 CREATE UNIQUE INDEX unique_slug ON posts(slug);
 
@@ -476,6 +481,10 @@ CREATE UNIQUE INDEX unique_meeting_id ON votes_status(meeting_id);
 CREATE UNIQUE INDEX unique_experience_feedback ON feedbacks(meeting_id, from_wxid, type)
 WHERE type IN ('experience_opening', 'experience_peak', 'experience_valley', 'experience_ending');
 
+-- Indexes for the sent / received branches of the feedback visibility filter
+CREATE INDEX idx_feedbacks_meeting_from_wxid ON feedbacks(meeting_id, from_wxid);
+CREATE INDEX idx_feedbacks_meeting_to_attendee ON feedbacks(meeting_id, to_attendee_id);
+
 -- Ensures one checkin per person per segment per meeting
 CREATE UNIQUE INDEX unique_checkin_person_segment ON checkins(meeting_id, wxid, segment_id);
 
@@ -957,6 +966,803 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql SECURITY DEFINER;
 
+-- Function to add summed ballot counts in one statement. Each element of
+-- vote_data is {category, name, delta}; keys are unique within one call.
+-- Counts nothing once voting is closed, whatever the caller has cached.
+CREATE OR REPLACE FUNCTION add_vote_counts(meeting_id_param UUID, vote_data JSONB)
+RETURNS SETOF votes AS $$
+    UPDATE votes v
+    SET count = v.count + d.delta
+    FROM jsonb_to_recordset(vote_data) AS d(category TEXT, name TEXT, delta INT)
+    WHERE v.meeting_id = meeting_id_param
+      AND v.category = d.category
+      AND v.name = d.name
+      AND EXISTS (SELECT 1 FROM votes_status s WHERE s.meeting_id = meeting_id_param AND s.open)
+    RETURNING v.*;
+$$ LANGUAGE sql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION add_vote_counts(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION add_vote_counts(UUID, JSONB) TO service_role;
+
+-- Function to apply a client-computed meeting diff in one transaction.
+-- meeting_diff holds only the changed meetings columns; upsert_segments holds
+-- full segment rows (IDs assigned client-side) to insert or update.
+CREATE OR REPLACE FUNCTION save_meeting_changes(
+    meeting_id_param UUID,
+    meeting_diff JSONB,
+    upsert_segments JSONB,
+    delete_segment_ids UUID[]
+)
+RETURNS BOOLEAN AS $$
+BEGIN
+    -- Lock the meeting row so concurrent saves of one agenda apply in turn
+    PERFORM 1 FROM meetings WHERE id = meeting_id_param FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN FALSE;
+    END IF;
+
+    UPDATE meetings m
+    SET (no, type, theme, manager_id, date, start_time, end_time, location, introduction, status, updated_at) = (
+        SELECT r.no, r.type, r.theme, r.manager_id, r.date, r.start_time, r.end_time,
+               r.location, r.introduction, r.status, NOW()
+        FROM jsonb_populate_record(NULL::meetings, to_jsonb(m) || COALESCE(meeting_diff, '{}'::JSONB)) r
+    )
+    WHERE m.id = meeting_id_param;
+
+    DELETE FROM segments
+    WHERE meeting_id = meeting_id_param
+      AND id = ANY(COALESCE(delete_segment_ids, '{}'::UUID[]));
+
+    INSERT INTO segments (
+        id, meeting_id, attendee_id, type, start_time, duration, end_time, title, content, related_segment_ids
+    )
+    SELECT COALESCE(s.id, uuid_generate_v4()), meeting_id_param, s.attendee_id, s.type, s.start_time,
+           s.duration, s.end_time, s.title, s.content, s.related_segment_ids
+    FROM jsonb_populate_recordset(NULL::segments, COALESCE(upsert_segments, '[]'::JSONB)) s
+    ON CONFLICT (id) DO UPDATE SET
+        attendee_id = EXCLUDED.attendee_id,
+        type = EXCLUDED.type,
+        start_time = EXCLUDED.start_time,
+        duration = EXCLUDED.duration,
+        end_time = EXCLUDED.end_time,
+        title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        related_segment_ids = EXCLUDED.related_segment_ids,
+        updated_at = NOW()
+    -- Never move another meeting's segment into this one
+    WHERE segments.meeting_id = meeting_id_param;
+
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION save_meeting_changes(UUID, JSONB, JSONB, UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION save_meeting_changes(UUID, JSONB, JSONB, UUID[]) TO service_role;
+
+-- Function to replace (regular segments) or append to (Table Topic Session)
+-- the timings of several segments of one meeting. Each element of
+-- segments_param is {segment_id, timings: [...]}; every timing carries
+-- name, planned_duration_minutes, actual_start_time, actual_end_time,
+-- actual_duration_seconds, dot_color and time_suffix ("(HH:MM)" of the start
+-- time, appended to a Table Topics name already taken in that segment).
+CREATE OR REPLACE FUNCTION save_meeting_timings(meeting_id_param UUID, segments_param JSONB)
+RETURNS SETOF timings AS $$
+DECLARE
+    seg RECORD;
+    t RECORD;
+    is_table_topics BOOLEAN;
+    taken_names TEXT[];
+    timing_name TEXT;
+BEGIN
+    -- Lock the meeting row so concurrent timer saves apply in turn
+    PERFORM 1 FROM meetings WHERE id = meeting_id_param FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    FOR seg IN
+        SELECT s.segment_id, s.timings
+        FROM jsonb_to_recordset(COALESCE(segments_param, '[]'::JSONB)) AS s(segment_id TEXT, timings JSONB)
+    LOOP
+        is_table_topics := EXISTS (
+            SELECT 1 FROM segments
+            WHERE id = seg.segment_id::UUID AND type = 'Table Topic Session'
+        );
+
+        IF is_table_topics THEN
+            SELECT COALESCE(array_agg(lower(name)), '{}') INTO taken_names
+            FROM timings WHERE segment_id = seg.segment_id AND name IS NOT NULL AND name <> '';
+        ELSE
+            DELETE FROM timings WHERE meeting_id = meeting_id_param AND segment_id = seg.segment_id;
+        END IF;
+
+        FOR t IN
+            SELECT *
+            FROM jsonb_to_recordset(COALESCE(seg.timings, '[]'::JSONB)) AS x(
+                name TEXT,
+                planned_duration_minutes INTEGER,
+                actual_start_time TIMESTAMPTZ,
+                actual_end_time TIMESTAMPTZ,
+                actual_duration_seconds INTEGER,
+                dot_color TEXT,
+                time_suffix TEXT
+            )
+        LOOP
+            timing_name := t.name;
+            IF is_table_topics AND COALESCE(t.name, '') <> '' THEN
+                IF lower(t.name) = ANY(taken_names) AND COALESCE(t.time_suffix, '') <> '' THEN
+                    timing_name := t.name || ' ' || t.time_suffix;
+                END IF;
+                taken_names := taken_names || lower(timing_name);
+            END IF;
+
+            RETURN QUERY
+            WITH inserted AS (
+                INSERT INTO timings (
+                    meeting_id, segment_id, name, planned_duration_minutes, actual_start_time, actual_end_time,
+                    actual_duration_seconds, dot_color
+                )
+                VALUES (
+                    meeting_id_param, seg.segment_id, timing_name, t.planned_duration_minutes, t.actual_start_time,
+                    t.actual_end_time, t.actual_duration_seconds, t.dot_color
+                )
+                RETURNING *
+            )
+            SELECT * FROM inserted;
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION save_meeting_timings(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION save_meeting_timings(UUID, JSONB) TO service_role;
+
+-- Function to replace one person's checkins for a meeting in one round-trip.
+-- segment_ids_param NULL = general attendance, '{}' = uncheckin, otherwise
+-- one checkin per segment. Raises P0002 when the meeting is missing (or a
+-- draft, with published_only), 22023 when a segment belongs elsewhere and
+-- 23P01 when another wxid holds the Timer segment.
+CREATE OR REPLACE FUNCTION checkin(
+    meeting_id_param UUID,
+    wxid_param TEXT,
+    segment_ids_param UUID[],
+    name_param TEXT,
+    referral_source_param TEXT,
+    is_member_param BOOLEAN,
+    published_only BOOLEAN
+)
+RETURNS SETOF checkins AS $$
+DECLARE
+    member BOOLEAN;
+BEGIN
+    -- Lock the meeting row so concurrent checkins (and the Timer check) apply
+    -- in turn; NO KEY UPDATE still lets other tables' foreign keys see it
+    PERFORM 1 FROM meetings
+    WHERE id = meeting_id_param AND (NOT published_only OR status = 'published')
+    FOR NO KEY UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Meeting % not found', meeting_id_param USING ERRCODE = 'P0002';
+    END IF;
+
+    IF cardinality(segment_ids_param) > 0 THEN
+        IF (
+            SELECT count(*) FROM segments
+            WHERE meeting_id = meeting_id_param AND id = ANY(segment_ids_param)
+        ) <> cardinality(ARRAY(SELECT DISTINCT unnest(segment_ids_param))) THEN
+            RAISE EXCEPTION 'One or more segment IDs do not belong to meeting %', meeting_id_param
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF EXISTS (
+            SELECT 1 FROM segments s
+            JOIN checkins c ON c.meeting_id = s.meeting_id AND c.segment_id = s.id
+            WHERE s.meeting_id = meeting_id_param
+              AND s.id = ANY(segment_ids_param)
+              AND lower(s.type) = 'timer'
+              AND c.wxid <> wxid_param
+        ) THEN
+            RAISE EXCEPTION 'Timer role is already taken' USING ERRCODE = '23P01';
+        END IF;
+    END IF;
+
+    -- Membership: the caller is a member, or this wxid is bound to one
+    member := is_member_param OR EXISTS (
+        SELECT 1 FROM attendees a
+        JOIN members m ON m.id = a.member_id
+        WHERE a.wxid = wxid_param
+    );
+
+    DELETE FROM checkins WHERE meeting_id = meeting_id_param AND wxid = wxid_param;
+
+    -- NULL = general attendance, '{}' = uncheckin, otherwise one per segment
+    IF segment_ids_param IS NULL THEN
+        RETURN QUERY
+        INSERT INTO checkins (meeting_id, wxid, segment_id, name, referral_source, is_member)
+        VALUES (meeting_id_param, wxid_param, NULL, name_param, referral_source_param, member)
+        RETURNING *;
+    ELSE
+        RETURN QUERY
+        INSERT INTO checkins (meeting_id, wxid, segment_id, name, referral_source, is_member)
+        SELECT meeting_id_param, wxid_param, s.id, name_param, referral_source_param, member
+        FROM (
+            SELECT u.id, min(u.n) AS n
+            FROM unnest(segment_ids_param) WITH ORDINALITY AS u(id, n)
+            GROUP BY u.id
+        ) s
+        ORDER BY s.n
+        RETURNING *;
+    END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION checkin(UUID, TEXT, UUID[], TEXT, TEXT, BOOLEAN, BOOLEAN) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION checkin(UUID, TEXT, UUID[], TEXT, TEXT, BOOLEAN, BOOLEAN) TO service_role;
+
+-- =============================================
+-- MEETING ATTENDANCE SNAPSHOTS
+-- =============================================
+-- Precomputed per-meeting attendance for the dashboard and statistics agent.
+-- The smart-merge itself stays in Python (app/services/meeting_stats.py
+-- `compute_meeting_attendance`), so attendance keeps a single definition.
+-- Triggers bump `version` whenever an input of the merge changes; a row is
+-- fresh while `computed_version = version`, and the backend re-merges and
+-- stores stale rows through `store_meeting_attendance`.
+--
+-- `invalidate_meeting_attendance` only touches meetings that still exist, so
+-- the segment / checkin deletes cascading from a meeting delete cannot
+-- recreate the snapshot row the foreign key removes.
+
+CREATE TABLE meeting_attendance (
+    meeting_id UUID PRIMARY KEY REFERENCES meetings(id) ON DELETE CASCADE,
+    version BIGINT NOT NULL DEFAULT 0,
+    computed_version BIGINT,
+    member_ids UUID[] NOT NULL DEFAULT '{}',
+    guest_names TEXT[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+ALTER TABLE meeting_attendance ENABLE ROW LEVEL SECURITY;
+
+-- Mark the given meetings' snapshots stale (creating the row if needed, so a
+-- merge that raced this write cannot store its result afterwards)
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance(meeting_ids UUID[])
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO meeting_attendance (meeting_id, version)
+    SELECT m.id, 1 FROM meetings m WHERE m.id = ANY(meeting_ids)
+    ON CONFLICT (meeting_id) DO UPDATE SET
+        version = meeting_attendance.version + 1,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Trigger for tables that carry meeting_id (segments, checkins)
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_meeting_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM invalidate_meeting_attendance(ARRAY[NEW.meeting_id]);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM invalidate_meeting_attendance(ARRAY[OLD.meeting_id]);
+    ELSE
+        PERFORM invalidate_meeting_attendance(ARRAY[OLD.meeting_id, NEW.meeting_id]);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Attendee name / wxid / member link changes and deletes affect meetings
+-- where the attendee holds a role or checked in by wxid
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_attendee()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM invalidate_meeting_attendance(ARRAY(
+        SELECT s.meeting_id FROM segments s
+        WHERE s.attendee_id = CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END
+        UNION
+        SELECT c.meeting_id FROM checkins c
+        WHERE (TG_OP <> 'DELETE' AND c.wxid = NEW.wxid) OR (TG_OP <> 'INSERT' AND c.wxid = OLD.wxid)
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Member renames affect guest-vs-member dedupe in meetings they took roles in
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_member()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM invalidate_meeting_attendance(ARRAY(
+        SELECT s.meeting_id FROM segments s
+        JOIN attendees a ON a.id = s.attendee_id
+        WHERE a.member_id = NEW.id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER segments_invalidate_meeting_attendance
+    AFTER INSERT OR DELETE OR UPDATE OF meeting_id, attendee_id ON segments
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_meeting_id();
+
+CREATE TRIGGER checkins_invalidate_meeting_attendance
+    AFTER INSERT OR DELETE OR UPDATE OF meeting_id, wxid, name, is_member ON checkins
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_meeting_id();
+
+CREATE TRIGGER attendees_invalidate_meeting_attendance
+    AFTER INSERT OR DELETE OR UPDATE OF name, wxid, member_id ON attendees
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_attendee();
+
+CREATE TRIGGER members_invalidate_meeting_attendance
+    AFTER UPDATE OF full_name ON members
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_member();
+
+-- Store merged attendance computed against snapshot `version`; rows whose
+-- version moved on since they were read are left stale
+CREATE OR REPLACE FUNCTION store_meeting_attendance(snapshots JSONB)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO meeting_attendance (meeting_id, version, computed_version, member_ids, guest_names)
+    SELECT s.meeting_id, s.version, s.version, s.member_ids, s.guest_names
+    FROM jsonb_to_recordset(snapshots)
+        AS s(meeting_id UUID, version BIGINT, member_ids UUID[], guest_names TEXT[])
+    WHERE EXISTS (SELECT 1 FROM meetings m WHERE m.id = s.meeting_id)
+    ON CONFLICT (meeting_id) DO UPDATE SET
+        computed_version = EXCLUDED.computed_version,
+        member_ids = EXCLUDED.member_ids,
+        guest_names = EXCLUDED.guest_names,
+        updated_at = NOW()
+    WHERE meeting_attendance.version = EXCLUDED.version;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION store_meeting_attendance(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION store_meeting_attendance(JSONB) TO service_role;
+REVOKE ALL ON FUNCTION invalidate_meeting_attendance(UUID[]) FROM PUBLIC, anon, authenticated;
+
+-- =============================================
+-- CONTENT INDEX
+-- =============================================
+-- Card data for the Posts index: ordinary posts plus ready, public wxposts,
+-- kept by triggers so `get_content_items` is one ordered query with no
+-- bodies or author lookups. Excerpts keep a single definition in Python
+-- (app/db/content.py `_excerpt`): content edits bump `version`, an excerpt
+-- is fresh while `excerpt_version = version`, and the backend computes and
+-- stores stale ones through `store_content_excerpts`.
+
+CREATE TABLE content_index (
+    id UUID PRIMARY KEY,
+    kind TEXT NOT NULL CHECK (kind IN ('post', 'wxpost')),
+    title TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    is_public BOOLEAN NOT NULL DEFAULT FALSE,
+    author_member_id UUID,
+    author_name TEXT,
+    cover_image_url TEXT,
+    article_revision INTEGER,
+    created_at TIMESTAMPTZ NOT NULL,
+    version BIGINT NOT NULL DEFAULT 1,
+    excerpt TEXT,
+    excerpt_version BIGINT
+);
+
+CREATE INDEX content_index_created_at_idx ON content_index(created_at DESC, id DESC);
+CREATE INDEX content_index_kind_created_at_idx ON content_index(kind, created_at DESC, id DESC);
+
+ALTER TABLE content_index ENABLE ROW LEVEL SECURITY;
+
+-- Source URL of the included manifest entry chosen as cover, if any
+CREATE OR REPLACE FUNCTION wxpost_cover_url(media_manifest JSONB, cover_media_id TEXT)
+RETURNS TEXT AS $$
+    SELECT m.item ->> 'sourceUrl'
+    FROM jsonb_array_elements(media_manifest) WITH ORDINALITY AS m(item, n)
+    WHERE cover_media_id IS NOT NULL
+      AND m.item ->> 'id' = cover_media_id
+      AND COALESCE(m.item -> 'include', 'true'::jsonb) NOT IN ('false'::jsonb, 'null'::jsonb)
+    ORDER BY m.n
+    LIMIT 1;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Content edits bump `version`, which marks the stored excerpt stale
+CREATE OR REPLACE FUNCTION index_post_content()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed INTEGER := 0;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM content_index WHERE id = OLD.id;
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE' AND NEW.content IS DISTINCT FROM OLD.content THEN
+        changed := 1;
+    END IF;
+
+    INSERT INTO content_index (id, kind, title, slug, is_public, author_member_id, author_name, created_at)
+    VALUES (
+        NEW.id, 'post', NEW.title, NEW.slug, COALESCE(NEW.is_public, FALSE), NEW.author_id,
+        (SELECT m.full_name FROM members m WHERE m.id = NEW.author_id),
+        COALESCE(NEW.created_at, NOW())
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        slug = EXCLUDED.slug,
+        is_public = EXCLUDED.is_public,
+        author_member_id = EXCLUDED.author_member_id,
+        author_name = EXCLUDED.author_name,
+        created_at = EXCLUDED.created_at,
+        version = content_index.version + changed;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Only ready, public wxposts are listed; an author-provided excerpt is stored
+-- as-is and counts as fresh
+CREATE OR REPLACE FUNCTION index_wxpost_content()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed INTEGER := 0;
+    provided TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM content_index WHERE id = OLD.id;
+        RETURN NULL;
+    END IF;
+    IF NEW.status <> 'ready' OR NOT NEW.is_public THEN
+        DELETE FROM content_index WHERE id = NEW.id;
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE' AND (NEW.content IS DISTINCT FROM OLD.content OR NEW.excerpt IS DISTINCT FROM OLD.excerpt) THEN
+        changed := 1;
+    END IF;
+    provided := NULLIF(NEW.excerpt, '');
+
+    INSERT INTO content_index (
+        id, kind, title, slug, is_public, cover_image_url, article_revision, created_at, excerpt, excerpt_version
+    )
+    VALUES (
+        NEW.id, 'wxpost', NEW.title, NEW.slug, TRUE,
+        wxpost_cover_url(NEW.media_manifest, NEW.cover_media_id),
+        NEW.article_revision, NEW.created_at,
+        provided, CASE WHEN provided IS NULL THEN NULL ELSE 1 END
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        slug = EXCLUDED.slug,
+        cover_image_url = EXCLUDED.cover_image_url,
+        article_revision = EXCLUDED.article_revision,
+        created_at = EXCLUDED.created_at,
+        version = content_index.version + changed,
+        excerpt = COALESCE(provided, content_index.excerpt),
+        excerpt_version = CASE
+            WHEN provided IS NULL THEN content_index.excerpt_version
+            ELSE content_index.version + changed
+        END;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION index_content_author_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE content_index SET author_name = NEW.full_name WHERE author_member_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER posts_index_content
+    AFTER INSERT OR DELETE OR UPDATE ON posts
+    FOR EACH ROW EXECUTE FUNCTION index_post_content();
+
+CREATE TRIGGER wxposts_index_content
+    AFTER INSERT OR DELETE OR UPDATE ON wxposts
+    FOR EACH ROW EXECUTE FUNCTION index_wxpost_content();
+
+CREATE TRIGGER members_index_content_author_name
+    AFTER UPDATE OF full_name ON members
+    FOR EACH ROW EXECUTE FUNCTION index_content_author_name();
+
+-- Store excerpts computed against index `version`; rows whose version moved
+-- on since they were read are left stale
+CREATE OR REPLACE FUNCTION store_content_excerpts(excerpts JSONB)
+RETURNS VOID AS $$
+BEGIN
+    UPDATE content_index c SET
+        excerpt = e.excerpt,
+        excerpt_version = e.version
+    FROM jsonb_to_recordset(excerpts) AS e(id UUID, version BIGINT, excerpt TEXT)
+    WHERE c.id = e.id AND c.version = e.version;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION store_content_excerpts(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION store_content_excerpts(JSONB) TO service_role;
+
+-- =============================================
+-- MEETING SEARCH
+-- =============================================
+-- Card data and search text for the agents' `lookup_meeting`
+-- (app/db/meeting_search.py), kept by triggers on meetings, segments and
+-- manager names. `search_meetings` matches the case-insensitive patterns
+-- built by `search_pattern`, which owns the word-boundary rule for short
+-- ASCII terms.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE TABLE meeting_search (
+    id UUID PRIMARY KEY,
+    no INT,
+    type TEXT NOT NULL,
+    date DATE NOT NULL,
+    status TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    introduction TEXT,
+    manager_id UUID,
+    manager_name TEXT,
+    segment_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    revision BIGSERIAL NOT NULL
+);
+
+CREATE INDEX meeting_search_status_date_idx ON meeting_search(status, date DESC, id DESC);
+CREATE INDEX meeting_search_no_idx ON meeting_search(no);
+-- Trigram indexes serve both substring and word-boundary (regex) matches,
+-- and work for CJK text where full-text parsers don't split words
+CREATE INDEX meeting_search_theme_trgm_idx ON meeting_search USING gin (theme extensions.gin_trgm_ops);
+CREATE INDEX meeting_search_introduction_trgm_idx ON meeting_search USING gin (introduction extensions.gin_trgm_ops);
+CREATE INDEX meeting_search_manager_name_trgm_idx ON meeting_search USING gin (manager_name extensions.gin_trgm_ops);
+
+ALTER TABLE meeting_search ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION index_meeting_search()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM meeting_search WHERE id = OLD.id;
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO meeting_search (
+        id, no, type, date, status, theme, introduction, manager_id, manager_name, segment_count
+    )
+    VALUES (
+        NEW.id, NEW.no, NEW.type, NEW.date, NEW.status, NEW.theme, NEW.introduction, NEW.manager_id,
+        (SELECT a.name FROM attendees a WHERE a.id = NEW.manager_id),
+        (SELECT count(*) FROM segments s WHERE s.meeting_id = NEW.id)
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        no = EXCLUDED.no,
+        type = EXCLUDED.type,
+        date = EXCLUDED.date,
+        status = EXCLUDED.status,
+        theme = EXCLUDED.theme,
+        introduction = EXCLUDED.introduction,
+        manager_id = EXCLUDED.manager_id,
+        manager_name = EXCLUDED.manager_name,
+        updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Statement-level, so saving a whole agenda recounts each meeting once
+CREATE OR REPLACE FUNCTION count_meeting_search_segments()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE meeting_search m SET
+        segment_count = (SELECT count(*) FROM segments s WHERE s.meeting_id = m.id),
+        updated_at = NOW()
+    WHERE m.id IN (SELECT DISTINCT meeting_id FROM changed_segments);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION index_meeting_search_manager_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE meeting_search SET manager_name = NEW.name, updated_at = NOW() WHERE manager_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER meetings_index_search
+    AFTER INSERT OR DELETE OR UPDATE ON meetings
+    FOR EACH ROW EXECUTE FUNCTION index_meeting_search();
+
+CREATE TRIGGER segments_insert_count_meeting_search
+    AFTER INSERT ON segments
+    REFERENCING NEW TABLE AS changed_segments
+    FOR EACH STATEMENT EXECUTE FUNCTION count_meeting_search_segments();
+
+CREATE TRIGGER segments_delete_count_meeting_search
+    AFTER DELETE ON segments
+    REFERENCING OLD TABLE AS changed_segments
+    FOR EACH STATEMENT EXECUTE FUNCTION count_meeting_search_segments();
+
+CREATE TRIGGER attendees_index_meeting_search_manager_name
+    AFTER UPDATE OF name ON attendees
+    FOR EACH ROW EXECUTE FUNCTION index_meeting_search_manager_name();
+
+-- Published meeting cards matching every given filter, newest first, each
+-- row carrying the full match count. `no_param` looks meetings up by display
+-- number without loading their segments. Patterns are case-insensitive regular
+-- expressions built by the backend. Only the filters in use reach the
+-- planner, so each one can pick its index.
+CREATE OR REPLACE FUNCTION search_meetings(
+    manager_pattern TEXT,
+    theme_pattern TEXT,
+    introduction_pattern TEXT,
+    type_param TEXT,
+    date_from DATE,
+    date_to DATE,
+    max_results INTEGER,
+    no_param INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    no INT,
+    type TEXT,
+    date DATE,
+    theme TEXT,
+    manager_name TEXT,
+    segment_count INTEGER,
+    introduction TEXT,
+    total_matches BIGINT
+) AS $$
+DECLARE
+    conditions TEXT := 'status = ''published''';
+BEGIN
+    IF manager_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND manager_name ~* $1';
+    END IF;
+    IF theme_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND theme ~* $2';
+    END IF;
+    IF introduction_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND introduction ~* $3';
+    END IF;
+    IF type_param IS NOT NULL THEN
+        conditions := conditions || ' AND type = $4';
+    END IF;
+    IF date_from IS NOT NULL THEN
+        conditions := conditions || ' AND date >= $5';
+    END IF;
+    IF date_to IS NOT NULL THEN
+        conditions := conditions || ' AND date <= $6';
+    END IF;
+    IF no_param IS NOT NULL THEN
+        conditions := conditions || ' AND no = $8';
+    END IF;
+
+    RETURN QUERY EXECUTE
+        'SELECT no, type, date, theme, manager_name, segment_count, introduction, count(*) OVER ()'
+        || ' FROM meeting_search WHERE ' || conditions
+        || ' ORDER BY date DESC, id DESC LIMIT $7'
+    USING manager_pattern, theme_pattern, introduction_pattern, type_param, date_from, date_to, max_results, no_param;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER, INTEGER) TO service_role;
+
+-- Change stamp for cached lookups. Every insert and update takes a fresh,
+-- larger `revision`, so any committed write moves the row count or the sum
+-- of revisions, whatever order concurrent writers commit in (`updated_at`
+-- is the transaction start time and cannot promise that).
+CREATE OR REPLACE FUNCTION stamp_meeting_search_revision()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.revision := nextval('meeting_search_revision_seq');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Also fires for the ON CONFLICT DO UPDATE in `index_meeting_search`
+CREATE TRIGGER meeting_search_stamp_revision
+    BEFORE UPDATE ON meeting_search
+    FOR EACH ROW EXECUTE FUNCTION stamp_meeting_search_revision();
+
+CREATE OR REPLACE FUNCTION meeting_search_version()
+RETURNS TEXT AS $$
+    SELECT count(*) || ':' || COALESCE(sum(revision), 0) FROM meeting_search;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION meeting_search_version() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION meeting_search_version() TO service_role;
+
+-- =============================================
+-- ANALYTICS SNAPSHOT FEED
+-- =============================================
+-- The statistics agent keeps a columnar in-memory copy of the tables below
+-- (app/services/analytics_snapshot.py) and refreshes it incrementally by
+-- `updated_at`, so every UPDATE has to move that column.
+
+CREATE OR REPLACE FUNCTION touch_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER members_touch_updated_at
+    BEFORE UPDATE ON members
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER attendees_touch_updated_at
+    BEFORE UPDATE ON attendees
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER meetings_touch_updated_at
+    BEFORE UPDATE ON meetings
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER segments_touch_updated_at
+    BEFORE UPDATE ON segments
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER awards_touch_updated_at
+    BEFORE UPDATE ON awards
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER checkins_touch_updated_at
+    BEFORE UPDATE ON checkins
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+-- Rows written at or after `since` (every row when NULL) for each analytics
+-- table, plus per-table row counts: a count below the caller's local copy
+-- means rows were deleted and the caller reloads from scratch. `meeting_ids`
+-- (meetings saved in the caller's process) also returns each listed meeting
+-- and ALL of its segments / awards / checkins, so the caller can replace them
+-- wholesale and see deletions inside those meetings without a reload.
+CREATE OR REPLACE FUNCTION analytics_changes(since TIMESTAMPTZ, meeting_ids UUID[] DEFAULT '{}')
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'as_of', NOW(),
+        'counts', jsonb_build_object(
+            'members', (SELECT COUNT(*) FROM members),
+            'attendees', (SELECT COUNT(*) FROM attendees),
+            'meetings', (SELECT COUNT(*) FROM meetings),
+            'segments', (SELECT COUNT(*) FROM segments),
+            'awards', (SELECT COUNT(*) FROM awards),
+            'checkins', (SELECT COUNT(*) FROM checkins)
+        ),
+        'members', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('id', id, 'username', username, 'full_name', full_name))
+            FROM members WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'attendees', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('id', id, 'name', name, 'wxid', wxid, 'member_id', member_id))
+            FROM attendees WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'meetings', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'no', no, 'type', type, 'theme', theme, 'date', date,
+                'manager_id', manager_id, 'status', status
+            ))
+            FROM meetings WHERE since IS NULL OR updated_at >= since OR id = ANY(meeting_ids)
+        ), '[]'::JSONB),
+        'segments', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'attendee_id', attendee_id,
+                'type', type, 'start_time', start_time
+            ))
+            FROM segments WHERE since IS NULL OR updated_at >= since OR meeting_id = ANY(meeting_ids)
+        ), '[]'::JSONB),
+        'awards', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'category', category, 'winner', winner
+            ))
+            FROM awards WHERE since IS NULL OR updated_at >= since OR meeting_id = ANY(meeting_ids)
+        ), '[]'::JSONB),
+        'checkins', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'wxid', wxid, 'name', name, 'is_member', is_member
+            ))
+            FROM checkins WHERE since IS NULL OR updated_at >= since OR meeting_id = ANY(meeting_ids)
+        ), '[]'::JSONB)
+    );
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION analytics_changes(TIMESTAMPTZ, UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION analytics_changes(TIMESTAMPTZ, UUID[]) TO service_role;
+
 -- =============================================
 -- AGENT CONVERSATION TABLES
 -- =============================================
@@ -0,0 +1,4 @@
+-- Keyset pagination of /meetings and /meetings/options seeks on (date, id)
+-- newest-first instead of OFFSET + exact count.
+
+CREATE INDEX IF NOT EXISTS idx_meetings_date_id ON public.meetings (date DESC, id DESC);
@@ -0,0 +1,57 @@
+-- Single-round-trip, transactional agenda saves for update_meeting: the
+-- client computes the segment diff and this applies it atomically.
+
+-- Function to apply a client-computed meeting diff in one transaction.
+-- meeting_diff holds only the changed meetings columns; upsert_segments holds
+-- full segment rows (IDs assigned client-side) to insert or update.
+CREATE OR REPLACE FUNCTION public.save_meeting_changes(
+    meeting_id_param UUID,
+    meeting_diff JSONB,
+    upsert_segments JSONB,
+    delete_segment_ids UUID[]
+)
+RETURNS BOOLEAN AS $$
+BEGIN
+    -- Lock the meeting row so concurrent saves of one agenda apply in turn
+    PERFORM 1 FROM meetings WHERE id = meeting_id_param FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN FALSE;
+    END IF;
+
+    UPDATE meetings m
+    SET (no, type, theme, manager_id, date, start_time, end_time, location, introduction, status, updated_at) = (
+        SELECT r.no, r.type, r.theme, r.manager_id, r.date, r.start_time, r.end_time,
+               r.location, r.introduction, r.status, NOW()
+        FROM jsonb_populate_record(NULL::meetings, to_jsonb(m) || COALESCE(meeting_diff, '{}'::JSONB)) r
+    )
+    WHERE m.id = meeting_id_param;
+
+    DELETE FROM segments
+    WHERE meeting_id = meeting_id_param
+      AND id = ANY(COALESCE(delete_segment_ids, '{}'::UUID[]));
+
+    INSERT INTO segments (
+        id, meeting_id, attendee_id, type, start_time, duration, end_time, title, content, related_segment_ids
+    )
+    SELECT COALESCE(s.id, uuid_generate_v4()), meeting_id_param, s.attendee_id, s.type, s.start_time,
+           s.duration, s.end_time, s.title, s.content, s.related_segment_ids
+    FROM jsonb_populate_recordset(NULL::segments, COALESCE(upsert_segments, '[]'::JSONB)) s
+    ON CONFLICT (id) DO UPDATE SET
+        attendee_id = EXCLUDED.attendee_id,
+        type = EXCLUDED.type,
+        start_time = EXCLUDED.start_time,
+        duration = EXCLUDED.duration,
+        end_time = EXCLUDED.end_time,
+        title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        related_segment_ids = EXCLUDED.related_segment_ids,
+        updated_at = NOW()
+    -- Never move another meeting's segment into this one
+    WHERE segments.meeting_id = meeting_id_param;
+
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION public.save_meeting_changes(UUID, JSONB, JSONB, UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.save_meeting_changes(UUID, JSONB, JSONB, UUID[]) TO service_role;
@@ -0,0 +1,108 @@
+-- Precomputed per-meeting attendance, re-merged lazily by the backend when
+-- triggers mark a snapshot stale.
+
+CREATE TABLE meeting_attendance (
+    meeting_id UUID PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    computed_version BIGINT,
+    member_ids UUID[] NOT NULL DEFAULT '{}',
+    guest_names TEXT[] NOT NULL DEFAULT '{}',
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+ALTER TABLE meeting_attendance ENABLE ROW LEVEL SECURITY;
+
+-- Mark the given meetings' snapshots stale (creating the row if needed, so a
+-- merge that raced this write cannot store its result afterwards)
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance(meeting_ids UUID[])
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO meeting_attendance (meeting_id, version)
+    SELECT m.id, 1 FROM meetings m WHERE m.id = ANY(meeting_ids)
+    ON CONFLICT (meeting_id) DO UPDATE SET
+        version = meeting_attendance.version + 1,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Trigger for tables that carry meeting_id (segments, checkins)
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_meeting_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM invalidate_meeting_attendance(ARRAY[NEW.meeting_id]);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM invalidate_meeting_attendance(ARRAY[OLD.meeting_id]);
+    ELSE
+        PERFORM invalidate_meeting_attendance(ARRAY[OLD.meeting_id, NEW.meeting_id]);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Attendee name / wxid / member link changes affect meetings where the
+-- attendee holds a role or checked in by wxid
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_attendee()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM invalidate_meeting_attendance(ARRAY(
+        SELECT s.meeting_id FROM segments s WHERE s.attendee_id = NEW.id
+        UNION
+        SELECT c.meeting_id FROM checkins c
+        WHERE c.wxid = NEW.wxid OR (TG_OP = 'UPDATE' AND c.wxid = OLD.wxid)
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Member renames affect guest-vs-member dedupe in meetings they took roles in
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_member()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM invalidate_meeting_attendance(ARRAY(
+        SELECT s.meeting_id FROM segments s
+        JOIN attendees a ON a.id = s.attendee_id
+        WHERE a.member_id = NEW.id
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER segments_invalidate_meeting_attendance
+    AFTER INSERT OR DELETE OR UPDATE OF meeting_id, attendee_id ON segments
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_meeting_id();
+
+CREATE TRIGGER checkins_invalidate_meeting_attendance
+    AFTER INSERT OR DELETE OR UPDATE OF meeting_id, wxid, name, is_member ON checkins
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_meeting_id();
+
+CREATE TRIGGER attendees_invalidate_meeting_attendance
+    AFTER INSERT OR UPDATE OF name, wxid, member_id ON attendees
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_attendee();
+
+CREATE TRIGGER members_invalidate_meeting_attendance
+    AFTER UPDATE OF full_name ON members
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_member();
+
+-- Store merged attendance computed against snapshot `version`; rows whose
+-- version moved on since they were read are left stale
+CREATE OR REPLACE FUNCTION store_meeting_attendance(snapshots JSONB)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO meeting_attendance (meeting_id, version, computed_version, member_ids, guest_names)
+    SELECT s.meeting_id, s.version, s.version, s.member_ids, s.guest_names
+    FROM jsonb_to_recordset(snapshots)
+        AS s(meeting_id UUID, version BIGINT, member_ids UUID[], guest_names TEXT[])
+    WHERE EXISTS (SELECT 1 FROM meetings m WHERE m.id = s.meeting_id)
+    ON CONFLICT (meeting_id) DO UPDATE SET
+        computed_version = EXCLUDED.computed_version,
+        member_ids = EXCLUDED.member_ids,
+        guest_names = EXCLUDED.guest_names,
+        updated_at = NOW()
+    WHERE meeting_attendance.version = EXCLUDED.version;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION store_meeting_attendance(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION store_meeting_attendance(JSONB) TO service_role;
+REVOKE ALL ON FUNCTION invalidate_meeting_attendance(UUID[]) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,89 @@
+-- Incremental feed for the statistics agent's in-memory analytics snapshot:
+-- keep updated_at current on every write and serve changed rows in one call.
+
+CREATE OR REPLACE FUNCTION public.touch_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER members_touch_updated_at
+    BEFORE UPDATE ON members
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER attendees_touch_updated_at
+    BEFORE UPDATE ON attendees
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER meetings_touch_updated_at
+    BEFORE UPDATE ON meetings
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER segments_touch_updated_at
+    BEFORE UPDATE ON segments
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER awards_touch_updated_at
+    BEFORE UPDATE ON awards
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+CREATE TRIGGER checkins_touch_updated_at
+    BEFORE UPDATE ON checkins
+    FOR EACH ROW EXECUTE FUNCTION touch_updated_at();
+
+-- Rows written at or after `since` (every row when NULL) for each analytics
+-- table, plus per-table row counts: a count below the caller's local copy
+-- means rows were deleted and the caller reloads from scratch
+CREATE OR REPLACE FUNCTION public.analytics_changes(since TIMESTAMPTZ)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'as_of', NOW(),
+        'counts', jsonb_build_object(
+            'members', (SELECT COUNT(*) FROM members),
+            'attendees', (SELECT COUNT(*) FROM attendees),
+            'meetings', (SELECT COUNT(*) FROM meetings),
+            'segments', (SELECT COUNT(*) FROM segments),
+            'awards', (SELECT COUNT(*) FROM awards),
+            'checkins', (SELECT COUNT(*) FROM checkins)
+        ),
+        'members', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('id', id, 'username', username, 'full_name', full_name))
+            FROM members WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'attendees', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('id', id, 'name', name, 'wxid', wxid, 'member_id', member_id))
+            FROM attendees WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'meetings', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'no', no, 'type', type, 'theme', theme, 'date', date,
+                'manager_id', manager_id, 'status', status
+            ))
+            FROM meetings WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'segments', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'attendee_id', attendee_id,
+                'type', type, 'start_time', start_time
+            ))
+            FROM segments WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'awards', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'category', category, 'winner', winner
+            ))
+            FROM awards WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'checkins', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'wxid', wxid, 'name', name, 'is_member', is_member
+            ))
+            FROM checkins WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB)
+    );
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION analytics_changes(TIMESTAMPTZ) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION analytics_changes(TIMESTAMPTZ) TO service_role;
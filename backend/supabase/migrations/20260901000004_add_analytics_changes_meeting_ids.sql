@@ -0,0 +1,62 @@
+-- Let local meeting saves refresh the analytics snapshot (and its per-member
+-- role-history index) for just the saved meetings, deletions included.
+
+DROP FUNCTION IF EXISTS public.analytics_changes(TIMESTAMPTZ);
+
+-- Rows written at or after `since` (every row when NULL) for each analytics
+-- table, plus per-table row counts: a count below the caller's local copy
+-- means rows were deleted and the caller reloads from scratch. `meeting_ids`
+-- (meetings saved in the caller's process) also returns each listed meeting
+-- and ALL of its segments / awards / checkins, so the caller can replace them
+-- wholesale and see deletions inside those meetings without a reload.
+CREATE OR REPLACE FUNCTION public.analytics_changes(since TIMESTAMPTZ, meeting_ids UUID[] DEFAULT '{}')
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'as_of', NOW(),
+        'counts', jsonb_build_object(
+            'members', (SELECT COUNT(*) FROM members),
+            'attendees', (SELECT COUNT(*) FROM attendees),
+            'meetings', (SELECT COUNT(*) FROM meetings),
+            'segments', (SELECT COUNT(*) FROM segments),
+            'awards', (SELECT COUNT(*) FROM awards),
+            'checkins', (SELECT COUNT(*) FROM checkins)
+        ),
+        'members', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('id', id, 'username', username, 'full_name', full_name))
+            FROM members WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'attendees', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object('id', id, 'name', name, 'wxid', wxid, 'member_id', member_id))
+            FROM attendees WHERE since IS NULL OR updated_at >= since
+        ), '[]'::JSONB),
+        'meetings', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'no', no, 'type', type, 'theme', theme, 'date', date,
+                'manager_id', manager_id, 'status', status
+            ))
+            FROM meetings WHERE since IS NULL OR updated_at >= since OR id = ANY(meeting_ids)
+        ), '[]'::JSONB),
+        'segments', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'attendee_id', attendee_id,
+                'type', type, 'start_time', start_time
+            ))
+            FROM segments WHERE since IS NULL OR updated_at >= since OR meeting_id = ANY(meeting_ids)
+        ), '[]'::JSONB),
+        'awards', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'category', category, 'winner', winner
+            ))
+            FROM awards WHERE since IS NULL OR updated_at >= since OR meeting_id = ANY(meeting_ids)
+        ), '[]'::JSONB),
+        'checkins', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'id', id, 'meeting_id', meeting_id, 'wxid', wxid, 'name', name, 'is_member', is_member
+            ))
+            FROM checkins WHERE since IS NULL OR updated_at >= since OR meeting_id = ANY(meeting_ids)
+        ), '[]'::JSONB)
+    );
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION analytics_changes(TIMESTAMPTZ, UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION analytics_changes(TIMESTAMPTZ, UUID[]) TO service_role;
@@ -0,0 +1,85 @@
+-- Timer saves in one round-trip: the backend validates the batch and computes
+-- each record's duration / dot colour, and this writes every segment's
+-- timings for a meeting in one transaction. Reads serve the stored values.
+
+ALTER TABLE timings
+    ADD COLUMN actual_duration_seconds INTEGER,
+    ADD COLUMN dot_color TEXT;
+
+-- Function to replace (regular segments) or append to (Table Topic Session)
+-- the timings of several segments of one meeting. Each element of
+-- segments_param is {segment_id, timings: [...]}; every timing carries
+-- name, planned_duration_minutes, actual_start_time, actual_end_time,
+-- actual_duration_seconds, dot_color and time_suffix ("(HH:MM)" of the start
+-- time, appended to a Table Topics name already taken in that segment).
+CREATE OR REPLACE FUNCTION public.save_meeting_timings(meeting_id_param UUID, segments_param JSONB)
+RETURNS SETOF timings AS $$
+DECLARE
+    seg RECORD;
+    t RECORD;
+    is_table_topics BOOLEAN;
+    taken_names TEXT[];
+    timing_name TEXT;
+BEGIN
+    -- Lock the meeting row so concurrent timer saves apply in turn
+    PERFORM 1 FROM meetings WHERE id = meeting_id_param FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    FOR seg IN
+        SELECT s.segment_id, s.timings
+        FROM jsonb_to_recordset(COALESCE(segments_param, '[]'::JSONB)) AS s(segment_id TEXT, timings JSONB)
+    LOOP
+        is_table_topics := EXISTS (
+            SELECT 1 FROM segments
+            WHERE id = seg.segment_id::UUID AND type = 'Table Topic Session'
+        );
+
+        IF is_table_topics THEN
+            SELECT COALESCE(array_agg(lower(name)), '{}') INTO taken_names
+            FROM timings WHERE segment_id = seg.segment_id AND name IS NOT NULL AND name <> '';
+        ELSE
+            DELETE FROM timings WHERE meeting_id = meeting_id_param AND segment_id = seg.segment_id;
+        END IF;
+
+        FOR t IN
+            SELECT *
+            FROM jsonb_to_recordset(COALESCE(seg.timings, '[]'::JSONB)) AS x(
+                name TEXT,
+                planned_duration_minutes INTEGER,
+                actual_start_time TIMESTAMPTZ,
+                actual_end_time TIMESTAMPTZ,
+                actual_duration_seconds INTEGER,
+                dot_color TEXT,
+                time_suffix TEXT
+            )
+        LOOP
+            timing_name := t.name;
+            IF is_table_topics AND COALESCE(t.name, '') <> '' THEN
+                IF lower(t.name) = ANY(taken_names) AND COALESCE(t.time_suffix, '') <> '' THEN
+                    timing_name := t.name || ' ' || t.time_suffix;
+                END IF;
+                taken_names := taken_names || lower(timing_name);
+            END IF;
+
+            RETURN QUERY
+            WITH inserted AS (
+                INSERT INTO timings (
+                    meeting_id, segment_id, name, planned_duration_minutes, actual_start_time, actual_end_time,
+                    actual_duration_seconds, dot_color
+                )
+                VALUES (
+                    meeting_id_param, seg.segment_id, timing_name, t.planned_duration_minutes, t.actual_start_time,
+                    t.actual_end_time, t.actual_duration_seconds, t.dot_color
+                )
+                RETURNING *
+            )
+            SELECT * FROM inserted;
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION public.save_meeting_timings(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.save_meeting_timings(UUID, JSONB) TO service_role;
@@ -0,0 +1,16 @@
+-- Coalesced vote counting: the backend sums the ballots cast within a short
+-- window and applies them with one call. Each element of vote_data is
+-- {category, name, delta}; keys are unique within one call.
+CREATE OR REPLACE FUNCTION public.add_vote_counts(meeting_id_param UUID, vote_data JSONB)
+RETURNS SETOF votes AS $$
+    UPDATE votes v
+    SET count = v.count + d.delta
+    FROM jsonb_to_recordset(vote_data) AS d(category TEXT, name TEXT, delta INT)
+    WHERE v.meeting_id = meeting_id_param
+      AND v.category = d.category
+      AND v.name = d.name
+    RETURNING v.*;
+$$ LANGUAGE sql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION public.add_vote_counts(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.add_vote_counts(UUID, JSONB) TO service_role;
@@ -0,0 +1,4 @@
+-- Feedback lists are filtered in the query to rows the reader sent
+-- (from_wxid) or received (to_attendee_id); index both branches of that OR.
+CREATE INDEX IF NOT EXISTS idx_feedbacks_meeting_from_wxid ON feedbacks(meeting_id, from_wxid);
+CREATE INDEX IF NOT EXISTS idx_feedbacks_meeting_to_attendee ON feedbacks(meeting_id, to_attendee_id);
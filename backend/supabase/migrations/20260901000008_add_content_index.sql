@@ -0,0 +1,166 @@
+-- Card data for the Posts index (ordinary posts plus public wxposts), kept
+-- by triggers so the feed is one ordered query. Excerpts are computed
+-- lazily by the backend when triggers mark them stale.
+
+CREATE TABLE content_index (
+    id UUID PRIMARY KEY,
+    kind TEXT NOT NULL CHECK (kind IN ('post', 'wxpost')),
+    title TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    is_public BOOLEAN NOT NULL DEFAULT FALSE,
+    author_member_id UUID,
+    author_name TEXT,
+    cover_image_url TEXT,
+    article_revision INTEGER,
+    created_at TIMESTAMPTZ NOT NULL,
+    version BIGINT NOT NULL DEFAULT 1,
+    excerpt TEXT,
+    excerpt_version BIGINT
+);
+
+CREATE INDEX content_index_created_at_idx ON content_index(created_at DESC, id DESC);
+CREATE INDEX content_index_kind_created_at_idx ON content_index(kind, created_at DESC, id DESC);
+
+ALTER TABLE content_index ENABLE ROW LEVEL SECURITY;
+
+-- Source URL of the included manifest entry chosen as cover, if any
+CREATE OR REPLACE FUNCTION wxpost_cover_url(media_manifest JSONB, cover_media_id TEXT)
+RETURNS TEXT AS $$
+    SELECT m.item ->> 'sourceUrl'
+    FROM jsonb_array_elements(media_manifest) WITH ORDINALITY AS m(item, n)
+    WHERE cover_media_id IS NOT NULL
+      AND m.item ->> 'id' = cover_media_id
+      AND COALESCE(m.item -> 'include', 'true'::jsonb) NOT IN ('false'::jsonb, 'null'::jsonb)
+    ORDER BY m.n
+    LIMIT 1;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Content edits bump `version`, which marks the stored excerpt stale
+CREATE OR REPLACE FUNCTION index_post_content()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed INTEGER := 0;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM content_index WHERE id = OLD.id;
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE' AND NEW.content IS DISTINCT FROM OLD.content THEN
+        changed := 1;
+    END IF;
+
+    INSERT INTO content_index (id, kind, title, slug, is_public, author_member_id, author_name, created_at)
+    VALUES (
+        NEW.id, 'post', NEW.title, NEW.slug, COALESCE(NEW.is_public, FALSE), NEW.author_id,
+        (SELECT m.full_name FROM members m WHERE m.id = NEW.author_id),
+        COALESCE(NEW.created_at, NOW())
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        slug = EXCLUDED.slug,
+        is_public = EXCLUDED.is_public,
+        author_member_id = EXCLUDED.author_member_id,
+        author_name = EXCLUDED.author_name,
+        created_at = EXCLUDED.created_at,
+        version = content_index.version + changed;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Only ready, public wxposts are listed; an author-provided excerpt is stored
+-- as-is and counts as fresh
+CREATE OR REPLACE FUNCTION index_wxpost_content()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed INTEGER := 0;
+    provided TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM content_index WHERE id = OLD.id;
+        RETURN NULL;
+    END IF;
+    IF NEW.status <> 'ready' OR NOT NEW.is_public THEN
+        DELETE FROM content_index WHERE id = NEW.id;
+        RETURN NULL;
+    END IF;
+    IF TG_OP = 'UPDATE' AND (NEW.content IS DISTINCT FROM OLD.content OR NEW.excerpt IS DISTINCT FROM OLD.excerpt) THEN
+        changed := 1;
+    END IF;
+    provided := NULLIF(NEW.excerpt, '');
+
+    INSERT INTO content_index (
+        id, kind, title, slug, is_public, cover_image_url, article_revision, created_at, excerpt, excerpt_version
+    )
+    VALUES (
+        NEW.id, 'wxpost', NEW.title, NEW.slug, TRUE,
+        wxpost_cover_url(NEW.media_manifest, NEW.cover_media_id),
+        NEW.article_revision, NEW.created_at,
+        provided, CASE WHEN provided IS NULL THEN NULL ELSE 1 END
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        slug = EXCLUDED.slug,
+        cover_image_url = EXCLUDED.cover_image_url,
+        article_revision = EXCLUDED.article_revision,
+        created_at = EXCLUDED.created_at,
+        version = content_index.version + changed,
+        excerpt = COALESCE(provided, content_index.excerpt),
+        excerpt_version = CASE
+            WHEN provided IS NULL THEN content_index.excerpt_version
+            ELSE content_index.version + changed
+        END;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION index_content_author_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE content_index SET author_name = NEW.full_name WHERE author_member_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER posts_index_content
+    AFTER INSERT OR DELETE OR UPDATE ON posts
+    FOR EACH ROW EXECUTE FUNCTION index_post_content();
+
+CREATE TRIGGER wxposts_index_content
+    AFTER INSERT OR DELETE OR UPDATE ON wxposts
+    FOR EACH ROW EXECUTE FUNCTION index_wxpost_content();
+
+CREATE TRIGGER members_index_content_author_name
+    AFTER UPDATE OF full_name ON members
+    FOR EACH ROW EXECUTE FUNCTION index_content_author_name();
+
+-- Store excerpts computed against index `version`; rows whose version moved
+-- on since they were read are left stale
+CREATE OR REPLACE FUNCTION store_content_excerpts(excerpts JSONB)
+RETURNS VOID AS $$
+BEGIN
+    UPDATE content_index c SET
+        excerpt = e.excerpt,
+        excerpt_version = e.version
+    FROM jsonb_to_recordset(excerpts) AS e(id UUID, version BIGINT, excerpt TEXT)
+    WHERE c.id = e.id AND c.version = e.version;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION store_content_excerpts(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION store_content_excerpts(JSONB) TO service_role;
+
+INSERT INTO content_index (id, kind, title, slug, is_public, author_member_id, author_name, created_at)
+SELECT p.id, 'post', p.title, p.slug, COALESCE(p.is_public, FALSE), p.author_id, m.full_name,
+       COALESCE(p.created_at, NOW())
+FROM posts p
+LEFT JOIN members m ON m.id = p.author_id;
+
+INSERT INTO content_index (
+    id, kind, title, slug, is_public, cover_image_url, article_revision, created_at, excerpt, excerpt_version
+)
+SELECT w.id, 'wxpost', w.title, w.slug, TRUE,
+       wxpost_cover_url(w.media_manifest, w.cover_media_id),
+       w.article_revision, w.created_at,
+       NULLIF(w.excerpt, ''), CASE WHEN NULLIF(w.excerpt, '') IS NULL THEN NULL ELSE 1 END
+FROM wxposts w
+WHERE w.status = 'ready' AND w.is_public;
@@ -0,0 +1,160 @@
+-- Card data and search text for the agents' `lookup_meeting`, kept by
+-- triggers so a lookup is one indexed query over all meetings instead of a
+-- scan of the most recent hydrated ones.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE TABLE meeting_search (
+    id UUID PRIMARY KEY,
+    no INT,
+    type TEXT NOT NULL,
+    date DATE NOT NULL,
+    status TEXT NOT NULL,
+    theme TEXT NOT NULL,
+    introduction TEXT,
+    manager_id UUID,
+    manager_name TEXT,
+    segment_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX meeting_search_status_date_idx ON meeting_search(status, date DESC, id DESC);
+-- Trigram indexes serve both substring and word-boundary (regex) matches,
+-- and work for CJK text where full-text parsers don't split words
+CREATE INDEX meeting_search_theme_trgm_idx ON meeting_search USING gin (theme extensions.gin_trgm_ops);
+CREATE INDEX meeting_search_introduction_trgm_idx ON meeting_search USING gin (introduction extensions.gin_trgm_ops);
+CREATE INDEX meeting_search_manager_name_trgm_idx ON meeting_search USING gin (manager_name extensions.gin_trgm_ops);
+
+ALTER TABLE meeting_search ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION index_meeting_search()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM meeting_search WHERE id = OLD.id;
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO meeting_search (
+        id, no, type, date, status, theme, introduction, manager_id, manager_name, segment_count
+    )
+    VALUES (
+        NEW.id, NEW.no, NEW.type, NEW.date, NEW.status, NEW.theme, NEW.introduction, NEW.manager_id,
+        (SELECT a.name FROM attendees a WHERE a.id = NEW.manager_id),
+        (SELECT count(*) FROM segments s WHERE s.meeting_id = NEW.id)
+    )
+    ON CONFLICT (id) DO UPDATE SET
+        no = EXCLUDED.no,
+        type = EXCLUDED.type,
+        date = EXCLUDED.date,
+        status = EXCLUDED.status,
+        theme = EXCLUDED.theme,
+        introduction = EXCLUDED.introduction,
+        manager_id = EXCLUDED.manager_id,
+        manager_name = EXCLUDED.manager_name,
+        updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Statement-level, so saving a whole agenda recounts each meeting once
+CREATE OR REPLACE FUNCTION count_meeting_search_segments()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE meeting_search m SET
+        segment_count = (SELECT count(*) FROM segments s WHERE s.meeting_id = m.id),
+        updated_at = NOW()
+    WHERE m.id IN (SELECT DISTINCT meeting_id FROM changed_segments);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION index_meeting_search_manager_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE meeting_search SET manager_name = NEW.name, updated_at = NOW() WHERE manager_id = NEW.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER meetings_index_search
+    AFTER INSERT OR DELETE OR UPDATE ON meetings
+    FOR EACH ROW EXECUTE FUNCTION index_meeting_search();
+
+CREATE TRIGGER segments_insert_count_meeting_search
+    AFTER INSERT ON segments
+    REFERENCING NEW TABLE AS changed_segments
+    FOR EACH STATEMENT EXECUTE FUNCTION count_meeting_search_segments();
+
+CREATE TRIGGER segments_delete_count_meeting_search
+    AFTER DELETE ON segments
+    REFERENCING OLD TABLE AS changed_segments
+    FOR EACH STATEMENT EXECUTE FUNCTION count_meeting_search_segments();
+
+CREATE TRIGGER attendees_index_meeting_search_manager_name
+    AFTER UPDATE OF name ON attendees
+    FOR EACH ROW EXECUTE FUNCTION index_meeting_search_manager_name();
+
+-- Published meeting cards matching every given filter, newest first, each
+-- row carrying the full match count. Patterns are case-insensitive regular
+-- expressions built by the backend. Only the filters in use reach the
+-- planner, so each one can pick its index.
+CREATE OR REPLACE FUNCTION search_meetings(
+    manager_pattern TEXT,
+    theme_pattern TEXT,
+    introduction_pattern TEXT,
+    type_param TEXT,
+    date_from DATE,
+    date_to DATE,
+    max_results INTEGER
+)
+RETURNS TABLE (
+    no INT,
+    type TEXT,
+    date DATE,
+    theme TEXT,
+    manager_name TEXT,
+    segment_count INTEGER,
+    introduction TEXT,
+    total_matches BIGINT
+) AS $$
+DECLARE
+    conditions TEXT := 'status = ''published''';
+BEGIN
+    IF manager_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND manager_name ~* $1';
+    END IF;
+    IF theme_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND theme ~* $2';
+    END IF;
+    IF introduction_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND introduction ~* $3';
+    END IF;
+    IF type_param IS NOT NULL THEN
+        conditions := conditions || ' AND type = $4';
+    END IF;
+    IF date_from IS NOT NULL THEN
+        conditions := conditions || ' AND date >= $5';
+    END IF;
+    IF date_to IS NOT NULL THEN
+        conditions := conditions || ' AND date <= $6';
+    END IF;
+
+    RETURN QUERY EXECUTE
+        'SELECT no, type, date, theme, manager_name, segment_count, introduction, count(*) OVER ()'
+        || ' FROM meeting_search WHERE ' || conditions
+        || ' ORDER BY date DESC, id DESC LIMIT $7'
+    USING manager_pattern, theme_pattern, introduction_pattern, type_param, date_from, date_to, max_results;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER) TO service_role;
+
+INSERT INTO meeting_search (
+    id, no, type, date, status, theme, introduction, manager_id, manager_name, segment_count
+)
+SELECT m.id, m.no, m.type, m.date, m.status, m.theme, m.introduction, m.manager_id, a.name,
+       (SELECT count(*) FROM segments s WHERE s.meeting_id = m.id)
+FROM meetings m
+LEFT JOIN attendees a ON a.id = m.manager_id;
@@ -0,0 +1,13 @@
+-- Cheap change stamp for `meeting_search`: any insert, update or delete moves
+-- the row count or the newest `updated_at`, so backends can revalidate their
+-- cached lookups with one index-only query.
+
+CREATE INDEX meeting_search_updated_at_idx ON meeting_search(updated_at DESC);
+
+CREATE OR REPLACE FUNCTION meeting_search_version()
+RETURNS TEXT AS $$
+    SELECT count(*) || ':' || COALESCE(max(updated_at)::TEXT, '') FROM meeting_search;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION meeting_search_version() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION meeting_search_version() TO service_role;
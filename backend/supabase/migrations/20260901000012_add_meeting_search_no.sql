@@ -0,0 +1,68 @@
+-- Let `lookup_meeting` find a meeting by display number through the search
+-- index, so a lookup by number returns card fields instead of hydrating the
+-- meeting's segments and attendees.
+
+CREATE INDEX meeting_search_no_idx ON meeting_search(no);
+
+DROP FUNCTION IF EXISTS search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER);
+
+-- Published meeting cards matching every given filter, newest first, each
+-- row carrying the full match count. `no_param` looks meetings up by display
+-- number without loading their segments. Patterns are case-insensitive regular
+-- expressions built by the backend. Only the filters in use reach the
+-- planner, so each one can pick its index.
+CREATE OR REPLACE FUNCTION search_meetings(
+    manager_pattern TEXT,
+    theme_pattern TEXT,
+    introduction_pattern TEXT,
+    type_param TEXT,
+    date_from DATE,
+    date_to DATE,
+    max_results INTEGER,
+    no_param INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    no INT,
+    type TEXT,
+    date DATE,
+    theme TEXT,
+    manager_name TEXT,
+    segment_count INTEGER,
+    introduction TEXT,
+    total_matches BIGINT
+) AS $$
+DECLARE
+    conditions TEXT := 'status = ''published''';
+BEGIN
+    IF manager_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND manager_name ~* $1';
+    END IF;
+    IF theme_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND theme ~* $2';
+    END IF;
+    IF introduction_pattern IS NOT NULL THEN
+        conditions := conditions || ' AND introduction ~* $3';
+    END IF;
+    IF type_param IS NOT NULL THEN
+        conditions := conditions || ' AND type = $4';
+    END IF;
+    IF date_from IS NOT NULL THEN
+        conditions := conditions || ' AND date >= $5';
+    END IF;
+    IF date_to IS NOT NULL THEN
+        conditions := conditions || ' AND date <= $6';
+    END IF;
+    IF no_param IS NOT NULL THEN
+        conditions := conditions || ' AND no = $8';
+    END IF;
+
+    RETURN QUERY EXECUTE
+        'SELECT no, type, date, theme, manager_name, segment_count, introduction, count(*) OVER ()'
+        || ' FROM meeting_search WHERE ' || conditions
+        || ' ORDER BY date DESC, id DESC LIMIT $7'
+    USING manager_pattern, theme_pattern, introduction_pattern, type_param, date_from, date_to, max_results, no_param;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION search_meetings(TEXT, TEXT, TEXT, TEXT, DATE, DATE, INTEGER, INTEGER) TO service_role;
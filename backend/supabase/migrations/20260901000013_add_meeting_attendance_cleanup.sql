@@ -0,0 +1,32 @@
+-- Drop attendance snapshots together with their meeting, and re-merge the
+-- meetings an attendee appeared in when the attendee is deleted.
+
+DELETE FROM meeting_attendance a
+WHERE NOT EXISTS (SELECT 1 FROM meetings m WHERE m.id = a.meeting_id);
+
+-- Safe alongside the invalidation triggers: `invalidate_meeting_attendance`
+-- only touches meetings that still exist, so the segment / checkin deletes
+-- cascading from a meeting delete cannot recreate its snapshot row.
+ALTER TABLE meeting_attendance
+    ADD CONSTRAINT meeting_attendance_meeting_id_fkey
+    FOREIGN KEY (meeting_id) REFERENCES meetings(id) ON DELETE CASCADE;
+
+CREATE OR REPLACE FUNCTION invalidate_meeting_attendance_by_attendee()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM invalidate_meeting_attendance(ARRAY(
+        SELECT s.meeting_id FROM segments s
+        WHERE s.attendee_id = CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END
+        UNION
+        SELECT c.meeting_id FROM checkins c
+        WHERE (TG_OP <> 'DELETE' AND c.wxid = NEW.wxid) OR (TG_OP <> 'INSERT' AND c.wxid = OLD.wxid)
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS attendees_invalidate_meeting_attendance ON attendees;
+
+CREATE TRIGGER attendees_invalidate_meeting_attendance
+    AFTER INSERT OR DELETE OR UPDATE OF name, wxid, member_id ON attendees
+    FOR EACH ROW EXECUTE FUNCTION invalidate_meeting_attendance_by_attendee();
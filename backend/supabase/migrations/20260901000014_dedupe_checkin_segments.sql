@@ -0,0 +1,79 @@
+-- A segment listed twice in one checkin is one checkin: count distinct ids
+-- in the ownership check and insert each segment once, in first-listed order.
+-- Previously the duplicate failed the count (22023) or the unique index.
+
+CREATE OR REPLACE FUNCTION checkin(
+    meeting_id_param UUID,
+    wxid_param TEXT,
+    segment_ids_param UUID[],
+    name_param TEXT,
+    referral_source_param TEXT,
+    is_member_param BOOLEAN,
+    published_only BOOLEAN
+)
+RETURNS SETOF checkins AS $$
+DECLARE
+    member BOOLEAN;
+BEGIN
+    -- Lock the meeting row so concurrent checkins (and the Timer check) apply
+    -- in turn; NO KEY UPDATE still lets other tables' foreign keys see it
+    PERFORM 1 FROM meetings
+    WHERE id = meeting_id_param AND (NOT published_only OR status = 'published')
+    FOR NO KEY UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Meeting % not found', meeting_id_param USING ERRCODE = 'P0002';
+    END IF;
+
+    IF cardinality(segment_ids_param) > 0 THEN
+        IF (
+            SELECT count(*) FROM segments
+            WHERE meeting_id = meeting_id_param AND id = ANY(segment_ids_param)
+        ) <> cardinality(ARRAY(SELECT DISTINCT unnest(segment_ids_param))) THEN
+            RAISE EXCEPTION 'One or more segment IDs do not belong to meeting %', meeting_id_param
+                USING ERRCODE = '22023';
+        END IF;
+
+        IF EXISTS (
+            SELECT 1 FROM segments s
+            JOIN checkins c ON c.meeting_id = s.meeting_id AND c.segment_id = s.id
+            WHERE s.meeting_id = meeting_id_param
+              AND s.id = ANY(segment_ids_param)
+              AND lower(s.type) = 'timer'
+              AND c.wxid <> wxid_param
+        ) THEN
+            RAISE EXCEPTION 'Timer role is already taken' USING ERRCODE = '23P01';
+        END IF;
+    END IF;
+
+    -- Membership: the caller is a member, or this wxid is bound to one
+    member := is_member_param OR EXISTS (
+        SELECT 1 FROM attendees a
+        JOIN members m ON m.id = a.member_id
+        WHERE a.wxid = wxid_param
+    );
+
+    DELETE FROM checkins WHERE meeting_id = meeting_id_param AND wxid = wxid_param;
+
+    -- NULL = general attendance, '{}' = uncheckin, otherwise one per segment
+    IF segment_ids_param IS NULL THEN
+        RETURN QUERY
+        INSERT INTO checkins (meeting_id, wxid, segment_id, name, referral_source, is_member)
+        VALUES (meeting_id_param, wxid_param, NULL, name_param, referral_source_param, member)
+        RETURNING *;
+    ELSE
+        RETURN QUERY
+        INSERT INTO checkins (meeting_id, wxid, segment_id, name, referral_source, is_member)
+        SELECT meeting_id_param, wxid_param, s.id, name_param, referral_source_param, member
+        FROM (
+            SELECT u.id, min(u.n) AS n
+            FROM unnest(segment_ids_param) WITH ORDINALITY AS u(id, n)
+            GROUP BY u.id
+        ) s
+        ORDER BY s.n
+        RETURNING *;
+    END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION checkin(UUID, TEXT, UUID[], TEXT, TEXT, BOOLEAN, BOOLEAN) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION checkin(UUID, TEXT, UUID[], TEXT, TEXT, BOOLEAN, BOOLEAN) TO service_role;
@@ -0,0 +1,39 @@
+-- Make the `meeting_search` change stamp independent of commit order.
+-- `updated_at = NOW()` is the writing transaction's start time, so a write
+-- that commits after a later-started one can leave both the row count and
+-- the newest `updated_at` unchanged, and cached lookups never revalidate.
+--
+-- Every insert and update now takes a fresh `revision` from a sequence. A
+-- row's new revision is drawn after its previous one committed, so it is
+-- always larger: any committed change moves the row count or raises the sum
+-- of revisions, whatever order the writers commit in.
+
+CREATE SEQUENCE meeting_search_revision_seq;
+
+ALTER TABLE meeting_search
+    ADD COLUMN revision BIGINT NOT NULL DEFAULT nextval('meeting_search_revision_seq');
+
+ALTER SEQUENCE meeting_search_revision_seq OWNED BY meeting_search.revision;
+
+CREATE OR REPLACE FUNCTION stamp_meeting_search_revision()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.revision := nextval('meeting_search_revision_seq');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Also fires for the ON CONFLICT DO UPDATE in `index_meeting_search`
+CREATE TRIGGER meeting_search_stamp_revision
+    BEFORE UPDATE ON meeting_search
+    FOR EACH ROW EXECUTE FUNCTION stamp_meeting_search_revision();
+
+DROP INDEX IF EXISTS meeting_search_updated_at_idx;
+
+CREATE OR REPLACE FUNCTION meeting_search_version()
+RETURNS TEXT AS $$
+    SELECT count(*) || ':' || COALESCE(sum(revision), 0) FROM meeting_search;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION meeting_search_version() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION meeting_search_version() TO service_role;
@@ -0,0 +1,18 @@
+-- Backends validate ballots against a cached votes status, so a close
+-- handled by another backend could keep counting ballots until that cache
+-- expires. Re-check the status in the counting statement itself: once
+-- voting is closed nothing is counted and no rows are returned.
+CREATE OR REPLACE FUNCTION public.add_vote_counts(meeting_id_param UUID, vote_data JSONB)
+RETURNS SETOF votes AS $$
+    UPDATE votes v
+    SET count = v.count + d.delta
+    FROM jsonb_to_recordset(vote_data) AS d(category TEXT, name TEXT, delta INT)
+    WHERE v.meeting_id = meeting_id_param
+      AND v.category = d.category
+      AND v.name = d.name
+      AND EXISTS (SELECT 1 FROM votes_status s WHERE s.meeting_id = meeting_id_param AND s.open)
+    RETURNING v.*;
+$$ LANGUAGE sql SECURITY INVOKER;
+
+REVOKE ALL ON FUNCTION public.add_vote_counts(UUID, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.add_vote_counts(UUID, JSONB) TO service_role;